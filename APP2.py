@@ -1,14 +1,9 @@
 import streamlit as st
-import math
-from math import sqrt
-import numpy as np
-import pandas as pd
-from datetime import datetime
 import hashlib
-import io
-from io import BytesIO
-import tempfile
-import os
+from importlib.util import find_spec
+
+from permisos import cambiar_plan_sesion, cerrar_sesion, iniciar_sesion, permisos_sesion, servicio_permisos
+from ui_comun import mostrar_datos_proyecto
 
 # =====================
 # CONFIGURACIÓN DE PÁGINA STREAMLIT
@@ -25,52 +20,21 @@ except Exception as e:
     pass
 
 # =====================
-# IMPORTACIONES DE GRÁFICOS (DIRECTAS COMO EN APP1.PY)
+# DEPENDENCIAS OPCIONALES
 # =====================
 
-# Importar matplotlib con manejo de errores
-MATPLOTLIB_AVAILABLE = False
-plt = None
-Rectangle = None
-Polygon = None
-
-try:
-    import matplotlib
-    # Configurar backend de manera más robusta
-    try:
-        matplotlib.use('Agg')  # Backend no interactivo para Streamlit
-    except:
-        pass  # Si falla, continuar con el backend por defecto
-    import matplotlib.pyplot as plt
-    from matplotlib.patches import Rectangle, Polygon
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    plt = None
-
-# Verificación de plotly
-try:
-    import plotly.express as px
-    import plotly.graph_objects as go
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
-    # No mostrar warning aquí para evitar problemas en la carga inicial
+# Solo se verifica que estén instaladas; cada página importa las que usa
+MATPLOTLIB_AVAILABLE = find_spec("matplotlib") is not None
+PLOTLY_AVAILABLE = find_spec("plotly") is not None
+REPORTLAB_AVAILABLE = find_spec("reportlab") is not None
 
-# Verificación de reportlab
+# Sistema de pagos real (usuarios, pagos y sesiones en simple_payment_system); si no se puede
+# importar, el simulado (modo demo)
 try:
-    from reportlab.lib.pagesizes import A4, letter
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
-    from reportlab.lib import colors
-    from reportlab.lib.styles import getSampleStyleSheet
-    from reportlab.lib.units import inch
-    REPORTLAB_AVAILABLE = True
+    import simple_payment_system
+    PAYMENT_SYSTEM_AVAILABLE = True
 except ImportError:
-    REPORTLAB_AVAILABLE = False
-    # No mostrar warning aquí para evitar problemas en la carga inicial
-
-# Sistema de pagos simple (simulado)
-PAYMENT_SYSTEM_AVAILABLE = False
+    PAYMENT_SYSTEM_AVAILABLE = False
 
 # Simulación del sistema de pagos para evitar errores
 class PaymentSystem:
@@ -96,11 +60,12 @@ class PaymentSystem:
     def upgrade_plan(self, user_id, plan):
         return {"success": True, "message": f"Plan actualizado a {plan} (modo demo)"}
 
-# Instanciar el sistema de pagos simulado
-payment_system = PaymentSystem()
+# Instanciar el sistema de pagos (el simulado si el real no está disponible)
+payment_system = simple_payment_system.payment_system if PAYMENT_SYSTEM_AVAILABLE else PaymentSystem()
 
-# Variables globales para compatibilidad
-# MATPLOTLIB_AVAILABLE se define en el bloque try/except de arriba
+# Con el sistema real, sus cambios (pagos, planes) invalidan los permisos cacheados en las sesiones
+if PAYMENT_SYSTEM_AVAILABLE:
+    servicio_permisos.conectar(payment_system)
 
 def verificar_dependencias():
     """Verifica las dependencias disponibles y muestra warnings apropiados"""
@@ -120,451 +85,6 @@ def verificar_dependencias():
     
     return warnings
 
-def safe_matplotlib_plot(func):
-    """Decorador para manejar gráficos de matplotlib de manera segura"""
-    def wrapper(*args, **kwargs):
-        if not MATPLOTLIB_AVAILABLE:
-            st.warning("⚠️ Matplotlib no está disponible. No se puede generar el gráfico.")
-            return None
-        try:
-            return func(*args, **kwargs)
-        except Exception as e:
-            st.error(f"Error generando gráfico: {str(e)}")
-            return None
-    return wrapper
-
-# =====================
-# FUNCIONES PARA GRÁFICOS DE CORTANTES Y MOMENTOS (ARTHUR H. NILSON)
-# =====================
-
-def calcular_cortantes_momentos_viga_simple(L, w, P=None, a=None):
-    """
-    Calcula cortantes y momentos para viga simplemente apoyada
-    Según Arthur H. Nilson - Diseño de Estructuras de Concreto
-    
-    L: Luz de la viga (m)
-    w: Carga distribuida (kg/m)
-    P: Carga puntual (kg) - opcional
-    a: Distancia de la carga puntual desde el apoyo izquierdo (m) - opcional
-    """
-    x = np.linspace(0, L, 100)
-    
-    # Inicializar arrays
-    V = np.zeros_like(x)
-    M = np.zeros_like(x)
-    
-    # Carga distribuida
-    if w > 0:
-        # Reacciones
-        R_A = w * L / 2
-        R_B = w * L / 2
-        
-        # Cortantes y momentos
-        V = R_A - w * x
-        M = R_A * x - w * x**2 / 2
-    
-    # Carga puntual
-    if P is not None and a is not None:
-        # Reacciones
-        R_A = P * (L - a) / L
-        R_B = P * a / L
-        
-        # Cortantes y momentos
-        for i, xi in enumerate(x):
-            if xi <= a:
-                V[i] = R_A
-                M[i] = R_A * xi
-            else:
-                V[i] = R_A - P
-                M[i] = R_A * xi - P * (xi - a)
-    
-    return x, V, M
-
-def calcular_cortantes_momentos_viga_empotrada(L, w, P=None, a=None):
-    """
-    Calcula cortantes y momentos para viga empotrada
-    Según Arthur H. Nilson - Diseño de Estructuras de Concreto
-    """
-    x = np.linspace(0, L, 100)
-    
-    # Inicializar arrays
-    V = np.zeros_like(x)
-    M = np.zeros_like(x)
-    
-    # Carga distribuida
-    if w > 0:
-        # Reacciones y momentos de empotramiento
-        R_A = w * L / 2
-        M_A = -w * L**2 / 12
-        M_B = w * L**2 / 12
-        
-        # Cortantes y momentos
-        V = R_A - w * x
-        M = M_A + R_A * x - w * x**2 / 2
-    
-    # Carga puntual
-    if P is not None and a is not None:
-        # Reacciones y momentos de empotramiento
-        R_A = P * (3*L - 2*a) * (L - a) / (2*L**2)
-        R_B = P * (3*L - 2*a) * a / (2*L**2)
-        M_A = -P * a * (L - a)**2 / (2*L**2)
-        M_B = P * a**2 * (L - a) / (2*L**2)
-        
-        # Cortantes y momentos
-        for i, xi in enumerate(x):
-            if xi <= a:
-                V[i] = R_A
-                M[i] = M_A + R_A * xi
-            else:
-                V[i] = R_A - P
-                M[i] = M_A + R_A * xi - P * (xi - a)
-    
-    return x, V, M
-
-def calcular_cortantes_momentos_viga_continua(L1, L2, w1, w2):
-    """
-    Calcula cortantes y momentos para viga continua de dos tramos
-    Según Arthur H. Nilson - Diseño de Estructuras de Concreto
-    """
-    # Coeficientes de momento para viga continua
-    # M_B = -w1*L1^2/8 - w2*L2^2/8 (aproximación)
-    M_B = -(w1 * L1**2 + w2 * L2**2) / 8
-    
-    # Reacciones
-    R_A = (w1 * L1 / 2) - (M_B / L1)
-    R_B1 = (w1 * L1 / 2) + (M_B / L1)
-    R_B2 = (w2 * L2 / 2) - (M_B / L2)
-    R_C = (w2 * L2 / 2) + (M_B / L2)
-    
-    # Generar puntos para cada tramo
-    x1 = np.linspace(0, L1, 50)
-    x2 = np.linspace(0, L2, 50)
-    
-    # Cortantes y momentos para tramo 1
-    V1 = R_A - w1 * x1
-    M1 = R_A * x1 - w1 * x1**2 / 2
-    
-    # Cortantes y momentos para tramo 2
-    V2 = R_B2 - w2 * x2
-    M2 = R_B2 * x2 - w2 * x2**2 / 2 + M_B
-    
-    return x1, V1, M1, x2, V2, M2, R_A, R_B1, R_B2, R_C, M_B
-
-@safe_matplotlib_plot
-def graficar_cortantes_momentos_nilson(L, w, P=None, a=None, tipo_viga="simple"):
-    """
-    Genera gráficos de cortantes y momentos según Arthur H. Nilson
-    """
-    if not MATPLOTLIB_AVAILABLE or plt is None:
-        st.warning("⚠️ Matplotlib no está disponible. No se puede generar el gráfico.")
-        return None
-        
-    if tipo_viga == "simple":
-        x, V, M = calcular_cortantes_momentos_viga_simple(L, w, P, a)
-    elif tipo_viga == "empotrada":
-        x, V, M = calcular_cortantes_momentos_viga_empotrada(L, w, P, a)
-    else:
-        st.error("Tipo de viga no válido")
-        return None
-    
-    # Crear figura con subplots
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
-    
-    # Gráfico de cortantes
-    ax1.plot(x, V, 'r-', linewidth=2, label='Cortante (V)')
-    ax1.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-    ax1.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-    ax1.axvline(x=L, color='k', linestyle='-', alpha=0.3)
-    ax1.fill_between(x, V, 0, alpha=0.3, color='red')
-    ax1.set_title(f'Diagrama de Cortantes - Viga {tipo_viga.title()}', fontsize=14, fontweight='bold')
-    ax1.set_xlabel('Distancia (m)')
-    ax1.set_ylabel('Cortante (kg)')
-    ax1.grid(True, alpha=0.3)
-    ax1.legend()
-    
-    # Gráfico de momentos
-    ax2.plot(x, M, 'b-', linewidth=2, label='Momento (M)')
-    ax2.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-    ax2.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-    ax2.axvline(x=L, color='k', linestyle='-', alpha=0.3)
-    ax2.fill_between(x, M, 0, alpha=0.3, color='blue')
-    ax2.set_title(f'Diagrama de Momentos - Viga {tipo_viga.title()}', fontsize=14, fontweight='bold')
-    ax2.set_xlabel('Distancia (m)')
-    ax2.set_ylabel('Momento (kg·m)')
-    ax2.grid(True, alpha=0.3)
-    ax2.legend()
-    
-    plt.tight_layout()
-    return fig
-
-@safe_matplotlib_plot
-def graficar_viga_continua_nilson(L1, L2, w1, w2):
-    """
-    Genera gráficos de cortantes y momentos para viga continua
-    """
-    if not MATPLOTLIB_AVAILABLE or plt is None:
-        st.warning("⚠️ Matplotlib no está disponible. No se puede generar el gráfico.")
-        return None
-        
-    x1, V1, M1, x2, V2, M2, R_A, R_B1, R_B2, R_C, M_B = calcular_cortantes_momentos_viga_continua(L1, L2, w1, w2)
-    
-    # Crear figura con subplots
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
-    
-    # Gráfico de cortantes
-    ax1.plot(x1, V1, 'r-', linewidth=2, label='Tramo 1')
-    ax1.plot(x2 + L1, V2, 'r-', linewidth=2, label='Tramo 2')
-    ax1.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-    ax1.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-    ax1.axvline(x=L1, color='k', linestyle='-', alpha=0.3)
-    ax1.axvline(x=L1+L2, color='k', linestyle='-', alpha=0.3)
-    ax1.fill_between(x1, V1, 0, alpha=0.3, color='red')
-    ax1.fill_between(x2 + L1, V2, 0, alpha=0.3, color='red')
-    ax1.set_title('Diagrama de Cortantes - Viga Continua', fontsize=14, fontweight='bold')
-    ax1.set_xlabel('Distancia (m)')
-    ax1.set_ylabel('Cortante (kg)')
-    ax1.grid(True, alpha=0.3)
-    ax1.legend()
-    
-    # Gráfico de momentos
-    ax2.plot(x1, M1, 'b-', linewidth=2, label='Tramo 1')
-    ax2.plot(x2 + L1, M2, 'b-', linewidth=2, label='Tramo 2')
-    ax2.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-    ax2.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-    ax2.axvline(x=L1, color='k', linestyle='-', alpha=0.3)
-    ax2.axvline(x=L1+L2, color='k', linestyle='-', alpha=0.3)
-    ax2.fill_between(x1, M1, 0, alpha=0.3, color='blue')
-    ax2.fill_between(x2 + L1, M2, 0, alpha=0.3, color='blue')
-    ax2.set_title('Diagrama de Momentos - Viga Continua', fontsize=14, fontweight='bold')
-    ax2.set_xlabel('Distancia (m)')
-    ax2.set_ylabel('Momento (kg·m)')
-    ax2.grid(True, alpha=0.3)
-    ax2.legend()
-    
-    plt.tight_layout()
-    return fig
-
-# =====================
-# FUNCIONES PARA GRÁFICOS DE CORTANTES Y MOMENTOS (JACK C. MCCORMAC)
-# =====================
-
-def calcular_cortantes_momentos_viga_simple_mccormac(L, w, P=None, a=None):
-    """
-    Calcula cortantes y momentos para viga simplemente apoyada
-    Según Jack C. McCormac - Diseño de Estructuras de Concreto
-    
-    L: Luz de la viga (m)
-    w: Carga distribuida (kg/m)
-    P: Carga puntual (kg) - opcional
-    a: Distancia de la carga puntual desde el apoyo izquierdo (m) - opcional
-    """
-    x = np.linspace(0, L, 100)
-    
-    # Inicializar arrays
-    V = np.zeros_like(x)
-    M = np.zeros_like(x)
-    
-    # Carga distribuida
-    if w > 0:
-        # Reacciones según McCormac
-        R_A = w * L / 2
-        R_B = w * L / 2
-        
-        # Cortantes y momentos
-        V = R_A - w * x
-        M = R_A * x - w * x**2 / 2
-    
-    # Carga puntual
-    if P is not None and a is not None:
-        # Reacciones según McCormac
-        R_A = P * (L - a) / L
-        R_B = P * a / L
-        
-        # Cortantes y momentos
-        for i, xi in enumerate(x):
-            if xi <= a:
-                V[i] = R_A
-                M[i] = R_A * xi
-            else:
-                V[i] = R_A - P
-                M[i] = R_A * xi - P * (xi - a)
-    
-    return x, V, M
-
-def calcular_cortantes_momentos_viga_empotrada_mccormac(L, w, P=None, a=None):
-    """
-    Calcula cortantes y momentos para viga empotrada
-    Según Jack C. McCormac - Diseño de Estructuras de Concreto
-    """
-    x = np.linspace(0, L, 100)
-    
-    # Inicializar arrays
-    V = np.zeros_like(x)
-    M = np.zeros_like(x)
-    
-    # Carga distribuida
-    if w > 0:
-        # Reacciones y momentos de empotramiento según McCormac
-        R_A = w * L / 2
-        M_A = -w * L**2 / 12
-        M_B = w * L**2 / 12
-        
-        # Cortantes y momentos
-        V = R_A - w * x
-        M = M_A + R_A * x - w * x**2 / 2
-    
-    # Carga puntual
-    if P is not None and a is not None:
-        # Reacciones y momentos de empotramiento según McCormac
-        R_A = P * (3*L - 2*a) * (L - a) / (2*L**2)
-        R_B = P * (3*L - 2*a) * a / (2*L**2)
-        M_A = -P * a * (L - a)**2 / (2*L**2)
-        M_B = P * a**2 * (L - a) / (2*L**2)
-        
-        # Cortantes y momentos
-        for i, xi in enumerate(x):
-            if xi <= a:
-                V[i] = R_A
-                M[i] = M_A + R_A * xi
-            else:
-                V[i] = R_A - P
-                M[i] = M_A + R_A * xi - P * (xi - a)
-    
-    return x, V, M
-
-def calcular_cortantes_momentos_viga_continua_mccormac(L1, L2, w1, w2):
-    """
-    Calcula cortantes y momentos para viga continua de dos tramos
-    Según Jack C. McCormac - Diseño de Estructuras de Concreto
-    """
-    # Coeficientes de momento para viga continua según McCormac
-    # M_B = -w1*L1^2/8 - w2*L2^2/8 (aproximación)
-    M_B = -(w1 * L1**2 + w2 * L2**2) / 8
-    
-    # Reacciones
-    R_A = (w1 * L1 / 2) - (M_B / L1)
-    R_B1 = (w1 * L1 / 2) + (M_B / L1)
-    R_B2 = (w2 * L2 / 2) - (M_B / L2)
-    R_C = (w2 * L2 / 2) + (M_B / L2)
-    
-    # Generar puntos para cada tramo
-    x1 = np.linspace(0, L1, 50)
-    x2 = np.linspace(0, L2, 50)
-    
-    # Cortantes y momentos para tramo 1
-    V1 = R_A - w1 * x1
-    M1 = R_A * x1 - w1 * x1**2 / 2
-    
-    # Cortantes y momentos para tramo 2
-    V2 = R_B2 - w2 * x2
-    M2 = R_B2 * x2 - w2 * x2**2 / 2 + M_B
-    
-    return x1, V1, M1, x2, V2, M2, R_A, R_B1, R_B2, R_C, M_B
-
-@safe_matplotlib_plot
-def graficar_cortantes_momentos_mccormac(L, w, P=None, a=None, tipo_viga="simple"):
-    """
-    Genera gráficos de cortantes y momentos según Jack C. McCormac
-    """
-    if not MATPLOTLIB_AVAILABLE or plt is None:
-        st.warning("⚠️ Matplotlib no está disponible. No se puede generar el gráfico.")
-        return None
-        
-    try:
-        if tipo_viga == "simple":
-            x, V, M = calcular_cortantes_momentos_viga_simple_mccormac(L, w, P, a)
-        elif tipo_viga == "empotrada":
-            x, V, M = calcular_cortantes_momentos_viga_empotrada_mccormac(L, w, P, a)
-        else:
-            st.error("Tipo de viga no válido")
-            return None
-        
-        # Crear figura
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
-        
-        # Gráfico de cortantes
-        ax1.plot(x, V, 'r-', linewidth=2, label='Cortante (V)')
-        ax1.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-        ax1.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-        ax1.axvline(x=L, color='k', linestyle='-', alpha=0.3)
-        ax1.fill_between(x, V, 0, alpha=0.3, color='red')
-        ax1.set_title(f'Diagrama de Cortantes - Viga {tipo_viga.title()} (McCormac)', fontsize=14, fontweight='bold')
-        ax1.set_xlabel('Distancia (m)')
-        ax1.set_ylabel('Cortante (kg)')
-        ax1.grid(True, alpha=0.3)
-        ax1.legend()
-        
-        # Gráfico de momentos
-        ax2.plot(x, M, 'b-', linewidth=2, label='Momento (M)')
-        ax2.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-        ax2.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-        ax2.axvline(x=L, color='k', linestyle='-', alpha=0.3)
-        ax2.fill_between(x, M, 0, alpha=0.3, color='blue')
-        ax2.set_title(f'Diagrama de Momentos - Viga {tipo_viga.title()} (McCormac)', fontsize=14, fontweight='bold')
-        ax2.set_xlabel('Distancia (m)')
-        ax2.set_ylabel('Momento (kg·m)')
-        ax2.grid(True, alpha=0.3)
-        ax2.legend()
-        
-        plt.tight_layout()
-        return fig
-        
-    except Exception as e:
-        st.error(f"Error generando gráfico: {str(e)}")
-        return None
-
-@safe_matplotlib_plot
-def graficar_viga_continua_mccormac(L1, L2, w1, w2):
-    """
-    Genera gráficos de cortantes y momentos para viga continua según McCormac
-    """
-    if not MATPLOTLIB_AVAILABLE or plt is None:
-        st.warning("⚠️ Matplotlib no está disponible. No se puede generar el gráfico.")
-        return None
-        
-    try:
-        x1, V1, M1, x2, V2, M2, R_A, R_B1, R_B2, R_C, M_B = calcular_cortantes_momentos_viga_continua_mccormac(L1, L2, w1, w2)
-        
-        # Crear figura con subplots
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
-        
-        # Gráfico de cortantes
-        ax1.plot(x1, V1, 'r-', linewidth=2, label='Tramo 1')
-        ax1.plot(x2 + L1, V2, 'r-', linewidth=2, label='Tramo 2')
-        ax1.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-        ax1.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-        ax1.axvline(x=L1, color='k', linestyle='-', alpha=0.3)
-        ax1.axvline(x=L1+L2, color='k', linestyle='-', alpha=0.3)
-        ax1.fill_between(x1, V1, 0, alpha=0.3, color='red')
-        ax1.fill_between(x2 + L1, V2, 0, alpha=0.3, color='red')
-        ax1.set_title('Diagrama de Cortantes - Viga Continua (McCormac)', fontsize=14, fontweight='bold')
-        ax1.set_xlabel('Distancia (m)')
-        ax1.set_ylabel('Cortante (kg)')
-        ax1.grid(True, alpha=0.3)
-        ax1.legend()
-        
-        # Gráfico de momentos
-        ax2.plot(x1, M1, 'b-', linewidth=2, label='Tramo 1')
-        ax2.plot(x2 + L1, M2, 'b-', linewidth=2, label='Tramo 2')
-        ax2.axhline(y=0, color='k', linestyle='-', alpha=0.3)
-        ax2.axvline(x=0, color='k', linestyle='-', alpha=0.3)
-        ax2.axvline(x=L1, color='k', linestyle='-', alpha=0.3)
-        ax2.axvline(x=L1+L2, color='k', linestyle='-', alpha=0.3)
-        ax2.fill_between(x1, M1, 0, alpha=0.3, color='blue')
-        ax2.fill_between(x2 + L1, M2, 0, alpha=0.3, color='blue')
-        ax2.set_title('Diagrama de Momentos - Viga Continua (McCormac)', fontsize=14, fontweight='bold')
-        ax2.set_xlabel('Distancia (m)')
-        ax2.set_ylabel('Momento (kg·m)')
-        ax2.grid(True, alpha=0.3)
-        ax2.legend()
-        
-        plt.tight_layout()
-        return fig
-        
-    except Exception as e:
-        st.error(f"Error generando gráfico: {str(e)}")
-        return None
-
 # =====================
 # SISTEMA DE LOGIN Y PLANES
 # =====================
@@ -585,4765 +105,444 @@ def get_user_plan(username):
     }
     return plan_mapping.get(username, "basico")
 
-# Función para generar PDF del reporte
-def generar_pdf_reportlab(resultados, datos_entrada, plan="premium"):
-    """
-    Genera un PDF profesional con formato de tesis (portada, índice, secciones, tablas, paginación, etc.)
-    siguiendo el modelo ing_Rey_concreto_armado.pdf, ahora con gráficos de cortantes, momentos y cálculos principales.
-    """
-    if not REPORTLAB_AVAILABLE:
-        pdf_buffer = io.BytesIO()
-        reporte_texto = f"""
-CONSORCIO DEJ
-Ingeniería y Construcción
-Reporte de Análisis Estructural - {plan.upper()}
-Fecha: {datetime.now().strftime('%d/%m/%Y %H:%M')}
-
-Este es un reporte básico. Para reportes en PDF, instale ReportLab:
-pip install reportlab
-
----
-Generado por: CONSORCIO DEJ
-        """
-        pdf_buffer.write(reporte_texto.encode('utf-8'))
-        pdf_buffer.seek(0)
-        return pdf_buffer
-    
-    # Importar reportlab de manera segura
-    try:
-        from reportlab.lib import colors
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
-        from reportlab.lib.styles import getSampleStyleSheet
-        from reportlab.lib.units import inch
-        reportlab_imports_ok = True
-    except ImportError as e:
-        # Si no se puede importar reportlab, crear un PDF básico
-        pdf_buffer = io.BytesIO()
-        reporte_texto = f"""
-CONSORCIO DEJ
-Ingeniería y Construcción
-Reporte de Análisis Estructural - {plan.upper()}
-Fecha: {datetime.now().strftime('%d/%m/%Y %H:%M')}
-
-Error: No se pudo importar reportlab
-Para reportes en PDF completos, instale ReportLab:
-pip install reportlab
-
-Error específico: {str(e)}
+# =====================
+# INTERFAZ STREAMLIT
+# =====================
 
----
-Generado por: CONSORCIO DEJ
-        """
-        pdf_buffer.write(reporte_texto.encode('utf-8'))
-        pdf_buffer.seek(0)
-        return pdf_buffer
-    pdf_buffer = io.BytesIO()
-    doc = SimpleDocTemplate(pdf_buffer, pagesize=A4, rightMargin=30, leftMargin=30, topMargin=40, bottomMargin=30)
-    styles = getSampleStyleSheet()
-    styleN = styles["Normal"]
-    styleH = styles["Heading1"]
-    styleH2 = styles["Heading2"]
-    styleH3 = styles["Heading3"]
-    elements = []
+# Configuración de la página
+st.set_page_config(
+    page_title="CONSORCIO DEJ - Análisis Estructural",
+    page_icon="🏗️",
+    layout="wide"
+)
 
-    # Portada con logo
-    from reportlab.platypus import Image as RLImage
-    import os
-    logo_path = 'LOGO CONSTRUCTORA DEJ6.png'
-    if os.path.exists(logo_path):
-        elements.append(Spacer(1, 30))
-        elements.append(RLImage(logo_path, width=180, height=180))
-        elements.append(Spacer(1, 10))
-    elements.append(Paragraph("CONSORCIO DEJ", styleH))
-    elements.append(Spacer(1, 30))
-    elements.append(Paragraph("<b>ANÁLISIS Y DISEÑO ESTRUCTURAL</b>", styleH2))
-    elements.append(Spacer(1, 20))
-    elements.append(Paragraph("<b>REPORTE TÉCNICO COMPLETO</b>", styleH2))
-    elements.append(Spacer(1, 20))
-    elements.append(Paragraph(f"<b>Fecha de Análisis:</b> {datetime.now().strftime('%d/%m/%Y %H:%M')}", styleN))
-    elements.append(Spacer(1, 20))
-    elements.append(Paragraph("<b>Software:</b> CONSORCIO DEJ - Análisis Estructural Avanzado", styleN))
-    elements.append(Spacer(1, 20))
-    elements.append(Paragraph("<b>Normativa:</b> ACI 318-2025, E.060, E.030", styleN))
-    elements.append(Spacer(1, 20))
-    elements.append(Paragraph("<b>Plan:</b> Premium", styleN))
-    elements.append(Spacer(1, 80))
-    elements.append(Paragraph("<b>Desarrollado por:</b> CONSORCIO DEJ", styleN))
-    elements.append(Spacer(1, 20))
-    elements.append(Paragraph("<b>Ingeniería y Construcción Especializada</b>", styleN))
-    elements.append(PageBreak())
-    
-    # Tabla de Contenido
-    elements.append(Paragraph("CONTENIDO", styleH))
-    elements.append(Spacer(1, 10))
-    
-    contenido_items = [
-        "1. RESUMEN EJECUTIVO",
-        "2. NORMATIVA Y CRITERIOS DE DISEÑO",
-        "3. DATOS DE ENTRADA Y PARÁMETROS",
-        "4. ANÁLISIS SÍSMICO",
-        "   4.1 Parámetros Sísmicos",
-        "   4.2 Zona Sísmica y Tipo de Suelo",
-        "   4.3 Cálculo de Cortante Basal",
-        "5. PROPIEDADES DE MATERIALES",
-        "6. PREDIMENSIONAMIENTO ESTRUCTURAL",
-        "7. RESULTADOS DEL ANÁLISIS COMPLETO",
-        "   7.1 Propiedades Calculadas",
-        "   7.2 Dimensiones Estructurales",
-        "   7.3 Verificaciones de Estabilidad",
-        "8. GRÁFICOS Y DIAGRAMAS",
-        "   8.1 Diagramas de Cortantes y Momentos",
-        "   8.2 Gráficos de Propiedades",
-        "   8.3 Mapa de Zona Sísmica",
-        "9. DISEÑO ESTRUCTURAL",
-        "   9.1 Diseño de Vigas",
-        "   9.2 Diseño de Columnas",
-        "   9.3 Diseño de Zapatas",
-        "10. VERIFICACIONES Y RECOMENDACIONES",
-        "11. CONCLUSIONES"
-    ]
+# Configurar PWA
+def configurar_pwa():
+    """Configurar PWA en Streamlit"""
     
-    for item in contenido_items:
-        if item.startswith("   "):
-            elements.append(Paragraph(item, styleN))
-        else:
-            elements.append(Paragraph(item, styleH2))
-        elements.append(Spacer(1, 2))
+    # Agregar meta tags para PWA
+    st.markdown('''
+    <head>
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <meta name="theme-color" content="#FFD700">
+        <meta name="apple-mobile-web-app-capable" content="yes">
+        <meta name="apple-mobile-web-app-status-bar-style" content="default">
+        <link rel="manifest" href="/manifest.json">
+        <link rel="apple-touch-icon" href="/icons/icon-192x192.svg">
+    </head>
+    ''', unsafe_allow_html=True)
     
-    elements.append(PageBreak())
-
-    # Tabla de Figuras
-    elements.append(Paragraph("<b>TABLA DE FIGURAS</b>", styleH))
-    figuras = [
-        ["Figura 1", "Mapa de Zona Sísmica del Perú", "8"],
-        ["Figura 2", "Clasificación de Tipos de Suelo", "9"],
-        ["Figura 3", "Espectro de Respuesta RNE E.030", "10"],
-        ["Figura 4", "Diagrama de Cortantes y Momentos", "12"],
-        ["Figura 5", "Gráfico de Propiedades de Materiales", "13"],
-        ["Figura 6", "Distribución de Dimensiones Estructurales", "14"],
-        ["Figura 7", "Gráfico de Zona Sísmica Seleccionada", "15"],
-        ["Figura 8", "Diagrama de Análisis Sísmico", "16"],
-        ["Figura 9", "Gráfico de Verificaciones de Estabilidad", "17"],
-        ["Figura 10", "Diagrama de Diseño de Vigas", "18"],
-        ["Figura 11", "Diagrama de Diseño de Columnas", "19"],
-        ["Figura 12", "Diagrama de Diseño de Zapatas", "20"]
-    ]
-    tabla_figuras = Table(figuras, colWidths=[80, 300, 50])
-    tabla_figuras.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-    ]))
-    elements.append(tabla_figuras)
-    elements.append(PageBreak())
-
-    # 1. Resumen Ejecutivo
-    elements.append(Paragraph("1. RESUMEN EJECUTIVO", styleH))
-    elements.append(Paragraph("El presente reporte técnico presenta el análisis y diseño estructural completo realizado mediante el software CONSORCIO DEJ - Análisis Estructural Avanzado. El análisis incluye verificación sísmica, predimensionamiento estructural, y diseño de elementos según las normativas vigentes.", styleN))
-    elements.append(Spacer(1, 5))
-    elements.append(Paragraph("Los resultados obtenidos demuestran que la estructura cumple con los requisitos de seguridad y funcionalidad establecidos en las normativas ACI 318-2025, E.060 y E.030.", styleN))
-    elements.append(Spacer(1, 10))
-    elements.append(PageBreak())
+    # Script de instalación PWA
+    st.markdown('''
+    <script>
+        // Registrar Service Worker
+        if ('serviceWorker' in navigator) {
+            navigator.serviceWorker.register('/sw.js')
+                .then(registration => console.log('✅ PWA registrada'))
+                .catch(error => console.log('❌ Error PWA:', error));
+        }
+        
+        // Detectar instalación
+        let deferredPrompt;
+        window.addEventListener('beforeinstallprompt', (e) => {
+            e.preventDefault();
+            deferredPrompt = e;
+            
+            // Mostrar botón de instalación
+            const installBtn = document.createElement('button');
+            installBtn.innerHTML = '📱 Instalar App';
+            installBtn.style.cssText = `
+                position: fixed;
+                top: 20px;
+                right: 20px;
+                background: #FFD700;
+                color: #333;
+                border: none;
+                padding: 10px 20px;
+                border-radius: 25px;
+                cursor: pointer;
+                z-index: 1000;
+                font-weight: bold;
+                box-shadow: 0 4px 10px rgba(0,0,0,0.2);
+            `;
+            
+            installBtn.onclick = async () => {
+                if (deferredPrompt) {
+                    deferredPrompt.prompt();
+                    const { outcome } = await deferredPrompt.userChoice;
+                    console.log('Usuario eligió:', outcome);
+                    deferredPrompt = null;
+                    installBtn.remove();
+                }
+            };
+            
+            document.body.appendChild(installBtn);
+        });
+        
+        // Detectar si está instalada
+        window.addEventListener('appinstalled', () => {
+            console.log('🎉 PWA instalada correctamente');
+        });
+    </script>
+    ''', unsafe_allow_html=True)
 
-    # 2. Normativa y Criterios de Diseño
-    elements.append(Paragraph("2. NORMATIVA Y CRITERIOS DE DISEÑO", styleH))
-    elements.append(Paragraph("Para el análisis se hace uso del Reglamento Nacional de Edificaciones, con las siguientes normas:", styleN))
-    elements.append(Spacer(1, 5))
-    elements.append(Paragraph("• Norma Técnica de Edificaciones E – 020 Cargas", styleN))
-    elements.append(Paragraph("• Norma Técnica de Edificaciones E – 030 Diseño Sismo Resistente", styleN))
-    elements.append(Paragraph("• Norma Técnica de Edificaciones E – 060 Concreto Armado", styleN))
-    elements.append(Paragraph("• ACI 318-2025: Building Code Requirements for Structural Concrete", styleN))
-    elements.append(Spacer(1, 10))
-    elements.append(PageBreak())
+# Configurar PWA al inicio
+configurar_pwa()
 
-    # 3. Normativa a Utilizar
-    elements.append(Paragraph("3. NORMATIVA A UTILIZAR", styleH))
-    elements.append(Paragraph("Para el análisis se hace uso del Reglamento Nacional de Edificaciones, con las siguientes normas:", styleN))
-    elements.append(Spacer(1, 5))
-    elements.append(Paragraph("• Norma Técnica de Edificaciones E – 020 Cargas", styleN))
-    elements.append(Paragraph("• Norma Técnica de Edificaciones E – 030 Diseño Sismo Resistente", styleN))
-    elements.append(Paragraph("• Norma Técnica de Edificaciones E – 060 Concreto Armado", styleN))
-    elements.append(Spacer(1, 10))
-    elements.append(PageBreak())
+# Verificar dependencias y mostrar warnings
+warnings = verificar_dependencias()
+for warning in warnings:
+    st.warning(warning)
 
-    # 4. Software a Utilizar
-    elements.append(Paragraph("4. SOFTWARE A UTILIZAR", styleH))
-    elements.append(Paragraph("Para el siguiente análisis de la estructura el software empleado es CONSORCIO DEJ - Aplicación de Análisis Estructural (Streamlit + Python), con validación mediante comparación con software comerciales como ETABS v18, AutoCAD 2018 y Revit 2020.", styleN))
-    elements.append(Spacer(1, 10))
-    elements.append(PageBreak())
+# Header con fondo amarillo
+st.markdown("""
+<div style="text-align: center; padding: 20px; background-color: #FFD700; color: #2F2F2F; border-radius: 10px; margin-bottom: 20px; border: 2px solid #FFA500;">
+    <h1>🏗️ CONSORCIO DEJ</h1>
+    <p style="font-size: 18px; font-weight: bold;">Ingeniería y Construcción</p>
+    <p style="font-size: 14px;">Software de Análisis Estructural Profesional</p>
+</div>
+""", unsafe_allow_html=True)
 
-    # 4. Análisis Sísmico
-    elements.append(Paragraph("4. ANÁLISIS SÍSMICO", styleH))
+# Sistema de autenticación y pagos
+def show_pricing_page():
+    """Mostrar página de precios y planes"""
+    st.title("💰 Planes y Precios - CONSORCIO DEJ")
     
-    elements.append(Paragraph("4.1 Parámetros Sísmicos", styleH2))
-    elements.append(Paragraph("El análisis sísmico se realiza según la Norma E.030 del Reglamento Nacional de Edificaciones. Los parámetros utilizados son:", styleN))
-    elements.append(Spacer(1, 5))
+    # Verificar si es administrador
+    is_admin = st.session_state.get('logged_in') and permisos_sesion().puede("cambiar_plan")
     
-    if resultados and 'analisis_sismico' in resultados:
-        sismico = resultados['analisis_sismico']
-        tabla_sismico = [
-            ["Parámetro", "Valor", "Descripción"],
-            ["Zona Sísmica (Z)", f"{sismico.get('Z', 0):.2f}", "Factor de zona según ubicación"],
-            ["Factor de Uso (U)", f"{sismico.get('U', 0):.1f}", "Según categoría de edificación"],
-            ["Factor de Suelo (S)", f"{sismico.get('S', 0):.1f}", "Según perfil geotécnico"],
-            ["Coef. Amplificación (C)", f"{sismico.get('C', 0):.1f}", "Según período fundamental"],
-            ["Reducción (R)", f"{sismico.get('R', 0):.1f}", "Según sistema estructural"],
-            ["Cortante Basal (V)", f"{sismico.get('cortante_basal_ton', 0):.2f} ton", "Fuerza sísmica total"]
-        ]
-        tabla = Table(tabla_sismico, colWidths=[200, 80, 200])
-        tabla.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.7, 0.8, 1.0)),
-            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ]))
-        elements.append(tabla)
-    elements.append(Spacer(1, 10))
+    col1, col2, col3 = st.columns(3)
     
-    elements.append(Paragraph("4.2 Zona Sísmica y Tipo de Suelo", styleH2))
-    elements.append(Paragraph("La estructura se encuentra ubicada en una zona sísmica con factor Z = 0.35, correspondiente a una zona de moderada actividad sísmica. El tipo de suelo es S3 (suelos blandos) con factor S = 1.20.", styleN))
-    elements.append(Spacer(1, 5))
+    with col1:
+        st.subheader("🆓 Plan Gratuito")
+        st.write("**$0/mes**")
+        st.write("✅ Cálculos básicos")
+        st.write("✅ Análisis simple")
+        st.write("✅ Reportes básicos")
+        st.write("❌ Sin análisis completo")
+        st.write("❌ Sin reportes PDF")
+        st.write("❌ Sin gráficos avanzados")
+        
+        if st.button("Seleccionar Gratuito", key="free_plan"):
+            if is_admin:
+                cambiar_plan_sesion("gratuito")
+                st.success("✅ Plan gratuito activado para administrador")
+                st.rerun()
+            else:
+                st.info("Ya tienes acceso al plan gratuito")
     
-    elements.append(Paragraph("4.3 Cálculo de Cortante Basal", styleH2))
-    elements.append(Paragraph("La cortante basal se calcula mediante la fórmula: V = Z·U·C·S·P/R", styleN))
-    elements.append(Paragraph("Donde P es el peso total de la estructura calculado automáticamente por el software.", styleN))
-    elements.append(Spacer(1, 10))
-    elements.append(PageBreak())
-
-    # 3. Datos de Entrada y Parámetros
-    elements.append(Paragraph("3. DATOS DE ENTRADA Y PARÁMETROS", styleH))
-    elements.append(Paragraph("Los datos de entrada utilizados para el análisis estructural son los siguientes:", styleN))
-    elements.append(Spacer(1, 5))
+    with col2:
+        st.subheader("⭐ Plan Premium")
+        st.write("**$29.99/mes**")
+        st.write("✅ Todo del plan gratuito")
+        st.write("✅ Análisis completo")
+        st.write("✅ Reportes PDF")
+        st.write("✅ Gráficos avanzados")
+        st.write("✅ Fórmulas de diseño")
+        st.write("❌ Sin soporte empresarial")
+        
+        if st.button("Actualizar a Premium", key="premium_plan"):
+            if is_admin:
+                # Acceso directo para administrador
+                cambiar_plan_sesion("premium")
+                st.success("✅ Plan Premium activado para administrador")
+                st.rerun()
+            elif PAYMENT_SYSTEM_AVAILABLE:
+                show_payment_form("premium")
+            else:
+                st.info("Sistema de pagos no disponible en modo demo")
     
-    # Tabla de datos de entrada
-    datos_tabla = [
-        ["Parámetro", "Valor", "Unidad"],
-        ["Resistencia del concreto (f'c)", f"{datos_entrada.get('f_c', 0)}", "kg/cm²"],
-        ["Resistencia del acero (fy)", f"{datos_entrada.get('f_y', 0)}", "kg/cm²"],
-        ["Luz libre de vigas", f"{datos_entrada.get('L_viga', 0)}", "m"],
-        ["Número de pisos", f"{datos_entrada.get('num_pisos', 0)}", ""],
-        ["Carga Muerta", f"{datos_entrada.get('CM', 0)}", "kg/m²"],
-        ["Carga Viva", f"{datos_entrada.get('CV', 0)}", "kg/m²"],
-        ["Zona Sísmica", f"{datos_entrada.get('zona_sismica', 'N/A')}", ""],
-        ["Tipo de Suelo", f"{datos_entrada.get('tipo_suelo', 'N/A')}", ""],
-        ["Tipo de Estructura", f"{datos_entrada.get('tipo_estructura', 'N/A')}", ""]
-    ]
-    tabla = Table(datos_tabla, colWidths=[200, 100, 80])
-    tabla.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.9, 0.9, 0.9)),
-        ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-    ]))
-    elements.append(tabla)
-    elements.append(Spacer(1, 10))
-    elements.append(PageBreak())
-
-    # 7. Combinaciones de Carga a Utilizar
-    elements.append(Paragraph("7. COMBINACIONES DE CARGA A UTILIZAR", styleH))
-    elements.append(Paragraph("Z = 0.35, S = 1.20, U = 1.00, Rx = 8 (Sistema Aporticado), Ry = 6 (Muros Estructurales)", styleN))
-    elements.append(Paragraph("Tp = 1.00 seg, TL = 1.60 seg", styleN))
-    elements.append(Spacer(1, 5))
-    elements.append(Paragraph("C = 2.50", styleN))
-    elements.append(Paragraph("Vx = ZUCS/R = 0.13125", styleN))
-    elements.append(Paragraph("Vy = ZUCS/R = 0.17500", styleN))
-    elements.append(Spacer(1, 10))
-    elements.append(PageBreak())
+    with col3:
+        st.subheader("🏢 Plan Empresarial")
+        st.write("**$99.99/mes**")
+        st.write("✅ Todo del plan premium")
+        st.write("✅ Soporte prioritario")
+        st.write("✅ Múltiples proyectos")
+        st.write("✅ Reportes personalizados")
+        st.write("✅ Capacitación incluida")
+        st.write("✅ API de integración")
+        
+        if st.button("Actualizar a Empresarial", key="business_plan"):
+            if is_admin:
+                # Acceso directo para administrador
+                cambiar_plan_sesion("empresarial")
+                st.success("✅ Plan Empresarial activado para administrador")
+                st.rerun()
+            elif PAYMENT_SYSTEM_AVAILABLE:
+                show_payment_form("empresarial")
+            else:
+                st.info("Sistema de pagos no disponible en modo demo")
 
-    # 5. Propiedades de Materiales
-    elements.append(Paragraph("5. PROPIEDADES DE MATERIALES", styleH))
-    elements.append(Paragraph("Las propiedades de los materiales se calculan automáticamente según las normativas vigentes:", styleN))
-    elements.append(Spacer(1, 5))
+def show_payment_form(plan):
+    """Mostrar formulario de pago"""
+    st.subheader(f"💳 Pago - Plan {plan.title()}")
     
-    # Tabla de propiedades de materiales
-    if resultados:
-        props_tabla = [
-            ["Propiedad", "Valor", "Unidad"],
-            ["Módulo de elasticidad del concreto (Ec)", f"{resultados.get('Ec', 0):.0f}", "kg/cm²"],
-            ["Módulo de elasticidad del acero (Es)", f"{resultados.get('Es', 0):,}", "kg/cm²"],
-            ["Deformación última del concreto (εcu)", f"{resultados.get('ecu', 0)}", ""],
-            ["Deformación de fluencia (εy)", f"{resultados.get('ey', 0):.4f}", ""],
-            ["Resistencia a tracción (fr)", f"{resultados.get('fr', 0):.1f}", "kg/cm²"],
-            ["β1", f"{resultados.get('beta1', 0):.3f}", ""]
-        ]
-        tabla_props = Table(props_tabla, colWidths=[200, 100, 80])
-        tabla_props.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.9, 0.9, 0.9)),
-            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ]))
-        elements.append(tabla_props)
-    elements.append(Spacer(1, 10))
-    elements.append(PageBreak())
-
-    # 9. Asignación de Parámetros
-    elements.append(Paragraph("9. ASIGNACIÓN DE PARÁMETROS", styleH))
-    elements.append(Paragraph("9.1 Patrones de cargas asignados", styleH2))
-    elements.append(Paragraph("Se realiza la definición de los patrones de carga tales como CM, CV, ESTXX y ESTYY.", styleN))
-    elements.append(Spacer(1, 5))
-    
-    elements.append(Paragraph("9.2 Definición del Sismo Estático X e Y", styleH2))
-    elements.append(Paragraph("Se definen los casos de sismo estático en ambas direcciones principales de la estructura.", styleN))
-    elements.append(Spacer(1, 5))
+    # Verificar si hay usuario logueado
+    if 'user' not in st.session_state:
+        st.warning("⚠️ Debes iniciar sesión o registrarte primero")
+        st.info("📝 Ve a la pestaña 'Registrarse' para crear una cuenta")
+        return
     
-    elements.append(Paragraph("9.3 Definición del Espectro de Respuesta", styleH2))
-    elements.append(Paragraph("Se define el espectro de respuesta según RNE E.030 para el análisis dinámico modal espectral.", styleN))
-    elements.append(Spacer(1, 10))
-    elements.append(PageBreak())
-
-    # 6. Predimensionamiento Estructural
-    elements.append(Paragraph("6. PREDIMENSIONAMIENTO ESTRUCTURAL", styleH))
-    elements.append(Paragraph("El predimensionamiento se realiza automáticamente según las normativas vigentes y las cargas aplicadas:", styleN))
-    elements.append(Spacer(1, 5))
+    payment_method = st.selectbox(
+        "Método de pago",
+        ["yape", "plin", "paypal", "transferencia", "efectivo"],
+        format_func=lambda x: {
+            "yape": "📱 Yape (Más Rápido)",
+            "plin": "📱 PLIN",
+            "paypal": "💳 PayPal",
+            "transferencia": "🏦 Transferencia Bancaria", 
+            "efectivo": "💵 Pago en Efectivo"
+        }[x]
+    )
     
-    if resultados:
-        dim_tabla = [
-            ["Dimensión", "Valor", "Unidad"],
-            ["Peso total estimado", f"{resultados.get('peso_total', 0):.1f}", "ton"],
-            ["Espesor de losa", f"{resultados.get('h_losa', 0)*100:.0f}", "cm"],
-            ["Dimensiones de viga", f"{resultados.get('b_viga', 0):.0f}×{resultados.get('d_viga', 0):.0f}", "cm"],
-            ["Dimensiones de columna", f"{resultados.get('lado_columna', 0):.0f}×{resultados.get('lado_columna', 0):.0f}", "cm"]
-        ]
-        tabla_dim = Table(dim_tabla, colWidths=[200, 100, 80])
-        tabla_dim.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.9, 0.9, 0.9)),
-            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ]))
-        elements.append(tabla_dim)
-    elements.append(Spacer(1, 10))
-    elements.append(PageBreak())
+    if st.button("Procesar Pago", type="primary"):
+        if PAYMENT_SYSTEM_AVAILABLE:
+            try:
+                result = payment_system.upgrade_plan(
+                    st.session_state['user'], 
+                    plan,
+                    payment_method
+                )
+                
+                if result["success"]:
+                    st.success("✅ Pago procesado correctamente")
+                    st.info("📋 Instrucciones de pago:")
+                    st.text(result["instructions"])
+                    
+                    # Mostrar información adicional
+                    st.info("📱 Envía el comprobante de pago a WhatsApp: +51 999 888 777")
+                    
+                    # Verificar si fue confirmado automáticamente
+                    if result.get("auto_confirmed"):
+                        st.success("🎉 ¡Plan activado inmediatamente!")
+                        st.info("✅ Pago confirmado automáticamente")
+                        
+                        # Actualizar plan y permisos de la sesión
+                        cambiar_plan_sesion(plan)
+                        
+                        # Botón para continuar con acceso completo
+                        if st.button("🚀 Continuar con Acceso Completo", key="continue_full_access"):
+                            st.rerun()
+                    else:
+                        st.info("⏰ Activación en 2 horas máximo")
+                        st.info("🔄 Recarga la página después de 2 horas")
+                else:
+                    st.error(f"❌ Error: {result['message']}")
+            except Exception as e:
+                st.error(f"❌ Error en el sistema de pagos: {str(e)}")
+                st.info("🔄 Intenta nuevamente o contacta soporte")
+        else:
+            st.error("❌ Sistema de pagos no disponible")
+            st.info("🔧 Contacta al administrador para activar el sistema")
 
-    # 9. Resultados de Diseño
-    elements.append(Paragraph("9. RESULTADOS DE DISEÑO ESTRUCTURAL", styleH))
-    
-    # Verificar si matplotlib está disponible para gráficos
-    matplotlib_available = False
-    if MATPLOTLIB_AVAILABLE:
-        try:
-            import matplotlib
-            matplotlib.use('Agg')  # Backend no interactivo
-            import matplotlib.pyplot as plt
-            import numpy as np
-            from io import BytesIO
-            matplotlib_available = True
-        except ImportError:
-            elements.append(Paragraph("⚠️ Matplotlib no está disponible. Los gráficos no se incluirán en el PDF.", styleN))
-    else:
-        elements.append(Paragraph("⚠️ Matplotlib no está disponible. Los gráficos no se incluirán en el PDF.", styleN))
-    
-    # Gráfico de cortantes y momentos (si hay datos y matplotlib está disponible)
-    if matplotlib_available and MATPLOTLIB_AVAILABLE:
-        try:
-            from reportlab.platypus import Image as RLImage
-            # Usar los datos principales de la viga
-            L = float(datos_entrada.get('L_viga', 6.0))
-            w = float(datos_entrada.get('CM', 150)) + float(datos_entrada.get('CV', 200))
-            P = None
-            a = None
-            # Gráfico de cortantes y momentos
-            x, V, M = calcular_cortantes_momentos_viga_simple_mccormac(L, w, P, a)
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(7, 5))
-            ax1.plot(x, V, 'r-', linewidth=2, label='Cortante (V)')
-            ax1.set_title('Diagrama de Cortantes')
-            ax1.set_xlabel('Distancia (m)')
-            ax1.set_ylabel('Cortante (kg)')
-            ax1.grid(True, alpha=0.3)
-            ax2.plot(x, M, 'b-', linewidth=2, label='Momento (M)')
-            ax2.set_title('Diagrama de Momentos')
-            ax2.set_xlabel('Distancia (m)')
-            ax2.set_ylabel('Momento (kg·m)')
-            ax2.grid(True, alpha=0.3)
-            plt.tight_layout()
-            cortante_momento_img = BytesIO()
-            fig.savefig(cortante_momento_img, format='png', bbox_inches='tight', dpi=200)
-            plt.close(fig)
-            cortante_momento_img.seek(0)
-            elements.append(Paragraph("Gráficos de Cortantes y Momentos para la Viga Principal", styleH2))
-            elements.append(RLImage(cortante_momento_img, width=400, height=280))
-            elements.append(Spacer(1, 10))
-        except Exception as e:
-            elements.append(Paragraph(f"No se pudo generar el gráfico de cortantes/momentos: {str(e)}", styleN))
-    
-    # Gráfico de propiedades principales
-    if matplotlib_available and MATPLOTLIB_AVAILABLE:
-        try:
-            from reportlab.platypus import Image as RLImage
-            fig, ax = plt.subplots(figsize=(6, 4))
-            propiedades = ['Ec', 'Es', 'fr', 'β1']
-            valores = [resultados.get('Ec', 0)/1000, resultados.get('Es', 0)/1000000, resultados.get('fr', 0), resultados.get('beta1', 0)]
-            color_list = ['#4169E1', '#DC143C', '#32CD32', '#FFD700']
-            bars = ax.bar(propiedades, valores, color=color_list)
-            ax.set_title("Propiedades de los Materiales")
-            ax.set_ylabel("Valor")
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height + 0.1, f'{height:.2f}', ha='center', va='bottom')
-            plt.tight_layout()
-            props_img = BytesIO()
-            fig.savefig(props_img, format='png', bbox_inches='tight', dpi=200)
-            plt.close(fig)
-            props_img.seek(0)
-            elements.append(Paragraph("Gráfico de Propiedades Principales", styleH2))
-            elements.append(RLImage(props_img, width=320, height=220))
-            elements.append(Spacer(1, 10))
-        except Exception as e:
-            elements.append(Paragraph(f"No se pudo generar el gráfico de propiedades: {str(e)}", styleN))
-    
-    # Gráfico de zona sísmica (esquema simple)
-    if matplotlib_available and MATPLOTLIB_AVAILABLE:
-        try:
-            from reportlab.platypus import Image as RLImage
-            fig, ax = plt.subplots(figsize=(4, 2.5))
-            zonas = ['Z1', 'Z2', 'Z3', 'Z4']
-            valores = [0.10, 0.15, 0.25, 0.35]
-            color_map = ['#A9CCE3', '#5499C7', '#2471A3', '#1B2631']
-            ax.bar(zonas, valores, color=color_map)
-            zona_sel = datos_entrada.get('zona_sismica', 'Z3')
-            idx = zonas.index(zona_sel) if zona_sel in zonas else 2
-            ax.bar(zonas[idx], valores[idx], color='#F1C40F')
-            ax.set_title('Zona Sísmica Seleccionada')
-            ax.set_ylabel('Z')
-            plt.tight_layout()
-            zona_img = BytesIO()
-            fig.savefig(zona_img, format='png', bbox_inches='tight', dpi=200)
-            plt.close(fig)
-            zona_img.seek(0)
-            elements.append(Paragraph("Gráfico de Zona Sísmica", styleH2))
-            elements.append(RLImage(zona_img, width=200, height=120))
-            elements.append(Spacer(1, 10))
-        except Exception as e:
-            elements.append(Paragraph(f"No se pudo generar el gráfico de zona sísmica: {str(e)}", styleN))
-    
-    # 8. Gráficos y Diagramas
-    elements.append(PageBreak())
-    elements.append(Paragraph("8. GRÁFICOS Y DIAGRAMAS", styleH))
-    
-    elements.append(Paragraph("8.1 Diagramas de Cortantes y Momentos", styleH2))
-    elements.append(Paragraph("Los diagramas de cortantes y momentos se generan automáticamente para las vigas principales según las cargas aplicadas.", styleN))
-    elements.append(Spacer(1, 5))
-    
-    elements.append(Paragraph("8.2 Gráficos de Propiedades", styleH2))
-    elements.append(Paragraph("Los gráficos muestran las propiedades calculadas de los materiales y las dimensiones estructurales.", styleN))
-    elements.append(Spacer(1, 5))
-    
-    elements.append(Paragraph("8.3 Mapa de Zona Sísmica", styleH2))
-    elements.append(Paragraph("El mapa muestra la clasificación sísmica del Perú y la zona seleccionada para el análisis.", styleN))
-    elements.append(Spacer(1, 10))
-    elements.append(PageBreak())
-    
-    # 9. Resultados del Análisis Completo
-    elements.append(Paragraph("9. RESULTADOS DEL ANÁLISIS COMPLETO", styleH))
-    
-    elements.append(Paragraph("9.1 Propiedades Calculadas", styleH2))
-    elements.append(Paragraph("Los resultados del análisis estructural completo incluyen:", styleN))
-    elements.append(Spacer(1, 5))
-    
-    if resultados:
-        # Tabla de resultados principales
-        resultados_tabla = [
-            ["Resultado", "Valor", "Unidad", "Estado"],
-            ["Peso Total Estructura", f"{resultados.get('peso_total', 0):.1f}", "ton", "✓"],
-            ["Cortante Basal Sísmica", f"{resultados.get('analisis_sismico', {}).get('cortante_basal_ton', 0):.2f}", "ton", "✓"],
-            ["Espesor Losa Calculado", f"{resultados.get('h_losa', 0)*100:.0f}", "cm", "✓"],
-            ["Dimensiones Viga", f"{resultados.get('b_viga', 0):.0f}×{resultados.get('d_viga', 0):.0f}", "cm", "✓"],
-            ["Dimensiones Columna", f"{resultados.get('lado_columna', 0):.0f}×{resultados.get('lado_columna', 0):.0f}", "cm", "✓"],
-            ["Módulo Elástico Concreto", f"{resultados.get('Ec', 0):.0f}", "kg/cm²", "✓"],
-            ["Módulo Elástico Acero", f"{resultados.get('Es', 0):,}", "kg/cm²", "✓"]
-        ]
-        tabla = Table(resultados_tabla, colWidths=[180, 80, 60, 60])
-        tabla.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.7, 0.8, 1.0)),
-            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ]))
-        elements.append(tabla)
-    elements.append(Spacer(1, 10))
-    
-    elements.append(Paragraph("9.2 Dimensiones Estructurales", styleH2))
-    elements.append(Paragraph("Las dimensiones estructurales se han calculado automáticamente según las normativas vigentes:", styleN))
-    elements.append(Spacer(1, 5))
-    
-    if resultados:
-        dim_estructurales = [
-            ["Elemento", "Dimensión", "Criterio"],
-            ["Losa", f"{resultados.get('h_losa', 0)*100:.0f} cm", "L/25 a L/30"],
-            ["Viga Principal", f"{resultados.get('b_viga', 0):.0f}×{resultados.get('d_viga', 0):.0f} cm", "L/12 a L/15"],
-            ["Columna", f"{resultados.get('lado_columna', 0):.0f}×{resultados.get('lado_columna', 0):.0f} cm", "Carga axial"],
-            ["Zapata", "Por calcular", "Capacidad portante"]
-        ]
-        tabla = Table(dim_estructurales, colWidths=[150, 100, 150])
-        tabla.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.9, 1.0, 0.9)),
-            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ]))
-        elements.append(tabla)
-    elements.append(Spacer(1, 10))
-    
-    elements.append(Paragraph("9.3 Verificaciones de Estabilidad", styleH2))
-    elements.append(Paragraph("Se han verificado los siguientes aspectos de estabilidad:", styleN))
-    elements.append(Spacer(1, 5))
-    
-    verificaciones = [
-        ["Verificación", "Resultado", "Normativa"],
-        ["Cortante Sísmica", "Cumple", "E.030"],
-        ["Derivas de Entrepiso", "Cumple", "E.030"],
-        ["Resistencia Flexión", "Cumple", "E.060"],
-        ["Resistencia Cortante", "Cumple", "E.060"],
-        ["Cuantías de Acero", "Cumple", "E.060"]
-    ]
-    tabla = Table(verificaciones, colWidths=[150, 100, 150])
-    tabla.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.Color(1.0, 0.9, 0.9)),
-        ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-    ]))
-    elements.append(tabla)
-    elements.append(Spacer(1, 10))
-    elements.append(PageBreak())
-    
-    # 10. RESULTADOS DEL ANÁLISIS
-    elements.append(Paragraph("10. RESULTADOS DEL ANÁLISIS", styleH))
-    
-    # 10.1 Cortante en la Base del Sismo Estático
-    elements.append(Paragraph("10.1 Cortante en la Base del Sismo Estático", styleH2))
-    if resultados and 'analisis_sismico' in resultados:
-        sismico = resultados['analisis_sismico']
-        cortante_tabla = [
-            ["Parámetro", "Valor", "Unidad"],
-            ["Cortante Basal Estático", f"{sismico.get('cortante_basal_ton', 0):.2f}", "ton"],
-            ["Factor de Zona (Z)", f"{sismico.get('Z', 0):.2f}", ""],
-            ["Factor de Uso (U)", f"{sismico.get('U', 0):.1f}", ""],
-            ["Factor de Suelo (S)", f"{sismico.get('S', 0):.1f}", ""],
-            ["Coeficiente Sísmico (C)", f"{sismico.get('C', 0):.1f}", ""],
-            ["Factor de Reducción (R)", f"{sismico.get('R', 0):.1f}", ""]
-        ]
-        tabla = Table(cortante_tabla, colWidths=[200, 100, 80])
-        tabla.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.7, 0.8, 1.0)),
-            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ]))
-        elements.append(tabla)
-    elements.append(Spacer(1, 10))
-    
-    # 10.2 Reacciones en la Base por Sismo Estático
-    elements.append(Paragraph("10.2 Reacciones en la Base por Sismo Estático", styleH2))
-    elements.append(Paragraph("Las reacciones en la base se calculan distribuyendo la cortante basal entre los elementos estructurales según su rigidez y ubicación.", styleN))
-    elements.append(Spacer(1, 5))
-    
-    # 10.3 Reacciones en la Base por Sismo Dinámico
-    elements.append(Paragraph("10.3 Reacciones en la Base por Sismo Dinámico", styleH2))
-    elements.append(Paragraph("El análisis dinámico considera los modos de vibración de la estructura y proporciona una distribución más precisa de las fuerzas sísmicas.", styleN))
-    elements.append(Spacer(1, 5))
-    
-    # 10.4 Fuerzas en los pisos por Sismo Estático
-    elements.append(Paragraph("10.4 Fuerzas en los pisos por Sismo Estático", styleH2))
-    if resultados and 'analisis_sismico' in resultados:
-        sismico = resultados['analisis_sismico']
-        peso_total = resultados.get('peso_total', 0)
-        elements.append(Paragraph(f"Peso total de la estructura: {peso_total:.1f} ton", styleN))
-        elements.append(Paragraph(f"Cortante basal distribuida en {datos_entrada.get('num_pisos', 1)} pisos", styleN))
-    elements.append(Spacer(1, 5))
-    
-    # 10.5 Fuerzas en los pisos por Sismo Dinámico
-    elements.append(Paragraph("10.5 Fuerzas en los pisos por Sismo Dinámico", styleH2))
-    elements.append(Paragraph("Las fuerzas dinámicas consideran la respuesta modal de la estructura y los efectos de amplificación local.", styleN))
-    elements.append(Spacer(1, 5))
-    
-    # 10.6 Masas Participativas
-    elements.append(Paragraph("10.6 Masas Participativas", styleH2))
-    if resultados and 'analisis_sismico' in resultados:
-        sismico = resultados['analisis_sismico']
-        elements.append(Paragraph("Los modos de vibración principales son:", styleN))
-        elements.append(Paragraph("• Modo 1: Traslacional en dirección X", styleN))
-        elements.append(Paragraph("• Modo 2: Traslacional en dirección Y", styleN))
-        elements.append(Paragraph("• Modo 3: Torsional", styleN))
-    elements.append(Spacer(1, 10))
-    
-    # 10.7 Fuerza Cortante que absorben los pórticos eje X
-    elements.append(Paragraph("10.7 Fuerza Cortante que absorben los pórticos eje X", styleH2))
-    if resultados and 'analisis_sismico' in resultados:
-        sismico = resultados['analisis_sismico']
-        cortante_x = sismico.get('cortante_basal_ton', 0) * 0.5  # Distribución simplificada
-        elements.append(Paragraph(f"Fuerza cortante total en eje X: {cortante_x:.2f} ton", styleN))
-        elements.append(Paragraph("Distribución entre pórticos según rigidez relativa", styleN))
-    elements.append(Spacer(1, 5))
-    
-    # 10.8 Fuerza Cortante que absorben los pórticos eje Y
-    elements.append(Paragraph("10.8 Fuerza Cortante que absorben los pórticos eje Y", styleH2))
-    if resultados and 'analisis_sismico' in resultados:
-        sismico = resultados['analisis_sismico']
-        cortante_y = sismico.get('cortante_basal_ton', 0) * 0.5  # Distribución simplificada
-        elements.append(Paragraph(f"Fuerza cortante total en eje Y: {cortante_y:.2f} ton", styleN))
-        elements.append(Paragraph("Distribución entre pórticos según rigidez relativa", styleN))
-    elements.append(Spacer(1, 5))
-    
-    # 10.9 Derivas de Entre piso eje X
-    elements.append(Paragraph("10.9 Derivas de Entre piso eje X", styleH2))
-    elements.append(Paragraph("Las derivas se calculan como la diferencia de desplazamientos entre pisos consecutivos dividida por la altura del piso.", styleN))
-    elements.append(Paragraph("Límite según RNE E.030: Δ/h ≤ 0.007", styleN))
-    elements.append(Spacer(1, 5))
-    
-    # 10.10 Derivas de Entre piso eje Y
-    elements.append(Paragraph("10.10 Derivas de Entre piso eje Y", styleH2))
-    elements.append(Paragraph("Verificación de derivas en dirección Y para asegurar el cumplimiento de los límites normativos.", styleN))
-    elements.append(Spacer(1, 10))
-    
-    # 11. DISEÑO ESTRUCTURAL
-    elements.append(PageBreak())
-    elements.append(Paragraph("11. DISEÑO ESTRUCTURAL", styleH))
-    
-    elements.append(Paragraph("11.1 Diseño de Vigas", styleH2))
-    elements.append(Paragraph("El diseño de vigas se realiza según la Norma E.060 y ACI 318-2025:", styleN))
-    elements.append(Spacer(1, 5))
-    
-    # Diseño por Flexión
-    elements.append(Paragraph("Diseño por Flexión", styleH3))
-    if resultados and 'diseno_flexion' in resultados:
-        flexion = resultados['diseno_flexion']
-        flexion_tabla = [
-            ["Parámetro", "Valor", "Unidad"],
-            ["Momento Último (Mu)", f"{resultados.get('Mu_estimado', 0):.0f}", "kg·m"],
-            ["Área de Acero (As)", f"{flexion.get('As', 0):.1f}", "cm²"],
-            ["Cuantía (ρ)", f"{flexion.get('rho', 0):.4f}", ""],
-            ["Cuantía Balanceada (ρb)", f"{flexion.get('rho_b', 0):.4f}", ""],
-            ["Cuantía Mínima (ρmin)", f"{flexion.get('rho_min', 0):.4f}", ""],
-            ["Cuantía Máxima (ρmax)", f"{flexion.get('rho_max', 0):.4f}", ""],
-            ["Momento Resistente (φMn)", f"{flexion.get('phiMn', 0):.0f}", "kg·m"]
-        ]
-        tabla = Table(flexion_tabla, colWidths=[200, 100, 80])
-        tabla.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.9, 1.0, 0.9)),
-            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ]))
-        elements.append(tabla)
-    elements.append(Spacer(1, 5))
-    
-    # 11.1.2 Diseño para el apoyo 2 y 3
-    elements.append(Paragraph("11.1.2 Diseño para el apoyo 2 y 3", styleH3))
-    elements.append(Paragraph("En los apoyos intermedios, el momento negativo requiere refuerzo superior adicional.", styleN))
-    elements.append(Spacer(1, 5))
-    
-    # 11.1.3 Diseño por Cortante
-    elements.append(Paragraph("11.1.3 Diseño por Cortante", styleH3))
-    if resultados and 'diseno_cortante' in resultados:
-        cortante = resultados['diseno_cortante']
-        cortante_tabla = [
-            ["Parámetro", "Valor", "Unidad"],
-            ["Cortante Último (Vu)", f"{resultados.get('Vu_estimado', 0):.0f}", "kg"],
-            ["Resistencia Concreto (Vc)", f"{cortante.get('Vc', 0):.0f}", "kg"],
-            ["Resistencia Acero (Vs)", f"{cortante.get('Vs_requerido', 0):.0f}", "kg"],
-            ["Área Estribos (Av/s)", f"{cortante.get('Av_s_requerido', 0):.3f}", "cm²/cm"],
-            ["Separación Máxima", f"{cortante.get('s_max', 0):.1f}", "cm"]
-        ]
-        tabla = Table(cortante_tabla, colWidths=[200, 100, 80])
-        tabla.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(1.0, 0.8, 0.8)),
-            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ]))
-        elements.append(tabla)
-    elements.append(Spacer(1, 10))
-    
-    # 11.2 Diseño de Viga V4 (eje B y C) en piso típico
-    elements.append(Paragraph("11.2 Diseño de Viga V4 (eje B y C) en piso típico", styleH2))
-    
-    # 11.2.1 Diseño por Flexión
-    elements.append(Paragraph("11.2.1 Diseño por Flexión", styleH3))
-    elements.append(Paragraph("Similar al diseño de V3, pero considerando las cargas específicas del eje B y C.", styleN))
-    elements.append(Spacer(1, 5))
-    
-    # 11.2.2 Diseño para el tramo 1-2 y 3-4
-    elements.append(Paragraph("11.2.2 Diseño para el tramo 1-2 y 3-4", styleH3))
-    elements.append(Paragraph("En los tramos, el momento positivo requiere refuerzo inferior.", styleN))
-    elements.append(Spacer(1, 5))
-    
-    # 11.2.3 Diseño para el apoyo 2 y 3
-    elements.append(Paragraph("11.2.3 Diseño para el apoyo 2 y 3", styleH3))
-    elements.append(Paragraph("Refuerzo superior en apoyos intermedios para resistir momentos negativos.", styleN))
-    elements.append(Spacer(1, 5))
-    
-    # 11.2.4 Diseño por Cortante
-    elements.append(Paragraph("11.2.4 Diseño por Cortante", styleH3))
-    elements.append(Paragraph("Verificación de resistencia al cortante y diseño de estribos.", styleN))
-    elements.append(Spacer(1, 10))
-    
-    elements.append(Paragraph("11.2 Diseño de Columnas", styleH2))
-    elements.append(Paragraph("El diseño de columnas considera la carga axial y momentos flectores:", styleN))
-    elements.append(Spacer(1, 5))
-    
-    # Cargas actuantes en la Columna
-    elements.append(Paragraph("Cargas Actuantes", styleH3))
-    if resultados and 'diseno_columna' in resultados:
-        columna = resultados['diseno_columna']
-        columna_tabla = [
-            ["Parámetro", "Valor", "Unidad"],
-            ["Carga Axial Última (Pu)", f"{resultados.get('Pu_estimado', 0):.0f}", "kg"],
-            ["Resistencia Nominal (Pn)", f"{columna.get('Pn', 0):.0f}", "kg"],
-            ["Resistencia Diseño (φPn)", f"{columna.get('phiPn', 0):.0f}", "kg"],
-            ["Área Total Columna", f"{resultados.get('lado_columna', 0)**2:.0f}", "cm²"],
-            ["Área Acero Columna", f"{columna.get('Ast', 0):.1f}", "cm²"]
-        ]
-        tabla = Table(columna_tabla, colWidths=[200, 100, 80])
-        tabla.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(1.0, 1.0, 0.9)),
-            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ]))
-        elements.append(tabla)
-    elements.append(Spacer(1, 5))
-    
-    # 12.1.2 Diseño por corte eje A – 1
-    elements.append(Paragraph("12.1.2 Diseño por corte eje A – 1", styleH3))
-    elements.append(Paragraph("Verificación de resistencia al cortante en columnas según ACI 318.", styleN))
-    elements.append(Spacer(1, 5))
-    
-    # 12.1.3 Cargas actuantes en la Columna del eje B – 1
-    elements.append(Paragraph("12.1.3 Cargas actuantes en la Columna del eje B – 1", styleH3))
-    elements.append(Paragraph("Análisis de cargas para columnas interiores con mayor área tributaria.", styleN))
-    elements.append(Spacer(1, 5))
-    
-    # 12.1.4 Diseño por corte eje B – 1
-    elements.append(Paragraph("12.1.4 Diseño por corte eje B – 1", styleH3))
-    elements.append(Paragraph("Diseño de estribos para columnas interiores.", styleN))
-    elements.append(Spacer(1, 5))
-    
-    # 12.1.5 Cargas actuantes en la Columna del eje B – 2
-    elements.append(Paragraph("12.1.5 Cargas actuantes en la Columna del eje B – 2", styleH3))
-    elements.append(Paragraph("Análisis de cargas para columnas de esquina.", styleN))
-    elements.append(Spacer(1, 5))
-    
-    # 12.1.6 Diseño por corte eje B –2
-    elements.append(Paragraph("12.1.6 Diseño por corte eje B –2", styleH3))
-    elements.append(Paragraph("Diseño de estribos para columnas de esquina.", styleN))
-    elements.append(Spacer(1, 10))
-    
-    elements.append(Paragraph("11.3 Diseño de Zapatas", styleH2))
-    elements.append(Paragraph("El diseño de zapatas considera la capacidad portante del suelo y las cargas de la estructura:", styleN))
-    elements.append(Spacer(1, 5))
-    if resultados and 'diseno_columna' in resultados:
-        columna = resultados['diseno_columna']
-        Pu = resultados.get('Pu_estimado', 0)
-        # Calcular diseño de zapata
-        fc = datos_entrada.get('f_c', 210)
-        fy = datos_entrada.get('f_y', 4200)
-        qu = 2.0  # kg/cm² (capacidad portante típica)
-        zapata = calcular_diseno_zapatas(fc, fy, Pu, qu)
-        
-        zapata_tabla = [
-            ["Parámetro", "Valor", "Unidad"],
-            ["Carga Axial (Pu)", f"{Pu:.0f}", "kg"],
-            ["Capacidad Portante (qn)", f"{zapata['qn']:.2f}", "kg/cm²"],
-            ["Área Estimada", f"{zapata['A_estimada']:.0f}", "cm²"],
-            ["Lado Zapata", f"{zapata['lado_zapata']:.1f}", "cm"],
-            ["Peralte Efectivo", f"{zapata['d_estimado']:.1f}", "cm"],
-            ["Área Acero Flexión", f"{zapata['As_flexion']:.1f}", "cm²"]
-        ]
-        tabla = Table(zapata_tabla, colWidths=[200, 100, 80])
-        tabla.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.9, 1.0, 1.0)),
-            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ]))
-        elements.append(tabla)
-    elements.append(Spacer(1, 10))
+def show_auth_page():
+    st.title("🏗️ CONSORCIO DEJ - Análisis Estructural")
     
-    # 12. Verificaciones y Recomendaciones
-    elements.append(PageBreak())
-    elements.append(Paragraph("12. VERIFICACIONES Y RECOMENDACIONES", styleH))
-    elements.append(Paragraph("Basado en el análisis estructural completo realizado, se presentan las siguientes verificaciones:", styleN))
-    elements.append(Spacer(1, 5))
+    # Pestañas para login/registro
+    tab1, tab2, tab3 = st.tabs(["🔐 Iniciar Sesión", "📝 Registrarse", "💰 Planes y Precios"])
     
-    verificaciones_finales = [
-        ["Aspecto", "Estado", "Observación"],
-        ["Cortante Sísmica", "✓ Cumple", "Dentro de límites normativos"],
-        ["Derivas de Entrepiso", "✓ Cumple", "Menor a 0.007 según E.030"],
-        ["Resistencia a Flexión", "✓ Cumple", "Según ACI 318-2025"],
-        ["Resistencia a Cortante", "✓ Cumple", "Según ACI 318-2025"],
-        ["Cuantías de Acero", "✓ Cumple", "Entre ρmin y ρmax"],
-        ["Estabilidad Estructural", "✓ Cumple", "Sistema estructural adecuado"]
-    ]
-    tabla = Table(verificaciones_finales, colWidths=[150, 100, 200])
-    tabla.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.9, 1.0, 0.9)),
-        ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-    ]))
-    elements.append(tabla)
-    elements.append(Spacer(1, 10))
+    with tab1:
+        st.subheader("Iniciar Sesión")
+        with st.form("login_form"):
+            username = st.text_input("Usuario")
+            password = st.text_input("Contraseña", type="password")
+            submitted = st.form_submit_button("Entrar")
+            
+            if submitted:
+                # Verificar credenciales especiales primero
+                if username == "admin" and password == "admin123":
+                    iniciar_sesion("admin", {"username": "admin", "plan": "empresarial", "name": "Administrador"})
+                    st.success("¡Bienvenido Administrador!")
+                    st.rerun()
+                elif username == "demo" and password == "demo":
+                    iniciar_sesion("demo", {"username": "demo", "plan": "gratuito", "name": "Usuario Demo"})
+                    st.success("¡Bienvenido al modo demo!")
+                    st.rerun()
+                elif not PAYMENT_SYSTEM_AVAILABLE:
+                    st.error("Credenciales disponibles: admin/admin123 o demo/demo")
+                else:
+                    # Sistema real: la contraseña se verifica en un hilo del KDF
+                    with st.spinner("Verificando credenciales..."):
+                        result = payment_system.login_user_async(username, password).result()
+                    if result["success"]:
+                        iniciar_sesion(result["user"]["email"], result["user"])
+                        # Token firmado solo en la sesión (nunca en la URL): permite anularlo al cerrar sesión
+                        st.session_state['sesion_token'] = result["token"]
+                        st.success(f"¡Bienvenido, {result['user']['name']}!")
+                        st.rerun()
+                    else:
+                        st.error(result["message"])
     
-    # 13. Conclusiones
-    elements.append(Paragraph("13. CONCLUSIONES", styleH))
-    elements.append(Paragraph("• El análisis estructural completo demuestra que la estructura cumple con todos los requisitos de las normativas vigentes (E.030, E.060, ACI 318-2025).", styleN))
-    elements.append(Spacer(1, 5))
-    elements.append(Paragraph("• La cortante sísmica calculada es adecuada para la zona sísmica y tipo de suelo considerados.", styleN))
-    elements.append(Spacer(1, 5))
-    elements.append(Paragraph("• Las dimensiones estructurales calculadas automáticamente garantizan la seguridad y funcionalidad de la estructura.", styleN))
-    elements.append(Spacer(1, 5))
-    elements.append(Paragraph("• El diseño de elementos estructurales (vigas, columnas, zapatas) cumple con los criterios de resistencia y ductilidad.", styleN))
-    elements.append(Spacer(1, 5))
-    elements.append(Paragraph("• Se recomienda realizar inspecciones periódicas durante la construcción para verificar el cumplimiento de los planos de diseño.", styleN))
-    elements.append(Spacer(1, 10))
+    with tab2:
+        st.subheader("Crear Cuenta")
+        with st.form("register_form"):
+            new_username = st.text_input("Usuario", placeholder="Tu nombre de usuario")
+            new_email = st.text_input("Email", placeholder="tuemail@gmail.com")
+            new_password = st.text_input("Contraseña", type="password", placeholder="Mínimo 6 caracteres")
+            confirm_password = st.text_input("Confirmar Contraseña", type="password")
+            submitted = st.form_submit_button("📝 Registrarse", type="primary")
+            
+            if submitted:
+                if not new_username or not new_email or not new_password:
+                    st.error("❌ Todos los campos son obligatorios")
+                elif new_password != confirm_password:
+                    st.error("❌ Las contraseñas no coinciden")
+                elif len(new_password) < 6:
+                    st.error("❌ La contraseña debe tener al menos 6 caracteres")
+                else:
+                    if not PAYMENT_SYSTEM_AVAILABLE:
+                        st.success("✅ Modo demo: Registro simulado exitoso")
+                        st.info("🔑 Credenciales: demo / demo")
+                    else:
+                        result = payment_system.register_user(new_email, new_password, new_username)
+                        if result["success"]:
+                            st.success("✅ " + result["message"])
+                            st.info("🔐 Ahora puedes iniciar sesión y actualizar tu plan")
+                        else:
+                            st.error("❌ " + result["message"])
     
-    # Pie de página y paginación
-    def add_page_number(canvas, doc):
-        page_num = canvas.getPageNumber()
-        text = f"CONSORCIO DEJ - Análisis Estructural    Página {page_num}"
-        canvas.saveState()
-        canvas.setFont('Helvetica', 8)
-        canvas.drawString(30, 15, text)
-        canvas.restoreState()
+    with tab3:
+        show_pricing_page()
 
-    doc.build(elements, onFirstPage=add_page_number, onLaterPages=add_page_number)
-    pdf_buffer.seek(0)
-    return pdf_buffer
+# Verificar estado de autenticación
+if 'logged_in' not in st.session_state:
+    st.session_state['logged_in'] = False
 
-# =====================
-# FUNCIONES DE CÁLCULO PARA DISEÑO ESTRUCTURAL
-# =====================
+# Enlaces antiguos con el token en la URL: quitarlo sin usarlo (pudo quedar en historial o Referer)
+if "sesion" in st.query_params:
+    del st.query_params["sesion"]
 
-def calcular_diseno_zapatas(fc, fy, Pu, qu, FS=3):
-    """
-    Calcula el diseño de zapatas según E.060 y ACI 318-2025
-    """
-    # Capacidad portante del suelo (E.060)
-    qn = qu / FS
-    
-    # Área de la zapata (estimación inicial)
-    A_estimada = Pu / qn
-    
-    # Dimensiones típicas (asumiendo zapata cuadrada)
-    lado_zapata = sqrt(A_estimada)
-    
-    # Peralte efectivo estimado (d = L/8 a L/12 según ACI 318)
-    d_estimado = lado_zapata / 10
-    
-    # Perímetro crítico para punzonamiento (ACI 318-19 Sección 22.6.4.1)
-    b0 = 4 * (25 + d_estimado)  # Asumiendo columna de 25x25 cm
-    
-    # Corte por punzonamiento (ACI 318-19 Sección 22.6.5.1)
-    Vc_punzonamiento = 0.53 * sqrt(fc) * b0 * d_estimado
-    
-    # Corte por flexión (ACI 318-19 Sección 22.5.5.1)
-    Vc_flexion = 0.53 * sqrt(fc) * lado_zapata * d_estimado
-    
-    # Momento último en la zapata (ACI 318-19 Sección 13.2.7.1)
-    Mu_zapata = (Pu / lado_zapata) * (lado_zapata - 0.25)**2 / 8  # Momento en la cara de la columna
-    
-    # Refuerzo por flexión (ACI 318-19 Sección 22.3.1)
-    j = 0.9  # Factor de brazo de palanca
-    phi = 0.9  # Factor de reducción para flexión
-    As_flexion = Mu_zapata / (phi * fy * j * d_estimado)
-    
-    # Verificaciones adicionales
-    # Verificación de espesor mínimo (ACI 318-19 Sección 13.2.7.1)
-    espesor_minimo = max(15, lado_zapata / 12)  # cm
-    
-    # Verificación de refuerzo mínimo (ACI 318-19 Sección 7.6.1.1)
-    As_min = 0.0018 * lado_zapata * d_estimado  # cm²
-    
-    return {
-        'qn': qn,
-        'A_estimada': A_estimada,
-        'lado_zapata': lado_zapata,
-        'd_estimado': d_estimado,
-        'Vc_punzonamiento': Vc_punzonamiento,
-        'Vc_flexion': Vc_flexion,
-        'Mu_zapata': Mu_zapata,
-        'As_flexion': As_flexion,
-        'b0': b0,
-        'espesor_minimo': espesor_minimo,
-        'As_min': As_min,
-        'verificacion_espesor': d_estimado >= espesor_minimo,
-        'verificacion_refuerzo': As_flexion >= As_min
-    }
+# Sesión anulada (cerrada en otra pestaña o réplica) o vencida: volver a iniciar sesión
+if st.session_state['logged_in'] and PAYMENT_SYSTEM_AVAILABLE and st.session_state.get('sesion_token'):
+    if payment_system.verify_session(st.session_state['sesion_token']) is None:
+        cerrar_sesion()
 
-def calcular_diseno_vigas_detallado(fc, fy, b, d, Mu, Vu):
-    """
-    Calcula el diseño detallado de vigas según ACI 318-2025
-    """
-    # Momento resistente (ACI 318-19 Sección 22.3.1)
-    # Asumir cuantía inicial
-    rho = 0.01  # 1% inicial
-    As = rho * b * d
-    
-    # Profundidad del bloque equivalente (ACI 318-19 Sección 22.2.2.4.1)
-    a = As * fy / (0.85 * fc * b)
-    
-    # Momento resistente (ACI 318-19 Sección 22.3.1)
-    Mn = As * fy * (d - a/2)
-    phi = 0.9  # Factor de reducción para flexión
-    phiMn = phi * Mn
-    
-    # Corte resistente del concreto (ACI 318-19 Sección 22.5.5.1)
-    Vc = 0.53 * sqrt(fc) * b * d
+if not st.session_state['logged_in']:
+    show_auth_page()
+    st.stop()
+else:
+    # Mostrar información del usuario (plan resuelto una vez por inicio de sesión)
+    permisos = permisos_sesion()
+    plan = permisos.plan
     
-    # Refuerzo por corte (ACI 318-19 Sección 22.5.10.5.3)
-    phi_corte = 0.75  # Factor de reducción para corte
-    if Vu > phi_corte * Vc:
-        Vs = (Vu - phi_corte * Vc) / phi_corte
-        # Asumir estribos #3 (Av = 0.71 cm²)
-        Av = 0.71
-        s = Av * fy * d / Vs
-        s_max = min(d/2, 60)  # cm (ACI 318-19 Sección 25.7.2.2)
-        s_final = min(s, s_max)
+    # Header con información del plan
+    if plan == "gratuito":
+        st.sidebar.info("🆓 Plan Gratuito")
+    elif plan == "premium":
+        st.sidebar.success("⭐ Plan Premium")
     else:
-        Vs = 0
-        s_final = min(d/2, 60)
-    
-    # Verificaciones adicionales
-    # Cuantía mínima (ACI 318-19 Sección 9.6.1.2)
-    rho_min = max(0.8 * sqrt(fc) / fy, 14 / fy)
-    
-    # Cuantía máxima (ACI 318-19 Sección 9.3.3.1)
-    rho_max = 0.75 * 0.85 * 0.85 * (fc / fy) * (6000 / (6000 + fy))
-    
-    # Verificación de cuantías
-    rho_actual = As / (b * d)
-    verificacion_cuantia = rho_min <= rho_actual <= rho_max
-    
-    return {
-        'As': As,
-        'a': a,
-        'Mn': Mn,
-        'phiMn': phiMn,
-        'Vc': Vc,
-        'Vs': Vs,
-        's_estribos': s_final,
-        'rho_actual': rho_actual,
-        'rho_min': rho_min,
-        'rho_max': rho_max,
-        'verificacion_momento': phiMn >= Mu,
-        'verificacion_corte': Vu <= phi_corte * (Vc + Vs),
-        'verificacion_cuantia': verificacion_cuantia
-    }
-
-def calcular_diseno_columnas_detallado(fc, fy, Ag, Ast, Pu, Mu=0):
-    """
-    Calcula el diseño detallado de columnas según ACI 318-2025
-    """
-    # Carga axial resistente (ACI 318-19 Sección 22.4.2.1)
-    Pn = 0.85 * fc * (Ag - Ast) + Ast * fy
-    
-    # Factor phi para columnas con estribos (ACI 318-19 Sección 21.2.1)
-    phi = 0.65
-    
-    # Resistencia de diseño
-    phiPn = phi * Pn
-    
-    # Espaciamiento de estribos (ACI 318-19 Sección 25.7.2.2)
-    lado_columna = sqrt(Ag)
-    db = 0.019  # Diámetro de barra #6 (3/4")
-    de = 0.0095  # Diámetro de estribo #3 (3/8")
-    
-    s_max = min(16 * db, 48 * de, lado_columna)
-    
-    # Verificación de cuantías (ACI 318-19 Sección 10.6.1.1)
-    rho = Ast / Ag
-    rho_min = 0.01  # 1% mínimo
-    rho_max = 0.06  # 6% máximo
-    
-    # Verificación de esbeltez (ACI 318-19 Sección 6.2.5)
-    # Para columnas no arriostradas
-    k = 1.0  # Factor de longitud efectiva
-    lu = 3.0  # Longitud no soportada (m)
-    r = 0.3 * lado_columna / 100  # Radio de giro (m)
-    klr = k * lu / r
-    
-    # Verificación de esbeltez
-    esbeltez_ok = klr <= 22  # Para columnas no arriostradas
-    
-    return {
-        'Pn': Pn,
-        'phiPn': phiPn,
-        'phi': phi,
-        's_max_estribos': s_max,
-        'rho': rho,
-        'rho_min': rho_min,
-        'rho_max': rho_max,
-        'klr': klr,
-        'verificacion_carga': Pu <= phiPn,
-        'verificacion_cuantia': rho_min <= rho <= rho_max,
-        'verificacion_esbeltez': esbeltez_ok
-    }
-
-def calcular_ejercicio_basico_corte(fc, b, d, Vu, fy=4200, L=6.0, CM=0, CV=0, num_estribos=0):
-    """
-    Calcula el ejercicio básico de corte según las fórmulas del PDF con datos completos
-    """
-    # Valores preliminares
-    phi = 0.75  # Factor de reducción para corte según ACI 318-19 Sección 21.2.1
+        st.sidebar.success("🏢 Plan Empresarial")
     
-    # Corte resistente del concreto (Vc y φVc) según ACI 318-19 Sección 22.5.5.1
-    Vc = 0.53 * sqrt(fc) * b * d  # Resistencia nominal del concreto
-    phiVc = phi * Vc  # Resistencia de diseño (con factor φ)
+    st.sidebar.write(f"Usuario: {st.session_state['user']}")
+    st.sidebar.write(f"Plan: {plan}")
     
-    # Cálculo de cargas si se proporcionan
-    if CM > 0 or CV > 0:
-        # Carga total por metro lineal
-        w_total = (CM + CV) * b / 100  # kg/m
-        # Cortante máximo en viga simplemente apoyada
-        Vu_calculado = w_total * L / 2
-        # Usar el mayor entre Vu proporcionado y Vu calculado
-        Vu_final = max(Vu, Vu_calculado)
-    else:
-        Vu_final = Vu
-        w_total = 0
+    # Botón para cerrar sesión
+    if st.sidebar.button("🚪 Cerrar Sesión"):
+        if PAYMENT_SYSTEM_AVAILABLE and st.session_state.get('sesion_token'):
+            payment_system.end_session(st.session_state['sesion_token'])
+        cerrar_sesion()
+        st.rerun()
     
-    # Verificar si se necesita refuerzo
-    if Vu_final > phiVc:
-        # Calcular Vs requerido
-        Vs_requerido = Vu_final - phiVc
-        
-        # Asumir estribos #3 (Av = 0.71 cm²)
-        Av = 0.71
+    # Mostrar estado de la PWA
+    def mostrar_estado_pwa():
+        """Mostrar estado de la PWA en el sidebar"""
+        st.sidebar.markdown("---")
+        st.sidebar.subheader("📱 Estado PWA")
         
-        # Espaciamiento de estribos
-        s = Av * fy * d / Vs_requerido
+        import os
+        archivos_pwa = ['manifest.json', 'sw.js', 'offline.html']
+        archivos_ok = sum(1 for archivo in archivos_pwa if os.path.exists(archivo))
         
-        # Limitar espaciamiento
-        s_max = min(d/2, 60)  # cm
-        s_final = min(s, s_max)
+        if archivos_ok == len(archivos_pwa):
+            st.sidebar.success("✅ PWA configurada")
+        elif archivos_ok > 0:
+            st.sidebar.info(f"📱 PWA parcialmente configurada ({archivos_ok}/{len(archivos_pwa)} archivos)")
+        else:
+            st.sidebar.info("📱 PWA no configurada (opcional)")
         
-        zona_critica = True
-        necesita_estribos = True
-    else:
-        # No se necesita refuerzo, usar espaciamiento máximo
-        s_final = min(d/2, 60)
-        Vs_requerido = 0
-        zona_critica = False
-        necesita_estribos = False
-    
-    # Refuerzo mínimo
-    Av_min = 0.2 * sqrt(fc) * b * s_final / fy
+        # Verificar iconos de manera opcional
+        if os.path.exists('icons'):
+            iconos = len([f for f in os.listdir('icons') if f.endswith('.svg')])
+            if iconos > 0:
+                st.sidebar.info(f"🎨 {iconos} iconos disponibles")
+        else:
+            st.sidebar.info("🎨 Iconos PWA (opcional)")
     
-    # Cálculo de estribos
-    if num_estribos > 0:
-        # Calcular espaciamiento basado en número de estribos
-        s_por_estribo = L * 100 / num_estribos  # cm
-        s_estribado = min(s_por_estribo, s_final)
-    else:
-        s_estribado = s_final
+    # Mostrar estado PWA
+    mostrar_estado_pwa()
+
+    # Sidebar para navegación
+    st.sidebar.title("📋 Menú Principal")
     
-    # Verificaciones adicionales
-    phiVc_mitad = phiVc / 2
-    if Vu_final <= phiVc_mitad:
-        zona_no_critica = True
-        s_max_final = min(d/2, 60)
+    # Mostrar plan actual
+    if plan == "gratuito":
+        st.sidebar.info("🆓 Plan Gratuito - Funciones limitadas")
+        st.sidebar.write("Para acceder a todas las funciones, actualiza a Premium")
+        
+        # Información sobre cómo acceder al plan premium
+        st.sidebar.markdown("---")
+        st.sidebar.subheader("🔑 Acceso Premium")
+        st.sidebar.write("**Usuario:** admin")
+        st.sidebar.write("**Contraseña:** admin123")
+        st.sidebar.info("Cierra sesión y vuelve a iniciar con las credenciales admin")
     else:
-        zona_no_critica = False
-        s_max_final = s_final
+        st.sidebar.success("⭐ Plan Premium - Acceso completo")
+        
+        # Información para administradores
+        st.sidebar.markdown("---")
+        st.sidebar.subheader("👨‍💼 Panel de Administrador")
+        st.sidebar.write("**Usuario actual:** " + st.session_state['user'])
+        st.sidebar.write("**Plan:** Premium")
+        st.sidebar.success("Acceso completo a todas las funciones")
     
-    # Tabla de valores Vu
-    valores_Vu = {
-        'Vu_proporcionado': Vu,
-        'Vu_calculado': Vu_calculado if w_total > 0 else 0,
-        'Vu_final': Vu_final,
-        'Vc': Vc,  # Agregado: resistencia nominal del concreto
-        'phiVc': phiVc,
-        'phiVc_mitad': phiVc_mitad,
-        'Vs_requerido': Vs_requerido
-    }
-    
-    # Cálculo de estribado gráficamente
-    estribado_grafico = {
-        'zona_critica': {
-            'longitud': d,  # cm
-            'estribos': int(d / s_final) if s_final > 0 else 0,
-            'espaciamiento': s_final
-        },
-        'zona_no_critica': {
-            'longitud': L * 100 - d,  # cm
-            'estribos': int((L * 100 - d) / s_max_final) if s_max_final > 0 else 0,
-            'espaciamiento': s_max_final
-        }
-    }
-    
-    return {
-        'Vc': Vc,  # Agregado: resistencia nominal del concreto
-        'phiVc': phiVc,
-        'Vs_requerido': Vs_requerido,
-        's_estribos': s_final,
-        's_estribado': s_estribado,
-        'zona_critica': zona_critica,
-        'zona_no_critica': zona_no_critica,
-        'necesita_estribos': necesita_estribos,
-        'Av_min': Av_min,
-        'verificacion': Vu_final <= phiVc + Vs_requerido,
-        'valores_Vu': valores_Vu,
-        'estribado_grafico': estribado_grafico,
-        'w_total': w_total,
-        'Vu_final': Vu_final,
-        'phiVc_mitad': phiVc_mitad,
-        's_max_final': s_max_final
-    }
-
-# =====================
-# FUNCIONES PARA DIBUJAR ELEMENTOS ESTRUCTURALES
-# =====================
-
-@safe_matplotlib_plot
-def graficar_diagrama_cortantes(L, Vu, phiVc, phiVc_mitad, w_total=0):
-    """
-    Grafica el diagrama de cortantes para el ejercicio de corte
-    """
-    if not MATPLOTLIB_AVAILABLE or plt is None:
-        return None
-        
-    try:
-        fig, ax = plt.subplots(figsize=(12, 8))
-        
-        # Generar puntos a lo largo de la viga
-        x = np.linspace(0, L, 100)
-        
-        # Calcular cortantes a lo largo de la viga
-        if w_total > 0:
-            # Carga distribuida
-            V = w_total * L / 2 - w_total * x
-        else:
-            # Carga puntual en el centro (simplificado)
-            V = np.full_like(x, Vu / 2)
-            V[x > L/2] = -Vu / 2
-        
-        # Graficar diagrama de cortantes
-        ax.plot(x, V, 'b-', linewidth=3, label='Cortante (V)')
-        ax.fill_between(x, V, 0, alpha=0.3, color='blue')
-        
-        # Líneas de referencia
-        ax.axhline(y=phiVc, color='red', linestyle='--', linewidth=2, label=f'φVc = {phiVc:.0f} kg')
-        ax.axhline(y=phiVc_mitad, color='orange', linestyle='--', linewidth=2, label=f'φVc/2 = {phiVc_mitad:.0f} kg')
-        ax.axhline(y=0, color='black', linestyle='-', alpha=0.5)
-        
-        # Configurar gráfico
-        ax.set_title('Diagrama de Cortantes - Ejercicio Básico de Corte', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Distancia (m)')
-        ax.set_ylabel('Cortante (kg)')
-        ax.grid(True, alpha=0.3)
-        ax.legend()
-        
-        # Agregar anotaciones
-        ax.text(L/2, max(V)*0.8, f'Vu máximo = {max(abs(V)):.0f} kg', 
-                ha='center', va='center', bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7))
-        
-        plt.tight_layout()
-        return fig
-        
-    except Exception as e:
-        print(f"Error graficando diagrama de cortantes: {str(e)}")
-        return None
-
-@safe_matplotlib_plot
-def graficar_estribado_viga(L, d, s_critica, s_no_critica, b=25):
-    """
-    Grafica el estribado de la viga según los resultados
-    """
-    if not MATPLOTLIB_AVAILABLE or plt is None:
-        return None
-        
-    try:
-        fig, ax = plt.subplots(figsize=(15, 8))
-        
-        # Escala para visualización
-        escala = 100  # 1 unidad = 1 cm
-        
-        # Dimensiones de la viga
-        ancho = b / escala
-        alto = d / escala
-        largo = L
-        
-        # Dibujar viga
-        from matplotlib.patches import Rectangle
-        rect_viga = Rectangle((0, 0), largo, alto, linewidth=2, edgecolor='black', facecolor='lightgray', alpha=0.7)
-        ax.add_patch(rect_viga)
-        
-        # Zona crítica (primeros d cm)
-        zona_critica = Rectangle((0, 0), d/100, alto, linewidth=1, edgecolor='red', facecolor='red', alpha=0.2)
-        ax.add_patch(zona_critica)
-        
-        # Zona no crítica
-        zona_no_critica = Rectangle((d/100, 0), largo - d/100, alto, linewidth=1, edgecolor='blue', facecolor='blue', alpha=0.1)
-        ax.add_patch(zona_no_critica)
-        
-        # Dibujar estribos en zona crítica
-        if s_critica > 0:
-            num_estribos_critica = int(d / s_critica)
-            for i in range(num_estribos_critica):
-                x = (d / num_estribos_critica) * i / 100
-                rect_estribo = Rectangle((x, 0), 0.05, alto, linewidth=1, edgecolor='red', facecolor='red', alpha=0.5)
-                ax.add_patch(rect_estribo)
-        
-        # Dibujar estribos en zona no crítica
-        if s_no_critica > 0:
-            num_estribos_no_critica = int((L*100 - d) / s_no_critica)
-            for i in range(num_estribos_no_critica):
-                x = d/100 + (s_no_critica / 100) * i
-                if x < largo:
-                    rect_estribo = Rectangle((x, 0), 0.05, alto, linewidth=1, edgecolor='blue', facecolor='blue', alpha=0.3)
-                    ax.add_patch(rect_estribo)
-        
-        # Configurar gráfico
-        ax.set_xlim(-0.1, largo + 0.1)
-        ax.set_ylim(-0.1, alto + 0.1)
-        ax.set_aspect('equal')
-        ax.set_title(f'Estribado de Viga - Zona Crítica: φ3/8"@{s_critica:.1f}cm, Zona No Crítica: φ3/8"@{s_no_critica:.1f}cm', 
-                    fontsize=12, fontweight='bold')
-        ax.set_xlabel('Longitud (m)')
-        ax.set_ylabel('Altura (m)')
-        ax.grid(True, alpha=0.3)
-        
-        # Agregar leyenda
-        from matplotlib.patches import Patch
-        legend_elements = [
-            Patch(facecolor='red', alpha=0.2, label='Zona Crítica'),
-            Patch(facecolor='blue', alpha=0.1, label='Zona No Crítica'),
-            Patch(facecolor='red', alpha=0.5, label='Estribos Críticos'),
-            Patch(facecolor='blue', alpha=0.3, label='Estribos No Críticos')
-        ]
-        ax.legend(handles=legend_elements, loc='upper right')
-        
-        # Agregar anotaciones
-        ax.text(largo/2, alto/2, f'Zona Crítica: {d}cm\nZona No Crítica: {L*100-d:.0f}cm', 
-                ha='center', va='center', bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7))
-        
-        plt.tight_layout()
-        return fig
-        
-    except Exception as e:
-        print(f"Error graficando estribado: {str(e)}")
-        return None
-
-def dibujar_viga(b, d, L, As, s_estribos, fc, fy):
-    """
-    Dibuja una viga con sus dimensiones y refuerzo
-    """
-    if not MATPLOTLIB_AVAILABLE:
-        return None
-        
-    try:
-        if plt is None or Rectangle is None:
-            return None
-            
-        fig, ax = plt.subplots(figsize=(12, 8))
-        
-        # Escala para visualización
-        escala = 100  # 1 unidad = 1 cm
-        
-        # Dimensiones de la viga
-        ancho = b / escala
-        alto = d / escala
-        largo = L
-        
-        # Dibujar viga
-        rect_viga = Rectangle((0, 0), largo, alto, linewidth=2, edgecolor='black', facecolor='lightgray', alpha=0.7)
-        ax.add_patch(rect_viga)
-        
-        # Dibujar acero longitudinal (simplificado como líneas)
-        num_barras = max(2, int(As / 2.85))  # Asumiendo barras #6 (2.85 cm²)
-        espaciado_barras = ancho / (num_barras + 1)
-        
-        # Acero superior
-        for i in range(num_barras):
-            x = espaciado_barras * (i + 1)
-            ax.plot([x, x], [alto - 0.05, alto - 0.15], 'red', linewidth=3, label='Acero Superior' if i == 0 else "")
-        
-        # Acero inferior
-        for i in range(num_barras):
-            x = espaciado_barras * (i + 1)
-            ax.plot([x, x], [0.05, 0.15], 'red', linewidth=3, label='Acero Inferior' if i == 0 else "")
-        
-        # Dibujar estribos (simplificado)
-        if s_estribos > 0:
-            num_estribos = int(L / (s_estribos / escala))
-            for i in range(num_estribos):
-                x = (L / num_estribos) * i
-                rect_estribo = Rectangle((x, 0), 0.1, alto, linewidth=1, edgecolor='blue', facecolor='none', linestyle='--')
-                ax.add_patch(rect_estribo)
-        
-        # Configurar gráfico
-        ax.set_xlim(-0.5, largo + 0.5)
-        ax.set_ylim(-0.5, alto + 0.5)
-        ax.set_aspect('equal')
-        ax.set_title(f'Viga de {b}×{d} cm - L = {L} m\nAcero: {As:.1f} cm² - Estribos: φ3/8"@{s_estribos:.1f}cm', fontsize=12, fontweight='bold')
-        ax.set_xlabel('Longitud (m)')
-        ax.set_ylabel('Altura (m)')
-        ax.grid(True, alpha=0.3)
-        
-        # Agregar leyenda
-        handles, labels = ax.get_legend_handles_labels()
-        by_label = dict(zip(labels, handles))
-        ax.legend(by_label.values(), by_label.keys(), loc='upper right')
-        
-        # Agregar anotaciones
-        ax.text(largo/2, alto/2, f'f\'c = {fc} kg/cm²\nfy = {fy} kg/cm²', 
-                ha='center', va='center', bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7))
-        
-        plt.tight_layout()
-        return fig
-        
-    except Exception as e:
-        # No mostrar error en st.error para evitar problemas en la interfaz
-        print(f"Error dibujando viga: {str(e)}")
-        return None
-
-def dibujar_columna(lado, Ast, fc, fy):
-    """
-    Dibuja una columna con sus dimensiones y refuerzo
-    """
-    if not MATPLOTLIB_AVAILABLE:
-        return None
-        
-    try:
-        if plt is None or Rectangle is None:
-            return None
-            
-        fig, ax = plt.subplots(figsize=(8, 8))
-        
-        # Escala para visualización
-        escala = 100  # 1 unidad = 1 cm
-        
-        # Dimensiones de la columna
-        ancho = lado / escala
-        alto = lado / escala
-        
-        # Dibujar columna
-        rect_columna = Rectangle((0, 0), ancho, alto, linewidth=2, edgecolor='black', facecolor='lightgray', alpha=0.7)
-        ax.add_patch(rect_columna)
-        
-        # Dibujar acero longitudinal (simplificado como círculos)
-        num_barras = max(4, int(Ast / 2.85))  # Mínimo 4 barras
-        espaciado = ancho / 3
-        
-        # Posiciones de las barras
-        posiciones = [
-            (espaciado, alto - espaciado),  # Esquina superior derecha
-            (ancho - espaciado, alto - espaciado),  # Esquina superior izquierda
-            (espaciado, espaciado),  # Esquina inferior derecha
-            (ancho - espaciado, espaciado),  # Esquina inferior izquierda
-        ]
-        
-        # Agregar barras adicionales si es necesario
-        if num_barras > 4:
-            for i in range(num_barras - 4):
-                x = espaciado + (i % 2) * espaciado
-                y = espaciado + (i // 2) * espaciado
-                posiciones.append((x, y))
-        
-        # Dibujar barras
-        for i, (x, y) in enumerate(posiciones[:num_barras]):
-            circulo = plt.Circle((x, y), 0.02, color='red', label='Acero Longitudinal' if i == 0 else "")
-            ax.add_patch(circulo)
-        
-        # Dibujar estribos (simplificado)
-        rect_estribo = Rectangle((0.05, 0.05), ancho - 0.1, alto - 0.1, 
-                               linewidth=1, edgecolor='blue', facecolor='none', linestyle='--')
-        ax.add_patch(rect_estribo)
-        
-        # Configurar gráfico
-        ax.set_xlim(-0.1, ancho + 0.1)
-        ax.set_ylim(-0.1, alto + 0.1)
-        ax.set_aspect('equal')
-        ax.set_title(f'Columna {lado}×{lado} cm\nAcero: {Ast:.1f} cm²', fontsize=12, fontweight='bold')
-        ax.set_xlabel('Ancho (m)')
-        ax.set_ylabel('Alto (m)')
-        ax.grid(True, alpha=0.3)
-        
-        # Agregar leyenda
-        handles, labels = ax.get_legend_handles_labels()
-        by_label = dict(zip(labels, handles))
-        ax.legend(by_label.values(), by_label.keys(), loc='upper right')
-        
-        # Agregar anotaciones
-        ax.text(ancho/2, alto/2, f'f\'c = {fc} kg/cm²\nfy = {fy} kg/cm²\nρ = {Ast/(lado*lado)*100:.1f}%', 
-                ha='center', va='center', bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7))
-        
-        plt.tight_layout()
-        return fig
-        
-    except Exception as e:
-        # No mostrar error en st.error para evitar problemas en la interfaz
-        print(f"Error dibujando columna: {str(e)}")
-        return None
-
-def dibujar_zapata(lado, d, fc, fy):
-    """
-    Dibuja una zapata con sus dimensiones
-    """
-    if not MATPLOTLIB_AVAILABLE:
-        return None
-        
-    try:
-        if plt is None or Rectangle is None:
-            return None
-            
-        fig, ax = plt.subplots(figsize=(10, 8))
-        
-        # Escala para visualización
-        escala = 100  # 1 unidad = 1 cm
-        
-        # Dimensiones de la zapata
-        ancho = lado / escala
-        alto = lado / escala
-        peralte = d / escala
-        
-        # Dibujar zapata
-        rect_zapata = Rectangle((0, 0), ancho, alto, linewidth=2, edgecolor='black', facecolor='sandybrown', alpha=0.7)
-        ax.add_patch(rect_zapata)
-        
-        # Dibujar columna (simplificado)
-        lado_columna = 0.25  # 25 cm
-        x_col = (ancho - lado_columna) / 2
-        y_col = (alto - lado_columna) / 2
-        rect_columna = Rectangle((x_col, y_col), lado_columna, lado_columna, 
-                               linewidth=2, edgecolor='red', facecolor='red', alpha=0.5)
-        ax.add_patch(rect_columna)
-        
-        # Dibujar refuerzo (simplificado como líneas)
-        espaciado_refuerzo = 0.2
-        for i in range(int(ancho / espaciado_refuerzo)):
-            x = espaciado_refuerzo * i
-            ax.plot([x, x], [0.05, alto - 0.05], 'blue', linewidth=2, alpha=0.7)
-        
-        for i in range(int(alto / espaciado_refuerzo)):
-            y = espaciado_refuerzo * i
-            ax.plot([0.05, ancho - 0.05], [y, y], 'blue', linewidth=2, alpha=0.7)
-        
-        # Configurar gráfico
-        ax.set_xlim(-0.1, ancho + 0.1)
-        ax.set_ylim(-0.1, alto + 0.1)
-        ax.set_aspect('equal')
-        ax.set_title(f'Zapata {lado}×{lado} cm - Peralte: {d} cm', fontsize=12, fontweight='bold')
-        ax.set_xlabel('Ancho (m)')
-        ax.set_ylabel('Largo (m)')
-        ax.grid(True, alpha=0.3)
-        
-        # Agregar anotaciones
-        ax.text(ancho/2, alto/2, f'f\'c = {fc} kg/cm²\nfy = {fy} kg/cm²\nPeralte = {d} cm', 
-                ha='center', va='center', bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7))
-        
-        # Agregar leyenda
-        ax.text(0.02, alto - 0.1, 'Zapata', bbox=dict(boxstyle="round,pad=0.3", facecolor="sandybrown", alpha=0.7))
-        ax.text(x_col + lado_columna/2, y_col + lado_columna/2, 'Columna', 
-                ha='center', va='center', color='white', fontweight='bold')
+    # Panel especial para administrador
+    if permisos.puede("cambiar_plan"):
+        st.sidebar.markdown("---")
+        st.sidebar.subheader("👨‍💼 Panel de Administrador")
+        st.sidebar.info("Acceso directo a todos los planes")
         
-        plt.tight_layout()
-        return fig
+        col1, col2, col3 = st.sidebar.columns(3)
+        with col1:
+            if st.button("🆓 Gratuito", key="sidebar_free"):
+                cambiar_plan_sesion("gratuito")
+                st.success("✅ Plan gratuito activado")
+                st.rerun()
         
-    except Exception as e:
-        # No mostrar error en st.error para evitar problemas en la interfaz
-        print(f"Error dibujando zapata: {str(e)}")
-        return None
-
-# =====================
-# FUNCIONES DE CÁLCULO
-# =====================
-def calcular_propiedades_concreto(fc):
-    Ec = 15000 * sqrt(fc)
-    ecu = 0.003
-    fr = 2 * sqrt(fc)
-    if fc <= 280:
-        beta1 = 0.85
-    else:
-        beta1 = 0.85 - 0.05 * ((fc - 280) / 70)
-        beta1 = max(beta1, 0.65)
-    return {'Ec': Ec, 'ecu': ecu, 'fr': fr, 'beta1': beta1}
-
-def calcular_propiedades_acero(fy):
-    Es = 2000000
-    ey = fy / Es
-    return {'Es': Es, 'ey': ey}
-
-def calcular_predimensionamiento(L_viga, num_pisos, num_vanos, CM, CV, fc, fy):
-    """
-    Calcula el predimensionamiento según ACI 318 y E.060
-    """
-    # Espesor de losa (L/25 a L/30 según E.060)
-    h_losa = max(L_viga / 25, 0.17)
-    
-    # Peralte efectivo de viga (L/12 a L/15 según ACI 318)
-    d_viga = L_viga * 100 / 12  # L/12 más conservador
-    
-    # Ancho de viga (mínimo 25 cm según E.060)
-    b_viga = max(0.3 * d_viga, 25)
-    
-    # Carga por columna (área tributaria)
-    area_tributaria = (L_viga * num_vanos)**2  # m²
-    
-    # Carga de servicio por columna
-    P_servicio = num_pisos * (CM + 0.25*CV) * area_tributaria * 1000  # kg
-    
-    # Carga mayorada por columna
-    P_mayorada = num_pisos * (1.2*CM + 1.6*CV) * area_tributaria * 1000  # kg
-    
-    # Área de columna por servicio (φ = 0.65, fc' efectivo = 0.85*fc)
-    A_col_servicio = P_servicio / (0.65 * 0.85 * fc)
-    
-    # Área de columna por resistencia
-    A_col_resistencia = P_mayorada / (0.65 * 0.85 * fc)
-    
-    # Usar el mayor
-    A_columna = max(A_col_servicio, A_col_resistencia)
-    lado_columna = sqrt(A_columna)
-    
-    return {
-        'h_losa': h_losa, 
-        'd_viga': d_viga, 
-        'b_viga': b_viga, 
-        'lado_columna': lado_columna, 
-        'A_columna': A_columna
-    }
-
-def calcular_diseno_flexion(fc, fy, b, d, Mu):
-    """
-    Calcula el diseño por flexión según ACI 318-2025
-    """
-    # Calcular β1
-    if fc <= 280:
-        beta1 = 0.85
-    else:
-        beta1 = 0.85 - 0.05 * ((fc - 280) / 70)
-        beta1 = max(beta1, 0.65)
-    
-    # Cuantía balanceada
-    rho_b = 0.85 * beta1 * (fc / fy) * (6000 / (6000 + fy))
-    
-    # Cuantía mínima
-    rho_min = max(0.8 * sqrt(fc) / fy, 14 / fy)
-    
-    # Cuantía máxima
-    rho_max = 0.75 * rho_b
-    
-    # Asumir cuantía inicial (entre mínima y máxima)
-    rho = (rho_min + rho_max) / 2
-    
-    # Calcular área de acero
-    As = rho * b * d
-    
-    # Calcular profundidad del bloque equivalente
-    a = As * fy / (0.85 * fc * b)
-    
-    # Calcular momento resistente
-    Mn = As * fy * (d - a/2)
-    phi = 0.9
-    phiMn = phi * Mn
-    
-    return {
-        'beta1': beta1,
-        'rho_b': rho_b,
-        'rho_min': rho_min,
-        'rho_max': rho_max,
-        'rho': rho,
-        'As': As,
-        'a': a,
-        'Mn': Mn,
-        'phiMn': phiMn,
-        'verificacion': phiMn >= Mu
-    }
-
-def calcular_diseno_cortante(fc, fy, bw, d, Vu):
-    """
-    Calcula el diseño por cortante según ACI 318-2025
-    """
-    # Resistencia del concreto
-    Vc = 0.53 * sqrt(fc) * bw * d
-    
-    # Factor phi para cortante
-    phi = 0.75
-    
-    # Verificar si se necesita refuerzo
-    if Vu <= phi * Vc:
-        Vs_requerido = 0
-        Av_s_requerido = 0
-        s_max = d/2
-    else:
-        Vs_requerido = (Vu / phi) - Vc
-        # Calcular área de estribos requerida (asumiendo estribos #3)
-        Av = 0.71  # cm² para estribo #3
-        s_requerido = Av * fy * d / Vs_requerido
-        s_max = min(d/2, 60)  # cm
+        with col2:
+            if st.button("⭐ Premium", key="sidebar_premium"):
+                cambiar_plan_sesion("premium")
+                st.success("✅ Plan premium activado")
+                st.rerun()
         
-        if s_requerido > s_max:
-            # Usar estribos más grandes o más separados
-            Av_s_requerido = Vs_requerido / (fy * d)
-        else:
-            Av_s_requerido = Av / s_requerido
-    
-    return {
-        'Vc': Vc,
-        'Vs_requerido': Vs_requerido,
-        'Av_s_requerido': Av_s_requerido,
-        's_max': s_max,
-        'phi': phi,
-        'verificacion': Vu <= phi * (Vc + Vs_requerido) if Vs_requerido > 0 else Vu <= phi * Vc
-    }
-
-def calcular_diseno_columna(fc, fy, Ag, Ast, Pu):
-    """
-    Calcula el diseño de columna según ACI 318-2025
-    """
-    # Resistencia nominal (ACI 318-19 Sección 22.4.2.1)
-    Pn = 0.85 * fc * (Ag - Ast) + fy * Ast
-    
-    # Factor phi para columnas con estribos (ACI 318-19 Sección 21.2.1)
-    phi = 0.65
-    
-    # Resistencia de diseño
-    phiPn = phi * Pn
-    
-    # Verificación de cuantías (ACI 318-19 Sección 10.6.1.1)
-    rho = Ast / Ag
-    rho_min = 0.01  # 1% mínimo
-    rho_max = 0.06  # 6% máximo
-    
-    return {
-        'Pn': Pn,
-        'phiPn': phiPn,
-        'phi': phi,
-        'rho': rho,
-        'rho_min': rho_min,
-        'rho_max': rho_max,
-        'verificacion': Pu <= phiPn,
-        'verificacion_cuantia': rho_min <= rho <= rho_max
-    }
-
-def calcular_analisis_sismico(zona_sismica, tipo_suelo, factor_importancia, peso_total):
-    """
-    Calcula análisis sísmico según E.030 con parámetros específicos del caso Ayacucho
-    """
-    # Factores según zona sísmica (E.030)
-    factores_zona = {
-        "Z1": 0.10,
-        "Z2": 0.15, 
-        "Z3": 0.25,
-        "Z4": 0.35
-    }
-    
-    # Factores según tipo de suelo (E.030 Tabla 2)
-    factores_suelo = {
-        "S0": 0.8,
-        "S1": 1.0,
-        "S2": 1.15,
-        "S3": 1.20,
-        "S4": 1.4
-    }
-    
-    Z = factores_zona.get(zona_sismica, 0.25)
-    S = factores_suelo.get(tipo_suelo, 1.0)
-    U = factor_importancia
-    
-    # Coeficiente sísmico según E.030
-    # Para estructuras regulares con T < TP, C = 2.5
-    C = 2.5
-    
-    # Factor de reducción según sistema estructural
-    # Pórticos: R = 8, Muros: R = 6
-    # Para el caso mixto (pórticos + muros), usar R = 7
-    R = 7.0
-    
-    # Cortante basal según E.030
-    V = (Z * U * C * S / R) * peso_total * 1000  # Convertir a kg
-    
-    # Cálculo de cortantes por dirección (según el caso)
-    Vx = (Z * U * C * S / 8) * peso_total * 1000  # Pórticos (R=8)
-    Vy = (Z * U * C * S / 6) * peso_total * 1000  # Muros (R=6)
-    
-    return {
-        'Z': Z,
-        'S': S,
-        'U': U,
-        'C': C,
-        'R': R,
-        'V': V,
-        'Vx': Vx,
-        'Vy': Vy,
-        'cortante_basal_ton': V / 1000,
-        'cortante_x_ton': Vx / 1000,
-        'cortante_y_ton': Vy / 1000
-    }
-
-# =====================
-# INTERFAZ STREAMLIT
-# =====================
-
-# Configuración de la página
-st.set_page_config(
-    page_title="CONSORCIO DEJ - Análisis Estructural",
-    page_icon="🏗️",
-    layout="wide"
-)
-
-# Configurar PWA
-def configurar_pwa():
-    """Configurar PWA en Streamlit"""
-    
-    # Agregar meta tags para PWA
-    st.markdown('''
-    <head>
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <meta name="theme-color" content="#FFD700">
-        <meta name="apple-mobile-web-app-capable" content="yes">
-        <meta name="apple-mobile-web-app-status-bar-style" content="default">
-        <link rel="manifest" href="/manifest.json">
-        <link rel="apple-touch-icon" href="/icons/icon-192x192.svg">
-    </head>
-    ''', unsafe_allow_html=True)
+        with col3:
+            if st.button("🏢 Empresarial", key="sidebar_enterprise"):
+                cambiar_plan_sesion("empresarial")
+                st.success("✅ Plan empresarial activado")
+                st.rerun()
     
-    # Script de instalación PWA
-    st.markdown('''
-    <script>
-        // Registrar Service Worker
-        if ('serviceWorker' in navigator) {
-            navigator.serviceWorker.register('/sw.js')
-                .then(registration => console.log('✅ PWA registrada'))
-                .catch(error => console.log('❌ Error PWA:', error));
-        }
-        
-        // Detectar instalación
-        let deferredPrompt;
-        window.addEventListener('beforeinstallprompt', (e) => {
-            e.preventDefault();
-            deferredPrompt = e;
-            
-            // Mostrar botón de instalación
-            const installBtn = document.createElement('button');
-            installBtn.innerHTML = '📱 Instalar App';
-            installBtn.style.cssText = `
-                position: fixed;
-                top: 20px;
-                right: 20px;
-                background: #FFD700;
-                color: #333;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 25px;
-                cursor: pointer;
-                z-index: 1000;
-                font-weight: bold;
-                box-shadow: 0 4px 10px rgba(0,0,0,0.2);
-            `;
-            
-            installBtn.onclick = async () => {
-                if (deferredPrompt) {
-                    deferredPrompt.prompt();
-                    const { outcome } = await deferredPrompt.userChoice;
-                    console.log('Usuario eligió:', outcome);
-                    deferredPrompt = null;
-                    installBtn.remove();
-                }
-            };
-            
-            document.body.appendChild(installBtn);
-        });
-        
-        // Detectar si está instalada
-        window.addEventListener('appinstalled', () => {
-            console.log('🎉 PWA instalada correctamente');
-        });
-    </script>
-    ''', unsafe_allow_html=True)
-
-# Configurar PWA al inicio
-configurar_pwa()
-
-# Verificar dependencias y mostrar warnings
-warnings = verificar_dependencias()
-for warning in warnings:
-    st.warning(warning)
-
-# Header con fondo amarillo
-st.markdown("""
-<div style="text-align: center; padding: 20px; background-color: #FFD700; color: #2F2F2F; border-radius: 10px; margin-bottom: 20px; border: 2px solid #FFA500;">
-    <h1>🏗️ CONSORCIO DEJ</h1>
-    <p style="font-size: 18px; font-weight: bold;">Ingeniería y Construcción</p>
-    <p style="font-size: 14px;">Software de Análisis Estructural Profesional</p>
-</div>
-""", unsafe_allow_html=True)
+    # Datos del proyecto compartidos con las páginas
+    st.session_state['datos_proyecto'] = mostrar_datos_proyecto()
 
-# Sistema de autenticación y pagos
-def show_pricing_page():
-    """Mostrar página de precios y planes"""
-    st.title("💰 Planes y Precios - CONSORCIO DEJ")
-    
-    # Verificar si es administrador
-    is_admin = st.session_state.get('user') == 'admin'
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.subheader("🆓 Plan Gratuito")
-        st.write("**$0/mes**")
-        st.write("✅ Cálculos básicos")
-        st.write("✅ Análisis simple")
-        st.write("✅ Reportes básicos")
-        st.write("❌ Sin análisis completo")
-        st.write("❌ Sin reportes PDF")
-        st.write("❌ Sin gráficos avanzados")
-        
-        if st.button("Seleccionar Gratuito", key="free_plan"):
-            if is_admin:
-                st.session_state['plan'] = "gratuito"
-                if 'user_data' in st.session_state:
-                    st.session_state['user_data']['plan'] = "gratuito"
-                st.success("✅ Plan gratuito activado para administrador")
-                st.rerun()
-            else:
-                st.info("Ya tienes acceso al plan gratuito")
-    
-    with col2:
-        st.subheader("⭐ Plan Premium")
-        st.write("**$29.99/mes**")
-        st.write("✅ Todo del plan gratuito")
-        st.write("✅ Análisis completo")
-        st.write("✅ Reportes PDF")
-        st.write("✅ Gráficos avanzados")
-        st.write("✅ Fórmulas de diseño")
-        st.write("❌ Sin soporte empresarial")
-        
-        if st.button("Actualizar a Premium", key="premium_plan"):
-            if is_admin:
-                # Acceso directo para administrador
-                st.session_state['plan'] = "premium"
-                if 'user_data' in st.session_state:
-                    st.session_state['user_data']['plan'] = "premium"
-                st.success("✅ Plan Premium activado para administrador")
-                st.rerun()
-            elif PAYMENT_SYSTEM_AVAILABLE:
-                show_payment_form("premium")
-            else:
-                st.info("Sistema de pagos no disponible en modo demo")
-    
-    with col3:
-        st.subheader("🏢 Plan Empresarial")
-        st.write("**$99.99/mes**")
-        st.write("✅ Todo del plan premium")
-        st.write("✅ Soporte prioritario")
-        st.write("✅ Múltiples proyectos")
-        st.write("✅ Reportes personalizados")
-        st.write("✅ Capacitación incluida")
-        st.write("✅ API de integración")
-        
-        if st.button("Actualizar a Empresarial", key="business_plan"):
-            if is_admin:
-                # Acceso directo para administrador
-                st.session_state['plan'] = "empresarial"
-                if 'user_data' in st.session_state:
-                    st.session_state['user_data']['plan'] = "empresarial"
-                st.success("✅ Plan Empresarial activado para administrador")
-                st.rerun()
-            elif PAYMENT_SYSTEM_AVAILABLE:
-                show_payment_form("empresarial")
-            else:
-                st.info("Sistema de pagos no disponible en modo demo")
-
-def show_payment_form(plan):
-    """Mostrar formulario de pago"""
-    st.subheader(f"💳 Pago - Plan {plan.title()}")
-    
-    # Verificar si hay usuario logueado
-    if 'user' not in st.session_state:
-        st.warning("⚠️ Debes iniciar sesión o registrarte primero")
-        st.info("📝 Ve a la pestaña 'Registrarse' para crear una cuenta")
-        return
-    
-    payment_method = st.selectbox(
-        "Método de pago",
-        ["yape", "plin", "paypal", "transferencia", "efectivo"],
-        format_func=lambda x: {
-            "yape": "📱 Yape (Más Rápido)",
-            "plin": "📱 PLIN",
-            "paypal": "💳 PayPal",
-            "transferencia": "🏦 Transferencia Bancaria", 
-            "efectivo": "💵 Pago en Efectivo"
-        }[x]
-    )
-    
-    if st.button("Procesar Pago", type="primary"):
-        if PAYMENT_SYSTEM_AVAILABLE:
-            try:
-                result = payment_system.upgrade_plan(
-                    st.session_state['user'], 
-                    plan
-                )
-                
-                if result["success"]:
-                    st.success("✅ Pago procesado correctamente")
-                    st.info("📋 Instrucciones de pago:")
-                    st.text(result["instructions"])
-                    
-                    # Mostrar información adicional
-                    st.info("📱 Envía el comprobante de pago a WhatsApp: +51 999 888 777")
-                    
-                    # Verificar si fue confirmado automáticamente
-                    if result.get("auto_confirmed"):
-                        st.success("🎉 ¡Plan activado inmediatamente!")
-                        st.info("✅ Pago confirmado automáticamente")
-                        
-                        # Actualizar plan en session state
-                        st.session_state['plan'] = plan
-                        if 'user_data' in st.session_state:
-                            st.session_state['user_data']['plan'] = plan
-                        
-                        # Botón para continuar con acceso completo
-                        if st.button("🚀 Continuar con Acceso Completo", key="continue_full_access"):
-                            st.rerun()
-                    else:
-                        st.info("⏰ Activación en 2 horas máximo")
-                        st.info("🔄 Recarga la página después de 2 horas")
-                else:
-                    st.error(f"❌ Error: {result['message']}")
-            except Exception as e:
-                st.error(f"❌ Error en el sistema de pagos: {str(e)}")
-                st.info("🔄 Intenta nuevamente o contacta soporte")
-        else:
-            st.error("❌ Sistema de pagos no disponible")
-            st.info("🔧 Contacta al administrador para activar el sistema")
-
-def show_auth_page():
-    st.title("🏗️ CONSORCIO DEJ - Análisis Estructural")
-    
-    # Pestañas para login/registro
-    tab1, tab2, tab3 = st.tabs(["🔐 Iniciar Sesión", "📝 Registrarse", "💰 Planes y Precios"])
-    
-    with tab1:
-        st.subheader("Iniciar Sesión")
-        with st.form("login_form"):
-            username = st.text_input("Usuario")
-            password = st.text_input("Contraseña", type="password")
-            submitted = st.form_submit_button("Entrar")
-            
-            if submitted:
-                # Verificar credenciales especiales primero
-                if username == "admin" and password == "admin123":
-                    st.session_state['logged_in'] = True
-                    st.session_state['user_data'] = {"username": "admin", "plan": "empresarial", "name": "Administrador"}
-                    st.session_state['user'] = "admin"
-                    st.session_state['plan'] = "empresarial"
-                    st.success("¡Bienvenido Administrador!")
-                    st.rerun()
-                elif username == "demo" and password == "demo":
-                    st.session_state['logged_in'] = True
-                    st.session_state['user_data'] = {"username": "demo", "plan": "gratuito", "name": "Usuario Demo"}
-                    st.session_state['user'] = "demo"
-                    st.session_state['plan'] = "gratuito"
-                    st.success("¡Bienvenido al modo demo!")
-                    st.rerun()
-                elif not PAYMENT_SYSTEM_AVAILABLE:
-                    st.error("Credenciales disponibles: admin/admin123 o demo/demo")
-                else:
-                    # Sistema real
-                    result = payment_system.login_user(username, password)
-                    if result["success"]:
-                        st.session_state['logged_in'] = True
-                        st.session_state['user_data'] = result["user"]
-                        st.session_state['user'] = result["user"]["email"]
-                        st.session_state['plan'] = result["user"]["plan"]
-                        st.success(f"¡Bienvenido, {result['user']['name']}!")
-                        st.rerun()
-                    else:
-                        st.error(result["message"])
-    
-    with tab2:
-        st.subheader("Crear Cuenta")
-        with st.form("register_form"):
-            new_username = st.text_input("Usuario", placeholder="Tu nombre de usuario")
-            new_email = st.text_input("Email", placeholder="tuemail@gmail.com")
-            new_password = st.text_input("Contraseña", type="password", placeholder="Mínimo 6 caracteres")
-            confirm_password = st.text_input("Confirmar Contraseña", type="password")
-            submitted = st.form_submit_button("📝 Registrarse", type="primary")
-            
-            if submitted:
-                if not new_username or not new_email or not new_password:
-                    st.error("❌ Todos los campos son obligatorios")
-                elif new_password != confirm_password:
-                    st.error("❌ Las contraseñas no coinciden")
-                elif len(new_password) < 6:
-                    st.error("❌ La contraseña debe tener al menos 6 caracteres")
-                else:
-                    if not PAYMENT_SYSTEM_AVAILABLE:
-                        st.success("✅ Modo demo: Registro simulado exitoso")
-                        st.info("🔑 Credenciales: demo / demo")
-                    else:
-                        result = payment_system.register_user(new_email, new_password, new_username)
-                        if result["success"]:
-                            st.success("✅ " + result["message"])
-                            st.info("🔐 Ahora puedes iniciar sesión y actualizar tu plan")
-                        else:
-                            st.error("❌ " + result["message"])
-    
-    with tab3:
-        show_pricing_page()
-
-# Verificar estado de autenticación
-if 'logged_in' not in st.session_state:
-    st.session_state['logged_in'] = False
-
-# Definir opción por defecto
-opcion = "🏗️ Cálculo Básico"
-
-if not st.session_state['logged_in']:
-    show_auth_page()
-    st.stop()
-else:
-    # Mostrar información del usuario
-    user_data = st.session_state.get('user_data', {})
-    plan = user_data.get('plan', 'gratuito')
-    
-    # Header con información del plan
-    if plan == "gratuito":
-        st.sidebar.info("🆓 Plan Gratuito")
-    elif plan == "premium":
-        st.sidebar.success("⭐ Plan Premium")
-    else:
-        st.sidebar.success("🏢 Plan Empresarial")
-    
-    st.sidebar.write(f"Usuario: {st.session_state['user']}")
-    st.sidebar.write(f"Plan: {plan}")
-    
-    # Botón para cerrar sesión
-    if st.sidebar.button("🚪 Cerrar Sesión"):
-        st.session_state['logged_in'] = False
-        st.session_state['user_data'] = None
-        st.session_state['user'] = None
-        st.session_state['plan'] = None
-        st.rerun()
-    
-    # Mostrar estado de la PWA
-    def mostrar_estado_pwa():
-        """Mostrar estado de la PWA en el sidebar"""
-        st.sidebar.markdown("---")
-        st.sidebar.subheader("📱 Estado PWA")
-        
-        import os
-        archivos_pwa = ['manifest.json', 'sw.js', 'offline.html']
-        archivos_ok = sum(1 for archivo in archivos_pwa if os.path.exists(archivo))
-        
-        if archivos_ok == len(archivos_pwa):
-            st.sidebar.success("✅ PWA configurada")
-        elif archivos_ok > 0:
-            st.sidebar.info(f"📱 PWA parcialmente configurada ({archivos_ok}/{len(archivos_pwa)} archivos)")
-        else:
-            st.sidebar.info("📱 PWA no configurada (opcional)")
-        
-        # Verificar iconos de manera opcional
-        if os.path.exists('icons'):
-            iconos = len([f for f in os.listdir('icons') if f.endswith('.svg')])
-            if iconos > 0:
-                st.sidebar.info(f"🎨 {iconos} iconos disponibles")
-        else:
-            st.sidebar.info("🎨 Iconos PWA (opcional)")
-    
-    # Mostrar estado PWA
-    mostrar_estado_pwa()
-
-    # Sidebar para navegación
-    st.sidebar.title("📋 Menú Principal")
-    
-    # Mostrar plan actual
-    if st.session_state['plan'] == "gratuito":
-        st.sidebar.info("🆓 Plan Gratuito - Funciones limitadas")
-        st.sidebar.write("Para acceder a todas las funciones, actualiza a Premium")
-        
-        # Información sobre cómo acceder al plan premium
-        st.sidebar.markdown("---")
-        st.sidebar.subheader("🔑 Acceso Premium")
-        st.sidebar.write("**Usuario:** admin")
-        st.sidebar.write("**Contraseña:** admin123")
-        st.sidebar.info("Cierra sesión y vuelve a iniciar con las credenciales admin")
-    else:
-        st.sidebar.success("⭐ Plan Premium - Acceso completo")
-        
-        # Información para administradores
-        st.sidebar.markdown("---")
-        st.sidebar.subheader("👨‍💼 Panel de Administrador")
-        st.sidebar.write("**Usuario actual:** " + st.session_state['user'])
-        st.sidebar.write("**Plan:** Premium")
-        st.sidebar.success("Acceso completo a todas las funciones")
-    
-    opcion = st.sidebar.selectbox("Selecciona una opción", 
-                                 ["🏗️ Cálculo Básico", "📊 Análisis Completo", "📄 Generar Reporte", "📚 Fórmulas de Diseño Estructural", "🏗️ Diseño de Zapatas", "🔧 Diseño de Vigas", "🏢 Diseño de Columnas", "✂️ Ejercicio Básico de Corte", "📈 Gráficos", "ℹ️ Acerca de", "✉️ Contacto"])
-    
-    # Panel especial para administrador
-    is_admin = st.session_state.get('user') == 'admin'
-    if is_admin:
-        st.sidebar.markdown("---")
-        st.sidebar.subheader("👨‍💼 Panel de Administrador")
-        st.sidebar.info("Acceso directo a todos los planes")
-        
-        col1, col2, col3 = st.sidebar.columns(3)
-        with col1:
-            if st.button("🆓 Gratuito", key="sidebar_free"):
-                st.session_state['plan'] = "gratuito"
-                if 'user_data' in st.session_state:
-                    st.session_state['user_data']['plan'] = "gratuito"
-                st.success("✅ Plan gratuito activado")
-                st.rerun()
-        
-        with col2:
-            if st.button("⭐ Premium", key="sidebar_premium"):
-                st.session_state['plan'] = "premium"
-                if 'user_data' in st.session_state:
-                    st.session_state['user_data']['plan'] = "premium"
-                st.success("✅ Plan premium activado")
-                st.rerun()
-        
-        with col3:
-            if st.button("🏢 Empresarial", key="sidebar_enterprise"):
-                st.session_state['plan'] = "empresarial"
-                if 'user_data' in st.session_state:
-                    st.session_state['user_data']['plan'] = "empresarial"
-                st.success("✅ Plan empresarial activado")
-                st.rerun()
-    
-    st.sidebar.markdown("---")
-    st.sidebar.header("📋 Datos del Proyecto - Caso Ayacucho")
-    st.sidebar.info("🏗️ **EDIFICIO DE 3 NIVELES - SERVICIOS PÚBLICOS**")
-    
-    # Datos fijos del caso Ayacucho
-    f_c = st.sidebar.number_input("f'c (kg/cm²)", 175, 700, 210, 10, disabled=True)
-    f_y = st.sidebar.number_input("fy (kg/cm²)", 2800, 6000, 4200, 100, disabled=True)
-    L_viga = st.sidebar.number_input("Luz libre de vigas (m)", 3.0, 15.0, 6.0, 0.5, disabled=True)
-    h_piso = st.sidebar.number_input("Altura de piso (m)", 2.5, 5.0, 3.0, 0.1, disabled=True)
-    num_pisos = st.sidebar.number_input("Número de pisos", 1, 100, 3, 1, disabled=True)
-    num_vanos = st.sidebar.number_input("Número de vanos", 1, 20, 4, 1, disabled=True)
-    CM = st.sidebar.number_input("Carga Muerta (kg/m²)", 100, 2000, 350, 50, disabled=True)
-    CV = st.sidebar.number_input("Carga Viva (kg/m²)", 100, 1000, 250, 50, disabled=True)
-    zona_sismica = st.sidebar.selectbox("Zona Sísmica", ["Z1", "Z2", "Z3", "Z4"], 2, disabled=True)
-    tipo_suelo = st.sidebar.selectbox("Tipo de Suelo", ["S1", "S2", "S3", "S4"], 0, disabled=True)
-    tipo_estructura = st.sidebar.selectbox("Tipo de Sistema Estructural", ["Pórticos", "Muros Estructurales", "Dual"], 2, disabled=True)
-    factor_importancia = st.sidebar.number_input("Factor de Importancia (U)", 1.0, 1.5, 1.0, 0.1, disabled=True)
-    
-    st.sidebar.success("✅ **Datos configurados según análisis presentado**")
-
-    # =====================
-    # MENÚ PRINCIPAL
-    # =====================
-    if opcion == "🏗️ Cálculo Básico":
-        st.title("Cálculo Básico de Análisis Estructural")
-        st.info("Plan gratuito: Cálculos básicos de análisis estructural")
-    
-    # Pestañas para diferentes tipos de cálculos
-    tab1, tab2, tab3 = st.tabs(["📏 Propiedades", "🏗️ Materiales", "⚖️ Cargas"])
-    
-    with tab1:
-        st.subheader("Propiedades del Proyecto")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.write(f"**Resistencia del concreto (f'c):** {f_c} kg/cm²")
-            st.write(f"**Resistencia del acero (fy):** {f_y} kg/cm²")
-            st.write(f"**Luz libre de vigas:** {L_viga} m")
-        with col2:
-            st.write(f"**Altura de piso:** {h_piso} m")
-            st.write(f"**Número de pisos:** {num_pisos}")
-            st.write(f"**Número de vanos:** {num_vanos}")
-    
-    with tab2:
-        st.subheader("Propiedades de los Materiales")
-        col1, col2 = st.columns(2)
-        with col1:
-            props_concreto = calcular_propiedades_concreto(f_c)
-            st.write(f"**Módulo de elasticidad del concreto (Ec):** {props_concreto['Ec']:.0f} kg/cm²")
-            st.write(f"**Deformación última del concreto (εcu):** {props_concreto['ecu']}")
-            st.write(f"**Resistencia a tracción (fr):** {props_concreto['fr']:.1f} kg/cm²")
-        with col2:
-            props_acero = calcular_propiedades_acero(f_y)
-            st.write(f"**Módulo de elasticidad del acero (Es):** {props_acero['Es']:,} kg/cm²")
-            st.write(f"**Deformación de fluencia (εy):** {props_acero['ey']:.4f}")
-            st.write(f"**β1:** {props_concreto['beta1']:.3f}")
-    
-    with tab3:
-        st.subheader("Cargas y Factores de Seguridad")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.write(f"**Carga Muerta:** {CM} kg/m²")
-            st.write(f"**Carga Viva:** {CV} kg/m²")
-            st.write(f"**Zona Sísmica:** {zona_sismica}")
-        with col2:
-            st.write(f"**Tipo de Suelo:** {tipo_suelo}")
-            st.write(f"**Tipo de Estructura:** {tipo_estructura}")
-            st.write(f"**Factor de Importancia:** {factor_importancia}")
-    
-    # Botón para calcular
-    if st.button("🚀 Calcular Análisis Básico", type="primary"):
-        # Cálculos básicos
-        peso_total = float(num_pisos) * float(L_viga) * float(num_vanos) * float(h_piso) * float(f_c) / 1000
-        
-        # Guardar resultados básicos
-        st.session_state['resultados_basicos'] = {
-            'peso_total': peso_total,
-            'f_c': f_c,
-            'f_y': f_y,
-            'L_viga': L_viga,
-            'num_pisos': num_pisos,
-            'CM': CM,
-            'CV': CV,
-            'zona_sismica': zona_sismica,
-            'tipo_suelo': tipo_suelo,
-            'tipo_estructura': tipo_estructura,
-            'Ec': props_concreto['Ec'],
-            'Es': props_acero['Es'],
-            'ecu': props_concreto['ecu'],
-            'fr': props_concreto['fr'],
-            'beta1': props_concreto['beta1'],
-            'ey': props_acero['ey']
-        }
-        
-        st.success("¡Cálculos básicos completados exitosamente!")
-        st.balloons()
-        
-        # MOSTRAR RESULTADOS INMEDIATAMENTE DESPUÉS DEL CÁLCULO
-        st.subheader("📊 Resultados del Cálculo Básico")
-        
-        # Mostrar resultados en columnas
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.metric("Peso Total Estimado", f"{peso_total:.1f} ton")
-            st.metric("Módulo de Elasticidad del Concreto", f"{props_concreto['Ec']:.0f} kg/cm²")
-            st.metric("Módulo de Elasticidad del Acero", f"{props_acero['Es']:,} kg/cm²")
-            st.metric("Resistencia a Tracción", f"{props_concreto['fr']:.1f} kg/cm²")
-        
-        with col2:
-            st.metric("Deformación Última del Concreto", f"{props_concreto['ecu']}")
-            st.metric("Deformación de Fluencia", f"{props_acero['ey']:.4f}")
-            st.metric("β1", f"{props_concreto['beta1']:.3f}")
-            st.metric("Altura Total", f"{float(num_pisos) * float(h_piso):.1f} m")
-        
-        # Análisis de estabilidad
-        st.subheader("🔍 Análisis de Estabilidad")
-        if peso_total < 1000:
-            st.success(f"✅ El peso total es aceptable (FS = {peso_total:.1f} ton < 1000 ton)")
-        else:
-            st.warning(f"⚠️ El peso total es alto (FS = {peso_total:.1f} ton > 1000 ton) - Revisar dimensiones")
-        
-        # Gráfico básico
-        st.subheader("📈 Gráfico de Propiedades")
-        datos = pd.DataFrame({
-            'Propiedad': ['Ec (kg/cm²)', 'Es (kg/cm²)', 'fr (kg/cm²)', 'β1'],
-            'Valor': [props_concreto['Ec']/1000, props_acero['Es']/1000000, props_concreto['fr'], props_concreto['beta1']]
-        })
-        
-        # Gráfico de barras mejorado
-        if PLOTLY_AVAILABLE:
-            fig = px.bar(datos, x='Propiedad', y='Valor', 
-                        title="Propiedades de los Materiales - Plan Gratuito",
-                        color='Propiedad',
-                        color_discrete_map={
-                            'Ec (kg/cm²)': '#2E8B57', 
-                            'Es (kg/cm²)': '#DC143C', 
-                            'fr (kg/cm²)': '#4169E1',
-                            'β1': '#FFD700'
-                        })
-            
-            # Personalizar el gráfico
-            fig.update_layout(
-                xaxis_title="Propiedad",
-                yaxis_title="Valor",
-                showlegend=True,
-                height=400
-            )
-            
-            # Agregar valores en las barras
-            fig.update_traces(texttemplate='%{y:.2f}', textposition='outside')
-            
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            # Gráfico alternativo con matplotlib
-            if MATPLOTLIB_AVAILABLE and plt is not None:
-                fig, ax = plt.subplots(figsize=(10, 6))
-                bars = ax.bar(datos['Propiedad'], datos['Valor'], 
-                             color=['#2E8B57', '#DC143C', '#4169E1', '#FFD700'])
-                ax.set_title("Propiedades de los Materiales - Plan Gratuito")
-                ax.set_xlabel("Propiedad")
-                ax.set_ylabel("Valor")
-                
-                # Agregar valores en las barras
-                for bar in bars:
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                           f'{height:.2f}', ha='center', va='bottom')
-                
-                st.pyplot(fig)
-            else:
-                st.info("📊 Gráfico no disponible - Matplotlib no está instalado")
-                st.write("Para ver gráficos, instale matplotlib: `pip install matplotlib`")
-
-    elif opcion == "📊 Análisis Completo":
-        # Verificar acceso basado en plan del usuario
-        user_plan = st.session_state.get('plan', 'gratuito')
-        user_email = st.session_state.get('user', '')
-        
-        # Verificar si es admin (acceso completo)
-        is_admin = user_email == 'admin' or user_email == 'admin@consorciodej.com'
-        
-        if user_plan == "gratuito" and not is_admin:
-            st.warning("⚠️ Esta función requiere plan premium. Actualiza tu cuenta para acceder a análisis completos.")
-            st.info("Plan gratuito incluye: Cálculos básicos, resultados simples")
-            st.info("Plan premium incluye: Análisis completo, reportes detallados, gráficos avanzados")
-            
-            # Mostrar botón para actualizar plan
-            col1, col2, col3 = st.columns([1, 2, 1])
-            with col2:
-                if st.button("⭐ Actualizar a Premium", type="primary"):
-                    st.session_state['show_pricing'] = True
-                    st.rerun()
-        else:
-            st.title("📊 Análisis Completo de Estructuras")
-            st.success("⭐ Plan Premium: Análisis completo con todas las verificaciones")
-            
-            # Datos de entrada completos - Caso Ayacucho
-            st.markdown("### 🏗️ **CASO PRÁCTICO: EDIFICIO DE 3 NIVELES - AYACUCHO**")
-            st.info("📋 **Análisis presentado en memoria de cálculo para Servicios Públicos**")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("🏗️ Propiedades del Proyecto")
-                st.write(f"**Ubicación:** Ayacucho (Zona Sísmica Z3)")
-                st.write(f"**Tipo de Suelo:** S1 (Roca o suelos muy rígidos)")
-                st.write(f"**Factor de Uso:** U = 1.00 (Servicios Públicos)")
-                st.write(f"**Sistema Estructural:** Dual (Pórticos + Muros)")
-                
-                st.subheader("📏 Dimensiones")
-                st.write(f"**Número de pisos:** {num_pisos}")
-                st.write(f"**Número de vanos:** {num_vanos}")
-                st.write(f"**Luz libre de vigas:** {L_viga} m")
-                st.write(f"**Altura de piso:** {h_piso} m")
-                
-            with col2:
-                st.subheader("⚖️ Cargas y Materiales")
-                st.write(f"**Carga Muerta:** {CM} kg/m²")
-                st.write(f"**Carga Viva:** {CV} kg/m²")
-                st.write(f"**f'c:** {f_c} kg/cm²")
-                st.write(f"**fy:** {f_y} kg/cm²")
-                
-                st.subheader("📊 Resultados Esperados")
-                st.success("**Según análisis presentado:**")
-                st.write("✅ Peso total: 550.5 ton")
-                st.write("✅ Cortante X (Pórticos): 72.2 ton")
-                st.write("✅ Cortante Y (Muros): 96.3 ton")
-                st.write("✅ Cortante promedio: 84.3 ton")
-            
-            # Botón para ejecutar análisis completo
-            if st.button("🔬 Ejecutar Análisis Completo", type="primary"):
-                # Cálculos completos
-                props_concreto = calcular_propiedades_concreto(f_c)
-                props_acero = calcular_propiedades_acero(f_y)
-                predim = calcular_predimensionamiento(L_viga, num_pisos, num_vanos, CM, CV, f_c, f_y)
-                
-                # Calcular peso total (más preciso)
-                # Peso por m² = (CM + CV) * área * num_pisos
-                area_total = float(L_viga) * float(num_vanos) * float(L_viga) * float(num_vanos)  # m²
-                peso_por_m2 = float(CM) + float(CV)  # kg/m²
-                peso_total = float(num_pisos) * area_total * peso_por_m2 / 1000  # ton
-                
-                # Para el caso específico de Ayacucho (ajuste según análisis presentado)
-                if zona_sismica == "Z3" and tipo_suelo == "S1":
-                    # Ajustar peso total para coincidir con el análisis presentado
-                    peso_total_ajustado = 550.5  # ton (según análisis presentado)
-                    # Calcular factor de ajuste
-                    factor_ajuste = peso_total_ajustado / peso_total if peso_total > 0 else 1.0
-                    # Ajustar cargas para que coincidan
-                    CM_ajustado = CM * factor_ajuste
-                    CV_ajustado = CV * factor_ajuste
-                    peso_total = peso_total_ajustado
-                else:
-                    CM_ajustado = CM
-                    CV_ajustado = CV
-                
-                # CÁLCULOS DE DISEÑO ESTRUCTURAL SEGÚN ACI 318-2025
-                
-                # 1. Diseño por Flexión
-                # Momento último estimado para viga típica
-                Mu_estimado = (1.2 * CM + 1.6 * CV) * L_viga**2 / 8 * 1000  # kg·m
-                diseno_flexion = calcular_diseno_flexion(f_c, f_y, predim['b_viga'], predim['d_viga'], Mu_estimado)
-                
-                # 2. Diseño por Cortante
-                # Cortante último estimado
-                Vu_estimado = (1.2 * CM + 1.6 * CV) * L_viga / 2 * 1000  # kg
-                diseno_cortante = calcular_diseno_cortante(f_c, f_y, predim['b_viga'], predim['d_viga'], Vu_estimado)
-                
-                # 3. Diseño de Columna
-                # Carga axial última estimada
-                Pu_estimado = peso_total * 1000 / num_vanos  # kg por columna
-                Ag_columna = predim['lado_columna']**2  # cm²
-                Ast_columna = 0.01 * Ag_columna  # 1% de acero inicial
-                diseno_columna = calcular_diseno_columna(f_c, f_y, Ag_columna, Ast_columna, Pu_estimado)
-                
-                # 4. Análisis Sísmico
-                analisis_sismico = calcular_analisis_sismico(zona_sismica, tipo_suelo, factor_importancia, peso_total)
-                
-                # Verificación específica para caso Ayacucho
-                if zona_sismica == "Z3" and tipo_suelo == "S1":
-                    # Valores esperados según análisis presentado
-                    peso_esperado = 550.5  # ton
-                    cortante_x_esperado = 72.2  # ton
-                    cortante_y_esperado = 96.3  # ton
-                    
-                    # Verificar coincidencia
-                    coincidencia_peso = abs(peso_total - peso_esperado) / peso_esperado < 0.05
-                    coincidencia_vx = abs(analisis_sismico['cortante_x_ton'] - cortante_x_esperado) / cortante_x_esperado < 0.10
-                    coincidencia_vy = abs(analisis_sismico['cortante_y_ton'] - cortante_y_esperado) / cortante_y_esperado < 0.10
-                    
-                    # Agregar verificación a resultados
-                    analisis_sismico['caso_ayacucho'] = {
-                        'peso_esperado': peso_esperado,
-                        'cortante_x_esperado': cortante_x_esperado,
-                        'cortante_y_esperado': cortante_y_esperado,
-                        'coincidencia_peso': coincidencia_peso,
-                        'coincidencia_vx': coincidencia_vx,
-                        'coincidencia_vy': coincidencia_vy
-                    }
-                
-                # Guardar resultados completos
-                resultados_completos = {
-                    'peso_total': peso_total,
-                    'Ec': props_concreto['Ec'],
-                    'Es': props_acero['Es'],
-                    'h_losa': predim['h_losa'],
-                    'b_viga': predim['b_viga'],
-                    'd_viga': predim['d_viga'],
-                    'lado_columna': predim['lado_columna'],
-                    'ecu': props_concreto['ecu'],
-                    'fr': props_concreto['fr'],
-                    'beta1': props_concreto['beta1'],
-                    'ey': props_acero['ey'],
-                    # Resultados de diseño estructural
-                    'diseno_flexion': diseno_flexion,
-                    'diseno_cortante': diseno_cortante,
-                    'diseno_columna': diseno_columna,
-                    'analisis_sismico': analisis_sismico,
-                    'Mu_estimado': Mu_estimado,
-                    'Vu_estimado': Vu_estimado,
-                    'Pu_estimado': Pu_estimado
-                }
-                
-                # Guardar datos de entrada
-                datos_entrada = {
-                    'f_c': f_c,
-                    'f_y': f_y,
-                    'L_viga': L_viga,
-                    'num_pisos': num_pisos,
-                    'CM': CM,
-                    'CV': CV,
-                    'zona_sismica': zona_sismica,
-                    'tipo_suelo': tipo_suelo,
-                    'tipo_estructura': tipo_estructura
-                }
-                
-                # Guardar en session state
-                st.session_state['resultados_completos'] = resultados_completos
-                st.session_state['datos_entrada'] = datos_entrada
-                
-                st.success("¡Análisis completo ejecutado exitosamente!")
-                st.balloons()
-                
-                # MOSTRAR RESULTADOS COMPLETOS INMEDIATAMENTE
-                st.subheader("📊 Resultados del Análisis Completo - Caso Ayacucho")
-                
-                # Sección especial para caso Ayacucho
-                if zona_sismica == "Z3" and tipo_suelo == "S1":
-                    st.markdown("### 🎯 **VERIFICACIÓN CASO AYACUCHO**")
-                    st.success("🏗️ **EDIFICIO DE 3 NIVELES - SERVICIOS PÚBLICOS**")
-                    
-                    # Comparación directa con análisis presentado
-                    col1, col2, col3, col4 = st.columns(4)
-                    with col1:
-                        st.metric("📊 Peso Total", f"{peso_total:.1f} ton", 
-                                delta=f"550.5 ton esperado", delta_color="normal")
-                    with col2:
-                        st.metric("🌍 Cortante X", f"{analisis_sismico['cortante_x_ton']:.1f} ton", 
-                                delta=f"72.2 ton esperado", delta_color="normal")
-                    with col3:
-                        st.metric("🏢 Cortante Y", f"{analisis_sismico['cortante_y_ton']:.1f} ton", 
-                                delta=f"96.3 ton esperado", delta_color="normal")
-                    with col4:
-                        st.metric("⚖️ Cortante Promedio", f"{analisis_sismico['cortante_basal_ton']:.1f} ton", 
-                                delta=f"84.3 ton esperado", delta_color="normal")
-                    
-                    # Estado de verificación
-                    if 'caso_ayacucho' in analisis_sismico:
-                        if (analisis_sismico['caso_ayacucho']['coincidencia_peso'] and 
-                            analisis_sismico['caso_ayacucho']['coincidencia_vx'] and 
-                            analisis_sismico['caso_ayacucho']['coincidencia_vy']):
-                            st.success("✅ **VERIFICACIÓN EXITOSA** - Los resultados coinciden con el análisis presentado")
-                        else:
-                            st.warning("⚠️ **VERIFICACIÓN PARCIAL** - Algunos valores difieren del análisis presentado")
-                    
-                    st.markdown("---")
-                
-                # Mostrar resultados en columnas
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.metric("Peso Total Estimado", f"{peso_total:.1f} ton")
-                    st.metric("Módulo de Elasticidad del Concreto", f"{props_concreto['Ec']:.0f} kg/cm²")
-                    st.metric("Módulo de Elasticidad del Acero", f"{props_acero['Es']:,} kg/cm²")
-                    st.metric("Deformación Última del Concreto", f"{props_concreto['ecu']}")
-                    st.metric("Resistencia a Tracción", f"{props_concreto['fr']:.1f} kg/cm²")
-                
-                with col2:
-                    st.metric("β1", f"{props_concreto['beta1']:.3f}")
-                    st.metric("Deformación de Fluencia", f"{props_acero['ey']:.4f}")
-                    st.metric("Espesor de Losa", f"{predim['h_losa']*100:.0f} cm")
-                    st.metric("Dimensiones de Viga", f"{predim['b_viga']:.0f}×{predim['d_viga']:.0f} cm")
-                    st.metric("Dimensiones de Columna", f"{predim['lado_columna']:.0f}×{predim['lado_columna']:.0f} cm")
-                
-                # Análisis de estabilidad
-                st.subheader("🔍 Análisis de Estabilidad")
-                
-                # Verificaciones básicas
-                if peso_total < 1000:
-                    st.success(f"✅ Peso total aceptable: {peso_total:.1f} ton")
-                else:
-                    st.warning(f"⚠️ Peso total alto: {peso_total:.1f} ton - Revisar dimensiones")
-                
-                if props_concreto['Ec'] > 200000:
-                    st.success(f"✅ Módulo de elasticidad del concreto adecuado: {props_concreto['Ec']:.0f} kg/cm²")
-                else:
-                    st.info(f"ℹ️ Módulo de elasticidad del concreto: {props_concreto['Ec']:.0f} kg/cm²")
-                
-                # RESULTADOS DE DISEÑO ESTRUCTURAL SEGÚN ACI 318-2025
-                st.subheader("🏗️ Resultados de Diseño Estructural (ACI 318-2025)")
-                
-                # Pestañas para diferentes tipos de diseño
-                tab1, tab2, tab3, tab4 = st.tabs(["📐 Flexión", "🔧 Cortante", "🏢 Columnas", "🌍 Sísmico"])
-                
-                with tab1:
-                    st.markdown("### 📐 Diseño por Flexión")
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Momento Último (Mu)", f"{resultados_completos['Mu_estimado']:.0f} kg·m")
-                        st.metric("Cuantía Balanceada (ρb)", f"{diseno_flexion['rho_b']:.4f}")
-                        st.metric("Cuantía Mínima (ρmin)", f"{diseno_flexion['rho_min']:.4f}")
-                        st.metric("Cuantía Máxima (ρmax)", f"{diseno_flexion['rho_max']:.4f}")
-                    with col2:
-                        st.metric("Área de Acero (As)", f"{diseno_flexion['As']:.1f} cm²")
-                        st.metric("Profundidad Bloque (a)", f"{diseno_flexion['a']:.1f} cm")
-                        st.metric("Momento Resistente (φMn)", f"{diseno_flexion['phiMn']:.0f} kg·m")
-                        if diseno_flexion['verificacion']:
-                            st.success("✅ Verificación de flexión: CUMPLE")
-                        else:
-                            st.error("❌ Verificación de flexión: NO CUMPLE")
-                
-                with tab2:
-                    st.markdown("### 🔧 Diseño por Cortante")
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Cortante Último (Vu)", f"{resultados_completos['Vu_estimado']:.0f} kg")
-                        st.metric("Resistencia Concreto (Vc)", f"{diseno_cortante['Vc']:.0f} kg")
-                        st.metric("Resistencia Acero (Vs)", f"{diseno_cortante['Vs_requerido']:.0f} kg")
-                    with col2:
-                        st.metric("Área Estribos (Av/s)", f"{diseno_cortante['Av_s_requerido']:.3f} cm²/cm")
-                        st.metric("Separación Máxima", f"{diseno_cortante['s_max']:.1f} cm")
-                        if diseno_cortante['verificacion']:
-                            st.success("✅ Verificación de cortante: CUMPLE")
-                        else:
-                            st.error("❌ Verificación de cortante: NO CUMPLE")
-                
-                with tab3:
-                    st.markdown("### 🏢 Diseño de Columnas")
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Carga Axial Última (Pu)", f"{resultados_completos['Pu_estimado']:.0f} kg")
-                        st.metric("Resistencia Nominal (Pn)", f"{diseno_columna['Pn']:.0f} kg")
-                        st.metric("Resistencia Diseño (φPn)", f"{diseno_columna['phiPn']:.0f} kg")
-                    with col2:
-                        st.metric("Área Total Columna", f"{Ag_columna:.0f} cm²")
-                        st.metric("Área Acero Columna", f"{Ast_columna:.1f} cm²")
-                        if diseno_columna['verificacion']:
-                            st.success("✅ Verificación de columna: CUMPLE")
-                        else:
-                            st.error("❌ Verificación de columna: NO CUMPLE")
-                
-                with tab4:
-                    st.markdown("### 🌍 Análisis Sísmico (E.030)")
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Factor Zona (Z)", f"{analisis_sismico['Z']:.2f}")
-                        st.metric("Factor Suelo (S)", f"{analisis_sismico['S']:.1f}")
-                        st.metric("Factor Importancia (U)", f"{analisis_sismico['U']:.1f}")
-                        st.metric("Cortante X (Pórticos)", f"{analisis_sismico['cortante_x_ton']:.1f} ton")
-                    with col2:
-                        st.metric("Coeficiente Sísmico (C)", f"{analisis_sismico['C']:.1f}")
-                        st.metric("Factor Reducción (R)", f"{analisis_sismico['R']:.1f}")
-                        st.metric("Cortante Basal (V)", f"{analisis_sismico['cortante_basal_ton']:.1f} ton")
-                        st.metric("Cortante Y (Muros)", f"{analisis_sismico['cortante_y_ton']:.1f} ton")
-                    
-                    # Verificación específica para caso Ayacucho
-                    if 'caso_ayacucho' in analisis_sismico:
-                        st.markdown("### 🎯 Verificación Caso Ayacucho")
-                        st.info("Comparación con análisis presentado:")
-                        
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.metric("Peso Total", f"{peso_total:.1f} ton", 
-                                    delta=f"{analisis_sismico['caso_ayacucho']['peso_esperado']:.1f} ton esperado")
-                        with col2:
-                            st.metric("Cortante X", f"{analisis_sismico['cortante_x_ton']:.1f} ton", 
-                                    delta=f"{analisis_sismico['caso_ayacucho']['cortante_x_esperado']:.1f} ton esperado")
-                        with col3:
-                            st.metric("Cortante Y", f"{analisis_sismico['cortante_y_ton']:.1f} ton", 
-                                    delta=f"{analisis_sismico['caso_ayacucho']['cortante_y_esperado']:.1f} ton esperado")
-                        
-                        # Estado de verificación
-                        if (analisis_sismico['caso_ayacucho']['coincidencia_peso'] and 
-                            analisis_sismico['caso_ayacucho']['coincidencia_vx'] and 
-                            analisis_sismico['caso_ayacucho']['coincidencia_vy']):
-                            st.success("✅ VERIFICACIÓN EXITOSA - Los resultados coinciden con el análisis presentado")
-                        else:
-                            st.warning("⚠️ VERIFICACIÓN PARCIAL - Algunos valores difieren del análisis presentado")
-                            if not analisis_sismico['caso_ayacucho']['coincidencia_peso']:
-                                st.error("❌ Peso total no coincide")
-                            if not analisis_sismico['caso_ayacucho']['coincidencia_vx']:
-                                st.error("❌ Cortante X no coincide")
-                            if not analisis_sismico['caso_ayacucho']['coincidencia_vy']:
-                                st.error("❌ Cortante Y no coincide")
-                
-                # Gráfico de resultados
-                if PLOTLY_AVAILABLE:
-                    st.subheader("📈 Gráfico de Resultados")
-                    datos_grafico = pd.DataFrame({
-                        'Propiedad': ['Peso Total (ton)', 'Ec (kg/cm²)', 'Es (kg/cm²)', 'Espesor Losa (cm)'],
-                        'Valor': [peso_total, props_concreto['Ec']/1000, props_acero['Es']/1000000, predim['h_losa']*100]
-                    })
-                    
-                    fig = px.bar(datos_grafico, x='Propiedad', y='Valor', 
-                                title="Resultados del Análisis Completo - Plan Premium",
-                                color='Propiedad',
-                                color_discrete_map={
-                                    'Peso Total (ton)': '#2E8B57',
-                                    'Ec (kg/cm²)': '#4169E1',
-                                    'Es (kg/cm²)': '#DC143C',
-                                    'Espesor Losa (cm)': '#FFD700'
-                                })
-                    
-                    fig.update_layout(
-                        xaxis_title="Propiedad",
-                        yaxis_title="Valor",
-                        height=400
-                    )
-                    
-                    fig.update_traces(texttemplate='%{y:.1f}', textposition='outside')
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    # Gráfico alternativo con matplotlib
-                    st.subheader("📈 Gráfico de Resultados")
-                    if MATPLOTLIB_AVAILABLE and plt is not None:
-                        fig, ax = plt.subplots(figsize=(10, 6))
-                        propiedades = ['Peso Total', 'Ec', 'Es', 'Espesor Losa']
-                        valores = [peso_total, props_concreto['Ec']/1000, props_acero['Es']/1000000, predim['h_losa']*100]
-                        color_list = ['#2E8B57', '#4169E1', '#DC143C', '#FFD700']
-                        
-                        bars = ax.bar(propiedades, valores, color=color_list)
-                        ax.set_title("Resultados del Análisis Completo - Plan Premium")
-                        ax.set_ylabel("Valor")
-                        
-                        # Agregar valores en las barras
-                        for bar in bars:
-                            height = bar.get_height()
-                            ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                                   f'{height:.1f}', ha='center', va='bottom')
-                        
-                        st.pyplot(fig)
-                    else:
-                        st.info("📊 Gráfico no disponible - Matplotlib no está instalado")
-                        st.write("Para ver gráficos, instale matplotlib: `pip install matplotlib`")
-
-    elif opcion == "📄 Generar Reporte":
-        st.title("📄 Generar Reporte Técnico")
-        
-        if st.session_state['plan'] == "gratuito":
-            if 'resultados_completos' in st.session_state:
-                resultados = st.session_state['resultados_completos']
-                
-                # Reporte básico gratuito
-                reporte_basico = f"""
-# REPORTE BÁSICO - ANÁLISIS ESTRUCTURAL
-## CONSORCIO DEJ
-### Fecha: {datetime.now().strftime('%d/%m/%Y %H:%M')}
-
-### DATOS DE ENTRADA:
-- Resistencia del concreto (f'c): {st.session_state.get('datos_entrada', {}).get('f_c', 0)} kg/cm²
-- Resistencia del acero (fy): {st.session_state.get('datos_entrada', {}).get('f_y', 0)} kg/cm²
-- Luz libre de vigas: {st.session_state.get('datos_entrada', {}).get('L_viga', 0)} m
-- Número de pisos: {st.session_state.get('datos_entrada', {}).get('num_pisos', 0)}
-- Carga Muerta: {st.session_state.get('datos_entrada', {}).get('CM', 0)} kg/m²
-- Carga Viva: {st.session_state.get('datos_entrada', {}).get('CV', 0)} kg/m²
-
-### RESULTADOS DEL ANÁLISIS:
-- Peso total estimado: {resultados.get('peso_total', 0):.1f} ton
-- Módulo de elasticidad del concreto: {resultados.get('Ec', 0):.0f} kg/cm²
-- Módulo de elasticidad del acero: {resultados.get('Es', 0):,} kg/cm²
-- Espesor de losa: {resultados.get('h_losa', 0)*100:.0f} cm
-- Dimensiones de viga: {resultados.get('b_viga', 0):.0f}×{resultados.get('d_viga', 0):.0f} cm
-- Dimensiones de columna: {resultados.get('lado_columna', 0):.0f}×{resultados.get('lado_columna', 0):.0f} cm
-
-### NOTA:
-Este es un reporte básico del plan gratuito. Para análisis más detallados, considere actualizar al plan premium.
-
----
-Generado por: CONSORCIO DEJ
-Plan: Gratuito
-"""
-                
-                st.text_area("Reporte Básico", reporte_basico, height=500)
-                
-                # Botones para el reporte básico
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    st.download_button(
-                        label="📥 Descargar TXT",
-                        data=reporte_basico,
-                        file_name=f"reporte_basico_analisis_estructural_{datetime.now().strftime('%Y%m%d_%H%M')}.txt",
-                        mime="text/plain"
-                    )
-                
-                with col2:
-                    # Generar PDF básico
-                    pdf_buffer = generar_pdf_reportlab(resultados, st.session_state.get('datos_entrada', {}), "gratuito")
-                    st.download_button(
-                        label="📄 Descargar PDF",
-                        data=pdf_buffer.getvalue(),
-                        file_name=f"reporte_basico_analisis_estructural_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf",
-                        mime="application/pdf"
-                    )
-                
-                with col3:
-                    if st.button("🖨️ Generar Reporte en Pantalla", type="primary"):
-                        st.success("✅ Reporte básico generado exitosamente")
-                        st.balloons()
-                        
-                        # Mostrar el reporte en formato expandible
-                        with st.expander("📋 VER REPORTE BÁSICO COMPLETO", expanded=True):
-                            st.markdown(reporte_basico)
-            else:
-                st.warning("⚠️ No hay resultados disponibles. Realiza primero el análisis completo.")
-        else:
-            # Reporte premium completo
-            if 'resultados_completos' in st.session_state:
-                resultados = st.session_state['resultados_completos']
-                datos_entrada = st.session_state.get('datos_entrada', {})
-                
-                reporte_premium = f"""
-# REPORTE TÉCNICO COMPLETO - ANÁLISIS ESTRUCTURAL
-## CONSORCIO DEJ
-### Análisis según ACI 318-2025 y E.060
-### Fecha: {datetime.now().strftime('%d/%m/%Y %H:%M')}
-
-### 1. DATOS DE ENTRADA:
-- Resistencia del concreto (f'c): {datos_entrada.get('f_c', 0)} kg/cm²
-- Resistencia del acero (fy): {datos_entrada.get('f_y', 0)} kg/cm²
-- Luz libre de vigas: {datos_entrada.get('L_viga', 0)} m
-- Número de pisos: {datos_entrada.get('num_pisos', 0)}
-- Carga Muerta: {datos_entrada.get('CM', 0)} kg/m²
-- Carga Viva: {datos_entrada.get('CV', 0)} kg/m²
-- Zona Sísmica: {datos_entrada.get('zona_sismica', 'N/A')}
-- Tipo de Suelo: {datos_entrada.get('tipo_suelo', 'N/A')}
-- Tipo de Estructura: {datos_entrada.get('tipo_estructura', 'N/A')}
-
-### 2. PROPIEDADES DE LOS MATERIALES:
-- Módulo de elasticidad del concreto (Ec): {resultados.get('Ec', 0):.0f} kg/cm²
-- Módulo de elasticidad del acero (Es): {resultados.get('Es', 0):,} kg/cm²
-- Deformación última del concreto (εcu): {resultados.get('ecu', 0)}
-- Deformación de fluencia (εy): {resultados.get('ey', 0):.4f}
-- Resistencia a tracción (fr): {resultados.get('fr', 0):.1f} kg/cm²
-- β1: {resultados.get('beta1', 0):.3f}
-
-### 3. DIMENSIONES CALCULADAS:
-- Peso total estimado: {resultados.get('peso_total', 0):.1f} ton
-- Espesor de losa: {resultados.get('h_losa', 0)*100:.0f} cm
-- Dimensiones de viga: {resultados.get('b_viga', 0):.0f}×{resultados.get('d_viga', 0):.0f} cm
-- Dimensiones de columna: {resultados.get('lado_columna', 0):.0f}×{resultados.get('lado_columna', 0):.0f} cm
-
-### 4. VERIFICACIONES DE ESTABILIDAD:
-- Peso total: {'✅ ACEPTABLE' if resultados.get('peso_total', 0) < 1000 else '⚠️ ALTO - Revisar dimensiones'}
-- Módulo de elasticidad del concreto: {'✅ ADECUADO' if resultados.get('Ec', 0) > 200000 else 'ℹ️ NORMAL'}
-
-### 5. RECOMENDACIONES TÉCNICAS:
-- Verificar la capacidad portante del suelo en campo
-- Revisar el diseño del refuerzo estructural según ACI 318-2025
-- Considerar efectos sísmicos según la normativa local
-- Realizar inspecciones periódicas durante la construcción
-- Monitorear deformaciones durante el servicio
-
-### 6. INFORMACIÓN DEL PROYECTO:
-- Empresa: CONSORCIO DEJ
-- Método de análisis: ACI 318-2025 y E.060
-- Fecha de análisis: {datetime.now().strftime('%d/%m/%Y %H:%M')}
-- Plan: Premium
-- Software: Streamlit + Python
-
----
-**Este reporte fue generado automáticamente por el sistema de análisis estructural de CONSORCIO DEJ.**
-**Para consultas técnicas, contacte a nuestro equipo de ingeniería.**
-"""
-                
-                st.text_area("Reporte Premium", reporte_premium, height=600)
-                
-                # Botones para el reporte premium
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    st.download_button(
-                        label="📥 Descargar TXT",
-                        data=reporte_premium,
-                        file_name=f"reporte_premium_analisis_estructural_{datetime.now().strftime('%Y%m%d_%H%M')}.txt",
-                        mime="text/plain"
-                    )
-                
-                with col2:
-                    # Generar PDF premium con datos de entrada
-                    if 'datos_entrada' in st.session_state:
-                        try:
-                            pdf_buffer = generar_pdf_reportlab(
-                                st.session_state['resultados_completos'], 
-                                st.session_state['datos_entrada'], 
-                                "premium"
-                            )
-                            st.download_button(
-                                label="📄 Descargar PDF Premium",
-                                data=pdf_buffer.getvalue(),
-                                file_name=f"reporte_premium_analisis_estructural_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf",
-                                mime="application/pdf"
-                            )
-                        except Exception as e:
-                            st.error(f"⚠️ Error generando PDF: {str(e)}")
-                            st.info("Intenta ejecutar el análisis completo nuevamente")
-                    else:
-                        st.warning("⚠️ Ejecuta primero el análisis completo")
-                
-                with col3:
-                    if st.button("🖨️ Generar Reporte en Pantalla", type="primary"):
-                        st.success("✅ Reporte técnico generado exitosamente")
-                        st.balloons()
-                        
-                        # Mostrar el reporte en formato expandible
-                        with st.expander("📋 VER REPORTE TÉCNICO COMPLETO", expanded=True):
-                            st.markdown(reporte_premium)
-            else:
-                st.warning("⚠️ No hay resultados disponibles. Realiza primero el análisis completo.")
-
-    elif opcion == "📚 Fórmulas de Diseño Estructural":
-        st.header("📚 Fórmulas de Diseño Estructural")
-        st.info("Fórmulas clave según ACI 318-2025, E.060, Nilson, McCormac, Hibbeler y Antonio Blanco.")
-        
-        # Pestañas para organizar las fórmulas
-        tab1, tab2, tab3, tab4 = st.tabs(["🏗️ Propiedades Materiales", "📐 Diseño por Flexión", "🔧 Diseño por Cortante", "🏢 Columnas y Losas"])
-        
-        with tab1:
-            st.subheader("🏗️ Propiedades del Material")
-            st.markdown("""
-            ### Concreto (ACI 318-2025 - Capítulo 19)
-            - **Resistencia a compresión (f'c):** \( f'_c \) (kg/cm²)  
-              *(Valores típicos: 210, 280, 350 kg/cm²)*
-            
-            - **Módulo de elasticidad (Ec):** \( E_c = 15000 \sqrt{f'_c} \) (kg/cm²)
-            
-            - **Deformación última del concreto (εcu):** \( \varepsilon_{cu} = 0.003 \) *(Para diseño por flexión)*
-            
-            - **Resistencia a tracción por flexión (fr):** \( f_r = 2 \sqrt{f'_c} \) (kg/cm²)
-            
-            ### Acero de Refuerzo (ACI 318-2025 - Capítulo 20)
-            - **Esfuerzo de fluencia (fy):** \( f_y \) (kg/cm²)  
-              *(Valores típicos: 4200, 5000 kg/cm²)*
-            
-            - **Módulo de elasticidad (Es):** \( E_s = 2,000,000 \) (kg/cm²)
-            
-            - **Deformación de fluencia (εy):** \( \varepsilon_y = \frac{f_y}{E_s} \)
-            """, unsafe_allow_html=True)
-            
-            # Fórmulas en LaTeX
-            st.latex(r"E_c = 15000 \sqrt{f'_c} \text{ (kg/cm²)}")
-            st.latex(r"\varepsilon_{cu} = 0.003")
-            st.latex(r"f_r = 2 \sqrt{f'_c} \text{ (kg/cm²)}")
-            st.latex(r"E_s = 2,000,000 \text{ (kg/cm²)}")
-            st.latex(r"\varepsilon_y = \frac{f_y}{E_s}")
-        
-        with tab2:
-            st.subheader("📐 Diseño por Flexión (ACI 318-2025 - Capítulo 9)")
-            st.markdown("""
-            - **Momento último (Mu):** \( M_u = 1.2M_D + 1.6M_L \) *(Combinación de carga mayorada)*
-            
-            - **Cuantía de acero (ρ):** \( \rho = \frac{A_s}{bd} \)
-            
-            - **Cuantía balanceada (ρb):** \( \rho_b = 0.85\beta_1 \frac{f'_c}{f_y} \left( \frac{6000}{6000+f_y} \right) \)  
-              *(β₁ = 0.85 si f'c ≤ 280 kg/cm², disminuye 0.05 por cada 70 kg/cm² adicionales)*
-            
-            - **Cuantía mínima (ρmin):** \( \rho_{min} = \max\left( \frac{0.8\sqrt{f'_c}}{f_y}, \frac{14}{f_y} \right) \)
-            
-            - **Cuantía máxima (ρmax):** \( \rho_{max} = 0.75\rho_b \) *(Para evitar falla frágil)*
-            
-            - **Profundidad del bloque equivalente (a):** \( a = \frac{A_s f_y}{0.85f'_c b} \)
-            
-            - **Momento resistente (φMn):** \( \phi M_n = \phi A_s f_y \left(d - \frac{a}{2}\right) \)  
-              *(φ = 0.9 para flexión)*
-            """, unsafe_allow_html=True)
-            
-            # Fórmulas en LaTeX
-            st.latex(r"M_u = 1.2M_D + 1.6M_L")
-            st.latex(r"\rho = \frac{A_s}{bd}")
-            st.latex(r"\rho_b = 0.85\beta_1 \frac{f'_c}{f_y} \left( \frac{6000}{6000+f_y} \right)")
-            st.latex(r"\rho_{min} = \max\left( \frac{0.8\sqrt{f'_c}}{f_y}, \frac{14}{f_y} \right)")
-            st.latex(r"\rho_{max} = 0.75\rho_b")
-            st.latex(r"a = \frac{A_s f_y}{0.85f'_c b}")
-            st.latex(r"\phi M_n = \phi A_s f_y \left(d - \frac{a}{2}\right)")
-        
-        with tab3:
-            st.subheader("🔧 Diseño por Cortante (ACI 318-2025 - Capítulo 22)")
-            st.markdown("""
-            - **Cortante último (Vu):** \( V_u = 1.2V_D + 1.6V_L \)
-            
-            - **Resistencia del concreto (Vc):** \( V_c = 0.53\sqrt{f'_c} b_w d \) (kg)
-            
-            - **Resistencia del acero (Vs):** \( V_s = \frac{A_v f_y d}{s} \)  
-              *(Av = Área de estribos, s = separación)*
-            
-            - **Cortante máximo (Vs máx):** \( V_{s,max} = 2.1\sqrt{f'_c} b_w d \) *(Límite superior)*
-            
-            - **Separación máxima de estribos (smax):** \( s_{max} = \min\left( \frac{d}{2}, 60 \text{ cm} \right) \)
-            
-            ---
-            #### **Resumen de Fórmulas para Diseño por Cortante en Vigas (RNE E.060 y ACI 318)**
-            
-            **1. Parámetros Básicos**
-            - **Carga Muerta (CM):** Ejemplo: 2 ton/m
-            - **Carga Viva (CV):** Ejemplo: 1.4 ton/m
-            
-            **2. Resistencia del Concreto:**
-            \[
-            \phi V_c = 0.85 \cdot 0.53 \sqrt{f'_c} \cdot b \cdot d
-            \]
-            
-            _Ejemplo:_ Para \( f'_c = 210\,kg/cm^2,\ b = 25\,cm,\ d = 54\,cm \):
-            \[
-            \phi V_c = 8.86\,ton
-            \]
-            
-            **3. Diagrama de Cortantes**
-            - **Cortante en Apoyos:**
-            \[
-            V_a = \frac{\omega \cdot L}{2}
-            \]
-            - **Cortante a distancia d del apoyo:**
-            \[
-            V_{ad} = V_a - \omega \cdot d
-            \]
-            _Ejemplo:_ \( V_a = 19.4\,ton,\ V_{ad} = 16.6\,ton \)
-            
-            **4. Diseño de Estribos**
-            - **Zona Crítica (\( V_u > \phi V_c \))**
-            \[
-            S = \frac{A_v f_y d}{V_u - \phi V_c}
-            \]
-            _Ejemplo:_ \( S = 35\,cm \) (limitado a \( d/2 = 27.5\,cm \))
-            
-            - **Zona No Crítica (\( V_u \leq \phi V_c \))**
-            \[
-            S_{max} = \min\left( \frac{d}{2}, 60\,cm \right)
-            \]
-            _Ejemplo:_ \( S = 27.5\,cm \)
-            
-            **5. Detalles Constructivos**
-            - Diámetro mínimo: \( \varphi 3/8'' \)
-            - Primer estribo a 5 cm del apoyo
-            - Distribución típica: 1@5cm, 5@10cm, resto@25cm
-            
-            **6. Normativa y Comprobaciones**
-            - RNE E.060 (Concreto Armado): Art. 13.7 y 13.8
-            - ACI 318: Sección 22.5
-            
-            **Conclusión:**
-            El diseño por cortante garantiza que la viga resista fuerzas laterales sin falla frágil. Los estribos deben distribuirse según zonas críticas y no críticas, cumpliendo espaciamientos máximos. La verificación de \( V_u \leq \phi V_n \) asegura seguridad ante cargas últimas.
-            """, unsafe_allow_html=True)
-            # Mantener las fórmulas originales y LaTeX ya presentes
-            st.latex(r"V_u = 1.2V_D + 1.6V_L")
-            st.latex(r"V_c = 0.53\sqrt{f'_c} b_w d \text{ (kg)}")
-            st.latex(r"V_s = \frac{A_v f_y d}{s}")
-            st.latex(r"V_{s,max} = 2.1\sqrt{f'_c} b_w d")
-            st.latex(r"s_{max} = \min\left( \frac{d}{2}, 60 \text{ cm} \right)")
-        
-        with tab4:
-            st.subheader("🏢 Columnas y Losas")
-            # ... (contenido existente) ...
-            st.markdown("""
-            ---
-            ### **Resumen de Fórmulas Estructurales para Tesis (RNE E.030 y E.060)**
-            
-            #### **1. Parámetros Sísmicos (RNE E.030)**
-            - **Factor de Zona (Z):**
-              - Zona 3: \( Z = 0.35 \) (Ayacucho)
-              - Tabla N°1 del Art. 11
-            - **Factor de Uso (U):**
-              - Edificaciones comunes (Categoría C): \( U = 1.00 \) (Art. 15)
-            - **Factor de Suelo (S):**
-              - Perfil S3 (suelos blandos): \( S = 1.20 \) (Tabla N°2 del Art. 13)
-            - **Coeficiente de Amplificación Sísmica (C):**
-              \[
-              C = \begin{cases}
-                2.5 & \text{si } T < T_p \\
-                2.5 \left( \frac{T_p}{T} \right) & \text{si } T_p \leq T \leq T_L \\
-                2.5 \left( \frac{T_p \cdot T_L}{T^2} \right) & \text{si } T > T_L
-              \end{cases}
-              \]
-              Donde \( T_p = 1.0\,seg,\ T_L = 1.6\,seg \) (S3)
-            - **Cortante Basal (V):**
-              \[
-              V = \frac{Z \cdot U \cdot C \cdot S}{R} \cdot P
-              \]
-              \( R \): Coeficiente de reducción (pórticos = 8, muros = 6)
-            
-            #### **2. Diseño de Vigas (RNE E.060)**
-            - **Momento Resistente (Mu):**
-              \[
-              M_u = \phi \cdot A_s \cdot f_y (d - \frac{a}{2})
-              \]
-              \[
-              a = \frac{A_s f_y}{0.85 f'_c b}
-              \]
-              \( \phi = 0.9 \) (flexión)
-            - **Cuantías:**
-              - Mínima: \( \rho_{min} = 0.7 \frac{\sqrt{f'_c}}{f_y} \)
-              - Máxima: \( \rho_{max} = 0.75 \rho_b \), donde \( \rho_b = 0.02125 \) para \( f'_c = 210\,kg/cm^2 \)
-            - **Cortante (Vu):**
-              \[
-              V_c = 0.53 \sqrt{f'_c} b d
-              \]
-              \[
-              V_s = V_u - \phi V_c \quad (\phi = 0.85)
-              \]
-            - **Espaciamiento de estribos:**
-              - Zona de confinamiento: \( s \leq \frac{d}{4} \leq 30\,cm \)
-              - Fuera de confinamiento: \( s \leq \frac{d}{2} \leq 60\,cm \)
-            
-            #### **3. Diseño de Columnas (RNE E.060)**
-            - **Combinaciones de carga:**
-              - \( 1.4\,CM + 1.7\,CV \)
-              - \( 1.25(CM + CV) \pm CS \)
-              - \( 0.9\,CM \pm CS \)
-            - **Refuerzo Longitudinal:**
-              - Cuantía mínima: \( \rho_{min} = 0.01 \)
-              - Cuantía máxima: \( \rho_{max} = 0.06 \)
-            - **Cortante en columnas:**
-              \[
-              V_c = 0.53 \sqrt{f'_c} b d
-              \]
-              - Estribos mínimos: \( \varphi \geq 3/8'' \), \( s \leq 12d_b \leq 25cm \)
-            
-            #### **4. Diseño de Zapatas (RNE E.060)**
-            - **Área de zapata:**
-              \[
-              A_z = \frac{P_{servicio}}{\sigma_t}
-              \]
-              (\( \sigma_t \): capacidad portante)
-            - **Peralte efectivo (d):**
-              - Por corte: \( d \geq \frac{V_u}{0.85 \cdot 1.1 \sqrt{f'_c} b_0} \)
-              - Por longitud de desarrollo: \( l_d \geq 0.08 \frac{f_y d_b}{\sqrt{f'_c}} \)
-            - **Acero mínimo:** \( \rho_{min} = 0.0018 \)
-            
-            #### **5. Gráficos y Detalles**
-            - Diagramas de interacción (columnas): Curvas \( P_u \) vs \( M_u \) para verificar capacidad.
-            - Ejemplo: \( \rho = 0.01 \rightarrow A_s = 25\,cm^2 \) (4ϕ3/4" + 8ϕ5/8").
-            - Distribución de estribos en columnas: Zona de confinamiento \( L_o \geq h_n/6 \geq 50\,cm \), estribos: 1@5cm, 5@10cm, resto@25cm.
-            - Detalles de armado en vigas: Acero superior/inferior: 2ϕ5/8" (tramos), 3ϕ5/8" (apoyos), estribos: ϕ3/8"@10cm (confinamiento), @25cm (resto).
-            
-            #### **Conclusiones**
-            - Las fórmulas y parámetros cumplen con la Norma E.030 (Diseño Sismorresistente) y E.060 (Concreto Armado).
-            - Los gráficos de interacción y detalles de refuerzo garantizan ductilidad y resistencia.
-            - La verificación de derivas (\( \Delta/h \leq 0.007 \)) asegura comportamiento sísmico adecuado.
-            
-            **Referencias:**
-            - RNE E.030 (Diseño Sismorresistente)
-            - RNE E.060 (Concreto Armado)
-            - ACI 318 (Equivalente para detalles constructivos)
-            """, unsafe_allow_html=True)
-            st.markdown("""
-            ---
-            ### **Resumen de Fórmulas y Normativa para Diseño de Columnas (RNE E.060 y ACI 318)**
-            
-            #### **1. Clasificación de Columnas**
-            - Por carga axial:
-              - Si \( P_u < 0.1 f'_c A_g \): Diseñar como viga (flexión simple).
-              - Si \( P_u \geq 0.1 f'_c A_g \): Diseñar como columna (flexocompresión).
-            - Por confinamiento:
-              - Estribos: Ductilidad moderada (zonas sísmicas).
-              - Espirales: Alta ductilidad y cargas axiales elevadas.
-            
-            #### **2. Resistencia Nominal en Compresión Pura (\( P_0 \))**
-            \[
-            P_0 = 0.85 f'_c (A_g - A_s) + f_y A_s
-            \]
-            - Factor de reducción (k): 0.85 (RNE E.060)
-            - \( A_g \): Área bruta de la sección
-            - \( A_s \): Área de acero longitudinal
-            
-            #### **3. Resistencia al Corte (\( V_c \)) con Carga Axial**
-            - Compresión axial:
-              \[
-              V_c = 0.53 f'_c \left(1 + \frac{N_u}{140 A_g}\right)
-              \]
-              [RNE E.060, Art. 13.7]
-            - Tracción axial:
-              \[
-              V_c = 0.53 f'_c \left(1 - \frac{N_u}{35 A_g}\right)
-              \]
-              (Si \( N_u \) es tracción)
-            
-            #### **4. Diseño de Estribos**
-            - Espaciamiento máximo (s):
-              - Zonas no sísmicas: \( s \leq \min(16d_b, 48d_e, 0.30m) \)
-              - Zonas sísmicas (RNE E.060, Cap. 21):
-                - En confinamiento: \( s \leq \min(\frac{d}{4}, 6d_b, 10cm) \)
-                - Fuera de confinamiento: \( s \leq \frac{d}{2} \)
-              - Diámetro mínimo: \( \varphi 3/8'' \)
-            
-            #### **5. Cuantías de Acero**
-            - Mínima: \( \rho_{min} = 1\% A_g \)
-            - Máxima: \( \rho_{max} = 6\% A_g \) (zonas sísmicas)
-            - Recomendación práctica: \( 1\% \leq \rho \leq 4\% \) para evitar congestión
-            
-            #### **6. Diagrama de Interacción**
-            - Punto A: Compresión pura (\( P_0 \))
-            - Punto B: Deformación nula en acero de tracción
-            - Punto E (Falla balanceada):
-              \[
-              c_b = \frac{0.003 d}{0.003 + \varepsilon_y} \quad (\varepsilon_y = \frac{f_y}{E_s})
-              \]
-            
-            #### **7. Detalles Constructivos**
-            - Refuerzo longitudinal: Mínimo 4 barras (1 en cada esquina)
-            - Separación máxima: 30cm
-            - Estribos cerrados: Obligatorios en zonas sísmicas (ganchos a 135°)
-            - Dimensiones mínimas:
-              - Rectangulares: 25×25cm (sísmicas)
-              - Circulares: Diámetro ≥ 25cm
-            
-            #### **8. Gráficos y Diagramas**
-            - Diagrama de interacción:
-              - Eje Y: Carga axial (\( P_n \))
-              - Eje X: Momento (\( M_n \))
-              - Incluir puntos A, B y E
-            - Zonas de confinamiento:
-              \[
-              L_c = \max(h, \frac{h_n}{6}, 50cm)
-              \]
-            - Detalle de estribos: Ejemplo: 1@5cm, 5@10cm, resto@25cm (zonas no críticas)
-            
-            #### **Normativa y Conclusiones**
-            - RNE E.060 (Perú): Art. 10 (Flexocompresión), Art. 13 (Cortante en columnas), Cap. 21 (Requisitos sísmicos)
-            - ACI 318: Sección 22.4 (Resistencia a compresión), Sección 18.7 (Confinamiento en zonas sísmicas)
-            - Recomendaciones para tesis: Validar resultados con software (ETABS, SAP2000), incluir planos de armado con detalles de estribos y empalmes
-            
-            **Referencias:**
-            - RNE E.060 (2019)
-            - ACI 318-19
-            - "Diseño de Estructuras de Concreto Armado" – Antonio Blanco Blasco
-            """, unsafe_allow_html=True)
-
-    elif opcion == "🏗️ Diseño de Zapatas":
-        st.title("🏗️ Diseño de Zapatas (Cimentaciones)")
-        st.info("📚 Basado en Norma E.060 y ACI 318 - Capítulo 11")
-        
-        # Verificar acceso basado en plan
-        if st.session_state['plan'] == "gratuito":
-            st.warning("⚠️ Esta función requiere plan premium. Actualiza tu cuenta para acceder al diseño de zapatas.")
-            st.info("Plan gratuito incluye: Cálculos básicos, resultados simples")
-            st.info("Plan premium incluye: Diseño completo de zapatas, verificaciones detalladas")
-            
-            col1, col2, col3 = st.columns([1, 2, 1])
-            with col2:
-                if st.button("⭐ Actualizar a Premium", type="primary", key="upgrade_zapatas"):
-                    st.session_state['show_pricing'] = True
-                    st.rerun()
-        else:
-            st.success("⭐ Plan Premium: Diseño completo de zapatas con todas las verificaciones")
-            
-            # Datos de entrada para zapatas
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("📐 Datos de Entrada")
-                fc_zapata = st.number_input("f'c (kg/cm²)", 175, 700, 210, 10, key="fc_zapata")
-                fy_zapata = st.number_input("fy (kg/cm²)", 2800, 6000, 4200, 100, key="fy_zapata")
-                Pu_zapata = st.number_input("Carga Axial Última Pu (kg)", 10000, 1000000, 100000, 1000, key="Pu_zapata")
-                qu_zapata = st.number_input("Capacidad Última del Suelo qu (kg/cm²)", 1.0, 50.0, 3.0, 0.1, key="qu_zapata")
-                FS_zapata = st.number_input("Factor de Seguridad FS", 2.0, 5.0, 3.0, 0.1, key="FS_zapata")
-            
-            with col2:
-                st.subheader("📋 Fórmulas Utilizadas")
-                st.markdown("""
-                **Capacidad Portante del Suelo:**
-                \[ q_n = \frac{q_u}{FS} \]
-                
-                **Área de la Zapata:**
-                \[ A = \frac{P}{q_n} \]
-                
-                **Corte por Punzonamiento:**
-                \[ V_c = 0.53\sqrt{f'_c} \cdot b_0 \cdot d \]
-                
-                **Corte por Flexión:**
-                \[ V_c = 0.53\sqrt{f'_c} \cdot b \cdot d \]
-                
-                **Refuerzo por Flexión:**
-                \[ A_s = \frac{M_u}{\phi \cdot f_y \cdot j \cdot d} \]
-                """, unsafe_allow_html=True)
-            
-            # Botón para calcular
-            if st.button("🔬 Calcular Diseño de Zapata", type="primary"):
-                # Cálculos de diseño de zapata
-                resultados_zapata = calcular_diseno_zapatas(fc_zapata, fy_zapata, Pu_zapata, qu_zapata, FS_zapata)
-                
-                st.success("¡Diseño de zapata calculado exitosamente!")
-                st.balloons()
-                
-                # Mostrar resultados
-                st.subheader("📊 Resultados del Diseño de Zapata")
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.metric("Capacidad Portante (qn)", f"{resultados_zapata['qn']:.2f} kg/cm²")
-                    st.metric("Área Estimada", f"{resultados_zapata['A_estimada']:.2f} cm²")
-                    st.metric("Lado de Zapata", f"{resultados_zapata['lado_zapata']:.1f} cm")
-                    st.metric("Peralte Efectivo", f"{resultados_zapata['d_estimado']:.1f} cm")
-                
-                with col2:
-                    st.metric("Corte Punzonamiento", f"{resultados_zapata['Vc_punzonamiento']:.0f} kg")
-                    st.metric("Corte Flexión", f"{resultados_zapata['Vc_flexion']:.0f} kg")
-                    st.metric("Momento Zapata", f"{resultados_zapata['Mu_zapata']:.0f} kg·cm")
-                    st.metric("Acero Flexión", f"{resultados_zapata['As_flexion']:.1f} cm²")
-                
-                # Verificaciones
-                st.subheader("🔍 Verificaciones de Diseño")
-                
-                # Verificación de capacidad portante
-                if resultados_zapata['qn'] > 0.5:
-                    st.success("✅ Capacidad portante adecuada")
-                else:
-                    st.warning("⚠️ Capacidad portante baja - Revisar suelo")
-                
-                # Verificación de dimensiones
-                if resultados_zapata['lado_zapata'] >= 100:
-                    st.success("✅ Dimensiones de zapata adecuadas")
-                else:
-                    st.info("ℹ️ Zapata pequeña - Considerar zapatas combinadas")
-                
-                # Verificación específica para caso Ayacucho
-                if fc_zapata == 210 and fy_zapata == 4200:
-                    st.markdown("**🏗️ Caso Ayacucho - Zapatas:**")
-                    st.success("✅ Materiales coinciden con caso Ayacucho")
-                    st.write(f"- f'c: {fc_zapata} kg/cm² ✓")
-                    st.write(f"- fy: {fy_zapata} kg/cm² ✓")
-                    
-                    # Verificaciones adicionales para Ayacucho
-                    if resultados_zapata['verificacion_espesor']:
-                        st.success("✅ Espesor mínimo cumple")
-                    else:
-                        st.warning("⚠️ Espesor mínimo no cumple")
-                    
-                    if resultados_zapata['verificacion_refuerzo']:
-                        st.success("✅ Refuerzo mínimo cumple")
-                    else:
-                        st.warning("⚠️ Refuerzo mínimo no cumple")
-                
-                # Gráfico de resultados
-                st.subheader("📈 Gráficos de Resultados")
-                
-                # Gráfico 1: Propiedades principales
-                if PLOTLY_AVAILABLE:
-                    datos_zapata = pd.DataFrame({
-                        'Propiedad': ['Capacidad (kg/cm²)', 'Área (cm²)', 'Lado (cm)', 'Peralte (cm)'],
-                        'Valor': [resultados_zapata['qn'], resultados_zapata['A_estimada']/10000, 
-                                 resultados_zapata['lado_zapata']/100, resultados_zapata['d_estimado']/100]
-                    })
-                    
-                    fig1 = px.bar(datos_zapata, x='Propiedad', y='Valor',
-                                title="Propiedades Principales de la Zapata",
-                                color='Propiedad',
-                                color_discrete_map={
-                                    'Capacidad (kg/cm²)': '#2E8B57',
-                                    'Área (cm²)': '#4169E1',
-                                    'Lado (cm)': '#DC143C',
-                                    'Peralte (cm)': '#FFD700'
-                                })
-                    
-                    fig1.update_layout(
-                        xaxis_title="Propiedad",
-                        yaxis_title="Valor",
-                        height=400
-                    )
-                    
-                    fig1.update_traces(texttemplate='%{y:.2f}', textposition='outside')
-                    st.plotly_chart(fig1, use_container_width=True)
-                
-                # Gráfico 2: Fuerzas de corte
-                if PLOTLY_AVAILABLE:
-                    datos_corte = pd.DataFrame({
-                        'Tipo de Corte': ['Punzonamiento', 'Flexión'],
-                        'Resistencia (kg)': [resultados_zapata['Vc_punzonamiento'], resultados_zapata['Vc_flexion']]
-                    })
-                    
-                    fig2 = px.pie(datos_corte, values='Resistencia (kg)', names='Tipo de Corte',
-                                title="Distribución de Resistencia al Corte",
-                                color_discrete_map={
-                                    'Punzonamiento': '#FF6B6B',
-                                    'Flexión': '#4ECDC4'
-                                })
-                    
-                    fig2.update_traces(textposition='inside', textinfo='percent+label+value')
-                    st.plotly_chart(fig2, use_container_width=True)
-                
-                # Gráfico 3: Comparación con valores típicos
-                if PLOTLY_AVAILABLE:
-                    datos_comparacion = pd.DataFrame({
-                        'Parámetro': ['Capacidad Portante', 'Área Zapata', 'Peralte'],
-                        'Valor Actual': [resultados_zapata['qn'], resultados_zapata['A_estimada']/10000, resultados_zapata['d_estimado']/100],
-                        'Valor Típico': [1.0, 2.0, 0.3]  # Valores típicos de referencia
-                    })
-                    
-                    fig3 = px.bar(datos_comparacion, x='Parámetro', y=['Valor Actual', 'Valor Típico'],
-                                title="Comparación con Valores Típicos",
-                                barmode='group',
-                                color_discrete_map={
-                                    'Valor Actual': '#2E8B57',
-                                    'Valor Típico': '#FFD700'
-                                })
-                    
-                    fig3.update_layout(
-                        xaxis_title="Parámetro",
-                        yaxis_title="Valor",
-                        height=400
-                    )
-                    
-                    st.plotly_chart(fig3, use_container_width=True)
-                
-                # Gráfico alternativo con matplotlib si plotly no está disponible
-                elif MATPLOTLIB_AVAILABLE and plt is not None:
-                    try:
-                        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-                        
-                        # Gráfico de barras para propiedades principales
-                        propiedades = ['Capacidad', 'Área', 'Lado', 'Peralte']
-                        valores = [resultados_zapata['qn'], resultados_zapata['A_estimada']/10000, 
-                                 resultados_zapata['lado_zapata']/100, resultados_zapata['d_estimado']/100]
-                        color_list = ['#2E8B57', '#4169E1', '#DC143C', '#FFD700']
-                        
-                        bars = ax1.bar(propiedades, valores, color=color_list)
-                        ax1.set_title("Propiedades Principales de la Zapata")
-                        ax1.set_ylabel("Valor")
-                        
-                        for bar in bars:
-                            height = bar.get_height()
-                            ax1.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                                   f'{height:.2f}', ha='center', va='bottom')
-                        
-                        # Gráfico de pie para fuerzas de corte
-                        tipos_corte = ['Punzonamiento', 'Flexión']
-                        valores_corte = [resultados_zapata['Vc_punzonamiento'], resultados_zapata['Vc_flexion']]
-                        colors_corte = ['#FF6B6B', '#4ECDC4']
-                        
-                        ax2.pie(valores_corte, labels=tipos_corte, autopct='%1.1f%%', colors=colors_corte)
-                        ax2.set_title("Distribución de Resistencia al Corte")
-                        
-                        if plt is not None:
-                            plt.tight_layout()
-                            st.pyplot(fig)
-                        
-                    except Exception as e:
-                        st.info(f"📊 Gráfico no disponible: {str(e)}")
-                else:
-                    st.info("📊 Gráficos no disponibles - Instale plotly o matplotlib")
-                
-                # Gráfico de cortantes y momentos según McCormac
-                st.subheader("📊 Diagramas de Cortantes y Momentos (McCormac)")
-                
-                # Generar gráfico de viga simplemente apoyada para la zapata
-                L_zapata = resultados_zapata['lado_zapata'] / 100  # Convertir a metros
-                w_zapata = Pu_zapata / L_zapata  # Carga distribuida equivalente
-                
-                fig_mccormac = graficar_cortantes_momentos_mccormac(L_zapata, w_zapata, None, None, "simple")
-                if fig_mccormac:
-                    st.pyplot(fig_mccormac)
-                    
-                    # Mostrar valores máximos
-                    x, V, M = calcular_cortantes_momentos_viga_simple_mccormac(L_zapata, w_zapata, None, None)
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Cortante Máximo", f"{max(abs(V)):.0f} kg")
-                    with col2:
-                        st.metric("Momento Máximo", f"{max(abs(M)):.0f} kg·m")
-                    with col3:
-                        st.metric("Luz de la Zapata", f"{L_zapata:.2f} m")
-                
-                # Dibujo de la zapata
-                st.subheader("🏗️ Dibujo de la Zapata")
-                fig_zapata = dibujar_zapata(resultados_zapata['lado_zapata'], resultados_zapata['d_estimado'], fc_zapata, fy_zapata)
-                if fig_zapata:
-                    st.pyplot(fig_zapata)
-
-    elif opcion == "🔧 Diseño de Vigas":
-        st.title("🔧 Diseño de Vigas")
-        st.info("📚 Basado en ACI 318 - Capítulo 9 y Norma E.060")
-        
-        # Verificar acceso basado en plan
-        if st.session_state['plan'] == "gratuito":
-            st.warning("⚠️ Esta función requiere plan premium. Actualiza tu cuenta para acceder al diseño de vigas.")
-            st.info("Plan gratuito incluye: Cálculos básicos, resultados simples")
-            st.info("Plan premium incluye: Diseño completo de vigas, verificaciones detalladas")
-            
-            col1, col2, col3 = st.columns([1, 2, 1])
-            with col2:
-                if st.button("⭐ Actualizar a Premium", type="primary", key="upgrade_vigas"):
-                    st.session_state['show_pricing'] = True
-                    st.rerun()
-        else:
-            st.success("⭐ Plan Premium: Diseño completo de vigas con todas las verificaciones")
-            
-            # Datos de entrada para vigas
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("📐 Datos de Entrada")
-                fc_viga = st.number_input("f'c (kg/cm²)", 175, 700, 210, 10, key="fc_viga")
-                fy_viga = st.number_input("fy (kg/cm²)", 2800, 6000, 4200, 100, key="fy_viga")
-                b_viga = st.number_input("Ancho de Viga b (cm)", 20, 100, 25, 1, key="b_viga")
-                d_viga = st.number_input("Peralte Efectivo d (cm)", 30, 100, 50, 1, key="d_viga")
-                Mu_viga = st.number_input("Momento Último Mu (kg·cm)", 10000, 10000000, 500000, 1000, key="Mu_viga")
-                Vu_viga = st.number_input("Cortante Último Vu (kg)", 1000, 100000, 15000, 100, key="Vu_viga")
-            
-            with col2:
-                st.subheader("📋 Fórmulas Utilizadas")
-                st.markdown("""
-                **Momento Resistente:**
-                \[ M_n = A_s \cdot f_y \cdot (d - \frac{a}{2}) \]
-                
-                **Profundidad del Bloque:**
-                \[ a = \frac{A_s \cdot f_y}{0.85 \cdot f'_c \cdot b} \]
-                
-                **Corte Resistente:**
-                \[ V_c = 0.53\sqrt{f'_c} \cdot b \cdot d \]
-                
-                **Refuerzo por Corte:**
-                \[ V_s = \frac{V_u - \phi V_c}{\phi} \]
-                
-                **Espaciamiento de Estribos:**
-                \[ s = \frac{A_v \cdot f_y \cdot d}{V_s} \]
-                """, unsafe_allow_html=True)
-            
-            # Botón para calcular
-            if st.button("🔬 Calcular Diseño de Viga", type="primary"):
-                # Cálculos de diseño de viga
-                resultados_viga = calcular_diseno_vigas_detallado(fc_viga, fy_viga, b_viga, d_viga, Mu_viga, Vu_viga)
-                
-                st.success("¡Diseño de viga calculado exitosamente!")
-                st.balloons()
-                
-                # Mostrar resultados
-                st.subheader("📊 Resultados del Diseño de Viga")
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.metric("Área de Acero (As)", f"{resultados_viga['As']:.1f} cm²")
-                    st.metric("Profundidad Bloque (a)", f"{resultados_viga['a']:.1f} cm")
-                    st.metric("Momento Resistente (φMn)", f"{resultados_viga['phiMn']:.0f} kg·cm")
-                    st.metric("Corte Concreto (Vc)", f"{resultados_viga['Vc']:.0f} kg")
-                
-                with col2:
-                    st.metric("Corte Acero (Vs)", f"{resultados_viga['Vs']:.0f} kg")
-                    st.metric("Espaciamiento Estribos", f"{resultados_viga['s_estribos']:.1f} cm")
-                    if resultados_viga['verificacion_momento']:
-                        st.success("✅ Verificación Momento: CUMPLE")
-                    else:
-                        st.error("❌ Verificación Momento: NO CUMPLE")
-                    if resultados_viga['verificacion_corte']:
-                        st.success("✅ Verificación Corte: CUMPLE")
-                    else:
-                        st.error("❌ Verificación Corte: NO CUMPLE")
-                
-                # Verificaciones detalladas
-                st.subheader("🔍 Verificaciones Detalladas")
-                
-                # Verificación de cuantía
-                rho_actual = resultados_viga['As'] / (b_viga * d_viga)
-                rho_min = max(0.8 * sqrt(fc_viga) / fy_viga, 14 / fy_viga)
-                rho_max = 0.75 * 0.85 * 0.85 * (fc_viga / fy_viga) * (6000 / (6000 + fy_viga))
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Cuantía Actual", f"{rho_actual:.4f}")
-                with col2:
-                    st.metric("Cuantía Mínima", f"{rho_min:.4f}")
-                with col3:
-                    st.metric("Cuantía Máxima", f"{rho_max:.4f}")
-                
-                if rho_min <= rho_actual <= rho_max:
-                    st.success("✅ Cuantía de acero dentro de límites")
-                else:
-                    st.warning("⚠️ Cuantía de acero fuera de límites - Revisar diseño")
-                
-                # Verificación específica para caso Ayacucho
-                if fc_viga == 210 and fy_viga == 4200:
-                    st.markdown("**🏗️ Caso Ayacucho - Vigas:**")
-                    st.success("✅ Materiales coinciden con caso Ayacucho")
-                    st.write(f"- f'c: {fc_viga} kg/cm² ✓")
-                    st.write(f"- fy: {fy_viga} kg/cm² ✓")
-                    
-                    # Verificaciones adicionales para Ayacucho
-                    if resultados_viga['verificacion_cuantia']:
-                        st.success("✅ Cuantía de acero cumple normativa")
-                    else:
-                        st.warning("⚠️ Cuantía de acero no cumple normativa")
-                    
-                    # Verificación de dimensiones típicas para Ayacucho
-                    if 20 <= b_viga <= 40 and 40 <= d_viga <= 70:
-                        st.success("✅ Dimensiones típicas para edificio de 3 niveles")
-                    else:
-                        st.info("ℹ️ Verificar dimensiones para edificio de 3 niveles")
-                
-                # Gráficos de resultados
-                st.subheader("📈 Gráficos de Resultados")
-                
-                # Gráfico 1: Propiedades de la viga
-                if PLOTLY_AVAILABLE:
-                    datos_viga = pd.DataFrame({
-                        'Propiedad': ['Área Acero (cm²)', 'Prof. Bloque (cm)', 'Momento Resistente (kg·cm)', 'Corte Concreto (kg)'],
-                        'Valor': [resultados_viga['As'], resultados_viga['a'], 
-                                 resultados_viga['phiMn']/1000, resultados_viga['Vc']/1000]
-                    })
-                    
-                    fig1 = px.bar(datos_viga, x='Propiedad', y='Valor',
-                                title="Propiedades del Diseño de Viga",
-                                color='Propiedad',
-                                color_discrete_map={
-                                    'Área Acero (cm²)': '#2E8B57',
-                                    'Prof. Bloque (cm)': '#4169E1',
-                                    'Momento Resistente (kg·cm)': '#DC143C',
-                                    'Corte Concreto (kg)': '#FFD700'
-                                })
-                    
-                    fig1.update_layout(
-                        xaxis_title="Propiedad",
-                        yaxis_title="Valor",
-                        height=400
-                    )
-                    
-                    fig1.update_traces(texttemplate='%{y:.1f}', textposition='outside')
-                    st.plotly_chart(fig1, use_container_width=True)
-                
-                # Gráfico 2: Verificaciones
-                if PLOTLY_AVAILABLE:
-                    verificaciones = ['Momento', 'Corte']
-                    valores_verificacion = [1 if resultados_viga['verificacion_momento'] else 0, 
-                                           1 if resultados_viga['verificacion_corte'] else 0]
-                    
-                    # Crear DataFrame para el gráfico
-                    df_verificaciones = pd.DataFrame({
-                        'Verificación': verificaciones,
-                        'Estado': valores_verificacion,
-                        'Estado_Texto': ['Cumple' if v == 1 else 'No Cumple' for v in valores_verificacion]
-                    })
-                    
-                    fig2 = px.bar(df_verificaciones, x='Verificación', y='Estado',
-                                title="Estado de Verificaciones",
-                                color='Estado_Texto',
-                                color_discrete_map={'Cumple': '#2E8B57', 'No Cumple': '#DC143C'})
-                    
-                    fig2.update_layout(
-                        xaxis_title="Verificación",
-                        yaxis_title="Estado (1=Cumple, 0=No Cumple)",
-                        height=300,
-                        yaxis=dict(range=[0, 1.2])
-                    )
-                    
-                    st.plotly_chart(fig2, use_container_width=True)
-                
-                # Gráfico 3: Cuantías de acero
-                if PLOTLY_AVAILABLE:
-                    datos_cuantia = pd.DataFrame({
-                        'Tipo': ['Actual', 'Mínima', 'Máxima'],
-                        'Cuantía': [rho_actual, rho_min, rho_max]
-                    })
-                    
-                    fig3 = px.bar(datos_cuantia, x='Tipo', y='Cuantía',
-                                title="Cuantías de Acero",
-                                color='Tipo',
-                                color_discrete_map={
-                                    'Actual': '#2E8B57',
-                                    'Mínima': '#4169E1',
-                                    'Máxima': '#DC143C'
-                                })
-                    
-                    fig3.update_layout(
-                        xaxis_title="Tipo de Cuantía",
-                        yaxis_title="Valor",
-                        height=400
-                    )
-                    
-                    fig3.update_traces(texttemplate='%{y:.4f}', textposition='outside')
-                    st.plotly_chart(fig3, use_container_width=True)
-                
-                # Gráfico alternativo con matplotlib
-                if MATPLOTLIB_AVAILABLE and plt is not None:
-                    try:
-                        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
-                        
-                        # Gráfico 1: Propiedades principales
-                        propiedades = ['As', 'a', 'φMn', 'Vc']
-                        valores = [resultados_viga['As'], resultados_viga['a'], 
-                                 resultados_viga['phiMn']/1000, resultados_viga['Vc']/1000]
-                        color_list = ['#2E8B57', '#4169E1', '#DC143C', '#FFD700']
-                        
-                        bars1 = ax1.bar(propiedades, valores, color=color_list)
-                        ax1.set_title("Propiedades del Diseño de Viga")
-                        ax1.set_ylabel("Valor")
-                        
-                        for bar in bars1:
-                            height = bar.get_height()
-                            ax1.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                                   f'{height:.1f}', ha='center', va='bottom')
-                        
-                        # Gráfico 2: Verificaciones
-                        verificaciones = ['Momento', 'Corte']
-                        valores_verif = [1 if resultados_viga['verificacion_momento'] else 0, 
-                                        1 if resultados_viga['verificacion_corte'] else 0]
-                        colors_verif = ['#2E8B57' if v == 1 else '#DC143C' for v in valores_verif]
-                        
-                        bars2 = ax2.bar(verificaciones, valores_verif, color=colors_verif)
-                        ax2.set_title("Estado de Verificaciones")
-                        ax2.set_ylabel("Estado (1=Cumple, 0=No Cumple)")
-                        ax2.set_ylim(0, 1.2)
-                        
-                        # Gráfico 3: Cuantías
-                        tipos_cuantia = ['Actual', 'Mínima', 'Máxima']
-                        valores_cuantia = [rho_actual, rho_min, rho_max]
-                        colors_cuantia = ['#2E8B57', '#4169E1', '#DC143C']
-                        
-                        bars3 = ax3.bar(tipos_cuantia, valores_cuantia, color=colors_cuantia)
-                        ax3.set_title("Cuantías de Acero")
-                        ax3.set_ylabel("Valor")
-                        
-                        for bar in bars3:
-                            height = bar.get_height()
-                            ax3.text(bar.get_x() + bar.get_width()/2., height + 0.0001,
-                                   f'{height:.4f}', ha='center', va='bottom')
-                        
-                        # Gráfico 4: Espaciamiento de estribos
-                        ax4.pie([resultados_viga['s_estribos'], 60 - resultados_viga['s_estribos']], 
-                               labels=[f'Estribos\n{resultados_viga["s_estribos"]:.1f}cm', 'Espacio Libre'],
-                               autopct='%1.1f%%', colors=['#FF6B6B', '#4ECDC4'])
-                        ax4.set_title("Distribución de Estribos")
-                        
-                        if plt is not None:
-                            plt.tight_layout()
-                            st.pyplot(fig)
-                        
-                    except Exception as e:
-                        st.info(f"📊 Gráfico no disponible: {str(e)}")
-                else:
-                    st.info("📊 Gráficos no disponibles - Instale plotly o matplotlib")
-                
-                # Gráfico de cortantes y momentos según McCormac
-                st.subheader("📊 Diagramas de Cortantes y Momentos (McCormac)")
-                
-                # Generar gráfico de viga con los datos calculados
-                L_viga_mccormac = 6.0  # Luz típica de viga
-                w_viga_mccormac = Vu_viga / L_viga_mccormac  # Carga distribuida equivalente
-                
-                fig_mccormac = graficar_cortantes_momentos_mccormac(L_viga_mccormac, w_viga_mccormac, None, None, "simple")
-                if fig_mccormac:
-                    st.pyplot(fig_mccormac)
-                    
-                    # Mostrar valores máximos
-                    x, V, M = calcular_cortantes_momentos_viga_simple_mccormac(L_viga_mccormac, w_viga_mccormac, None, None)
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Cortante Máximo", f"{max(abs(V)):.0f} kg")
-                    with col2:
-                        st.metric("Momento Máximo", f"{max(abs(M)):.0f} kg·m")
-                    with col3:
-                        st.metric("Luz de la Viga", f"{L_viga_mccormac} m")
-                
-                # Dibujo de la viga
-                st.subheader("🔧 Dibujo de la Viga")
-                fig_viga = dibujar_viga(b_viga, d_viga, L_viga_mccormac, resultados_viga['As'], resultados_viga['s_estribos'], fc_viga, fy_viga)
-                if fig_viga:
-                    st.pyplot(fig_viga)
-
-    elif opcion == "🏢 Diseño de Columnas":
-        st.title("🏢 Diseño de Columnas")
-        st.info("📚 Basado en ACI 318 - Capítulo 10 y Norma E.060")
-        
-        # Verificar acceso basado en plan
-        if st.session_state['plan'] == "gratuito":
-            st.warning("⚠️ Esta función requiere plan premium. Actualiza tu cuenta para acceder al diseño de columnas.")
-            st.info("Plan gratuito incluye: Cálculos básicos, resultados simples")
-            st.info("Plan premium incluye: Diseño completo de columnas, verificaciones detalladas")
-            
-            col1, col2, col3 = st.columns([1, 2, 1])
-            with col2:
-                if st.button("⭐ Actualizar a Premium", type="primary", key="upgrade_columnas"):
-                    st.session_state['show_pricing'] = True
-                    st.rerun()
-        else:
-            st.success("⭐ Plan Premium: Diseño completo de columnas con todas las verificaciones")
-            
-            # Datos de entrada para columnas
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("📐 Datos de Entrada")
-                fc_columna = st.number_input("f'c (kg/cm²)", 175, 700, 210, 10, key="fc_columna")
-                fy_columna = st.number_input("fy (kg/cm²)", 2800, 6000, 4200, 100, key="fy_columna")
-                lado_columna = st.number_input("Lado de Columna (cm)", 20, 100, 30, 1, key="lado_columna")
-                Ag_columna = lado_columna * lado_columna
-                st.write(f"**Área Bruta (Ag):** {Ag_columna} cm²")
-                rho_columna = st.number_input("Cuantía de Acero ρ (%)", 0.5, 6.0, 1.0, 0.1, key="rho_columna")
-                Ast_columna = rho_columna / 100 * Ag_columna
-                st.write(f"**Área de Acero (Ast):** {Ast_columna:.1f} cm²")
-                Pu_columna = st.number_input("Carga Axial Última Pu (kg)", 10000, 1000000, 100000, 1000, key="Pu_columna")
-            
-            with col2:
-                st.subheader("📋 Fórmulas Utilizadas")
-                st.markdown("""
-                **Carga Axial Resistente:**
-                \[ P_n = 0.85f'_c(A_g - A_{st}) + A_{st} \cdot f_y \]
-                
-                **Resistencia de Diseño:**
-                \[ \phi P_n = \phi \cdot P_n \]
-                
-                **Espaciamiento de Estribos:**
-                \[ s \leq \min(16\phi_b, 48\phi_e, b, h) \]
-                
-                **Cuantías:**
-                \[ 1\% \leq \rho \leq 6\% \]
-                """, unsafe_allow_html=True)
-            
-            # Botón para calcular
-            if st.button("🔬 Calcular Diseño de Columna", type="primary"):
-                # Cálculos de diseño de columna
-                resultados_columna = calcular_diseno_columnas_detallado(fc_columna, fy_columna, Ag_columna, Ast_columna, Pu_columna)
-                
-                st.success("¡Diseño de columna calculado exitosamente!")
-                st.balloons()
-                
-                # Mostrar resultados
-                st.subheader("📊 Resultados del Diseño de Columna")
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.metric("Resistencia Nominal (Pn)", f"{resultados_columna['Pn']:.0f} kg")
-                    st.metric("Resistencia Diseño (φPn)", f"{resultados_columna['phiPn']:.0f} kg")
-                    st.metric("Factor φ", f"{resultados_columna['phi']:.2f}")
-                    st.metric("Espaciamiento Máx. Estribos", f"{resultados_columna['s_max_estribos']:.1f} cm")
-                
-                with col2:
-                    st.metric("Cuantía Actual", f"{resultados_columna['rho']:.3f}")
-                    st.metric("Cuantía Mínima", f"{resultados_columna['rho_min']:.3f}")
-                    st.metric("Cuantía Máxima", f"{resultados_columna['rho_max']:.3f}")
-                    if resultados_columna['verificacion_carga']:
-                        st.success("✅ Verificación Carga: CUMPLE")
-                    else:
-                        st.error("❌ Verificación Carga: NO CUMPLE")
-                
-                # Verificaciones detalladas
-                st.subheader("🔍 Verificaciones Detalladas")
-                
-                if resultados_columna['verificacion_cuantia']:
-                    st.success("✅ Cuantía de acero dentro de límites")
-                else:
-                    st.warning("⚠️ Cuantía de acero fuera de límites - Revisar diseño")
-                
-                # Factor de seguridad
-                FS_columna = resultados_columna['phiPn'] / Pu_columna
-                st.metric("Factor de Seguridad", f"{FS_columna:.2f}")
-                
-                if FS_columna >= 1.0:
-                    st.success("✅ Columna segura")
-                else:
-                    st.error("❌ Columna insegura - Aumentar dimensiones o acero")
-                
-                # Verificación específica para caso Ayacucho
-                if fc_columna == 210 and fy_columna == 4200:
-                    st.markdown("**🏗️ Caso Ayacucho - Columnas:**")
-                    st.success("✅ Materiales coinciden con caso Ayacucho")
-                    st.write(f"- f'c: {fc_columna} kg/cm² ✓")
-                    st.write(f"- fy: {fy_columna} kg/cm² ✓")
-                    
-                    # Verificaciones adicionales para Ayacucho
-                    if resultados_columna['verificacion_esbeltez']:
-                        st.success("✅ Verificación de esbeltez cumple")
-                    else:
-                        st.warning("⚠️ Verificación de esbeltez no cumple")
-                    
-                    # Verificación de dimensiones típicas para edificio de 3 niveles
-                    if 25 <= lado_columna <= 50:
-                        st.success("✅ Dimensiones típicas para edificio de 3 niveles")
-                    else:
-                        st.info("ℹ️ Verificar dimensiones para edificio de 3 niveles")
-                    
-                    # Verificación de carga típica para Ayacucho
-                    if 50000 <= Pu_columna <= 200000:
-                        st.success("✅ Carga axial típica para edificio de 3 niveles")
-                    else:
-                        st.info("ℹ️ Verificar carga axial para edificio de 3 niveles")
-                
-                # Gráficos de resultados
-                st.subheader("📈 Gráficos de Resultados")
-                
-                # Gráfico 1: Propiedades de la columna
-                if PLOTLY_AVAILABLE:
-                    datos_columna = pd.DataFrame({
-                        'Propiedad': ['Resistencia Nominal (kg)', 'Resistencia Diseño (kg)', 'Factor φ', 'Espaciamiento Estribos (cm)'],
-                        'Valor': [resultados_columna['Pn']/1000, resultados_columna['phiPn']/1000, 
-                                 resultados_columna['phi'], resultados_columna['s_max_estribos']]
-                    })
-                    
-                    fig1 = px.bar(datos_columna, x='Propiedad', y='Valor',
-                                title="Propiedades del Diseño de Columna",
-                                color='Propiedad',
-                                color_discrete_map={
-                                    'Resistencia Nominal (kg)': '#2E8B57',
-                                    'Resistencia Diseño (kg)': '#4169E1',
-                                    'Factor φ': '#DC143C',
-                                    'Espaciamiento Estribos (cm)': '#FFD700'
-                                })
-                    
-                    fig1.update_layout(
-                        xaxis_title="Propiedad",
-                        yaxis_title="Valor",
-                        height=400
-                    )
-                    
-                    fig1.update_traces(texttemplate='%{y:.1f}', textposition='outside')
-                    st.plotly_chart(fig1, use_container_width=True)
-                
-                # Gráfico 2: Cuantías de acero
-                if PLOTLY_AVAILABLE:
-                    datos_cuantia_col = pd.DataFrame({
-                        'Tipo': ['Actual', 'Mínima', 'Máxima'],
-                        'Cuantía': [resultados_columna['rho'], resultados_columna['rho_min'], resultados_columna['rho_max']]
-                    })
-                    
-                    fig2 = px.bar(datos_cuantia_col, x='Tipo', y='Cuantía',
-                                title="Cuantías de Acero en Columna",
-                                color='Tipo',
-                                color_discrete_map={
-                                    'Actual': '#2E8B57',
-                                    'Mínima': '#4169E1',
-                                    'Máxima': '#DC143C'
-                                })
-                    
-                    fig2.update_layout(
-                        xaxis_title="Tipo de Cuantía",
-                        yaxis_title="Valor",
-                        height=400
-                    )
-                    
-                    fig2.update_traces(texttemplate='%{y:.3f}', textposition='outside')
-                    st.plotly_chart(fig2, use_container_width=True)
-                
-                # Gráfico 3: Factor de seguridad
-                if PLOTLY_AVAILABLE:
-                    fig3 = px.pie(values=[FS_columna, 2.0 - FS_columna], 
-                                names=[f'Factor Seguridad\n{FS_columna:.2f}', 'Margen'],
-                                title="Factor de Seguridad de la Columna",
-                                color_discrete_map={
-                                    f'Factor Seguridad\n{FS_columna:.2f}': '#2E8B57' if FS_columna >= 1.0 else '#DC143C',
-                                    'Margen': '#FFD700'
-                                })
-                    
-                    fig3.update_traces(textposition='inside', textinfo='percent+label')
-                    st.plotly_chart(fig3, use_container_width=True)
-                
-                # Gráfico 4: Comparación de cargas
-                if PLOTLY_AVAILABLE:
-                    datos_cargas = pd.DataFrame({
-                        'Tipo de Carga': ['Carga Aplicada', 'Resistencia Diseño'],
-                        'Valor (kg)': [Pu_columna/1000, resultados_columna['phiPn']/1000]
-                    })
-                    
-                    fig4 = px.bar(datos_cargas, x='Tipo de Carga', y='Valor (kg)',
-                                title="Comparación de Cargas",
-                                color='Tipo de Carga',
-                                color_discrete_map={
-                                    'Carga Aplicada': '#DC143C',
-                                    'Resistencia Diseño': '#2E8B57'
-                                })
-                    
-                    fig4.update_layout(
-                        xaxis_title="Tipo de Carga",
-                        yaxis_title="Valor (ton)",
-                        height=400
-                    )
-                    
-                    fig4.update_traces(texttemplate='%{y:.1f}', textposition='outside')
-                    st.plotly_chart(fig4, use_container_width=True)
-                
-                # Gráfico alternativo con matplotlib
-                if MATPLOTLIB_AVAILABLE and plt is not None:
-                    try:
-                        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
-                        
-                        # Gráfico 1: Propiedades principales
-                        propiedades = ['Pn', 'φPn', 'φ', 's_max']
-                        valores = [resultados_columna['Pn']/1000, resultados_columna['phiPn']/1000, 
-                                 resultados_columna['phi'], resultados_columna['s_max_estribos']]
-                        color_list = ['#2E8B57', '#4169E1', '#DC143C', '#FFD700']
-                        
-                        bars1 = ax1.bar(propiedades, valores, color=color_list)
-                        ax1.set_title("Propiedades del Diseño de Columna")
-                        ax1.set_ylabel("Valor")
-                        
-                        for bar in bars1:
-                            height = bar.get_height()
-                            ax1.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                                   f'{height:.1f}', ha='center', va='bottom')
-                        
-                        # Gráfico 2: Cuantías
-                        tipos_cuantia = ['Actual', 'Mínima', 'Máxima']
-                        valores_cuantia = [resultados_columna['rho'], resultados_columna['rho_min'], resultados_columna['rho_max']]
-                        colors_cuantia = ['#2E8B57', '#4169E1', '#DC143C']
-                        
-                        bars2 = ax2.bar(tipos_cuantia, valores_cuantia, color=colors_cuantia)
-                        ax2.set_title("Cuantías de Acero")
-                        ax2.set_ylabel("Valor")
-                        
-                        for bar in bars2:
-                            height = bar.get_height()
-                            ax2.text(bar.get_x() + bar.get_width()/2., height + 0.001,
-                                   f'{height:.3f}', ha='center', va='bottom')
-                        
-                        # Gráfico 3: Factor de seguridad
-                        ax3.pie([FS_columna, 2.0 - FS_columna], 
-                               labels=[f'Factor Seguridad\n{FS_columna:.2f}', 'Margen'],
-                               autopct='%1.1f%%', 
-                               colors=['#2E8B57' if FS_columna >= 1.0 else '#DC143C', '#FFD700'])
-                        ax3.set_title("Factor de Seguridad")
-                        
-                        # Gráfico 4: Comparación de cargas
-                        tipos_carga = ['Carga Aplicada', 'Resistencia Diseño']
-                        valores_carga = [Pu_columna/1000, resultados_columna['phiPn']/1000]
-                        colors_carga = ['#DC143C', '#2E8B57']
-                        
-                        bars4 = ax4.bar(tipos_carga, valores_carga, color=colors_carga)
-                        ax4.set_title("Comparación de Cargas")
-                        ax4.set_ylabel("Valor (ton)")
-                        
-                        for bar in bars4:
-                            height = bar.get_height()
-                            ax4.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                                   f'{height:.1f}', ha='center', va='bottom')
-                        
-                        plt.tight_layout()
-                        st.pyplot(fig)
-                        
-                    except Exception as e:
-                        st.info(f"📊 Gráfico no disponible: {str(e)}")
-                else:
-                    st.info("📊 Gráficos no disponibles - Instale plotly o matplotlib")
-                
-                # Gráfico de cortantes y momentos según McCormac
-                st.subheader("📊 Diagramas de Cortantes y Momentos (McCormac)")
-                
-                # Generar gráfico de viga con los datos de la columna
-                L_columna_mccormac = 3.0  # Altura típica de piso
-                w_columna_mccormac = Pu_columna / L_columna_mccormac  # Carga distribuida equivalente
-                
-                fig_mccormac = graficar_cortantes_momentos_mccormac(L_columna_mccormac, w_columna_mccormac, None, None, "empotrada")
-                if fig_mccormac:
-                    st.pyplot(fig_mccormac)
-                    
-                    # Mostrar valores máximos
-                    x, V, M = calcular_cortantes_momentos_viga_empotrada_mccormac(L_columna_mccormac, w_columna_mccormac, None, None)
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Cortante Máximo", f"{max(abs(V)):.0f} kg")
-                    with col2:
-                        st.metric("Momento Máximo", f"{max(abs(M)):.0f} kg·m")
-                    with col3:
-                        st.metric("Altura de Piso", f"{L_columna_mccormac} m")
-                
-                # Dibujo de la columna
-                st.subheader("🏢 Dibujo de la Columna")
-                fig_columna = dibujar_columna(lado_columna, Ast_columna, fc_columna, fy_columna)
-                if fig_columna:
-                    st.pyplot(fig_columna)
-
-    elif opcion == "✂️ Ejercicio Básico de Corte":
-        st.title("✂️ Ejercicio Básico de Corte")
-        st.info("📚 Basado en las fórmulas del PDF - Norma E.060 y ACI 318")
-        
-        # Verificar acceso basado en plan
-        if st.session_state['plan'] == "gratuito":
-            st.warning("⚠️ Esta función requiere plan premium. Actualiza tu cuenta para acceder al ejercicio de corte.")
-            st.info("Plan gratuito incluye: Cálculos básicos, resultados simples")
-            st.info("Plan premium incluye: Ejercicios detallados de corte, verificaciones completas")
-            
-            col1, col2, col3 = st.columns([1, 2, 1])
-            with col2:
-                if st.button("⭐ Actualizar a Premium", type="primary", key="upgrade_corte"):
-                    st.session_state['show_pricing'] = True
-                    st.rerun()
-        else:
-            st.success("⭐ Plan Premium: Ejercicio completo de corte con todas las verificaciones")
-            
-            # Pestañas para organizar la información
-            tab1, tab2, tab3, tab4 = st.tabs(["📐 Datos de Entrada", "🔬 Cálculos", "📊 Resultados", "📈 Gráficos"])
-            
-            with tab1:
-                st.subheader("📐 Datos de Entrada - Ejercicio Básico de Corte")
-                
-                # Datos básicos de la viga
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown("**🏗️ Propiedades de la Viga:**")
-                    fc_corte = st.number_input("f'c (kg/cm²)", 175, 700, 210, 10, key="fc_corte")
-                    b_corte = st.number_input("Ancho de Viga b (cm)", 20, 100, 25, 1, key="b_corte")
-                    d_corte = st.number_input("Peralte Efectivo d (cm)", 30, 100, 54, 1, key="d_corte")
-                    L_corte = st.number_input("Luz de la Viga L (m)", 3.0, 15.0, 6.0, 0.5, key="L_corte")
-                    fy_corte = st.number_input("fy (kg/cm²)", 2800, 6000, 4200, 100, key="fy_corte")
-                
-                with col2:
-                    st.markdown("**⚖️ Cargas y Fuerzas:**")
-                    CM_corte = st.number_input("Carga Muerta CM (kg/m²)", 0, 5000, 150, 50, key="CM_corte")
-                    CV_corte = st.number_input("Carga Viva CV (kg/m²)", 0, 3000, 200, 50, key="CV_corte")
-                    Vu_corte = st.number_input("Cortante Último Vu (kg)", 1000, 100000, 16600, 100, key="Vu_corte")
-                    num_estribos = st.number_input("Cantidad de Fierro Corte (estribos)", 0, 100, 0, 1, key="num_estribos")
-                
-                # Información adicional
-                st.markdown("---")
-                st.markdown("**📋 Fórmulas del PDF:**")
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown("""
-                    **Corte Resistente del Concreto:**
-                    \[ V_c = 0.53\sqrt{f'_c} \cdot b \cdot d \]
-                    \[ \phi V_c = \phi \cdot V_c \]
-                    
-                    **Para Vu > φVc:**
-                    \[ s = \frac{A_v \cdot f_y \cdot d}{V_u - \phi V_c} \]
-                    """, unsafe_allow_html=True)
-                
-                with col2:
-                    st.markdown("""
-                    **Para φVc/2 < Vu ≤ φVc:**
-                    \[ s_{max} = \min(\frac{d}{2}, 60cm) \]
-                    
-                    **Refuerzo Mínimo:**
-                    \[ A_{v,min} = 0.2\sqrt{f'_c} \cdot \frac{b \cdot s}{f_y} \]
-                    
-                    **Factor φ = 0.75** (ACI 318-19)
-                    """, unsafe_allow_html=True)
-            
-            with tab2:
-                st.subheader("🔬 Cálculos - Valores Preliminares")
-                
-                # Botón para calcular
-                if st.button("🚀 Calcular Ejercicio de Corte", type="primary", key="calcular_corte"):
-                    # Cálculos del ejercicio de corte
-                    resultados_corte = calcular_ejercicio_basico_corte(
-                        fc_corte, b_corte, d_corte, Vu_corte, fy_corte, 
-                        L_corte, CM_corte, CV_corte, num_estribos
-                    )
-                    
-                    # Guardar resultados en session state
-                    st.session_state['resultados_corte'] = resultados_corte
-                    st.session_state['datos_entrada_corte'] = {
-                        'fc': fc_corte, 'b': b_corte, 'd': d_corte, 'L': L_corte,
-                        'fy': fy_corte, 'CM': CM_corte, 'CV': CV_corte, 'Vu': Vu_corte
-                    }
-                    
-                    st.success("¡Ejercicio de corte calculado exitosamente!")
-                    st.balloons()
-                
-                # Mostrar valores preliminares si existen resultados
-                if 'resultados_corte' in st.session_state:
-                    resultados = st.session_state['resultados_corte']
-                    
-                    st.markdown("**📊 Valores Preliminares:**")
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        st.metric("Resistencia Nominal (Vc)", f"{resultados['Vc']:.0f} kg")
-                        st.metric("Corte Resistente (φVc)", f"{resultados['phiVc']:.0f} kg")
-                        st.metric("φVc/2", f"{resultados['phiVc_mitad']:.0f} kg")
-                    
-                    with col2:
-                        st.metric("Vu Final", f"{resultados['Vu_final']:.0f} kg")
-                        st.metric("Vs Requerido", f"{resultados['Vs_requerido']:.0f} kg")
-                        st.metric("Carga Total (w)", f"{resultados['w_total']:.1f} kg/m")
-                    
-                    with col3:
-                        st.metric("Zona Crítica", "Sí" if resultados['zona_critica'] else "No")
-                        st.metric("Necesita Estribos", "Sí" if resultados['necesita_estribos'] else "No")
-                        st.metric("Espaciamiento Máximo", f"{resultados['s_max_final']:.1f} cm")
-                    
-                    # Tabla de valores Vu
-                    st.markdown("**📋 Tabla de Valores Vu:**")
-                    valores_Vu = resultados['valores_Vu']
-                    datos_tabla = pd.DataFrame({
-                        'Parámetro': ['Vu Proporcionado', 'Vu Calculado', 'Vu Final', 'Vc', 'φVc', 'φVc/2', 'Vs Requerido'],
-                        'Valor (kg)': [
-                            valores_Vu['Vu_proporcionado'],
-                            valores_Vu['Vu_calculado'],
-                            valores_Vu['Vu_final'],
-                            valores_Vu['Vc'],
-                            valores_Vu['phiVc'],
-                            valores_Vu['phiVc_mitad'],
-                            valores_Vu['Vs_requerido']
-                        ]
-                    })
-                    st.dataframe(datos_tabla, use_container_width=True)
-                    
-                    # Verificación final
-                    st.markdown("**✅ Verificación Final:**")
-                    if resultados['verificacion']:
-                        st.success("✅ CUMPLE - El diseño es seguro")
-                    else:
-                        st.error("❌ NO CUMPLE - Revisar el diseño")
-            
-            with tab3:
-                st.subheader("📊 Resultados - Cálculo de Estribos")
-                
-                if 'resultados_corte' in st.session_state:
-                    resultados = st.session_state['resultados_corte']
-                    
-                    # Cálculo de estribos
-                    st.markdown("**🔧 Cálculo de Estribos:**")
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.metric("Espaciamiento Estribos", f"{resultados['s_estribos']:.1f} cm")
-                        st.metric("Espaciamiento Estribado", f"{resultados['s_estribado']:.1f} cm")
-                        st.metric("Refuerzo Mínimo (Av,min)", f"{resultados['Av_min']:.3f} cm²/cm")
-                        st.metric("Factor de Seguridad", f"{resultados['Vu_final'] / resultados['phiVc']:.2f}")
-                    
-                    with col2:
-                        if resultados['zona_critica']:
-                            st.warning("⚠️ Zona Crítica - Requiere refuerzo")
-                            st.info("📋 Distribución recomendada:")
-                            st.write("- 1@5cm, 5@10cm, resto@25cm")
-                            st.write("- Usar estribos #3 (φ3/8\")")
-                        else:
-                            st.success("✅ Zona No Crítica")
-                            st.info("📋 Estribos mínimos:")
-                            st.write("- Espaciamiento máximo: d/2 o 60cm")
-                            st.write("- Diámetro mínimo: φ3/8\"")
-                        
-                        if resultados['verificacion']:
-                            st.success("✅ Verificación: CUMPLE")
-                        else:
-                            st.error("❌ Verificación: NO CUMPLE")
-                    
-                    # Cálculo de estribado gráficamente
-                    st.markdown("**📐 Cálculo de Estribado Gráficamente:**")
-                    estribado = resultados['estribado_grafico']
-                    
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.markdown("**🔴 Zona Crítica:**")
-                        st.write(f"- Longitud: {estribado['zona_critica']['longitud']} cm")
-                        st.write(f"- Estribos: {estribado['zona_critica']['estribos']} unidades")
-                        st.write(f"- Espaciamiento: {estribado['zona_critica']['espaciamiento']:.1f} cm")
-                    
-                    with col2:
-                        st.markdown("**🔵 Zona No Crítica:**")
-                        st.write(f"- Longitud: {estribado['zona_no_critica']['longitud']:.0f} cm")
-                        st.write(f"- Estribos: {estribado['zona_no_critica']['estribos']} unidades")
-                        st.write(f"- Espaciamiento: {estribado['zona_no_critica']['espaciamiento']:.1f} cm")
-                    
-                    # Comparación con valores del PDF y caso Ayacucho
-                    st.markdown("**📚 Comparación con Valores del PDF y Caso Ayacucho:**")
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.write(f"- φVc calculado: {resultados['phiVc']:.0f} kg")
-                        st.write(f"- φVc del PDF: 8.86 ton = 8,860 kg")
-                        
-                        diferencia = abs(resultados['phiVc'] - 8860) / 8860 * 100
-                        if diferencia < 5:
-                            st.success(f"✅ Coincidencia excelente (diferencia: {diferencia:.1f}%)")
-                        elif diferencia < 10:
-                            st.info(f"ℹ️ Coincidencia buena (diferencia: {diferencia:.1f}%)")
-                        else:
-                            st.warning(f"⚠️ Diferencia significativa (diferencia: {diferencia:.1f}%)")
-                        
-                        # Verificación específica para caso Ayacucho
-                        if fc_corte == 210 and b_corte == 25 and d_corte == 54:
-                            st.markdown("**🏗️ Caso Ayacucho Verificado:**")
-                            st.success("✅ Datos coinciden con caso Ayacucho")
-                            st.write(f"- f'c: {fc_corte} kg/cm² ✓")
-                            st.write(f"- b: {b_corte} cm ✓")
-                            st.write(f"- d: {d_corte} cm ✓")
-                    
-                    with col2:
-                        st.write(f"- Vu máximo: {resultados['Vu_final']:.0f} kg")
-                        st.write(f"- Factor de seguridad: {resultados['Vu_final'] / resultados['phiVc']:.2f}")
-                        if resultados['Vu_final'] / resultados['phiVc'] >= 1.0:
-                            st.success("✅ Diseño seguro")
-                        else:
-                            st.error("❌ Diseño inseguro")
-            
-            with tab4:
-                st.subheader("📈 Gráficos - Diagrama de Cortantes y Estribado")
-                
-                if 'resultados_corte' in st.session_state:
-                    resultados = st.session_state['resultados_corte']
-                    datos_entrada = st.session_state['datos_entrada_corte']
-                    
-                    # Gráfico 1: Diagrama de cortantes
-                    st.markdown("**📊 Diagrama de Cortantes:**")
-                    fig_cortantes = graficar_diagrama_cortantes(
-                        datos_entrada['L'], resultados['Vu_final'], 
-                        resultados['phiVc'], resultados['phiVc_mitad'], 
-                        resultados['w_total']
-                    )
-                    if fig_cortantes:
-                        st.pyplot(fig_cortantes)
-                    else:
-                        st.info("📊 Gráfico no disponible - Matplotlib no está instalado")
-                    
-                    # Gráfico 2: Estribado de la viga
-                    st.markdown("**🏗️ Estribado de la Viga (Lado Derecho como Típico):**")
-                    fig_estribado = graficar_estribado_viga(
-                        datos_entrada['L'], datos_entrada['d'],
-                        resultados['s_estribos'], resultados['s_max_final'],
-                        datos_entrada['b']
-                    )
-                    if fig_estribado:
-                        st.pyplot(fig_estribado)
-                    else:
-                        st.info("📊 Gráfico no disponible - Matplotlib no está instalado")
-                    
-                    # Gráficos adicionales con Plotly
-                    if PLOTLY_AVAILABLE:
-                        st.markdown("**📈 Gráficos Adicionales:**")
-                        
-                        # Gráfico 3: Propiedades de corte
-                        datos_corte = pd.DataFrame({
-                            'Propiedad': ['φVc (ton)', 'Vs Requerido (ton)', 'Espaciamiento (cm)', 'Av,min (cm²/cm)'],
-                            'Valor': [resultados['phiVc']/1000, resultados['Vs_requerido']/1000, 
-                                     resultados['s_estribos'], resultados['Av_min']]
-                        })
-                        
-                        fig1 = px.bar(datos_corte, x='Propiedad', y='Valor',
-                                    title="Propiedades del Ejercicio de Corte",
-                                    color='Propiedad',
-                                    color_discrete_map={
-                                        'φVc (ton)': '#2E8B57',
-                                        'Vs Requerido (ton)': '#4169E1',
-                                        'Espaciamiento (cm)': '#DC143C',
-                                        'Av,min (cm²/cm)': '#FFD700'
-                                    })
-                        
-                        fig1.update_layout(height=400)
-                        fig1.update_traces(texttemplate='%{y:.2f}', textposition='outside')
-                        st.plotly_chart(fig1, use_container_width=True)
-                        
-                        # Gráfico 4: Estado de la zona
-                        estado_zona = 'Crítica' if resultados['zona_critica'] else 'No Crítica'
-                        color_zona = '#DC143C' if resultados['zona_critica'] else '#2E8B57'
-                        
-                        fig2 = px.pie(values=[1], names=[estado_zona],
-                                    title="Estado de la Zona de Corte",
-                                    color_discrete_map={estado_zona: color_zona})
-                        
-                        fig2.update_traces(textposition='inside', textinfo='label+percent')
-                        st.plotly_chart(fig2, use_container_width=True)
-                        
-                        # Gráfico 5: Factor de seguridad
-                        FS_corte = resultados['Vu_final'] / resultados['phiVc']
-                        estado_fs = 'Seguro' if FS_corte >= 1.0 else 'Inseguro'
-                        datos_fs = pd.DataFrame({
-                            'Tipo': ['Factor de Seguridad'],
-                            'Valor': [FS_corte],
-                            'Estado': [estado_fs]
-                        })
-                        
-                        fig3 = px.bar(datos_fs, x='Tipo', y='Valor',
-                                    title="Factor de Seguridad",
-                                    color='Estado',
-                                    color_discrete_map={'Seguro': '#2E8B57', 'Inseguro': '#DC143C'})
-                        
-                        fig3.update_layout(height=300)
-                        fig3.update_traces(texttemplate='%{y:.2f}', textposition='outside')
-                        fig3.add_hline(y=1.0, line_dash="dash", line_color="red", annotation_text="Límite de Seguridad")
-                        st.plotly_chart(fig3, use_container_width=True)
-                    else:
-                        st.info("📊 Gráficos interactivos no disponibles - Plotly no está instalado")
-                else:
-                    st.info("🔬 Realiza primero los cálculos en la pestaña 'Cálculos' para ver los gráficos")
-                
-                # Gráfico alternativo con matplotlib
-                if MATPLOTLIB_AVAILABLE and plt is not None:
-                    try:
-                        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
-                        
-                        # Gráfico 1: Propiedades principales
-                        propiedades = ['φVc', 'Vs', 's', 'Av,min']
-                        valores = [resultados_corte['phiVc']/1000, resultados_corte['Vs_requerido']/1000, 
-                                 resultados_corte['s_estribos'], resultados_corte['Av_min']]
-                        color_list = ['#2E8B57', '#4169E1', '#DC143C', '#FFD700']
-                        
-                        bars1 = ax1.bar(propiedades, valores, color=color_list)
-                        ax1.set_title("Propiedades del Ejercicio de Corte")
-                        ax1.set_ylabel("Valor")
-                        
-                        for bar in bars1:
-                            height = bar.get_height()
-                            ax1.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                                   f'{height:.2f}', ha='center', va='bottom')
-                        
-                        # Gráfico 2: Comparación con PDF
-                        fuentes = ['Cálculo Actual', 'Valor del PDF']
-                        valores_pdf = [resultados_corte['phiVc']/1000, 8.86]
-                        colors_pdf = ['#2E8B57', '#4169E1']
-                        
-                        bars2 = ax2.bar(fuentes, valores_pdf, color=colors_pdf)
-                        ax2.set_title("Comparación con Valores del PDF")
-                        ax2.set_ylabel("φVc (ton)")
-                        
-                        for bar in bars2:
-                            height = bar.get_height()
-                            ax2.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                                   f'{height:.2f}', ha='center', va='bottom')
-                        
-                        # Gráfico 3: Estado de la zona
-                        estado_zona = 'Crítica' if resultados_corte['zona_critica'] else 'No Crítica'
-                        color_zona = '#DC143C' if resultados_corte['zona_critica'] else '#2E8B57'
-                        
-                        ax3.pie([1], labels=[estado_zona], autopct='%1.1f%%', colors=[color_zona])
-                        ax3.set_title("Estado de la Zona de Corte")
-                        
-                        # Gráfico 4: Factor de seguridad
-                        FS_corte = Vu_corte / resultados_corte['phiVc']
-                        ax4.bar(['Factor de Seguridad'], [FS_corte], 
-                               color='#2E8B57' if FS_corte >= 1.0 else '#DC143C')
-                        ax4.set_title("Factor de Seguridad")
-                        ax4.set_ylabel("Valor")
-                        ax4.axhline(y=1.0, color='red', linestyle='--', label='Límite de Seguridad')
-                        ax4.text(0, FS_corte + 0.05, f'{FS_corte:.2f}', ha='center', va='bottom')
-                        ax4.legend()
-                        
-                        plt.tight_layout()
-                        st.pyplot(fig)
-                        
-                    except Exception as e:
-                        st.info(f"📊 Gráfico no disponible: {str(e)}")
-                
-                # Gráfico de cortantes y momentos según McCormac
-                st.subheader("📊 Diagramas de Cortantes y Momentos (McCormac)")
-                
-                # Generar gráfico de viga con los datos de corte
-                L_corte_mccormac = 4.0  # Luz típica
-                w_corte_mccormac = Vu_corte / L_corte_mccormac  # Carga distribuida equivalente
-                
-                fig_mccormac = graficar_cortantes_momentos_mccormac(L_corte_mccormac, w_corte_mccormac, None, None, "simple")
-                if fig_mccormac:
-                    st.pyplot(fig_mccormac)
-                    
-                    # Mostrar valores máximos
-                    x, V, M = calcular_cortantes_momentos_viga_simple_mccormac(L_corte_mccormac, w_corte_mccormac, None, None)
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Cortante Máximo", f"{max(abs(V)):.0f} kg")
-                    with col2:
-                        st.metric("Momento Máximo", f"{max(abs(M)):.0f} kg·m")
-                    with col3:
-                        st.metric("Luz del Elemento", f"{L_corte_mccormac} m")
-                
-                # Dibujo de la viga de corte
-                st.subheader("✂️ Dibujo del Elemento a Corte")
-                
-                # Obtener resultados de corte desde session state
-                if 'resultados_corte' in st.session_state:
-                    resultados_corte = st.session_state['resultados_corte']
-                    # Calcular área de acero aproximada (2% del área de la sección)
-                    As_aproximada = 0.02 * b_corte * d_corte
-                    
-                    fig_corte = dibujar_viga(b_corte, d_corte, L_corte_mccormac, As_aproximada, 
-                                           resultados_corte.get('s_estribos', 20), fc_corte, fy_corte)
-                    if fig_corte:
-                        st.pyplot(fig_corte)
-                else:
-                    st.warning("⚠️ No hay resultados de corte disponibles. Realiza primero el cálculo.")
-                
-                # Gráficos adicionales si matplotlib está disponible
-                if MATPLOTLIB_AVAILABLE and plt is not None:
-                    try:
-                        # Verificar que tenemos resultados de corte
-                        if 'resultados_corte' in st.session_state:
-                            resultados_corte = st.session_state['resultados_corte']
-                            
-                            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 10))
-                            
-                            # Gráfico 1: Propiedades del ejercicio
-                            propiedades = ['Vu (ton)', 'φVc (ton)', 'Vs (ton)', 's_estribos (cm)']
-                            valores = [Vu_corte/1000, resultados_corte.get('phiVc', 0)/1000, 
-                                     resultados_corte.get('Vs_requerido', 0)/1000, resultados_corte.get('s_estribos', 0)]
-                            color_list = ['#2E8B57', '#DC143C', '#4169E1', '#FFD700']
-                            
-                            bars1 = ax1.bar(propiedades, valores, color=color_list)
-                            ax1.set_title("Propiedades del Ejercicio de Corte")
-                            ax1.set_ylabel("Valor")
-                            
-                            for bar in bars1:
-                                height = bar.get_height()
-                                ax1.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                                       f'{height:.2f}', ha='center', va='bottom')
-                            
-                            # Gráfico 2: Comparación con PDF
-                            fuentes = ['Cálculo Actual', 'Valor del PDF']
-                            valores_pdf = [resultados_corte.get('phiVc', 0)/1000, 8.86]
-                            colors_pdf = ['#2E8B57', '#4169E1']
-                            
-                            bars2 = ax2.bar(fuentes, valores_pdf, color=colors_pdf)
-                            ax2.set_title("Comparación con Valores del PDF")
-                            ax2.set_ylabel("φVc (ton)")
-                            
-                            for bar in bars2:
-                                height = bar.get_height()
-                                ax2.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                                       f'{height:.2f}', ha='center', va='bottom')
-                            
-                            # Gráfico 3: Estado de la zona
-                            estado_zona = 'Crítica' if resultados_corte.get('zona_critica', False) else 'No Crítica'
-                            color_zona = '#DC143C' if resultados_corte.get('zona_critica', False) else '#2E8B57'
-                            
-                            ax3.pie([1], labels=[estado_zona], autopct='%1.1f%%', colors=[color_zona])
-                            ax3.set_title("Estado de la Zona de Corte")
-                            
-                            # Gráfico 4: Factor de seguridad
-                            phiVc = resultados_corte.get('phiVc', 1)  # Evitar división por cero
-                            FS_corte = Vu_corte / phiVc if phiVc > 0 else 0
-                            ax4.bar(['Factor de Seguridad'], [FS_corte], 
-                                   color='#2E8B57' if FS_corte >= 1.0 else '#DC143C')
-                            ax4.set_title("Factor de Seguridad")
-                            ax4.set_ylabel("Valor")
-                            ax4.axhline(y=1.0, color='red', linestyle='--', label='Límite de Seguridad')
-                            ax4.text(0, FS_corte + 0.05, f'{FS_corte:.2f}', ha='center', va='bottom')
-                            ax4.legend()
-                            
-                            if plt is not None:
-                                plt.tight_layout()
-                                st.pyplot(fig)
-                        else:
-                            st.warning("⚠️ No hay resultados de corte disponibles para generar gráficos.")
-                        
-                    except Exception as e:
-                        st.info(f"📊 Gráfico no disponible: {str(e)}")
-                else:
-                    st.info("📊 Gráficos no disponibles - Instale plotly o matplotlib")
-
-    elif opcion == "📈 Gráficos":
-        st.title("📈 Gráficos y Visualizaciones")
-        
-        # Pestañas para diferentes tipos de gráficos
-        tab1, tab2, tab3 = st.tabs(["📊 Gráficos Básicos", "🔧 Cortantes y Momentos (Nilson)", "📈 Gráficos Avanzados"])
-        
-        with tab1:
-            st.subheader("📊 Gráficos Básicos")
-            
-            if st.session_state['plan'] == "gratuito":
-                st.warning("⚠️ Esta función requiere plan premium. Actualiza tu cuenta para acceder a gráficos avanzados.")
-                st.info("Plan gratuito incluye: Cálculos básicos, resultados simples")
-                st.info("Plan premium incluye: Gráficos interactivos, visualizaciones avanzadas")
-                
-                # Mostrar botón para actualizar plan
-                col1, col2, col3 = st.columns([1, 2, 1])
-                with col2:
-                    if st.button("⭐ Actualizar a Premium", type="primary", key="upgrade_graficos"):
-                        st.session_state['show_pricing'] = True
-                        st.rerun()
-            else:
-                # Gráficos premium
-                if 'resultados_completos' in st.session_state:
-                    resultados = st.session_state['resultados_completos']
-                    
-                    # Gráfico de propiedades
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        if PLOTLY_AVAILABLE:
-                            datos_propiedades = pd.DataFrame({
-                                'Propiedad': ['Ec (kg/cm²)', 'Es (kg/cm²)', 'fr (kg/cm²)', 'β1'],
-                                'Valor': [resultados.get('Ec', 0)/1000, resultados.get('Es', 0)/1000000, 
-                                         resultados.get('fr', 0), resultados.get('beta1', 0)]
-                            })
-                            
-                            fig1 = px.bar(datos_propiedades, x='Propiedad', y='Valor',
-                                         title="Propiedades de los Materiales - Plan Premium",
-                                         color='Propiedad',
-                                         color_discrete_map={
-                                             'Ec (kg/cm²)': '#4169E1',
-                                             'Es (kg/cm²)': '#DC143C',
-                                             'fr (kg/cm²)': '#32CD32',
-                                             'β1': '#FFD700'
-                                         })
-                            
-                            fig1.update_layout(
-                                xaxis_title="Propiedad",
-                                yaxis_title="Valor",
-                                height=400
-                            )
-                            
-                            fig1.update_traces(texttemplate='%{y:.2f}', textposition='outside')
-                            st.plotly_chart(fig1, use_container_width=True)
-                        else:
-                            # Gráfico alternativo con matplotlib
-                            if MATPLOTLIB_AVAILABLE and plt is not None:
-                                try:
-                                    fig1, ax1 = plt.subplots(figsize=(8, 6))
-                                    propiedades = ['Ec', 'Es', 'fr', 'β1']
-                                    valores = [resultados.get('Ec', 0)/1000, resultados.get('Es', 0)/1000000, 
-                                              resultados.get('fr', 0), resultados.get('beta1', 0)]
-                                    color_list = ['#4169E1', '#DC143C', '#32CD32', '#FFD700']
-                                    bars = ax1.bar(propiedades, valores, color=color_list)
-                                    ax1.set_title("Propiedades de los Materiales - Plan Premium")
-                                    ax1.set_ylabel("Valor")
-                                    for bar in bars:
-                                        height = bar.get_height()
-                                        ax1.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                                               f'{height:.2f}', ha='center', va='bottom')
-                                    st.pyplot(fig1)
-                                except ImportError:
-                                    st.info("📊 Gráfico no disponible - Matplotlib no está instalado")
-                                    st.write("Para ver gráficos, instale matplotlib: `pip install matplotlib`")
-                    
-                    with col2:
-                        # Gráfico de dimensiones
-                        if PLOTLY_AVAILABLE:
-                            datos_dimensiones = pd.DataFrame({
-                                'Dimensión': ['Peso Total (ton)', 'Espesor Losa (cm)', 'Ancho Viga (cm)', 'Alto Viga (cm)'],
-                                'Valor': [resultados.get('peso_total', 0), resultados.get('h_losa', 0)*100, 
-                                         resultados.get('b_viga', 0), resultados.get('d_viga', 0)]
-                            })
-                            
-                            fig2 = px.pie(datos_dimensiones, values='Valor', names='Dimensión',
-                                         title="Distribución de Dimensiones - Plan Premium",
-                                         color_discrete_map={
-                                             'Peso Total (ton)': '#2E8B57',
-                                             'Espesor Losa (cm)': '#FF6B6B',
-                                             'Ancho Viga (cm)': '#4ECDC4',
-                                             'Alto Viga (cm)': '#FFD93D'
-                                         })
-                            
-                            fig2.update_traces(textposition='inside', textinfo='percent+label+value')
-                            st.plotly_chart(fig2, use_container_width=True)
-                        else:
-                            # Gráfico alternativo con matplotlib
-                            if MATPLOTLIB_AVAILABLE and plt is not None:
-                                fig2, ax2 = plt.subplots(figsize=(8, 8))
-                                dimensiones = ['Peso Total', 'Espesor Losa', 'Ancho Viga', 'Alto Viga']
-                                valores = [resultados.get('peso_total', 0), resultados.get('h_losa', 0)*100, 
-                                          resultados.get('b_viga', 0), resultados.get('d_viga', 0)]
-                                color_list = ['#2E8B57', '#FF6B6B', '#4ECDC4', '#FFD93D']
-                                
-                                ax2.pie(valores, labels=dimensiones, autopct='%1.1f%%', colors=color_list)
-                                ax2.set_title("Distribución de Dimensiones - Plan Premium")
-                                st.pyplot(fig2)
-                            else:
-                                st.info("📊 Gráfico no disponible - Matplotlib no está instalado")
-                                st.write("Para ver gráficos, instale matplotlib: `pip install matplotlib`")
-                else:
-                    st.warning("⚠️ No hay resultados disponibles. Realiza primero el análisis completo.")
-        
-        with tab2:
-            st.subheader("🔧 Diagramas de Cortantes y Momentos - Jack C. McCormac")
-            st.info("📚 Basado en 'Diseño de Estructuras de Concreto' de Jack C. McCormac")
-            
-            # Seleccionar tipo de viga
-            tipo_viga = st.selectbox(
-                "Selecciona el tipo de viga:",
-                ["Viga Simplemente Apoyada", "Viga Empotrada", "Viga Continua (2 tramos)"],
-                help="Según Jack C. McCormac - Diseño de Estructuras de Concreto"
-            )
-            
-            if tipo_viga == "Viga Simplemente Apoyada":
-                st.markdown("### 📐 Viga Simplemente Apoyada")
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    L = st.number_input("Luz de la viga (m)", 1.0, 20.0, 6.0, 0.5)
-                    w = st.number_input("Carga distribuida (kg/m)", 0.0, 10000.0, 1000.0, 100.0)
-                
-                with col2:
-                    usar_carga_puntual = st.checkbox("Agregar carga puntual")
-                    if usar_carga_puntual:
-                        P = st.number_input("Carga puntual (kg)", 0.0, 50000.0, 5000.0, 500.0)
-                        a = st.number_input("Distancia desde apoyo izquierdo (m)", 0.1, L-0.1, L/2, 0.1)
-                    else:
-                        P = None
-                        a = None
-                
-                if st.button("🔬 Generar Diagramas", type="primary"):
-                    fig = graficar_cortantes_momentos_mccormac(L, w, P, a, "simple")
-                    if fig:
-                        st.pyplot(fig)
-                        
-                        # Mostrar valores máximos
-                        x, V, M = calcular_cortantes_momentos_viga_simple_mccormac(L, w, P, a)
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.metric("Cortante Máximo", f"{max(abs(V)):.1f} kg")
-                        with col2:
-                            st.metric("Momento Máximo", f"{max(abs(M)):.1f} kg·m")
-                        with col3:
-                            st.metric("Luz de la Viga", f"{L} m")
-        
-            elif tipo_viga == "Viga Empotrada":
-                st.markdown("### 🔒 Viga Empotrada")
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    L = st.number_input("Luz de la viga (m)", 1.0, 20.0, 6.0, 0.5, key="empotrada")
-                    w = st.number_input("Carga distribuida (kg/m)", 0.0, 10000.0, 1000.0, 100.0, key="w_empotrada")
-                
-                with col2:
-                    usar_carga_puntual = st.checkbox("Agregar carga puntual", key="puntual_empotrada")
-                    if usar_carga_puntual:
-                        P = st.number_input("Carga puntual (kg)", 0.0, 50000.0, 5000.0, 500.0, key="P_empotrada")
-                        a = st.number_input("Distancia desde apoyo izquierdo (m)", 0.1, L-0.1, L/2, 0.1, key="a_empotrada")
-                    else:
-                        P = None
-                        a = None
-                
-                if st.button("🔬 Generar Diagramas", type="primary", key="btn_empotrada"):
-                    fig = graficar_cortantes_momentos_mccormac(L, w, P, a, "empotrada")
-                    if fig:
-                        st.pyplot(fig)
-                        
-                        # Mostrar valores máximos
-                        x, V, M = calcular_cortantes_momentos_viga_empotrada_mccormac(L, w, P, a)
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.metric("Cortante Máximo", f"{max(abs(V)):.1f} kg")
-                        with col2:
-                            st.metric("Momento Máximo", f"{max(abs(M)):.1f} kg·m")
-                        with col3:
-                            st.metric("Luz de la Viga", f"{L} m")
-        
-            elif tipo_viga == "Viga Continua (2 tramos)":
-                st.markdown("### 🔗 Viga Continua de 2 Tramos")
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    L1 = st.number_input("Luz del primer tramo (m)", 1.0, 15.0, 5.0, 0.5)
-                    L2 = st.number_input("Luz del segundo tramo (m)", 1.0, 15.0, 5.0, 0.5)
-                
-                with col2:
-                    w1 = st.number_input("Carga distribuida tramo 1 (kg/m)", 0.0, 10000.0, 1000.0, 100.0)
-                    w2 = st.number_input("Carga distribuida tramo 2 (kg/m)", 0.0, 10000.0, 1000.0, 100.0)
-                
-                if st.button("🔬 Generar Diagramas", type="primary", key="btn_continua"):
-                    fig = graficar_viga_continua_mccormac(L1, L2, w1, w2)
-                    if fig:
-                        st.pyplot(fig)
-                        
-                        # Mostrar valores máximos
-                        x1, V1, M1, x2, V2, M2, R_A, R_B1, R_B2, R_C, M_B = calcular_cortantes_momentos_viga_continua_mccormac(L1, L2, w1, w2)
-                        
-                        col1, col2, col3, col4 = st.columns(4)
-                        with col1:
-                            st.metric("Cortante Máx. Tramo 1", f"{max(abs(V1)):.1f} kg")
-                        with col2:
-                            st.metric("Cortante Máx. Tramo 2", f"{max(abs(V2)):.1f} kg")
-                        with col3:
-                            st.metric("Momento Máx. Tramo 1", f"{max(abs(M1)):.1f} kg·m")
-                        with col4:
-                            st.metric("Momento Máx. Tramo 2", f"{max(abs(M2)):.1f} kg·m")
-                        
-                        # Mostrar reacciones
-                        st.subheader("📊 Reacciones Calculadas")
-                        col1, col2, col3, col4 = st.columns(4)
-                        with col1:
-                            st.metric("Reacción A", f"{R_A:.1f} kg")
-                        with col2:
-                            st.metric("Reacción B1", f"{R_B1:.1f} kg")
-                        with col3:
-                            st.metric("Reacción B2", f"{R_B2:.1f} kg")
-                        with col4:
-                            st.metric("Reacción C", f"{R_C:.1f} kg")
-        
-            # Información técnica
-            st.markdown("---")
-            st.subheader("📚 Información Técnica - Jack C. McCormac")
-            st.markdown("""
-            **Referencia:** Diseño de Estructuras de Concreto - Jack C. McCormac
-            
-            **Fórmulas utilizadas:**
-            - **Viga simplemente apoyada:** Reacciones R = wL/2, Momento máximo M = wL²/8
-            - **Viga empotrada:** Momentos de empotramiento M = ±wL²/12
-            - **Viga continua:** Método de coeficientes para momentos en apoyos
-            
-            **Aplicaciones:**
-            - Diseño de vigas de concreto armado
-            - Análisis de cargas distribuidas y puntuales
-            - Verificación de momentos y cortantes máximos
-            - Diseño de refuerzo según ACI 318
-            """)
-        
-        with tab3:
-            st.subheader("📈 Gráficos Avanzados")
-            st.info("Esta sección incluye gráficos avanzados y visualizaciones 3D (disponible en plan empresarial)")
-            
-            if st.session_state['plan'] == "empresarial":
-                st.success("🏢 Plan Empresarial: Acceso completo a gráficos avanzados")
-                # Aquí se pueden agregar gráficos 3D y visualizaciones avanzadas
-                st.info("🚧 Funcionalidad en desarrollo - Próximamente gráficos 3D y visualizaciones avanzadas")
-            else:
-                st.warning("⚠️ Esta función requiere plan empresarial")
-                st.info("Actualiza a plan empresarial para acceder a gráficos 3D y visualizaciones avanzadas")
-
-    elif opcion == "ℹ️ Acerca de":
-        st.title("ℹ️ Acerca de CONSORCIO DEJ")
-        st.write("""
-        ### 🏗️ CONSORCIO DEJ
-        **Ingeniería y Construcción Especializada**
-        
-        Esta aplicación fue desarrollada para facilitar el análisis y diseño estructural
-        utilizando métodos reconocidos en ingeniería civil.
-        
-        **Características del Plan Gratuito:**
-        - ✅ Cálculos básicos de análisis estructural
-        - ✅ Resultados simples con gráficos básicos
-        - ✅ Reporte básico descargable
-        - ✅ Análisis de propiedades de materiales
-        
-        **Características del Plan Premium:**
-        - ⭐ Análisis completo con ACI 318-2025
-        - ⭐ Cálculos de predimensionamiento automáticos
-        - ⭐ **Reportes técnicos en PDF** (NUEVO)
-        - ⭐ **Gráficos interactivos avanzados** (NUEVO)
-        - ⭐ Verificaciones de estabilidad completas
-        - ⭐ Fórmulas de diseño estructural detalladas
-        
-        **Desarrollado con:** Python, Streamlit, Plotly
-        **Normativas:** ACI 318-2025, E.060, E.030
-        """)
-
-    elif opcion == "✉️ Contacto":
-        st.title("✉️ Contacto")
-        st.write("""
-        ### 🏗️ CONSORCIO DEJ
-        **Información de Contacto:**
-        
-        📧 Email: contacto@consorciodej.com  
-        📱 Teléfono: +123 456 7890  
-        🌐 Web: www.consorciodej.com  
-        📍 Dirección: [Tu dirección aquí]
-        
-        **Horarios de Atención:**
-        Lunes a Viernes: 8:00 AM - 6:00 PM
-        
-        **Servicios:**
-        - Análisis estructural
-        - Diseño de estructuras
-        - Ingeniería civil
-        - Construcción especializada
-        """)
+    # =====================
+    # MENÚ PRINCIPAL
+    # =====================
+    # Cada página (paginas/) se ejecuta sola e importa solo sus dependencias
+    pagina = st.navigation([
+        st.Page("paginas/calculo_basico.py", title="Cálculo Básico", icon="🏗️", default=True),
+        st.Page("paginas/analisis_completo.py", title="Análisis Completo", icon="📊"),
+        st.Page("paginas/generar_reporte.py", title="Generar Reporte", icon="📄"),
+        st.Page("paginas/comparar_analisis.py", title="Comparar Análisis", icon="🔀"),
+        st.Page("paginas/proyectos.py", title="Mis Proyectos", icon="🗂️"),
+        st.Page("paginas/formulas_diseno.py", title="Fórmulas de Diseño Estructural", icon="📚"),
+        st.Page("paginas/diseno_zapatas.py", title="Diseño de Zapatas", icon="🏗️"),
+        st.Page("paginas/diseno_vigas.py", title="Diseño de Vigas", icon="🔧"),
+        st.Page("paginas/diseno_columnas.py", title="Diseño de Columnas", icon="🏢"),
+        st.Page("paginas/ejercicio_corte.py", title="Ejercicio Básico de Corte", icon="✂️"),
+        st.Page("paginas/graficos_diagramas.py", title="Gráficos", icon="📈"),
+        st.Page("paginas/acerca_de.py", title="Acerca de", icon="ℹ️"),
+        st.Page("paginas/contacto.py", title="Contacto", icon="✉️"),
+    ])
+    pagina.run()
 
     # ✅ RESULTADOS: 4/4 pruebas pasaron
     # ✅ La aplicación está lista para producción
\ No newline at end of file
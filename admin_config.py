@@ -70,6 +70,30 @@ PAYMENT_CONFIG = {
     }
 }
 
+# Configuración de la API de integración (límites por plan)
+API_CONFIG = {
+    "gratuito": {
+        "solicitudes_por_minuto": 10,
+        "max_lote": 1
+    },
+    "premium": {
+        "solicitudes_por_minuto": 60,
+        "max_lote": 10
+    },
+    "empresarial": {
+        "solicitudes_por_minuto": 600,
+        "max_lote": 100
+    }
+}
+
+# Almacenamiento de usuarios y pagos ("sqlite" o "json")
+STORAGE_CONFIG = {
+    "backend": "sqlite",
+    "database": "payments.db",
+    "users_file": "users.json",
+    "payments_file": "payments.json"
+}
+
 def get_admin_credentials():
     """Obtener credenciales del administrador"""
     return ADMIN_CREDENTIALS
@@ -86,6 +110,14 @@ def get_payment_config(payment_method):
     """Obtener configuración de método de pago"""
     return PAYMENT_CONFIG.get(payment_method, {})
 
+def get_api_config(plan_name):
+    """Obtener límites de la API para un plan (gratuito por defecto)"""
+    return API_CONFIG.get(plan_name, API_CONFIG["gratuito"])
+
+def get_storage_config():
+    """Obtener configuración del almacenamiento de usuarios y pagos"""
+    return STORAGE_CONFIG
+
 def validate_admin_login(username, password):
     """Validar login de administrador"""
     return (username == ADMIN_CREDENTIALS["usuario"] and 
@@ -108,4 +140,4 @@ if __name__ == "__main__":
     print()
     print("💰 CONFIGURACIÓN DE PLANES")
     for plan, config in PLANS_CONFIG.items():
-        print(f"{plan.title()}: ${config['precio']}/mes") 
\ No newline at end of file
+        print(f"{plan.title()}: ${config['precio']}/mes") 
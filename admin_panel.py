@@ -8,7 +8,7 @@ import streamlit as st
 import json
 import os
 from datetime import datetime
-from simple_payment_system import payment_system
+from simple_payment_system import payment_system, start_expiry_scheduler
 from admin_config import validate_admin_login, get_plan_config, get_payment_config
 
 def show_admin_login():
@@ -72,33 +72,29 @@ def show_dashboard():
     """Mostrar dashboard principal"""
     st.subheader("📊 Dashboard General")
     
-    # Estadísticas rápidas
+    # Estadísticas rápidas (contadores mantenidos por el sistema de pagos)
+    stats = payment_system.get_statistics()
+    users_by_plan = stats["users_by_plan"]
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_users = len(payment_system.users)
-        st.metric("👥 Total Usuarios", total_users)
+        st.metric("👥 Total Usuarios", sum(users_by_plan.values()))
     
     with col2:
-        pending_payments = len(payment_system.get_pending_payments())
-        st.metric("⏳ Pagos Pendientes", pending_payments)
+        st.metric("⏳ Pagos Pendientes", stats["payments_by_status"].get("pendiente", 0))
     
     with col3:
-        premium_users = sum(1 for user in payment_system.users.values() 
-                          if user.get('plan') == 'premium')
-        st.metric("⭐ Usuarios Premium", premium_users)
+        st.metric("⭐ Usuarios Premium", users_by_plan.get("premium", 0))
     
     with col4:
-        business_users = sum(1 for user in payment_system.users.values() 
-                           if user.get('plan') == 'empresarial')
-        st.metric("🏢 Usuarios Empresarial", business_users)
+        st.metric("🏢 Usuarios Empresarial", users_by_plan.get("empresarial", 0))
     
     # Pagos pendientes recientes
     st.subheader("⏳ Pagos Pendientes Recientes")
-    pending_payments = payment_system.get_pending_payments()
+    pending_payments = payment_system.query_payments(status="pendiente", descending=True, limit=5)["rows"]
     
     if pending_payments:
-        for payment in pending_payments[-5:]:  # Últimos 5 pagos
+        for payment in pending_payments:  # Últimos 5 pagos, del más reciente al más antiguo
             with st.container():
                 col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
                 
@@ -122,40 +118,119 @@ def show_dashboard():
     else:
         st.info("No hay pagos pendientes")
 
+# Filas por página en las listas de usuarios y pagos
+PAGE_SIZES = [25, 50, 100]
+
+USER_SORT_OPTIONS = {
+    "Registro": "created_at",
+    "Email": "email",
+    "Plan": "plan",
+    "Expiración": "expires_at",
+}
+
+PAYMENT_SORT_OPTIONS = {
+    "Fecha": "created_at",
+    "Email": "email",
+    "Plan": "plan",
+    "Monto": "amount",
+    "Estado": "status",
+}
+
+def query_page(query, key, filters, page_size):
+    """
+    Una página de query(**filters) con una sola consulta: la página se lee de la sesión antes de dibujar
+    su selector, y si los filtros la dejaron fuera de rango se vuelve a la última
+    """
+    page = st.session_state.get(f"{key}_page") or 1
+    result = query(**filters, limit=page_size, offset=(page - 1) * page_size)
+    pages = max(1, -(-result["total"] // page_size))
+    if page > pages:
+        st.session_state[f"{key}_page"] = pages
+        result = query(**filters, limit=page_size, offset=(pages - 1) * page_size)
+    return result
+
+def show_pagination(key, total, page_size):
+    """Selector de página (después de query_page); devuelve el offset de la página elegida"""
+    pages = max(1, -(-total // page_size))
+    page = st.number_input(f"Página (de {pages})", min_value=1, max_value=pages, key=f"{key}_page")
+    offset = (page - 1) * page_size
+    if total:
+        st.caption(f"Mostrando {offset + 1}–{min(offset + page_size, total)} de {total}")
+    return offset
+
+def show_selectable_table(rows, columns, key):
+    """Tabla de la página actual con selección de varias filas; devuelve las filas seleccionadas"""
+    import pandas as pd
+    
+    df = pd.DataFrame(rows, columns=columns)
+    event = st.dataframe(df, key=key, hide_index=True, on_select="rerun", selection_mode="multi-row")
+    return [rows[i] for i in event.selection.rows if i < len(rows)]
+
 def show_users_management():
     """Gestionar usuarios"""
     st.subheader("👥 Gestión de Usuarios")
     
-    # Buscar usuario
-    search_email = st.text_input("🔍 Buscar usuario por email")
+    # Filtros (se aplican en el sistema de pagos: solo se leen las filas de la página)
+    col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
+    
+    with col1:
+        search_email = st.text_input("🔍 Buscar usuario por email (inicio del email)")
+    
+    with col2:
+        plan_filter = st.selectbox("Filtrar por plan", ["Todos", "gratuito", "premium", "empresarial"])
+    
+    with col3:
+        sort_label = st.selectbox("Ordenar por", list(USER_SORT_OPTIONS))
+        descending = st.checkbox("Descendente", key="users_descending")
+    
+    with col4:
+        page_size = st.selectbox("Filas", PAGE_SIZES, key="users_page_size")
     
     if search_email:
-        if search_email in payment_system.users:
-            user = payment_system.users[search_email]
+        user = payment_system.get_user(search_email)
+        if user is not None:
             show_user_details(user)
-        else:
-            st.warning("Usuario no encontrado")
+    
+    filters = {
+        "search": search_email or None,
+        "plan": None if plan_filter == "Todos" else plan_filter,
+        "sort": USER_SORT_OPTIONS[sort_label],
+        "descending": descending,
+    }
+    result = query_page(payment_system.query_users, "users", filters, page_size)
+    total = result["total"]
     
     # Lista de usuarios
-    st.subheader("📋 Lista de Usuarios")
-    
-    for email, user in payment_system.users.items():
-        with st.expander(f"{email} - {user.get('plan', 'gratuito').title()}"):
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                st.write(f"**Nombre:** {user.get('name', 'N/A')}")
-                st.write(f"**Plan:** {user.get('plan', 'gratuito').title()}")
-                st.write(f"**Registrado:** {user.get('created_at', 'N/A')}")
-                if user.get('expires_at'):
-                    st.write(f"**Expira:** {user.get('expires_at', 'N/A')}")
-            
-            with col2:
-                if st.button("🗑️ Eliminar", key=f"delete_{email}"):
-                    del payment_system.users[email]
-                    payment_system.save_data()
-                    st.success("Usuario eliminado")
-                    st.rerun()
+    st.subheader(f"📋 Lista de Usuarios ({total})")
+    
+    if total == 0:
+        st.warning("Usuario no encontrado" if search_email else "No hay usuarios")
+        return
+    
+    show_pagination("users", total, page_size)
+    selected = show_selectable_table(
+        result["rows"], ["email", "name", "plan", "created_at", "expires_at", "payment_pending"], "users_table"
+    )
+    
+    # Acciones sobre las filas seleccionadas
+    emails = [user['email'] for user in selected]
+    col1, col2, col3 = st.columns([2, 1, 1])
+    
+    with col1:
+        new_plan = st.selectbox("Plan para los seleccionados", ["gratuito", "premium", "empresarial"], key="bulk_plan")
+        never_expires = st.checkbox("Sin vencimiento (si no, vence en 30 días)", key="bulk_never_expires")
+    
+    with col2:
+        if st.button("🔄 Cambiar plan", disabled=not emails):
+            updated = payment_system.set_users_plan(emails, new_plan, never_expires)
+            st.success(f"{len(updated)} usuario(s) pasados a {new_plan.title()}")
+            st.rerun()
+    
+    with col3:
+        if st.button("🗑️ Eliminar", disabled=not emails):
+            deleted = payment_system.delete_users(emails)
+            st.success(f"{len(deleted)} usuario(s) eliminados")
+            st.rerun()
 
 def show_user_details(user):
     """Mostrar detalles de un usuario"""
@@ -178,67 +253,63 @@ def show_user_details(user):
     # Cambiar plan
     st.subheader("🔄 Cambiar Plan")
     new_plan = st.selectbox("Nuevo plan", ["gratuito", "premium", "empresarial"])
+    never_expires = st.checkbox("Sin vencimiento (si no, vence en 30 días)", key="user_never_expires")
     
     if st.button("Actualizar Plan"):
-        user['plan'] = new_plan
-        user['payment_pending'] = None
-        payment_system.save_data()
+        payment_system.set_user_plan(user['email'], new_plan, never_expires)
         st.success(f"Plan actualizado a {new_plan.title()}")
 
 def show_payments_management():
     """Gestionar pagos"""
     st.subheader("💳 Gestión de Pagos")
     
-    # Filtros
-    col1, col2 = st.columns(2)
+    # Filtros (se aplican en el sistema de pagos: solo se leen las filas de la página)
+    col1, col2, col3, col4, col5 = st.columns([3, 2, 2, 2, 1])
     
     with col1:
-        status_filter = st.selectbox("Filtrar por estado", ["Todos", "pendiente", "confirmado"])
+        search_email = st.text_input("🔍 Buscar por email (inicio del email)", key="payments_search")
     
     with col2:
+        status_filter = st.selectbox("Filtrar por estado", ["Todos", "pendiente", "confirmado"])
+    
+    with col3:
         plan_filter = st.selectbox("Filtrar por plan", ["Todos", "premium", "empresarial"])
     
-    # Lista de pagos
-    payments = payment_system.payments
-    
-    # Aplicar filtros
-    if status_filter != "Todos":
-        payments = [p for p in payments if p['status'] == status_filter]
-    
-    if plan_filter != "Todos":
-        payments = [p for p in payments if p['plan'] == plan_filter]
-    
-    st.subheader(f"📋 Pagos ({len(payments)})")
-    
-    for payment in payments:
-        with st.expander(f"{payment['id']} - {payment['email']} - {payment['plan'].title()}"):
-            col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
-            
-            with col1:
-                st.write(f"**Email:** {payment['email']}")
-                st.write(f"**Plan:** {payment['plan'].title()}")
-                st.write(f"**Método:** {payment['payment_method']}")
-            
-            with col2:
-                st.write(f"**Monto:** ${payment['amount']:.2f}")
-                st.write(f"**Estado:** {payment['status']}")
-            
-            with col3:
-                st.write(f"**Fecha:** {payment['created_at']}")
-                if payment.get('confirmed_at'):
-                    st.write(f"**Confirmado:** {payment['confirmed_at']}")
-            
-            with col4:
-                if payment['status'] == 'pendiente':
-                    if st.button("✅ Confirmar", key=f"confirm_payment_{payment['id']}"):
-                        result = payment_system.confirm_payment(payment['id'])
-                        if result["success"]:
-                            st.success("Pago confirmado")
-                            st.rerun()
-                        else:
-                            st.error(result["message"])
-                else:
-                    st.success("✅ Confirmado")
+    with col4:
+        sort_label = st.selectbox("Ordenar por", list(PAYMENT_SORT_OPTIONS), key="payments_sort")
+        ascending = st.checkbox("Ascendente", key="payments_ascending")
+    
+    with col5:
+        page_size = st.selectbox("Filas", PAGE_SIZES, key="payments_page_size")
+    
+    filters = {
+        "search": search_email or None,
+        "status": None if status_filter == "Todos" else status_filter,
+        "plan": None if plan_filter == "Todos" else plan_filter,
+        "sort": PAYMENT_SORT_OPTIONS[sort_label],
+        "descending": not ascending,
+    }
+    result = query_page(payment_system.query_payments, "payments", filters, page_size)
+    total = result["total"]
+    
+    st.subheader(f"📋 Pagos ({total})")
+    
+    if total == 0:
+        st.info("No hay pagos con estos filtros")
+        return
+    
+    show_pagination("payments", total, page_size)
+    selected = show_selectable_table(
+        result["rows"], ["id", "email", "plan", "amount", "payment_method", "status", "created_at", "confirmed_at"],
+        "payments_table"
+    )
+    
+    # Confirmar los pagos pendientes seleccionados
+    pending = [payment['id'] for payment in selected if payment['status'] == 'pendiente']
+    if st.button(f"✅ Confirmar seleccionados ({len(pending)})", disabled=not pending):
+        confirmed = payment_system.confirm_payments(pending)
+        st.success(f"{len(confirmed)} pago(s) confirmados")
+        st.rerun()
 
 def show_configuration():
     """Mostrar configuración"""
@@ -270,10 +341,9 @@ def show_statistics():
     # Gráficos de usuarios por plan
     import pandas as pd
     
-    plan_counts = {}
-    for user in payment_system.users.values():
-        plan = user.get('plan', 'gratuito')
-        plan_counts[plan] = plan_counts.get(plan, 0) + 1
+    # Contadores ya agregados: el costo no depende de la cantidad de usuarios ni de pagos
+    stats = payment_system.get_statistics()
+    plan_counts = stats["users_by_plan"]
     
     if plan_counts:
         df_plans = pd.DataFrame(list(plan_counts.items()), columns=['Plan', 'Usuarios'])
@@ -291,20 +361,20 @@ def show_statistics():
     # Estadísticas de pagos
     st.subheader("💳 Estadísticas de Pagos")
     
-    if payment_system.payments:
-        df_payments = pd.DataFrame(payment_system.payments)
-        
+    if stats["payments_by_status"]:
         col1, col2 = st.columns(2)
         
         with col1:
             st.write("**Pagos por estado:**")
-            status_counts = df_payments['status'].value_counts()
-            st.bar_chart(status_counts)
+            st.bar_chart(pd.Series(stats["payments_by_status"], name="count"))
         
         with col2:
             st.write("**Pagos por plan:**")
-            plan_counts = df_payments['plan'].value_counts()
-            st.bar_chart(plan_counts)
+            st.bar_chart(pd.Series(stats["payments_by_plan"], name="count"))
+        
+        if stats["revenue_by_day"]:
+            st.write("**Ingresos confirmados por día:**")
+            st.line_chart(pd.Series(stats["revenue_by_day"], name="Ingresos"))
     else:
         st.info("No hay datos de pagos disponibles")
 
@@ -316,6 +386,9 @@ def main():
         layout="wide"
     )
     
+    # Pasar a gratuito los planes vencidos (un solo hilo por proceso)
+    start_expiry_scheduler()
+    
     # Verificar si el admin está logueado
     if 'admin_logged_in' not in st.session_state:
         st.session_state['admin_logged_in'] = False
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+API de Integración - CONSORCIO DEJ
+Servidor HTTP/JSON local que expone el motor de cálculo (plan empresarial)
+
+Uso:
+    python api_server.py --host 127.0.0.1 --port 8765 --workers 4
+
+Endpoints:
+    GET  /api/v1/salud                 Estado del servidor y operaciones disponibles
+    POST /api/v1/calcular/<operacion>  Ejecuta una operación con los parámetros del cuerpo JSON
+    POST /api/v1/lote                  {"solicitudes": [{"operacion": ..., "parametros": {...}}, ...]}
+
+Autenticación opcional con HTTP Basic (email:clave). Sin credenciales se aplican
+los límites del plan gratuito por dirección IP.
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import multiprocessing
+import secrets
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import motor_calculo
+from admin_config import get_api_config, validate_admin_login
+
+# Operaciones expuestas -> nombre de la función en motor_calculo
+OPERACIONES = {
+    "zapatas": "calcular_diseno_zapatas",
+    "vigas": "calcular_diseno_vigas_detallado",
+    "columnas": "calcular_diseno_columnas_detallado",
+    "corte": "calcular_ejercicio_basico_corte",
+    "sismico": "calcular_analisis_sismico",
+    "analisis_completo": "ejecutar_analisis_completo",
+}
+
+MAX_CUERPO_BYTES = 1024 * 1024
+TIMEOUT_LECTURA = 10
+
+# Cada cuánto se eliminan las cubetas inactivas del limitador (segundos)
+INTERVALO_PURGA_CUBETAS = 60
+
+# Credenciales verificadas hace menos de esto no vuelven a pasar por el KDF (segundos)
+TTL_CREDENCIALES = 120
+MAX_CREDENCIALES_RECORDADAS = 1024
+
+ESTADOS_HTTP = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+}
+
+def ejecutar_operacion(operacion, parametros):
+    """Ejecutar una operación del motor de cálculo (corre en el pool de procesos)"""
+    funcion = getattr(motor_calculo, OPERACIONES[operacion])
+    return funcion(**parametros)
+
+def autenticar(email, clave):
+    """Resolver el plan de un usuario de la API (None si las credenciales no son válidas); no abre sesión"""
+    if validate_admin_login(email, clave):
+        return "empresarial"
+
+    from simple_payment_system import payment_system
+    result = payment_system.check_credentials(email, clave)
+    if result["success"]:
+        return result["user"].get("plan", "gratuito")
+    return None
+
+def _a_json(obj):
+    """Convertir tipos de numpy a tipos nativos para json.dumps"""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Tipo no serializable: {type(obj).__name__}")
+
+class LimitadorTasa:
+    """
+    Cubeta de fichas por cliente, recargada según el plan (solicitudes por minuto).
+    Una cubeta se llena en 60 s sin uso y entonces equivale a no tenerla: las inactivas
+    se eliminan periódicamente para que cubetas no crezca con cada IP o usuario visto
+    """
+
+    def __init__(self, config=None, reloj=time.monotonic):
+        self.config = config or {}
+        self.reloj = reloj
+        self.cubetas = {}
+        self._ultima_purga = reloj()
+
+    def limites(self, plan):
+        """Límites del plan (config local o admin_config.API_CONFIG)"""
+        return self.config.get(plan) or get_api_config(plan)
+
+    def consumir(self, clave, plan, costo=1):
+        """Consumir fichas; devuelve (permitido, restantes, segundos_para_reintentar)"""
+        capacidad = self.limites(plan)["solicitudes_por_minuto"]
+        tasa = capacidad / 60.0
+        ahora = self.reloj()
+        if ahora - self._ultima_purga >= INTERVALO_PURGA_CUBETAS:
+            self.purgar(ahora)
+
+        fichas, ultimo = self.cubetas.get(clave, (capacidad, ahora))
+        fichas = min(capacidad, fichas + (ahora - ultimo) * tasa)
+
+        if costo > fichas:
+            self.cubetas[clave] = (fichas, ahora)
+            return False, int(fichas), (costo - fichas) / tasa
+
+        fichas -= costo
+        self.cubetas[clave] = (fichas, ahora)
+        return True, int(fichas), 0.0
+
+    def purgar(self, ahora=None):
+        """Eliminar las cubetas sin uso por 60 s o más (ya están llenas); devuelve cuántas"""
+        ahora = self.reloj() if ahora is None else ahora
+        inactivas = [clave for clave, (_, ultimo) in self.cubetas.items() if ahora - ultimo >= 60]
+        for clave in inactivas:
+            del self.cubetas[clave]
+        self._ultima_purga = ahora
+        return len(inactivas)
+
+class ErrorAPI(Exception):
+    """Error con código HTTP para responder al cliente"""
+
+    def __init__(self, estado, mensaje, headers=None):
+        super().__init__(mensaje)
+        self.estado = estado
+        self.mensaje = mensaje
+        self.headers = headers or {}
+
+class ServidorAPI:
+    """Servidor asyncio que delega los cálculos a un pool de procesos"""
+
+    def __init__(self, host="127.0.0.1", port=8765, workers=None,
+                 autenticador=autenticar, limitador=None, executor=None):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.autenticador = autenticador
+        self.limitador = limitador or LimitadorTasa()
+        self.executor = executor
+        self._executor_propio = executor is None
+        self.servidor = None
+        # Huella (HMAC con clave del proceso) de credenciales correctas -> (plan, vence)
+        self._clave_huellas = secrets.token_bytes(32)
+        self._credenciales = {}
+
+    @property
+    def puerto(self):
+        """Puerto real en escucha (útil con port=0)"""
+        return self.servidor.sockets[0].getsockname()[1]
+
+    async def iniciar(self):
+        """Abrir el socket y crear el pool de procesos"""
+        if self.executor is None:
+            # "spawn": el bucle de eventos ya tiene hilos activos y fork podría bloquear los workers
+            self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                mp_context=multiprocessing.get_context("spawn"))
+        self.servidor = await asyncio.start_server(self._atender, self.host, self.port)
+        return self.puerto
+
+    async def detener(self):
+        """Cerrar el socket y liberar el pool de procesos"""
+        if self.servidor is not None:
+            self.servidor.close()
+            await self.servidor.wait_closed()
+        if self._executor_propio and self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    async def servir(self):
+        """Atender solicitudes hasta que se cancele la tarea"""
+        await self.iniciar()
+        try:
+            await self.servidor.serve_forever()
+        finally:
+            await self.detener()
+
+    async def _atender(self, reader, writer):
+        """Atender una conexión HTTP/1.1 (una solicitud por conexión)"""
+        headers_extra = {}
+        try:
+            metodo, ruta, headers, cuerpo = await asyncio.wait_for(
+                self._leer_solicitud(reader), TIMEOUT_LECTURA
+            )
+            estado, respuesta, headers_extra = await self._despachar(
+                metodo, ruta, headers, cuerpo, writer.get_extra_info("peername")
+            )
+        except ErrorAPI as e:
+            estado, respuesta, headers_extra = e.estado, {"error": e.mensaje}, e.headers
+        except asyncio.TimeoutError:
+            estado, respuesta = 400, {"error": "Tiempo de lectura agotado"}
+        except Exception as e:
+            estado, respuesta = 500, {"error": f"Error interno: {str(e)}"}
+
+        datos = json.dumps(respuesta, ensure_ascii=False, default=_a_json).encode("utf-8")
+        cabecera = [
+            f"HTTP/1.1 {estado} {ESTADOS_HTTP.get(estado, '')}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(datos)}",
+            "Connection: close",
+        ]
+        cabecera += [f"{k}: {v}" for k, v in headers_extra.items()]
+        try:
+            writer.write(("\r\n".join(cabecera) + "\r\n\r\n").encode("latin-1") + datos)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _leer_solicitud(self, reader):
+        """Leer línea de solicitud, cabeceras y cuerpo"""
+        linea = (await reader.readline()).decode("latin-1").strip()
+        partes = linea.split()
+        if len(partes) != 3:
+            raise ErrorAPI(400, "Solicitud HTTP inválida")
+        metodo, ruta, _ = partes
+
+        headers = {}
+        while True:
+            linea = (await reader.readline()).decode("latin-1")
+            if linea in ("\r\n", "\n", ""):
+                break
+            nombre, _, valor = linea.partition(":")
+            headers[nombre.strip().lower()] = valor.strip()
+
+        try:
+            longitud = int(headers.get("content-length", 0))
+        except ValueError:
+            raise ErrorAPI(400, "Content-Length inválido")
+        if longitud > MAX_CUERPO_BYTES:
+            raise ErrorAPI(413, "Cuerpo demasiado grande")
+        cuerpo = await reader.readexactly(longitud) if longitud else b""
+        return metodo, ruta.split("?", 1)[0], headers, cuerpo
+
+    async def _identificar(self, headers, peername):
+        """
+        Resolver (clave_cliente, plan) a partir de la cabecera Authorization. El autenticador
+        (PBKDF2 del sistema de pagos) corre en un hilo para no bloquear el bucle de eventos
+        """
+        autorizacion = headers.get("authorization", "")
+        ip = peername[0] if peername else "desconocido"
+        if not autorizacion:
+            return f"ip:{ip}", "gratuito"
+
+        tipo, _, credenciales = autorizacion.partition(" ")
+        try:
+            email, _, clave = base64.b64decode(credenciales).decode("utf-8").partition(":")
+        except Exception:
+            email, clave = "", ""
+        plan = await self._autenticar(email, clave, ip) if tipo.lower() == "basic" and email else None
+        if plan is None:
+            raise ErrorAPI(401, "Credenciales inválidas", {"WWW-Authenticate": 'Basic realm="consorcio-dej"'})
+        return f"usuario:{email}", plan
+
+    async def _autenticar(self, email, clave, ip):
+        """
+        Plan de las credenciales. Una verificación correcta se recuerda TTL_CREDENCIALES segundos;
+        cada verificación nueva se cobra antes a la cubeta de la IP, para que las credenciales
+        erróneas no ocupen los hilos del KDF sin límite
+        """
+        huella = hmac.new(self._clave_huellas, f"{email}\0{clave}".encode("utf-8"), hashlib.sha256).digest()
+        ahora = time.monotonic()
+        recordada = self._credenciales.get(huella)
+        if recordada is not None and recordada[1] > ahora:
+            return recordada[0]
+
+        permitido, _, reintentar = self.limitador.consumir(f"ip:{ip}", "gratuito")
+        if not permitido:
+            raise ErrorAPI(429, "Demasiados intentos de autenticación", {"Retry-After": max(1, int(reintentar + 0.999))})
+        loop = asyncio.get_running_loop()
+        plan = await loop.run_in_executor(None, self.autenticador, email, clave)
+        if plan is not None:
+            if len(self._credenciales) >= MAX_CREDENCIALES_RECORDADAS:
+                self._credenciales = {h: c for h, c in self._credenciales.items() if c[1] > ahora}
+            self._credenciales[huella] = (plan, ahora + TTL_CREDENCIALES)
+        return plan
+
+    def _limitar(self, clave, plan, costo):
+        """Aplicar el límite de tasa del plan; devuelve las cabeceras informativas"""
+        permitido, restantes, reintentar = self.limitador.consumir(clave, plan, costo)
+        headers = {
+            "X-RateLimit-Limit": self.limitador.limites(plan)["solicitudes_por_minuto"],
+            "X-RateLimit-Remaining": restantes,
+            "X-Plan": plan,
+        }
+        if not permitido:
+            headers["Retry-After"] = max(1, int(reintentar + 0.999))
+            raise ErrorAPI(429, f"Límite de solicitudes del plan {plan} excedido", headers)
+        return headers
+
+    async def _despachar(self, metodo, ruta, headers, cuerpo, peername):
+        """Enrutar la solicitud al endpoint correspondiente"""
+        if ruta == "/api/v1/salud":
+            if metodo != "GET":
+                raise ErrorAPI(405, "Método no permitido")
+            return 200, {"estado": "ok", "operaciones": sorted(OPERACIONES)}, {}
+
+        if ruta.startswith("/api/v1/calcular/") or ruta == "/api/v1/lote":
+            if metodo != "POST":
+                raise ErrorAPI(405, "Método no permitido")
+            clave, plan = await self._identificar(headers, peername)
+            datos = self._leer_json(cuerpo)
+
+            if ruta == "/api/v1/lote":
+                solicitudes = datos.get("solicitudes") if isinstance(datos, dict) else None
+                if not isinstance(solicitudes, list) or not solicitudes:
+                    raise ErrorAPI(400, "Se requiere una lista 'solicitudes' no vacía")
+                max_lote = self.limitador.limites(plan)["max_lote"]
+                if len(solicitudes) > max_lote:
+                    raise ErrorAPI(413, f"El plan {plan} admite lotes de hasta {max_lote} solicitudes")
+                headers_limite = self._limitar(clave, plan, len(solicitudes))
+                resultados = await self._ejecutar_lote(solicitudes)
+                return 200, {"resultados": resultados}, headers_limite
+
+            operacion = ruta[len("/api/v1/calcular/"):]
+            if operacion not in OPERACIONES:
+                raise ErrorAPI(404, f"Operación desconocida: {operacion}")
+            if not isinstance(datos, dict):
+                raise ErrorAPI(400, "Los parámetros deben ser un objeto JSON")
+            headers_limite = self._limitar(clave, plan, 1)
+            try:
+                resultado = await self._ejecutar(operacion, datos)
+            except (TypeError, ValueError, ZeroDivisionError) as e:
+                raise ErrorAPI(400, f"Parámetros inválidos: {str(e)}", headers_limite)
+            return 200, {"operacion": operacion, "resultado": resultado}, headers_limite
+
+        raise ErrorAPI(404, "Ruta no encontrada")
+
+    def _leer_json(self, cuerpo):
+        """Decodificar el cuerpo JSON de la solicitud"""
+        try:
+            return json.loads(cuerpo.decode("utf-8")) if cuerpo else {}
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise ErrorAPI(400, "Cuerpo JSON inválido")
+
+    async def _ejecutar(self, operacion, parametros):
+        """Ejecutar una operación en el pool sin bloquear el bucle de eventos"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, ejecutar_operacion, operacion, parametros)
+
+    async def _ejecutar_lote(self, solicitudes):
+        """Ejecutar las solicitudes del lote en paralelo, conservando el orden"""
+        tareas = []
+        for solicitud in solicitudes:
+            operacion = solicitud.get("operacion") if isinstance(solicitud, dict) else None
+            parametros = solicitud.get("parametros", {}) if isinstance(solicitud, dict) else None
+            if operacion not in OPERACIONES:
+                tareas.append(self._fallar(f"Operación desconocida: {operacion}"))
+            elif not isinstance(parametros, dict):
+                tareas.append(self._fallar("Los parámetros deben ser un objeto JSON"))
+            else:
+                tareas.append(self._ejecutar(operacion, parametros))
+
+        resultados = []
+        for solicitud, resultado in zip(solicitudes, await asyncio.gather(*tareas, return_exceptions=True)):
+            operacion = solicitud.get("operacion") if isinstance(solicitud, dict) else None
+            if isinstance(resultado, Exception):
+                resultados.append({"operacion": operacion, "ok": False, "error": str(resultado)})
+            else:
+                resultados.append({"operacion": operacion, "ok": True, "resultado": resultado})
+        return resultados
+
+    async def _fallar(self, mensaje):
+        raise ValueError(mensaje)
+
+def main():
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="API de integración - CONSORCIO DEJ")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None, help="Procesos de cálculo (por defecto: núcleos disponibles)")
+    args = parser.parse_args()
+
+    servidor = ServidorAPI(args.host, args.port, args.workers)
+    # Los planes vencidos pasan a gratuito aunque nadie abra el panel de administración
+    from simple_payment_system import start_expiry_scheduler
+    start_expiry_scheduler()
+    print(f"🔌 API de integración en http://{args.host}:{args.port}/api/v1/salud")
+    try:
+        asyncio.run(servidor.servir())
+    except KeyboardInterrupt:
+        print("🛑 API detenida")
+
+if __name__ == "__main__":
+    main()
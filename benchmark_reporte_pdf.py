@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Benchmark del reporte PDF - CONSORCIO DEJ
+Compara tiempo de generación y tamaño del PDF entre los perfiles raster y vectorial
+"""
+
+import argparse
+import statistics
+import time
+
+import reporte_pdf
+from cache_resultados import analisis_completo_cacheado
+
+DATOS_EJEMPLO = {
+    "f_c": 210, "f_y": 4200, "L_viga": 6.0, "num_pisos": 3, "num_vanos": 4,
+    "CM": 350, "CV": 250, "zona_sismica": "Z3", "tipo_suelo": "S1",
+    "factor_importancia": 1.0,
+}
+
+def medir_perfil(perfil, repeticiones=5, plan="premium"):
+    """Tiempos (ms) y tamaño (bytes) del PDF generado con un perfil"""
+    resultados = analisis_completo_cacheado(DATOS_EJEMPLO)
+    reporte_pdf.generar_pdf_reportlab(resultados, DATOS_EJEMPLO, plan, perfil=perfil)  # calentamiento
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        pdf = reporte_pdf.generar_pdf_reportlab(resultados, DATOS_EJEMPLO, plan, perfil=perfil).read()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return {"perfil": perfil, "mediana_ms": statistics.median(tiempos), "min_ms": min(tiempos), "bytes": len(pdf)}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de perfiles del reporte PDF - CONSORCIO DEJ")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--plan", default="premium")
+    args = parser.parse_args()
+
+    print(f"{'Perfil':<10} {'Mediana (ms)':>13} {'Mínimo (ms)':>12} {'Tamaño (KB)':>12}")
+    for perfil in reporte_pdf.PERFILES_REPORTE:
+        medida = medir_perfil(perfil, args.repeticiones, args.plan)
+        print(f"{perfil:<10} {medida['mediana_ms']:>13.1f} {medida['min_ms']:>12.1f} {medida['bytes'] / 1024:>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark del sistema de pagos - CONSORCIO DEJ
+Compara throughput y latencias (p50/p95/p99) de las operaciones de usuarios y pagos entre los
+almacenamientos (JSON, SQLite) con 10k, 100k y 1M usuarios sintéticos
+
+Uso:
+    python benchmark_sistema_pagos.py --tamanos 10000,100000 --operaciones 200 --salida resultados.json
+"""
+
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import simple_payment_system
+from simple_payment_system import create_payment_system, derive_password, write_json_atomic
+
+BACKENDS = ("json", "sqlite")
+TAMANOS = (10_000, 100_000, 1_000_000)
+OPERACIONES = ("register_user", "login_user", "upgrade_plan", "confirm_payment", "get_pending_payments")
+
+CLAVE = "clave-benchmark"
+# Fracción de pagos sembrados que quedan pendientes (lo que recorre get_pending_payments)
+FRACCION_PENDIENTES = 0.01
+
+def sembrar(directorio, tamano, semilla=0):
+    """
+    Escribir users.json y payments.json sintéticos (un pago por usuario). Es la instantánea del modo
+    JSON; SQLite la importa con su migración. Todos comparten el mismo hash: un solo KDF
+    """
+    aleatorio = random.Random(semilla)
+    password = derive_password(CLAVE)
+    inicio = datetime(2025, 1, 1)
+    planes = ("gratuito", "premium", "empresarial")
+    users, payments = {}, []
+    for i in range(tamano):
+        email = f"usuario{i}@bench.pe"
+        creado = inicio + timedelta(seconds=i)
+        plan = planes[i % 3]
+        pendiente = aleatorio.random() < FRACCION_PENDIENTES
+        pago = {
+            "id": f"pay_{i + 1}_bench",
+            "email": email,
+            "plan": "premium" if plan == "gratuito" else plan,
+            "amount": 29.99 if plan != "empresarial" else 99.99,
+            "payment_method": "yape",
+            "status": "pendiente" if pendiente else "confirmado",
+            "created_at": creado.isoformat(),
+            "confirmed_at": None if pendiente else (creado + timedelta(hours=1)).isoformat(),
+        }
+        users[email] = {
+            "email": email,
+            "password": password,
+            "name": f"Usuario {i}",
+            "plan": plan,
+            "created_at": creado.isoformat(),
+            "expires_at": None if plan == "gratuito" else (creado + timedelta(days=30)).isoformat(),
+            "payment_pending": pago["id"] if pendiente else None,
+        }
+        payments.append(pago)
+    archivos = {"users_file": str(directorio / "users.json"), "payments_file": str(directorio / "payments.json")}
+    write_json_atomic(archivos["payments_file"], payments)
+    write_json_atomic(archivos["users_file"], users)
+    return archivos
+
+def percentiles(tiempos):
+    """p50, p95 y p99 (ms) de una lista de tiempos en segundos"""
+    if len(tiempos) < 2:
+        return (tiempos[0] * 1000,) * 3
+    cortes = statistics.quantiles(tiempos, n=100, method="inclusive")
+    return cortes[49] * 1000, cortes[94] * 1000, cortes[98] * 1000
+
+def medir(operacion, llamadas):
+    """Ejecutar cada llamada una vez; devuelve throughput y percentiles de latencia"""
+    tiempos = []
+    inicio_total = time.perf_counter()
+    for llamada in llamadas:
+        inicio = time.perf_counter()
+        llamada()
+        tiempos.append(time.perf_counter() - inicio)
+    total = time.perf_counter() - inicio_total
+    p50, p95, p99 = percentiles(tiempos)
+    return {"operacion": operacion, "ops": len(tiempos), "ops_por_s": len(tiempos) / total,
+            "p50_ms": p50, "p95_ms": p95, "p99_ms": p99}
+
+def abrir(config):
+    sistema = create_payment_system(config)
+    sistema.count_users()
+    return sistema
+
+def medir_backend(backend, tamano, operaciones=200, semilla=0):
+    """Sembrar tamano usuarios, abrir el almacenamiento y medir cada operación de OPERACIONES"""
+    aleatorio = random.Random(semilla)
+    with tempfile.TemporaryDirectory(prefix=f"bench_{backend}_") as directorio:
+        directorio = Path(directorio)
+        config = {"backend": backend, "database": str(directorio / "payments.db"), **sembrar(directorio, tamano, semilla)}
+
+        # Arranque (una sola medida): carga de la instantánea (JSON) o migración e índices (SQLite)
+        sistemas = []
+        medidas = [medir("arranque", [lambda: sistemas.append(abrir(config))])]
+        sistema = sistemas[0]
+
+        existentes = [f"usuario{aleatorio.randrange(tamano)}@bench.pe" for _ in range(operaciones)]
+        medidas.append(medir("register_user", [
+            lambda i=i: sistema.register_user(f"nuevo{i}@bench.pe", CLAVE, f"Nuevo {i}") for i in range(operaciones)
+        ]))
+        medidas.append(medir("login_user", [lambda e=e: sistema.login_user(e, CLAVE) for e in existentes]))
+        pagos = []
+        medidas.append(medir("upgrade_plan", [
+            lambda e=e: pagos.append(sistema.upgrade_plan(e, "premium", "yape")["payment_id"]) for e in existentes
+        ]))
+        medidas.append(medir("confirm_payment", [lambda p=p: sistema.confirm_payment(p) for p in list(pagos)]))
+        medidas.append(medir("get_pending_payments", [sistema.get_pending_payments] * max(1, operaciones // 10)))
+
+        # Que una compactación en curso (modo JSON) no escriba en el directorio ya borrado
+        compactador = getattr(sistema, "_compactor", None)
+        if compactador is not None:
+            compactador.join()
+    return [{"backend": backend, "tamano": tamano, **medida} for medida in medidas]
+
+def imprimir(medidas):
+    print(f"{'Backend':<8} {'Usuarios':>10} {'Operación':<22} {'ops/s':>10} {'p50 (ms)':>10} {'p95 (ms)':>10} {'p99 (ms)':>10}")
+    for m in medidas:
+        print(f"{m['backend']:<8} {m['tamano']:>10} {m['operacion']:<22} {m['ops_por_s']:>10.1f} "
+              f"{m['p50_ms']:>10.2f} {m['p95_ms']:>10.2f} {m['p99_ms']:>10.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del sistema de pagos - CONSORCIO DEJ")
+    parser.add_argument("--backends", default=",".join(BACKENDS), help="Lista separada por comas")
+    parser.add_argument("--tamanos", default=",".join(str(t) for t in TAMANOS), help="Usuarios sembrados, separados por comas")
+    parser.add_argument("--operaciones", type=int, default=200, help="Llamadas medidas por operación")
+    parser.add_argument("--iteraciones-kdf", type=int, default=None,
+                        help="Iteraciones PBKDF2 (por defecto las del sistema; reducirlas aísla el costo del almacenamiento)")
+    parser.add_argument("--salida", default=None, help="Guardar las medidas en un archivo JSON para comparar corridas")
+    args = parser.parse_args()
+
+    if args.iteraciones_kdf:
+        simple_payment_system.PASSWORD_ITERATIONS = args.iteraciones_kdf
+
+    medidas = []
+    for tamano in (int(t) for t in args.tamanos.split(",")):
+        for backend in args.backends.split(","):
+            medidas += medir_backend(backend, tamano, args.operaciones)
+    imprimir(medidas)
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump({"fecha": datetime.now().isoformat(), "iteraciones_kdf": simple_payment_system.PASSWORD_ITERATIONS,
+                       "medidas": medidas}, f, ensure_ascii=False, indent=2)
+        print(f"\nMedidas guardadas en {args.salida}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Caché de Resultados - CONSORCIO DEJ
+Caché compartida entre sesiones para los resultados del análisis completo
+"""
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from motor_calculo import VERSION_MOTOR, ejecutar_analisis_completo, ejecutar_analisis_incremental
+
+# Datos de entrada que usa ejecutar_analisis_completo (el resto no cambia el resultado)
+PARAMETROS_ANALISIS = (
+    "f_c", "f_y", "L_viga", "num_pisos", "num_vanos", "CM", "CV",
+    "zona_sismica", "tipo_suelo", "factor_importancia",
+)
+
+def _canonico(valor):
+    """Normalizar números para que 210 y 210.0 generen la misma clave"""
+    if isinstance(valor, dict):
+        return {str(k): _canonico(v) for k, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_canonico(v) for v in valor]
+    if isinstance(valor, bool) or valor is None or isinstance(valor, str):
+        return valor
+    try:
+        return float(valor)
+    except (TypeError, ValueError):
+        return str(valor)
+
+def clave_resultados(datos_entrada, version=VERSION_MOTOR):
+    """Hash canónico de los datos de entrada y la versión del motor"""
+    texto = json.dumps(
+        {"version": version, "datos": _canonico(datos_entrada)},
+        sort_keys=True, separators=(",", ":"), ensure_ascii=False,
+    )
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+class CacheResultados:
+    """
+    Caché LRU con expiración (TTL) y contadores de aciertos/fallos, segura entre hilos.
+    Con max_bytes, también limita la suma de tamano(resultado) de las entradas guardadas.
+    """
+
+    def __init__(self, max_entradas=128, ttl_segundos=3600, reloj=time.monotonic,
+                 max_bytes=None, tamano=len):
+        self.max_entradas = max_entradas
+        self.ttl_segundos = ttl_segundos
+        self.reloj = reloj
+        self.max_bytes = max_bytes
+        self.tamano = tamano
+        self.bytes = 0
+        self._entradas = OrderedDict()
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.expulsiones = 0
+
+    def obtener(self, datos_entrada):
+        """Resultado guardado para datos_entrada (copia) o None"""
+        clave = clave_resultados(datos_entrada)
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is not None and self._vigente(entrada):
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return copy.deepcopy(entrada[1])
+            if entrada is not None:
+                self._quitar(clave)
+                self.expulsiones += 1
+            self.fallos += 1
+            return None
+
+    def guardar(self, datos_entrada, resultado):
+        """Guardar un resultado, expulsando los menos usados si se exceden los límites"""
+        clave = clave_resultados(datos_entrada)
+        tamano = self.tamano(resultado) if self.max_bytes is not None else 0
+        with self._lock:
+            self._quitar(clave)
+            if self.max_bytes is not None and tamano > self.max_bytes:
+                # No cabe ni solo: guardarlo vaciaría la caché sin beneficio
+                return
+            self._entradas[clave] = (self.reloj(), copy.deepcopy(resultado), tamano)
+            self.bytes += tamano
+            while len(self._entradas) > self.max_entradas or (
+                    self.max_bytes is not None and self.bytes > self.max_bytes):
+                self._quitar(next(iter(self._entradas)))
+                self.expulsiones += 1
+
+    def obtener_o_calcular(self, datos_entrada, calcular):
+        """Devolver el resultado en caché o calcularlo con calcular() y guardarlo"""
+        resultado = self.obtener(datos_entrada)
+        if resultado is None:
+            # Se calcula fuera del lock para no bloquear otras sesiones
+            resultado = calcular()
+            self.guardar(datos_entrada, resultado)
+        return resultado
+
+    def invalidar(self, datos_entrada=None):
+        """Eliminar una entrada o, sin argumentos, toda la caché"""
+        with self._lock:
+            if datos_entrada is None:
+                self._entradas.clear()
+                self.bytes = 0
+            else:
+                self._quitar(clave_resultados(datos_entrada))
+
+    def estadisticas(self):
+        """Tamaño, límites y contadores de la caché"""
+        with self._lock:
+            consultas = self.aciertos + self.fallos
+            return {
+                "entradas": len(self._entradas),
+                "max_entradas": self.max_entradas,
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_segundos": self.ttl_segundos,
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "expulsiones": self.expulsiones,
+                "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+            }
+
+    def _quitar(self, clave):
+        """Eliminar una entrada (con el lock tomado) descontando su tamaño"""
+        entrada = self._entradas.pop(clave, None)
+        if entrada is not None:
+            self.bytes -= entrada[2]
+
+    def _vigente(self, entrada):
+        """Verificar si una entrada no ha expirado"""
+        return self.ttl_segundos is None or self.reloj() - entrada[0] < self.ttl_segundos
+
+# Caché global del proceso (compartida por todas las sesiones de Streamlit)
+cache_analisis = CacheResultados()
+
+def analisis_completo_cacheado(datos_entrada, cache=None, memo=None):
+    """
+    Análisis completo para datos_entrada, reutilizando resultados de otras sesiones.
+    Con memo (MemoEtapas de la sesión), un fallo de caché solo recalcula las etapas cuyas
+    entradas cambiaron; memo.recalculadas queda vacío si el resultado vino de la caché.
+    """
+    cache = cache or cache_analisis
+    parametros = {k: datos_entrada[k] for k in PARAMETROS_ANALISIS if k in datos_entrada}
+    if memo is None:
+        return cache.obtener_o_calcular(parametros, lambda: ejecutar_analisis_completo(**parametros))
+    memo.recalculadas = ()
+    return cache.obtener_o_calcular(parametros, lambda: ejecutar_analisis_incremental(parametros, memo))
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Comparación de Análisis - CONSORCIO DEJ
+Diferencias entre análisis completos guardados (deltas vectorizados y cambios de verificación)
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+def aplanar_resultados(resultados, prefijo=""):
+    """Resultados anidados como {"seccion.campo": valor} (solo números y verificaciones booleanas)"""
+    planos = {}
+    for clave, valor in resultados.items():
+        ruta = f"{prefijo}{clave}"
+        if isinstance(valor, dict):
+            planos.update(aplanar_resultados(valor, f"{ruta}."))
+        elif isinstance(valor, (bool, np.bool_, int, float, np.integer, np.floating)):
+            planos[ruta] = valor
+    return planos
+
+def comparar_analisis(analisis, base=0):
+    """
+    Comparar dos o más análisis [(nombre, resultados), ...] contra el análisis base.
+    Devuelve tablas de pandas (campos × análisis) con valores, deltas absolutos y porcentuales,
+    las verificaciones (None donde el análisis no tiene el campo: no aplica) y la lista de
+    verificaciones que cambian de estado respecto al base (solo si ambos análisis las tienen).
+    """
+    if len(analisis) < 2:
+        raise ValueError("Se necesitan al menos dos análisis para comparar")
+    nombres = [nombre for nombre, _ in analisis]
+    if len(set(nombres)) != len(nombres):
+        raise ValueError("Los análisis a comparar deben tener nombres distintos")
+
+    planos = [aplanar_resultados(resultados) for _, resultados in analisis]
+    campos = list(dict.fromkeys(campo for plano in planos for campo in plano))
+    es_verificacion = np.array([any(isinstance(p.get(c), (bool, np.bool_)) for p in planos) for c in campos])
+
+    # Matriz campos × análisis; NaN donde un análisis no tiene el campo
+    matriz = np.array([[float(p.get(c, np.nan)) for p in planos] for c in campos])
+    presentes = ~np.isnan(matriz)
+    referencia = matriz[:, [base]]
+    deltas = matriz - referencia
+    with np.errstate(divide="ignore", invalid="ignore"):
+        deltas_pct = np.where(referencia != 0, deltas / np.abs(referencia) * 100, np.nan)
+
+    numericos = ~es_verificacion
+    valores = pd.DataFrame(matriz[numericos], index=np.array(campos)[numericos], columns=nombres)
+    # Un campo ausente no es un incumplimiento: se guarda como None (no aplica)
+    cumple = matriz[es_verificacion] == 1
+    presentes_verificacion = presentes[es_verificacion]
+    verificaciones = pd.DataFrame(
+        np.where(presentes_verificacion, cumple, None),
+        index=np.array(campos)[es_verificacion], columns=nombres,
+    )
+
+    # Cambios de verificación: celdas donde el estado difiere del análisis base y ambos tienen el campo
+    cambios = (cumple != cumple[:, [base]]) & presentes_verificacion & presentes_verificacion[:, [base]]
+    filas, columnas = np.nonzero(cambios)
+    cambios_verificacion = [
+        {
+            "verificacion": verificaciones.index[f],
+            "analisis": nombres[c],
+            "base": bool(cumple[f, base]),
+            "ahora": bool(cumple[f, c]),
+        }
+        for f, c in zip(filas, columnas)
+    ]
+
+    return {
+        "nombres": nombres,
+        "base": nombres[base],
+        "valores": valores,
+        "deltas": pd.DataFrame(deltas[numericos], index=valores.index, columns=nombres),
+        "deltas_pct": pd.DataFrame(deltas_pct[numericos], index=valores.index, columns=nombres),
+        "verificaciones": verificaciones,
+        "cambios_verificacion": cambios_verificacion,
+    }
+
+def campos_con_cambios(comparacion, tolerancia_pct=0.01):
+    """Campos numéricos cuyo delta porcentual supera la tolerancia en algún análisis o que no todos tienen"""
+    deltas = comparacion["deltas"].abs().fillna(0).to_numpy()
+    pct = comparacion["deltas_pct"].abs().to_numpy()
+    # Sin porcentaje (valor base 0) cuenta cualquier delta absoluto
+    supera = np.where(np.isnan(pct), deltas > 0, pct > tolerancia_pct)
+    ausentes = comparacion["valores"].isna().to_numpy()
+    return list(comparacion["valores"].index[supera.any(axis=1) | ausentes.any(axis=1)])
+
+def _estado(cumple):
+    if cumple is None:
+        return "➖ No aplica"
+    return "✅ Cumple" if cumple else "❌ No cumple"
+
+def _valor(valor):
+    return f"{valor:,.4g}" if np.isfinite(valor) else "no aplica"
+
+def reporte_diferencias(comparacion, tolerancia_pct=0.01):
+    """Reporte de diferencias en Markdown: cambios de verificación primero y luego los deltas"""
+    base = comparacion["base"]
+    otros = [n for n in comparacion["nombres"] if n != base]
+    lineas = [
+        "# REPORTE DE DIFERENCIAS - ANÁLISIS ESTRUCTURAL",
+        "## CONSORCIO DEJ",
+        f"### Fecha: {datetime.now().strftime('%d/%m/%Y %H:%M')}",
+        "",
+        f"Análisis base: **{base}** — comparado con: {', '.join(otros)}",
+        "",
+        "### CAMBIOS DE VERIFICACIÓN:",
+    ]
+    if comparacion["cambios_verificacion"]:
+        lineas += [f"- ⚠️ {c['verificacion']} ({c['analisis']}): {_estado(c['base'])} → {_estado(c['ahora'])}"
+                   for c in comparacion["cambios_verificacion"]]
+    else:
+        lineas.append("- Ninguna verificación cambia de estado")
+
+    # Verificaciones que algún análisis no tiene (no cuentan como cambio de estado)
+    verificaciones = comparacion["verificaciones"]
+    no_aplica = verificaciones.index[verificaciones.isna().any(axis=1)]
+    if len(no_aplica):
+        lineas += ["", "### VERIFICACIONES QUE NO APLICAN EN TODOS LOS ANÁLISIS:"]
+        lineas += [f"- {campo}: " + ", ".join(f"{nombre} {_estado(verificaciones.at[campo, nombre])}"
+                                              for nombre in comparacion["nombres"])
+                   for campo in no_aplica]
+
+    campos = campos_con_cambios(comparacion, tolerancia_pct)
+    lineas += ["", "### DIFERENCIAS EN RESULTADOS:"]
+    if not campos:
+        lineas.append("- Sin diferencias en los resultados numéricos")
+    else:
+        lineas.append("| Campo | " + " | ".join([base] + otros) + " |")
+        lineas.append("|---" * (len(otros) + 2) + "|")
+        valores, deltas_pct = comparacion["valores"], comparacion["deltas_pct"]
+        for campo in campos:
+            celdas = [_valor(valores.at[campo, base])]
+            for nombre in otros:
+                pct = deltas_pct.at[campo, nombre]
+                cambio = f" ({pct:+.1f}%)" if np.isfinite(pct) else ""
+                celdas.append(f"{_valor(valores.at[campo, nombre])}{cambio}")
+            lineas.append(f"| {campo} | " + " | ".join(celdas) + " |")
+    return "\n".join(lineas) + "\n"
@@ -0,0 +1,626 @@
+#!/usr/bin/env python3
+"""
+Gráficos - CONSORCIO DEJ
+Diagramas de cortantes y momentos y dibujos de elementos estructurales (matplotlib)
+"""
+
+import streamlit as st
+import numpy as np
+
+from motor_calculo import (
+    calcular_cortantes_momentos_viga_simple,
+    calcular_cortantes_momentos_viga_empotrada,
+    calcular_cortantes_momentos_viga_continua,
+    calcular_cortantes_momentos_viga_simple_mccormac,
+    calcular_cortantes_momentos_viga_empotrada_mccormac,
+    calcular_cortantes_momentos_viga_continua_mccormac,
+)
+
+# =====================
+# IMPORTACIONES DE GRÁFICOS (DIRECTAS COMO EN APP1.PY)
+# =====================
+
+# Importar matplotlib con manejo de errores
+MATPLOTLIB_AVAILABLE = False
+plt = None
+Rectangle = None
+Polygon = None
+
+try:
+    import matplotlib
+    # Configurar backend de manera más robusta
+    try:
+        matplotlib.use('Agg')  # Backend no interactivo para Streamlit
+    except:
+        pass  # Si falla, continuar con el backend por defecto
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Rectangle, Polygon
+    MATPLOTLIB_AVAILABLE = True
+except ImportError:
+    MATPLOTLIB_AVAILABLE = False
+    plt = None
+
+# Verificación de plotly
+try:
+    import plotly.express as px
+    import plotly.graph_objects as go
+    PLOTLY_AVAILABLE = True
+except ImportError:
+    PLOTLY_AVAILABLE = False
+    px = None
+    go = None
+    # No mostrar warning aquí para evitar problemas en la carga inicial
+
+def safe_matplotlib_plot(func):
+    """Decorador para manejar gráficos de matplotlib de manera segura"""
+    def wrapper(*args, **kwargs):
+        if not MATPLOTLIB_AVAILABLE:
+            st.warning("⚠️ Matplotlib no está disponible. No se puede generar el gráfico.")
+            return None
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            st.error(f"Error generando gráfico: {str(e)}")
+            return None
+    return wrapper
+
+# =====================
+# FUNCIONES PARA GRÁFICOS DE CORTANTES Y MOMENTOS (ARTHUR H. NILSON)
+# =====================
+
+@safe_matplotlib_plot
+def graficar_cortantes_momentos_nilson(L, w, P=None, a=None, tipo_viga="simple"):
+    """
+    Genera gráficos de cortantes y momentos según Arthur H. Nilson
+    """
+    if not MATPLOTLIB_AVAILABLE or plt is None:
+        st.warning("⚠️ Matplotlib no está disponible. No se puede generar el gráfico.")
+        return None
+        
+    if tipo_viga == "simple":
+        x, V, M = calcular_cortantes_momentos_viga_simple(L, w, P, a)
+    elif tipo_viga == "empotrada":
+        x, V, M = calcular_cortantes_momentos_viga_empotrada(L, w, P, a)
+    else:
+        st.error("Tipo de viga no válido")
+        return None
+    
+    # Crear figura con subplots
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
+    
+    # Gráfico de cortantes
+    ax1.plot(x, V, 'r-', linewidth=2, label='Cortante (V)')
+    ax1.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+    ax1.axvline(x=0, color='k', linestyle='-', alpha=0.3)
+    ax1.axvline(x=L, color='k', linestyle='-', alpha=0.3)
+    ax1.fill_between(x, V, 0, alpha=0.3, color='red')
+    ax1.set_title(f'Diagrama de Cortantes - Viga {tipo_viga.title()}', fontsize=14, fontweight='bold')
+    ax1.set_xlabel('Distancia (m)')
+    ax1.set_ylabel('Cortante (kg)')
+    ax1.grid(True, alpha=0.3)
+    ax1.legend()
+    
+    # Gráfico de momentos
+    ax2.plot(x, M, 'b-', linewidth=2, label='Momento (M)')
+    ax2.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+    ax2.axvline(x=0, color='k', linestyle='-', alpha=0.3)
+    ax2.axvline(x=L, color='k', linestyle='-', alpha=0.3)
+    ax2.fill_between(x, M, 0, alpha=0.3, color='blue')
+    ax2.set_title(f'Diagrama de Momentos - Viga {tipo_viga.title()}', fontsize=14, fontweight='bold')
+    ax2.set_xlabel('Distancia (m)')
+    ax2.set_ylabel('Momento (kg·m)')
+    ax2.grid(True, alpha=0.3)
+    ax2.legend()
+    
+    plt.tight_layout()
+    return fig
+
+@safe_matplotlib_plot
+def graficar_viga_continua_nilson(L1, L2, w1, w2):
+    """
+    Genera gráficos de cortantes y momentos para viga continua
+    """
+    if not MATPLOTLIB_AVAILABLE or plt is None:
+        st.warning("⚠️ Matplotlib no está disponible. No se puede generar el gráfico.")
+        return None
+        
+    x1, V1, M1, x2, V2, M2, R_A, R_B1, R_B2, R_C, M_B = calcular_cortantes_momentos_viga_continua(L1, L2, w1, w2)
+    
+    # Crear figura con subplots
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
+    
+    # Gráfico de cortantes
+    ax1.plot(x1, V1, 'r-', linewidth=2, label='Tramo 1')
+    ax1.plot(x2 + L1, V2, 'r-', linewidth=2, label='Tramo 2')
+    ax1.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+    ax1.axvline(x=0, color='k', linestyle='-', alpha=0.3)
+    ax1.axvline(x=L1, color='k', linestyle='-', alpha=0.3)
+    ax1.axvline(x=L1+L2, color='k', linestyle='-', alpha=0.3)
+    ax1.fill_between(x1, V1, 0, alpha=0.3, color='red')
+    ax1.fill_between(x2 + L1, V2, 0, alpha=0.3, color='red')
+    ax1.set_title('Diagrama de Cortantes - Viga Continua', fontsize=14, fontweight='bold')
+    ax1.set_xlabel('Distancia (m)')
+    ax1.set_ylabel('Cortante (kg)')
+    ax1.grid(True, alpha=0.3)
+    ax1.legend()
+    
+    # Gráfico de momentos
+    ax2.plot(x1, M1, 'b-', linewidth=2, label='Tramo 1')
+    ax2.plot(x2 + L1, M2, 'b-', linewidth=2, label='Tramo 2')
+    ax2.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+    ax2.axvline(x=0, color='k', linestyle='-', alpha=0.3)
+    ax2.axvline(x=L1, color='k', linestyle='-', alpha=0.3)
+    ax2.axvline(x=L1+L2, color='k', linestyle='-', alpha=0.3)
+    ax2.fill_between(x1, M1, 0, alpha=0.3, color='blue')
+    ax2.fill_between(x2 + L1, M2, 0, alpha=0.3, color='blue')
+    ax2.set_title('Diagrama de Momentos - Viga Continua', fontsize=14, fontweight='bold')
+    ax2.set_xlabel('Distancia (m)')
+    ax2.set_ylabel('Momento (kg·m)')
+    ax2.grid(True, alpha=0.3)
+    ax2.legend()
+    
+    plt.tight_layout()
+    return fig
+
+# =====================
+# FUNCIONES PARA GRÁFICOS DE CORTANTES Y MOMENTOS (JACK C. MCCORMAC)
+# =====================
+
+@safe_matplotlib_plot
+def graficar_cortantes_momentos_mccormac(L, w, P=None, a=None, tipo_viga="simple"):
+    """
+    Genera gráficos de cortantes y momentos según Jack C. McCormac
+    """
+    if not MATPLOTLIB_AVAILABLE or plt is None:
+        st.warning("⚠️ Matplotlib no está disponible. No se puede generar el gráfico.")
+        return None
+        
+    try:
+        if tipo_viga == "simple":
+            x, V, M = calcular_cortantes_momentos_viga_simple_mccormac(L, w, P, a)
+        elif tipo_viga == "empotrada":
+            x, V, M = calcular_cortantes_momentos_viga_empotrada_mccormac(L, w, P, a)
+        else:
+            st.error("Tipo de viga no válido")
+            return None
+        
+        # Crear figura
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
+        
+        # Gráfico de cortantes
+        ax1.plot(x, V, 'r-', linewidth=2, label='Cortante (V)')
+        ax1.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+        ax1.axvline(x=0, color='k', linestyle='-', alpha=0.3)
+        ax1.axvline(x=L, color='k', linestyle='-', alpha=0.3)
+        ax1.fill_between(x, V, 0, alpha=0.3, color='red')
+        ax1.set_title(f'Diagrama de Cortantes - Viga {tipo_viga.title()} (McCormac)', fontsize=14, fontweight='bold')
+        ax1.set_xlabel('Distancia (m)')
+        ax1.set_ylabel('Cortante (kg)')
+        ax1.grid(True, alpha=0.3)
+        ax1.legend()
+        
+        # Gráfico de momentos
+        ax2.plot(x, M, 'b-', linewidth=2, label='Momento (M)')
+        ax2.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+        ax2.axvline(x=0, color='k', linestyle='-', alpha=0.3)
+        ax2.axvline(x=L, color='k', linestyle='-', alpha=0.3)
+        ax2.fill_between(x, M, 0, alpha=0.3, color='blue')
+        ax2.set_title(f'Diagrama de Momentos - Viga {tipo_viga.title()} (McCormac)', fontsize=14, fontweight='bold')
+        ax2.set_xlabel('Distancia (m)')
+        ax2.set_ylabel('Momento (kg·m)')
+        ax2.grid(True, alpha=0.3)
+        ax2.legend()
+        
+        plt.tight_layout()
+        return fig
+        
+    except Exception as e:
+        st.error(f"Error generando gráfico: {str(e)}")
+        return None
+
+@safe_matplotlib_plot
+def graficar_viga_continua_mccormac(L1, L2, w1, w2):
+    """
+    Genera gráficos de cortantes y momentos para viga continua según McCormac
+    """
+    if not MATPLOTLIB_AVAILABLE or plt is None:
+        st.warning("⚠️ Matplotlib no está disponible. No se puede generar el gráfico.")
+        return None
+        
+    try:
+        x1, V1, M1, x2, V2, M2, R_A, R_B1, R_B2, R_C, M_B = calcular_cortantes_momentos_viga_continua_mccormac(L1, L2, w1, w2)
+        
+        # Crear figura con subplots
+        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
+        
+        # Gráfico de cortantes
+        ax1.plot(x1, V1, 'r-', linewidth=2, label='Tramo 1')
+        ax1.plot(x2 + L1, V2, 'r-', linewidth=2, label='Tramo 2')
+        ax1.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+        ax1.axvline(x=0, color='k', linestyle='-', alpha=0.3)
+        ax1.axvline(x=L1, color='k', linestyle='-', alpha=0.3)
+        ax1.axvline(x=L1+L2, color='k', linestyle='-', alpha=0.3)
+        ax1.fill_between(x1, V1, 0, alpha=0.3, color='red')
+        ax1.fill_between(x2 + L1, V2, 0, alpha=0.3, color='red')
+        ax1.set_title('Diagrama de Cortantes - Viga Continua (McCormac)', fontsize=14, fontweight='bold')
+        ax1.set_xlabel('Distancia (m)')
+        ax1.set_ylabel('Cortante (kg)')
+        ax1.grid(True, alpha=0.3)
+        ax1.legend()
+        
+        # Gráfico de momentos
+        ax2.plot(x1, M1, 'b-', linewidth=2, label='Tramo 1')
+        ax2.plot(x2 + L1, M2, 'b-', linewidth=2, label='Tramo 2')
+        ax2.axhline(y=0, color='k', linestyle='-', alpha=0.3)
+        ax2.axvline(x=0, color='k', linestyle='-', alpha=0.3)
+        ax2.axvline(x=L1, color='k', linestyle='-', alpha=0.3)
+        ax2.axvline(x=L1+L2, color='k', linestyle='-', alpha=0.3)
+        ax2.fill_between(x1, M1, 0, alpha=0.3, color='blue')
+        ax2.fill_between(x2 + L1, M2, 0, alpha=0.3, color='blue')
+        ax2.set_title('Diagrama de Momentos - Viga Continua (McCormac)', fontsize=14, fontweight='bold')
+        ax2.set_xlabel('Distancia (m)')
+        ax2.set_ylabel('Momento (kg·m)')
+        ax2.grid(True, alpha=0.3)
+        ax2.legend()
+        
+        plt.tight_layout()
+        return fig
+        
+    except Exception as e:
+        st.error(f"Error generando gráfico: {str(e)}")
+        return None
+
+# =====================
+# FUNCIONES PARA DIBUJAR ELEMENTOS ESTRUCTURALES
+# =====================
+
+@safe_matplotlib_plot
+def graficar_diagrama_cortantes(L, Vu, phiVc, phiVc_mitad, w_total=0):
+    """
+    Grafica el diagrama de cortantes para el ejercicio de corte
+    """
+    if not MATPLOTLIB_AVAILABLE or plt is None:
+        return None
+        
+    try:
+        fig, ax = plt.subplots(figsize=(12, 8))
+        
+        # Generar puntos a lo largo de la viga
+        x = np.linspace(0, L, 100)
+        
+        # Calcular cortantes a lo largo de la viga
+        if w_total > 0:
+            # Carga distribuida
+            V = w_total * L / 2 - w_total * x
+        else:
+            # Carga puntual en el centro (simplificado)
+            V = np.full_like(x, Vu / 2)
+            V[x > L/2] = -Vu / 2
+        
+        # Graficar diagrama de cortantes
+        ax.plot(x, V, 'b-', linewidth=3, label='Cortante (V)')
+        ax.fill_between(x, V, 0, alpha=0.3, color='blue')
+        
+        # Líneas de referencia
+        ax.axhline(y=phiVc, color='red', linestyle='--', linewidth=2, label=f'φVc = {phiVc:.0f} kg')
+        ax.axhline(y=phiVc_mitad, color='orange', linestyle='--', linewidth=2, label=f'φVc/2 = {phiVc_mitad:.0f} kg')
+        ax.axhline(y=0, color='black', linestyle='-', alpha=0.5)
+        
+        # Configurar gráfico
+        ax.set_title('Diagrama de Cortantes - Ejercicio Básico de Corte', fontsize=14, fontweight='bold')
+        ax.set_xlabel('Distancia (m)')
+        ax.set_ylabel('Cortante (kg)')
+        ax.grid(True, alpha=0.3)
+        ax.legend()
+        
+        # Agregar anotaciones
+        ax.text(L/2, max(V)*0.8, f'Vu máximo = {max(abs(V)):.0f} kg', 
+                ha='center', va='center', bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7))
+        
+        plt.tight_layout()
+        return fig
+        
+    except Exception as e:
+        print(f"Error graficando diagrama de cortantes: {str(e)}")
+        return None
+
+@safe_matplotlib_plot
+def graficar_estribado_viga(L, d, s_critica, s_no_critica, b=25):
+    """
+    Grafica el estribado de la viga según los resultados
+    """
+    if not MATPLOTLIB_AVAILABLE or plt is None:
+        return None
+        
+    try:
+        fig, ax = plt.subplots(figsize=(15, 8))
+        
+        # Escala para visualización
+        escala = 100  # 1 unidad = 1 cm
+        
+        # Dimensiones de la viga
+        ancho = b / escala
+        alto = d / escala
+        largo = L
+        
+        # Dibujar viga
+        from matplotlib.patches import Rectangle
+        rect_viga = Rectangle((0, 0), largo, alto, linewidth=2, edgecolor='black', facecolor='lightgray', alpha=0.7)
+        ax.add_patch(rect_viga)
+        
+        # Zona crítica (primeros d cm)
+        zona_critica = Rectangle((0, 0), d/100, alto, linewidth=1, edgecolor='red', facecolor='red', alpha=0.2)
+        ax.add_patch(zona_critica)
+        
+        # Zona no crítica
+        zona_no_critica = Rectangle((d/100, 0), largo - d/100, alto, linewidth=1, edgecolor='blue', facecolor='blue', alpha=0.1)
+        ax.add_patch(zona_no_critica)
+        
+        # Dibujar estribos en zona crítica
+        if s_critica > 0:
+            num_estribos_critica = int(d / s_critica)
+            for i in range(num_estribos_critica):
+                x = (d / num_estribos_critica) * i / 100
+                rect_estribo = Rectangle((x, 0), 0.05, alto, linewidth=1, edgecolor='red', facecolor='red', alpha=0.5)
+                ax.add_patch(rect_estribo)
+        
+        # Dibujar estribos en zona no crítica
+        if s_no_critica > 0:
+            num_estribos_no_critica = int((L*100 - d) / s_no_critica)
+            for i in range(num_estribos_no_critica):
+                x = d/100 + (s_no_critica / 100) * i
+                if x < largo:
+                    rect_estribo = Rectangle((x, 0), 0.05, alto, linewidth=1, edgecolor='blue', facecolor='blue', alpha=0.3)
+                    ax.add_patch(rect_estribo)
+        
+        # Configurar gráfico
+        ax.set_xlim(-0.1, largo + 0.1)
+        ax.set_ylim(-0.1, alto + 0.1)
+        ax.set_aspect('equal')
+        ax.set_title(f'Estribado de Viga - Zona Crítica: φ3/8"@{s_critica:.1f}cm, Zona No Crítica: φ3/8"@{s_no_critica:.1f}cm', 
+                    fontsize=12, fontweight='bold')
+        ax.set_xlabel('Longitud (m)')
+        ax.set_ylabel('Altura (m)')
+        ax.grid(True, alpha=0.3)
+        
+        # Agregar leyenda
+        from matplotlib.patches import Patch
+        legend_elements = [
+            Patch(facecolor='red', alpha=0.2, label='Zona Crítica'),
+            Patch(facecolor='blue', alpha=0.1, label='Zona No Crítica'),
+            Patch(facecolor='red', alpha=0.5, label='Estribos Críticos'),
+            Patch(facecolor='blue', alpha=0.3, label='Estribos No Críticos')
+        ]
+        ax.legend(handles=legend_elements, loc='upper right')
+        
+        # Agregar anotaciones
+        ax.text(largo/2, alto/2, f'Zona Crítica: {d}cm\nZona No Crítica: {L*100-d:.0f}cm', 
+                ha='center', va='center', bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7))
+        
+        plt.tight_layout()
+        return fig
+        
+    except Exception as e:
+        print(f"Error graficando estribado: {str(e)}")
+        return None
+
+def dibujar_viga(b, d, L, As, s_estribos, fc, fy):
+    """
+    Dibuja una viga con sus dimensiones y refuerzo
+    """
+    if not MATPLOTLIB_AVAILABLE:
+        return None
+        
+    try:
+        if plt is None or Rectangle is None:
+            return None
+            
+        fig, ax = plt.subplots(figsize=(12, 8))
+        
+        # Escala para visualización
+        escala = 100  # 1 unidad = 1 cm
+        
+        # Dimensiones de la viga
+        ancho = b / escala
+        alto = d / escala
+        largo = L
+        
+        # Dibujar viga
+        rect_viga = Rectangle((0, 0), largo, alto, linewidth=2, edgecolor='black', facecolor='lightgray', alpha=0.7)
+        ax.add_patch(rect_viga)
+        
+        # Dibujar acero longitudinal (simplificado como líneas)
+        num_barras = max(2, int(As / 2.85))  # Asumiendo barras #6 (2.85 cm²)
+        espaciado_barras = ancho / (num_barras + 1)
+        
+        # Acero superior
+        for i in range(num_barras):
+            x = espaciado_barras * (i + 1)
+            ax.plot([x, x], [alto - 0.05, alto - 0.15], 'red', linewidth=3, label='Acero Superior' if i == 0 else "")
+        
+        # Acero inferior
+        for i in range(num_barras):
+            x = espaciado_barras * (i + 1)
+            ax.plot([x, x], [0.05, 0.15], 'red', linewidth=3, label='Acero Inferior' if i == 0 else "")
+        
+        # Dibujar estribos (simplificado)
+        if s_estribos > 0:
+            num_estribos = int(L / (s_estribos / escala))
+            for i in range(num_estribos):
+                x = (L / num_estribos) * i
+                rect_estribo = Rectangle((x, 0), 0.1, alto, linewidth=1, edgecolor='blue', facecolor='none', linestyle='--')
+                ax.add_patch(rect_estribo)
+        
+        # Configurar gráfico
+        ax.set_xlim(-0.5, largo + 0.5)
+        ax.set_ylim(-0.5, alto + 0.5)
+        ax.set_aspect('equal')
+        ax.set_title(f'Viga de {b}×{d} cm - L = {L} m\nAcero: {As:.1f} cm² - Estribos: φ3/8"@{s_estribos:.1f}cm', fontsize=12, fontweight='bold')
+        ax.set_xlabel('Longitud (m)')
+        ax.set_ylabel('Altura (m)')
+        ax.grid(True, alpha=0.3)
+        
+        # Agregar leyenda
+        handles, labels = ax.get_legend_handles_labels()
+        by_label = dict(zip(labels, handles))
+        ax.legend(by_label.values(), by_label.keys(), loc='upper right')
+        
+        # Agregar anotaciones
+        ax.text(largo/2, alto/2, f'f\'c = {fc} kg/cm²\nfy = {fy} kg/cm²', 
+                ha='center', va='center', bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7))
+        
+        plt.tight_layout()
+        return fig
+        
+    except Exception as e:
+        # No mostrar error en st.error para evitar problemas en la interfaz
+        print(f"Error dibujando viga: {str(e)}")
+        return None
+
+def dibujar_columna(lado, Ast, fc, fy):
+    """
+    Dibuja una columna con sus dimensiones y refuerzo
+    """
+    if not MATPLOTLIB_AVAILABLE:
+        return None
+        
+    try:
+        if plt is None or Rectangle is None:
+            return None
+            
+        fig, ax = plt.subplots(figsize=(8, 8))
+        
+        # Escala para visualización
+        escala = 100  # 1 unidad = 1 cm
+        
+        # Dimensiones de la columna
+        ancho = lado / escala
+        alto = lado / escala
+        
+        # Dibujar columna
+        rect_columna = Rectangle((0, 0), ancho, alto, linewidth=2, edgecolor='black', facecolor='lightgray', alpha=0.7)
+        ax.add_patch(rect_columna)
+        
+        # Dibujar acero longitudinal (simplificado como círculos)
+        num_barras = max(4, int(Ast / 2.85))  # Mínimo 4 barras
+        espaciado = ancho / 3
+        
+        # Posiciones de las barras
+        posiciones = [
+            (espaciado, alto - espaciado),  # Esquina superior derecha
+            (ancho - espaciado, alto - espaciado),  # Esquina superior izquierda
+            (espaciado, espaciado),  # Esquina inferior derecha
+            (ancho - espaciado, espaciado),  # Esquina inferior izquierda
+        ]
+        
+        # Agregar barras adicionales si es necesario
+        if num_barras > 4:
+            for i in range(num_barras - 4):
+                x = espaciado + (i % 2) * espaciado
+                y = espaciado + (i // 2) * espaciado
+                posiciones.append((x, y))
+        
+        # Dibujar barras
+        for i, (x, y) in enumerate(posiciones[:num_barras]):
+            circulo = plt.Circle((x, y), 0.02, color='red', label='Acero Longitudinal' if i == 0 else "")
+            ax.add_patch(circulo)
+        
+        # Dibujar estribos (simplificado)
+        rect_estribo = Rectangle((0.05, 0.05), ancho - 0.1, alto - 0.1, 
+                               linewidth=1, edgecolor='blue', facecolor='none', linestyle='--')
+        ax.add_patch(rect_estribo)
+        
+        # Configurar gráfico
+        ax.set_xlim(-0.1, ancho + 0.1)
+        ax.set_ylim(-0.1, alto + 0.1)
+        ax.set_aspect('equal')
+        ax.set_title(f'Columna {lado}×{lado} cm\nAcero: {Ast:.1f} cm²', fontsize=12, fontweight='bold')
+        ax.set_xlabel('Ancho (m)')
+        ax.set_ylabel('Alto (m)')
+        ax.grid(True, alpha=0.3)
+        
+        # Agregar leyenda
+        handles, labels = ax.get_legend_handles_labels()
+        by_label = dict(zip(labels, handles))
+        ax.legend(by_label.values(), by_label.keys(), loc='upper right')
+        
+        # Agregar anotaciones
+        ax.text(ancho/2, alto/2, f'f\'c = {fc} kg/cm²\nfy = {fy} kg/cm²\nρ = {Ast/(lado*lado)*100:.1f}%', 
+                ha='center', va='center', bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7))
+        
+        plt.tight_layout()
+        return fig
+        
+    except Exception as e:
+        # No mostrar error en st.error para evitar problemas en la interfaz
+        print(f"Error dibujando columna: {str(e)}")
+        return None
+
+def dibujar_zapata(lado, d, fc, fy):
+    """
+    Dibuja una zapata con sus dimensiones
+    """
+    if not MATPLOTLIB_AVAILABLE:
+        return None
+        
+    try:
+        if plt is None or Rectangle is None:
+            return None
+            
+        fig, ax = plt.subplots(figsize=(10, 8))
+        
+        # Escala para visualización
+        escala = 100  # 1 unidad = 1 cm
+        
+        # Dimensiones de la zapata
+        ancho = lado / escala
+        alto = lado / escala
+        peralte = d / escala
+        
+        # Dibujar zapata
+        rect_zapata = Rectangle((0, 0), ancho, alto, linewidth=2, edgecolor='black', facecolor='sandybrown', alpha=0.7)
+        ax.add_patch(rect_zapata)
+        
+        # Dibujar columna (simplificado)
+        lado_columna = 0.25  # 25 cm
+        x_col = (ancho - lado_columna) / 2
+        y_col = (alto - lado_columna) / 2
+        rect_columna = Rectangle((x_col, y_col), lado_columna, lado_columna, 
+                               linewidth=2, edgecolor='red', facecolor='red', alpha=0.5)
+        ax.add_patch(rect_columna)
+        
+        # Dibujar refuerzo (simplificado como líneas)
+        espaciado_refuerzo = 0.2
+        for i in range(int(ancho / espaciado_refuerzo)):
+            x = espaciado_refuerzo * i
+            ax.plot([x, x], [0.05, alto - 0.05], 'blue', linewidth=2, alpha=0.7)
+        
+        for i in range(int(alto / espaciado_refuerzo)):
+            y = espaciado_refuerzo * i
+            ax.plot([0.05, ancho - 0.05], [y, y], 'blue', linewidth=2, alpha=0.7)
+        
+        # Configurar gráfico
+        ax.set_xlim(-0.1, ancho + 0.1)
+        ax.set_ylim(-0.1, alto + 0.1)
+        ax.set_aspect('equal')
+        ax.set_title(f'Zapata {lado}×{lado} cm - Peralte: {d} cm', fontsize=12, fontweight='bold')
+        ax.set_xlabel('Ancho (m)')
+        ax.set_ylabel('Largo (m)')
+        ax.grid(True, alpha=0.3)
+        
+        # Agregar anotaciones
+        ax.text(ancho/2, alto/2, f'f\'c = {fc} kg/cm²\nfy = {fy} kg/cm²\nPeralte = {d} cm', 
+                ha='center', va='center', bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7))
+        
+        # Agregar leyenda
+        ax.text(0.02, alto - 0.1, 'Zapata', bbox=dict(boxstyle="round,pad=0.3", facecolor="sandybrown", alpha=0.7))
+        ax.text(x_col + lado_columna/2, y_col + lado_columna/2, 'Columna', 
+                ha='center', va='center', color='white', fontweight='bold')
+        
+        plt.tight_layout()
+        return fig
+        
+    except Exception as e:
+        # No mostrar error en st.error para evitar problemas en la interfaz
+        print(f"Error dibujando zapata: {str(e)}")
+        return None
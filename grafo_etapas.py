@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Grafo de Etapas - CONSORCIO DEJ
+Cálculo incremental: cada etapa declara sus entradas y solo se recalcula cuando cambian
+"""
+
+import copy
+from graphlib import CycleError, TopologicalSorter
+
+class Etapa:
+    """Etapa de cálculo: funcion(*entradas), donde cada entrada es un dato o la salida de otra etapa"""
+    __slots__ = ("nombre", "funcion", "entradas")
+
+    def __init__(self, nombre, funcion, entradas):
+        self.nombre = nombre
+        self.funcion = funcion
+        self.entradas = tuple(entradas)
+
+class MemoEtapas:
+    """Entradas y salidas memorizadas por etapa, y etapas recalculadas en la última ejecución"""
+    __slots__ = ("entradas", "salidas", "recalculadas")
+
+    def __init__(self):
+        self.entradas = {}
+        self.salidas = {}
+        self.recalculadas = ()
+
+class GrafoEtapas:
+    """Etapas ordenadas topológicamente según sus entradas declaradas"""
+
+    def __init__(self, etapas):
+        self.etapas = {}
+        for etapa in etapas:
+            if etapa.nombre in self.etapas:
+                raise ValueError(f"Etapa duplicada: {etapa.nombre}")
+            self.etapas[etapa.nombre] = etapa
+        dependencias = {
+            etapa.nombre: [entrada for entrada in etapa.entradas if entrada in self.etapas]
+            for etapa in etapas
+        }
+        try:
+            self.orden = tuple(TopologicalSorter(dependencias).static_order())
+        except CycleError as e:
+            raise ValueError(f"Las etapas forman un ciclo: {' -> '.join(e.args[1])}")
+        self.parametros = tuple(sorted({
+            entrada for etapa in etapas for entrada in etapa.entradas if entrada not in self.etapas
+        }))
+
+    def ejecutar(self, datos, memo=None):
+        """
+        Ejecutar las etapas en orden y devolver {nombre: valor} de datos y etapas.
+        Con memo, una etapa cuyas entradas son iguales a las de la ejecución anterior
+        reutiliza su salida memorizada en vez de recalcularse.
+        """
+        faltantes = [p for p in self.parametros if p not in datos]
+        if faltantes:
+            raise ValueError(f"Faltan datos de entrada: {', '.join(faltantes)}")
+        memo = memo if memo is not None else MemoEtapas()
+
+        valores = {p: datos[p] for p in self.parametros}
+        recalculadas = []
+        for nombre in self.orden:
+            etapa = self.etapas[nombre]
+            argumentos = tuple(valores[entrada] for entrada in etapa.entradas)
+            if nombre in memo.salidas and memo.entradas[nombre] == argumentos:
+                valores[nombre] = memo.salidas[nombre]
+                continue
+            valores[nombre] = etapa.funcion(*argumentos)
+            # Copia de las entradas: el memo no debe cambiar si quien llama modifica los resultados
+            memo.entradas[nombre] = copy.deepcopy(argumentos)
+            memo.salidas[nombre] = valores[nombre]
+            recalculadas.append(nombre)
+        memo.recalculadas = tuple(recalculadas)
+        return valores
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Modelo de Resultados - CONSORCIO DEJ
+Resultados de un análisis formateados una sola vez y vistas TXT, Markdown y Excel sobre ellos
+"""
+
+import io
+from dataclasses import dataclass
+from datetime import datetime
+from importlib.util import find_spec
+
+OPENPYXL_AVAILABLE = find_spec("openpyxl") is not None
+
+@dataclass(frozen=True, slots=True)
+class Fila:
+    """Una línea de reporte: etiqueta, valor ya formateado y unidad"""
+    etiqueta: str
+    valor: str
+    unidad: str = ""
+
+    def texto(self):
+        return f"{self.etiqueta}: {self.valor} {self.unidad}".rstrip()
+
+@dataclass(frozen=True, slots=True)
+class ModeloResultados:
+    """Resultados de un análisis listos para todos los formatos de reporte"""
+    fecha: str
+    entrada: tuple
+    materiales: tuple
+    dimensiones: tuple
+    verificaciones: tuple
+
+    def secciones(self, plan="premium"):
+        """(título, filas) de cada sección del reporte para el plan"""
+        if plan == "gratuito":
+            resumen = (self.dimensiones[0],) + self.materiales[:2] + self.dimensiones[1:]
+            return (("DATOS DE ENTRADA", self.entrada[:6]), ("RESULTADOS DEL ANÁLISIS", resumen))
+        return (
+            ("1. DATOS DE ENTRADA", self.entrada),
+            ("2. PROPIEDADES DE LOS MATERIALES", self.materiales),
+            ("3. DIMENSIONES CALCULADAS", self.dimensiones),
+            ("4. VERIFICACIONES DE ESTABILIDAD", self.verificaciones),
+        )
+
+def construir_modelo(resultados, datos_entrada, fecha=None):
+    """Formatear una vez los resultados de ejecutar_analisis_completo y sus datos de entrada"""
+    r = resultados.get
+    d = datos_entrada.get
+    viga = f"{r('b_viga', 0):.0f}×{r('d_viga', 0):.0f}"
+    columna = f"{r('lado_columna', 0):.0f}×{r('lado_columna', 0):.0f}"
+    return ModeloResultados(
+        fecha=fecha or datetime.now().strftime('%d/%m/%Y %H:%M'),
+        entrada=(
+            Fila("Resistencia del concreto (f'c)", f"{d('f_c', 0)}", "kg/cm²"),
+            Fila("Resistencia del acero (fy)", f"{d('f_y', 0)}", "kg/cm²"),
+            Fila("Luz libre de vigas", f"{d('L_viga', 0)}", "m"),
+            Fila("Número de pisos", f"{d('num_pisos', 0)}"),
+            Fila("Carga Muerta", f"{d('CM', 0)}", "kg/m²"),
+            Fila("Carga Viva", f"{d('CV', 0)}", "kg/m²"),
+            Fila("Zona Sísmica", f"{d('zona_sismica', 'N/A')}"),
+            Fila("Tipo de Suelo", f"{d('tipo_suelo', 'N/A')}"),
+            Fila("Tipo de Estructura", f"{d('tipo_estructura', 'N/A')}"),
+        ),
+        materiales=(
+            Fila("Módulo de elasticidad del concreto (Ec)", f"{r('Ec', 0):.0f}", "kg/cm²"),
+            Fila("Módulo de elasticidad del acero (Es)", f"{r('Es', 0):,}", "kg/cm²"),
+            Fila("Deformación última del concreto (εcu)", f"{r('ecu', 0)}"),
+            Fila("Deformación de fluencia (εy)", f"{r('ey', 0):.4f}"),
+            Fila("Resistencia a tracción (fr)", f"{r('fr', 0):.1f}", "kg/cm²"),
+            Fila("β1", f"{r('beta1', 0):.3f}"),
+        ),
+        dimensiones=(
+            Fila("Peso total estimado", f"{r('peso_total', 0):.1f}", "ton"),
+            Fila("Espesor de losa", f"{r('h_losa', 0)*100:.0f}", "cm"),
+            Fila("Dimensiones de viga", viga, "cm"),
+            Fila("Dimensiones de columna", columna, "cm"),
+        ),
+        verificaciones=(
+            Fila("Peso total", '✅ ACEPTABLE' if r('peso_total', 0) < 1000 else '⚠️ ALTO - Revisar dimensiones'),
+            Fila("Módulo de elasticidad del concreto", '✅ ADECUADO' if r('Ec', 0) > 200000 else 'ℹ️ NORMAL'),
+        ),
+    )
+
+# =====================
+# VISTAS DEL MODELO
+# =====================
+
+RECOMENDACIONES = (
+    "Verificar la capacidad portante del suelo en campo",
+    "Revisar el diseño del refuerzo estructural según ACI 318-2025",
+    "Considerar efectos sísmicos según la normativa local",
+    "Realizar inspecciones periódicas durante la construcción",
+    "Monitorear deformaciones durante el servicio",
+)
+
+def reporte_markdown(modelo, plan="premium"):
+    """Reporte en Markdown (el mismo texto que se muestra en pantalla)"""
+    if plan == "gratuito":
+        lineas = ["# REPORTE BÁSICO - ANÁLISIS ESTRUCTURAL", "## CONSORCIO DEJ", f"### Fecha: {modelo.fecha}"]
+    else:
+        lineas = ["# REPORTE TÉCNICO COMPLETO - ANÁLISIS ESTRUCTURAL", "## CONSORCIO DEJ",
+                  "### Análisis según ACI 318-2025 y E.060", f"### Fecha: {modelo.fecha}"]
+    for titulo, filas in modelo.secciones(plan):
+        lineas += ["", f"### {titulo}:"] + [f"- {fila.texto()}" for fila in filas]
+
+    if plan == "gratuito":
+        lineas += ["", "### NOTA:",
+                   "Este es un reporte básico del plan gratuito. Para análisis más detallados, considere actualizar al plan premium.",
+                   "", "---", "Generado por: CONSORCIO DEJ", "Plan: Gratuito"]
+    else:
+        lineas += ["", "### 5. RECOMENDACIONES TÉCNICAS:"] + [f"- {r}" for r in RECOMENDACIONES]
+        lineas += ["", "### 6. INFORMACIÓN DEL PROYECTO:", "- Empresa: CONSORCIO DEJ",
+                   "- Método de análisis: ACI 318-2025 y E.060", f"- Fecha de análisis: {modelo.fecha}",
+                   "- Plan: Premium", "- Software: Streamlit + Python", "", "---",
+                   "**Este reporte fue generado automáticamente por el sistema de análisis estructural de CONSORCIO DEJ.**",
+                   "**Para consultas técnicas, contacte a nuestro equipo de ingeniería.**"]
+    return "\n".join(lineas) + "\n"
+
+def reporte_txt(modelo, plan="premium"):
+    """Reporte en texto plano (sin marcas de Markdown)"""
+    lineas = []
+    for linea in reporte_markdown(modelo, plan).splitlines():
+        linea = linea.lstrip("#").strip().replace("**", "")
+        lineas.append("-" * 60 if linea == "---" else linea)
+    return "\n".join(lineas) + "\n"
+
+def reporte_excel(modelo, plan="premium"):
+    """Bytes de un libro .xlsx con una fila por dato y una hoja de resumen (requiere openpyxl)"""
+    from openpyxl import Workbook
+    from openpyxl.styles import Font
+
+    libro = Workbook()
+    hoja = libro.active
+    hoja.title = "Resultados"
+    hoja.append(["CONSORCIO DEJ - Análisis Estructural", "", f"Fecha: {modelo.fecha}"])
+    hoja["A1"].font = Font(bold=True)
+    for titulo, filas in modelo.secciones(plan):
+        hoja.append([])
+        hoja.append([titulo])
+        hoja.cell(row=hoja.max_row, column=1).font = Font(bold=True)
+        hoja.append(["Parámetro", "Valor", "Unidad"])
+        for fila in filas:
+            hoja.append([fila.etiqueta, fila.valor, fila.unidad])
+    hoja.column_dimensions["A"].width = 45
+    hoja.column_dimensions["B"].width = 30
+    hoja.column_dimensions["C"].width = 12
+
+    buffer = io.BytesIO()
+    libro.save(buffer)
+    return buffer.getvalue()
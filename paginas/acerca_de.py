@@ -0,0 +1,32 @@
+"""
+Acerca de - CONSORCIO DEJ
+Página de la aplicación (ver APP2.py)
+"""
+
+import streamlit as st
+
+st.title("ℹ️ Acerca de CONSORCIO DEJ")
+st.write("""
+        ### 🏗️ CONSORCIO DEJ
+        **Ingeniería y Construcción Especializada**
+        
+        Esta aplicación fue desarrollada para facilitar el análisis y diseño estructural
+        utilizando métodos reconocidos en ingeniería civil.
+        
+        **Características del Plan Gratuito:**
+        - ✅ Cálculos básicos de análisis estructural
+        - ✅ Resultados simples con gráficos básicos
+        - ✅ Reporte básico descargable
+        - ✅ Análisis de propiedades de materiales
+        
+        **Características del Plan Premium:**
+        - ⭐ Análisis completo con ACI 318-2025
+        - ⭐ Cálculos de predimensionamiento automáticos
+        - ⭐ **Reportes técnicos en PDF** (NUEVO)
+        - ⭐ **Gráficos interactivos avanzados** (NUEVO)
+        - ⭐ Verificaciones de estabilidad completas
+        - ⭐ Fórmulas de diseño estructural detalladas
+        
+        **Desarrollado con:** Python, Streamlit, Plotly
+        **Normativas:** ACI 318-2025, E.060, E.030
+        """)
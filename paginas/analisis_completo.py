@@ -0,0 +1,329 @@
+"""
+Análisis Completo - CONSORCIO DEJ
+Página de la aplicación (ver APP2.py)
+"""
+
+import streamlit as st
+import pandas as pd
+
+from cache_resultados import analisis_completo_cacheado, cache_analisis
+from graficos import MATPLOTLIB_AVAILABLE, PLOTLY_AVAILABLE, plt, px
+from grafo_etapas import MemoEtapas
+from modelo_resultados import construir_modelo
+from motor_calculo import GRAFO_ANALISIS
+from permisos import puede
+from ui_comun import datos_proyecto
+
+# Datos del proyecto (sidebar de APP2.py)
+datos = datos_proyecto()
+f_c, f_y, L_viga, h_piso = datos['f_c'], datos['f_y'], datos['L_viga'], datos['h_piso']
+num_pisos, num_vanos, CM, CV = datos['num_pisos'], datos['num_vanos'], datos['CM'], datos['CV']
+zona_sismica, tipo_suelo = datos['zona_sismica'], datos['tipo_suelo']
+tipo_estructura, factor_importancia = datos['tipo_estructura'], datos['factor_importancia']
+
+# Verificar acceso basado en plan del usuario (el administrador tiene acceso con cualquier plan)
+if not puede("analisis_completo"):
+    st.warning("⚠️ Esta función requiere plan premium. Actualiza tu cuenta para acceder a análisis completos.")
+    st.info("Plan gratuito incluye: Cálculos básicos, resultados simples")
+    st.info("Plan premium incluye: Análisis completo, reportes detallados, gráficos avanzados")
+
+    # Mostrar botón para actualizar plan
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("⭐ Actualizar a Premium", type="primary"):
+            st.session_state['show_pricing'] = True
+            st.rerun()
+else:
+    st.title("📊 Análisis Completo de Estructuras")
+    st.success("⭐ Plan Premium: Análisis completo con todas las verificaciones")
+
+    # Datos de entrada completos - Caso Ayacucho
+    st.markdown("### 🏗️ **CASO PRÁCTICO: EDIFICIO DE 3 NIVELES - AYACUCHO**")
+    st.info("📋 **Análisis presentado en memoria de cálculo para Servicios Públicos**")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("🏗️ Propiedades del Proyecto")
+        st.write(f"**Ubicación:** Ayacucho (Zona Sísmica Z3)")
+        st.write(f"**Tipo de Suelo:** S1 (Roca o suelos muy rígidos)")
+        st.write(f"**Factor de Uso:** U = 1.00 (Servicios Públicos)")
+        st.write(f"**Sistema Estructural:** Dual (Pórticos + Muros)")
+
+        st.subheader("📏 Dimensiones")
+        st.write(f"**Número de pisos:** {num_pisos}")
+        st.write(f"**Número de vanos:** {num_vanos}")
+        st.write(f"**Luz libre de vigas:** {L_viga} m")
+        st.write(f"**Altura de piso:** {h_piso} m")
+
+    with col2:
+        st.subheader("⚖️ Cargas y Materiales")
+        st.write(f"**Carga Muerta:** {CM} kg/m²")
+        st.write(f"**Carga Viva:** {CV} kg/m²")
+        st.write(f"**f'c:** {f_c} kg/cm²")
+        st.write(f"**fy:** {f_y} kg/cm²")
+
+        st.subheader("📊 Resultados Esperados")
+        st.success("**Según análisis presentado:**")
+        st.write("✅ Peso total: 550.5 ton")
+        st.write("✅ Cortante X (Pórticos): 72.2 ton")
+        st.write("✅ Cortante Y (Muros): 96.3 ton")
+        st.write("✅ Cortante promedio: 84.3 ton")
+
+    # Botón para ejecutar análisis completo
+    if st.button("🔬 Ejecutar Análisis Completo", type="primary"):
+        # Datos de entrada (clave de la caché compartida entre sesiones)
+        datos_entrada = {
+            'f_c': f_c,
+            'f_y': f_y,
+            'L_viga': L_viga,
+            'num_pisos': num_pisos,
+            'num_vanos': num_vanos,
+            'CM': CM,
+            'CV': CV,
+            'zona_sismica': zona_sismica,
+            'tipo_suelo': tipo_suelo,
+            'tipo_estructura': tipo_estructura,
+            'factor_importancia': factor_importancia
+        }
+
+        # Cálculos completos (motor_calculo, reutilizados si otra sesión ya los ejecutó;
+        # si no, solo se recalculan las etapas afectadas por los datos que cambiaron)
+        memo_analisis = st.session_state.setdefault('memo_analisis', MemoEtapas())
+        resultados_completos = analisis_completo_cacheado(datos_entrada, memo=memo_analisis)
+        peso_total = resultados_completos['peso_total']
+        diseno_flexion = resultados_completos['diseno_flexion']
+        diseno_cortante = resultados_completos['diseno_cortante']
+        diseno_columna = resultados_completos['diseno_columna']
+        analisis_sismico = resultados_completos['analisis_sismico']
+        props_concreto = {k: resultados_completos[k] for k in ('Ec', 'ecu', 'fr', 'beta1')}
+        props_acero = {k: resultados_completos[k] for k in ('Es', 'ey')}
+        predim = {k: resultados_completos[k] for k in ('h_losa', 'b_viga', 'd_viga', 'lado_columna')}
+        Ag_columna = predim['lado_columna']**2  # cm²
+        Ast_columna = 0.01 * Ag_columna  # 1% de acero inicial
+
+        # Guardar en session state
+        st.session_state['resultados_completos'] = resultados_completos
+        st.session_state['datos_entrada'] = datos_entrada
+        st.session_state['modelo_resultados'] = construir_modelo(resultados_completos, datos_entrada)
+
+        st.success("¡Análisis completo ejecutado exitosamente!")
+        st.balloons()
+        estadisticas_cache = cache_analisis.estadisticas()
+        st.caption(f"♻️ Caché compartida: {estadisticas_cache['aciertos']} aciertos, "
+                   f"{estadisticas_cache['fallos']} fallos, {estadisticas_cache['entradas']} resultados guardados")
+        if memo_analisis.recalculadas:
+            st.caption(f"🔁 Etapas recalculadas: {len(memo_analisis.recalculadas)} de {len(GRAFO_ANALISIS.orden)} "
+                       f"({', '.join(memo_analisis.recalculadas)})")
+
+        # MOSTRAR RESULTADOS COMPLETOS INMEDIATAMENTE
+        st.subheader("📊 Resultados del Análisis Completo - Caso Ayacucho")
+
+        # Sección especial para caso Ayacucho
+        if zona_sismica == "Z3" and tipo_suelo == "S1":
+            st.markdown("### 🎯 **VERIFICACIÓN CASO AYACUCHO**")
+            st.success("🏗️ **EDIFICIO DE 3 NIVELES - SERVICIOS PÚBLICOS**")
+
+            # Comparación directa con análisis presentado
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("📊 Peso Total", f"{peso_total:.1f} ton", 
+                        delta=f"550.5 ton esperado", delta_color="normal")
+            with col2:
+                st.metric("🌍 Cortante X", f"{analisis_sismico['cortante_x_ton']:.1f} ton", 
+                        delta=f"72.2 ton esperado", delta_color="normal")
+            with col3:
+                st.metric("🏢 Cortante Y", f"{analisis_sismico['cortante_y_ton']:.1f} ton", 
+                        delta=f"96.3 ton esperado", delta_color="normal")
+            with col4:
+                st.metric("⚖️ Cortante Promedio", f"{analisis_sismico['cortante_basal_ton']:.1f} ton", 
+                        delta=f"84.3 ton esperado", delta_color="normal")
+
+            # Estado de verificación
+            if 'caso_ayacucho' in analisis_sismico:
+                if (analisis_sismico['caso_ayacucho']['coincidencia_peso'] and 
+                    analisis_sismico['caso_ayacucho']['coincidencia_vx'] and 
+                    analisis_sismico['caso_ayacucho']['coincidencia_vy']):
+                    st.success("✅ **VERIFICACIÓN EXITOSA** - Los resultados coinciden con el análisis presentado")
+                else:
+                    st.warning("⚠️ **VERIFICACIÓN PARCIAL** - Algunos valores difieren del análisis presentado")
+
+            st.markdown("---")
+
+        # Mostrar resultados en columnas
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.metric("Peso Total Estimado", f"{peso_total:.1f} ton")
+            st.metric("Módulo de Elasticidad del Concreto", f"{props_concreto['Ec']:.0f} kg/cm²")
+            st.metric("Módulo de Elasticidad del Acero", f"{props_acero['Es']:,} kg/cm²")
+            st.metric("Deformación Última del Concreto", f"{props_concreto['ecu']}")
+            st.metric("Resistencia a Tracción", f"{props_concreto['fr']:.1f} kg/cm²")
+
+        with col2:
+            st.metric("β1", f"{props_concreto['beta1']:.3f}")
+            st.metric("Deformación de Fluencia", f"{props_acero['ey']:.4f}")
+            st.metric("Espesor de Losa", f"{predim['h_losa']*100:.0f} cm")
+            st.metric("Dimensiones de Viga", f"{predim['b_viga']:.0f}×{predim['d_viga']:.0f} cm")
+            st.metric("Dimensiones de Columna", f"{predim['lado_columna']:.0f}×{predim['lado_columna']:.0f} cm")
+
+        # Análisis de estabilidad
+        st.subheader("🔍 Análisis de Estabilidad")
+
+        # Verificaciones básicas
+        if peso_total < 1000:
+            st.success(f"✅ Peso total aceptable: {peso_total:.1f} ton")
+        else:
+            st.warning(f"⚠️ Peso total alto: {peso_total:.1f} ton - Revisar dimensiones")
+
+        if props_concreto['Ec'] > 200000:
+            st.success(f"✅ Módulo de elasticidad del concreto adecuado: {props_concreto['Ec']:.0f} kg/cm²")
+        else:
+            st.info(f"ℹ️ Módulo de elasticidad del concreto: {props_concreto['Ec']:.0f} kg/cm²")
+
+        # RESULTADOS DE DISEÑO ESTRUCTURAL SEGÚN ACI 318-2025
+        st.subheader("🏗️ Resultados de Diseño Estructural (ACI 318-2025)")
+
+        # Pestañas para diferentes tipos de diseño
+        tab1, tab2, tab3, tab4 = st.tabs(["📐 Flexión", "🔧 Cortante", "🏢 Columnas", "🌍 Sísmico"])
+
+        with tab1:
+            st.markdown("### 📐 Diseño por Flexión")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Momento Último (Mu)", f"{resultados_completos['Mu_estimado']:.0f} kg·m")
+                st.metric("Cuantía Balanceada (ρb)", f"{diseno_flexion['rho_b']:.4f}")
+                st.metric("Cuantía Mínima (ρmin)", f"{diseno_flexion['rho_min']:.4f}")
+                st.metric("Cuantía Máxima (ρmax)", f"{diseno_flexion['rho_max']:.4f}")
+            with col2:
+                st.metric("Área de Acero (As)", f"{diseno_flexion['As']:.1f} cm²")
+                st.metric("Profundidad Bloque (a)", f"{diseno_flexion['a']:.1f} cm")
+                st.metric("Momento Resistente (φMn)", f"{diseno_flexion['phiMn']:.0f} kg·m")
+                if diseno_flexion['verificacion']:
+                    st.success("✅ Verificación de flexión: CUMPLE")
+                else:
+                    st.error("❌ Verificación de flexión: NO CUMPLE")
+
+        with tab2:
+            st.markdown("### 🔧 Diseño por Cortante")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Cortante Último (Vu)", f"{resultados_completos['Vu_estimado']:.0f} kg")
+                st.metric("Resistencia Concreto (Vc)", f"{diseno_cortante['Vc']:.0f} kg")
+                st.metric("Resistencia Acero (Vs)", f"{diseno_cortante['Vs_requerido']:.0f} kg")
+            with col2:
+                st.metric("Área Estribos (Av/s)", f"{diseno_cortante['Av_s_requerido']:.3f} cm²/cm")
+                st.metric("Separación Máxima", f"{diseno_cortante['s_max']:.1f} cm")
+                if diseno_cortante['verificacion']:
+                    st.success("✅ Verificación de cortante: CUMPLE")
+                else:
+                    st.error("❌ Verificación de cortante: NO CUMPLE")
+
+        with tab3:
+            st.markdown("### 🏢 Diseño de Columnas")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Carga Axial Última (Pu)", f"{resultados_completos['Pu_estimado']:.0f} kg")
+                st.metric("Resistencia Nominal (Pn)", f"{diseno_columna['Pn']:.0f} kg")
+                st.metric("Resistencia Diseño (φPn)", f"{diseno_columna['phiPn']:.0f} kg")
+            with col2:
+                st.metric("Área Total Columna", f"{Ag_columna:.0f} cm²")
+                st.metric("Área Acero Columna", f"{Ast_columna:.1f} cm²")
+                if diseno_columna['verificacion']:
+                    st.success("✅ Verificación de columna: CUMPLE")
+                else:
+                    st.error("❌ Verificación de columna: NO CUMPLE")
+
+        with tab4:
+            st.markdown("### 🌍 Análisis Sísmico (E.030)")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Factor Zona (Z)", f"{analisis_sismico['Z']:.2f}")
+                st.metric("Factor Suelo (S)", f"{analisis_sismico['S']:.1f}")
+                st.metric("Factor Importancia (U)", f"{analisis_sismico['U']:.1f}")
+                st.metric("Cortante X (Pórticos)", f"{analisis_sismico['cortante_x_ton']:.1f} ton")
+            with col2:
+                st.metric("Coeficiente Sísmico (C)", f"{analisis_sismico['C']:.1f}")
+                st.metric("Factor Reducción (R)", f"{analisis_sismico['R']:.1f}")
+                st.metric("Cortante Basal (V)", f"{analisis_sismico['cortante_basal_ton']:.1f} ton")
+                st.metric("Cortante Y (Muros)", f"{analisis_sismico['cortante_y_ton']:.1f} ton")
+
+            # Verificación específica para caso Ayacucho
+            if 'caso_ayacucho' in analisis_sismico:
+                st.markdown("### 🎯 Verificación Caso Ayacucho")
+                st.info("Comparación con análisis presentado:")
+
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Peso Total", f"{peso_total:.1f} ton", 
+                            delta=f"{analisis_sismico['caso_ayacucho']['peso_esperado']:.1f} ton esperado")
+                with col2:
+                    st.metric("Cortante X", f"{analisis_sismico['cortante_x_ton']:.1f} ton", 
+                            delta=f"{analisis_sismico['caso_ayacucho']['cortante_x_esperado']:.1f} ton esperado")
+                with col3:
+                    st.metric("Cortante Y", f"{analisis_sismico['cortante_y_ton']:.1f} ton", 
+                            delta=f"{analisis_sismico['caso_ayacucho']['cortante_y_esperado']:.1f} ton esperado")
+
+                # Estado de verificación
+                if (analisis_sismico['caso_ayacucho']['coincidencia_peso'] and 
+                    analisis_sismico['caso_ayacucho']['coincidencia_vx'] and 
+                    analisis_sismico['caso_ayacucho']['coincidencia_vy']):
+                    st.success("✅ VERIFICACIÓN EXITOSA - Los resultados coinciden con el análisis presentado")
+                else:
+                    st.warning("⚠️ VERIFICACIÓN PARCIAL - Algunos valores difieren del análisis presentado")
+                    if not analisis_sismico['caso_ayacucho']['coincidencia_peso']:
+                        st.error("❌ Peso total no coincide")
+                    if not analisis_sismico['caso_ayacucho']['coincidencia_vx']:
+                        st.error("❌ Cortante X no coincide")
+                    if not analisis_sismico['caso_ayacucho']['coincidencia_vy']:
+                        st.error("❌ Cortante Y no coincide")
+
+        # Gráfico de resultados
+        if PLOTLY_AVAILABLE:
+            st.subheader("📈 Gráfico de Resultados")
+            datos_grafico = pd.DataFrame({
+                'Propiedad': ['Peso Total (ton)', 'Ec (kg/cm²)', 'Es (kg/cm²)', 'Espesor Losa (cm)'],
+                'Valor': [peso_total, props_concreto['Ec']/1000, props_acero['Es']/1000000, predim['h_losa']*100]
+            })
+
+            fig = px.bar(datos_grafico, x='Propiedad', y='Valor', 
+                        title="Resultados del Análisis Completo - Plan Premium",
+                        color='Propiedad',
+                        color_discrete_map={
+                            'Peso Total (ton)': '#2E8B57',
+                            'Ec (kg/cm²)': '#4169E1',
+                            'Es (kg/cm²)': '#DC143C',
+                            'Espesor Losa (cm)': '#FFD700'
+                        })
+
+            fig.update_layout(
+                xaxis_title="Propiedad",
+                yaxis_title="Valor",
+                height=400
+            )
+
+            fig.update_traces(texttemplate='%{y:.1f}', textposition='outside')
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            # Gráfico alternativo con matplotlib
+            st.subheader("📈 Gráfico de Resultados")
+            if MATPLOTLIB_AVAILABLE and plt is not None:
+                fig, ax = plt.subplots(figsize=(10, 6))
+                propiedades = ['Peso Total', 'Ec', 'Es', 'Espesor Losa']
+                valores = [peso_total, props_concreto['Ec']/1000, props_acero['Es']/1000000, predim['h_losa']*100]
+                color_list = ['#2E8B57', '#4169E1', '#DC143C', '#FFD700']
+
+                bars = ax.bar(propiedades, valores, color=color_list)
+                ax.set_title("Resultados del Análisis Completo - Plan Premium")
+                ax.set_ylabel("Valor")
+
+                # Agregar valores en las barras
+                for bar in bars:
+                    height = bar.get_height()
+                    ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                           f'{height:.1f}', ha='center', va='bottom')
+
+                st.pyplot(fig)
+            else:
+                st.info("📊 Gráfico no disponible - Matplotlib no está instalado")
+                st.write("Para ver gráficos, instale matplotlib: `pip install matplotlib`")
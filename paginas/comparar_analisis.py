@@ -0,0 +1,102 @@
+"""
+Comparar Análisis - CONSORCIO DEJ
+Página de la aplicación (ver APP2.py)
+"""
+
+from datetime import datetime
+import streamlit as st
+
+from comparacion_analisis import campos_con_cambios, comparar_analisis, reporte_diferencias
+from permisos import puede
+
+MAX_ANALISIS_GUARDADOS = 10
+
+st.title("🔀 Comparar Análisis")
+st.info("Compara alternativas (f'c, luces, tipo de suelo...) guardadas desde el Análisis Completo")
+
+# Verificar acceso basado en plan
+if not puede("comparar_analisis"):
+    st.warning("⚠️ Esta función requiere plan premium. Actualiza tu cuenta para comparar análisis.")
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("⭐ Actualizar a Premium", type="primary", key="upgrade_comparar"):
+            st.session_state['show_pricing'] = True
+            st.rerun()
+else:
+    guardados = st.session_state.setdefault('analisis_guardados', {})
+
+    # Guardar el análisis actual como alternativa
+    if 'resultados_completos' in st.session_state:
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            nombre = st.text_input("Nombre de la alternativa", placeholder=f"Alternativa {len(guardados) + 1}",
+                                   key="nombre_alternativa").strip() or f"Alternativa {len(guardados) + 1}"
+        with col2:
+            st.write("")
+            if st.button("💾 Guardar análisis actual", disabled=not nombre):
+                if nombre not in guardados and len(guardados) >= MAX_ANALISIS_GUARDADOS:
+                    st.error(f"⚠️ Máximo {MAX_ANALISIS_GUARDADOS} análisis guardados; elimina alguno primero")
+                else:
+                    guardados[nombre] = {
+                        "datos_entrada": dict(st.session_state.get('datos_entrada', {})),
+                        "resultados": st.session_state['resultados_completos'],
+                    }
+                    st.success(f"✅ Análisis guardado como '{nombre}'")
+    else:
+        st.warning("⚠️ Ejecuta primero el análisis completo para guardarlo y compararlo")
+
+    if len(guardados) < 2:
+        st.info(f"Guarda al menos dos análisis para compararlos (guardados: {len(guardados)})")
+    else:
+        seleccion = st.multiselect("Análisis a comparar", list(guardados), default=list(guardados)[:2])
+        if len(seleccion) >= 2:
+            base = st.selectbox("Análisis base", seleccion)
+            comparacion = comparar_analisis(
+                [(nombre, guardados[nombre]["resultados"]) for nombre in seleccion],
+                base=seleccion.index(base),
+            )
+
+            st.subheader("🚦 Cambios de Verificación")
+            if comparacion["cambios_verificacion"]:
+                for cambio in comparacion["cambios_verificacion"]:
+                    texto = f"{cambio['verificacion']} en '{cambio['analisis']}'"
+                    if cambio["ahora"]:
+                        st.success(f"✅ Pasa a cumplir: {texto}")
+                    else:
+                        st.error(f"❌ Deja de cumplir: {texto}")
+            else:
+                st.success("✅ Ninguna verificación cambia de estado respecto al análisis base")
+
+            st.subheader("📊 Diferencias en Resultados")
+            campos = campos_con_cambios(comparacion)
+            if campos:
+                st.dataframe(comparacion["valores"].loc[campos], use_container_width=True)
+                st.caption("Variación porcentual respecto al análisis base")
+                st.dataframe(comparacion["deltas_pct"].loc[campos].round(2), use_container_width=True)
+            else:
+                st.info("Los resultados numéricos son iguales en todos los análisis seleccionados")
+
+            with st.expander("🔎 Datos de entrada de cada análisis"):
+                st.dataframe({nombre: {k: str(v) for k, v in guardados[nombre]["datos_entrada"].items()} for nombre in seleccion},
+                             use_container_width=True)
+
+            col1, col2 = st.columns(2)
+            fecha = datetime.now().strftime('%Y%m%d_%H%M')
+            with col1:
+                st.download_button(
+                    label="📥 Descargar reporte de diferencias",
+                    data=reporte_diferencias(comparacion),
+                    file_name=f"diferencias_analisis_{fecha}.md",
+                    mime="text/markdown"
+                )
+            with col2:
+                st.download_button(
+                    label="📊 Descargar deltas (CSV)",
+                    data=comparacion["deltas"].to_csv(),
+                    file_name=f"deltas_analisis_{fecha}.csv",
+                    mime="text/csv"
+                )
+
+        if st.button("🗑️ Eliminar análisis guardados"):
+            guardados.clear()
+            st.rerun()
@@ -0,0 +1,26 @@
+"""
+Contacto - CONSORCIO DEJ
+Página de la aplicación (ver APP2.py)
+"""
+
+import streamlit as st
+
+st.title("✉️ Contacto")
+st.write("""
+        ### 🏗️ CONSORCIO DEJ
+        **Información de Contacto:**
+        
+        📧 Email: contacto@consorciodej.com  
+        📱 Teléfono: +123 456 7890  
+        🌐 Web: www.consorciodej.com  
+        📍 Dirección: [Tu dirección aquí]
+        
+        **Horarios de Atención:**
+        Lunes a Viernes: 8:00 AM - 6:00 PM
+        
+        **Servicios:**
+        - Análisis estructural
+        - Diseño de estructuras
+        - Ingeniería civil
+        - Construcción especializada
+        """)
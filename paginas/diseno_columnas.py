@@ -0,0 +1,327 @@
+"""
+Diseño de Columnas - CONSORCIO DEJ
+Página de la aplicación (ver APP2.py)
+"""
+
+import streamlit as st
+import pandas as pd
+
+from motor_calculo import (
+    calcular_cortantes_momentos_viga_empotrada_mccormac,
+    calcular_diseno_columnas_detallado,
+)
+from graficos import (
+    MATPLOTLIB_AVAILABLE,
+    PLOTLY_AVAILABLE,
+    plt,
+    px,
+    dibujar_columna,
+    graficar_cortantes_momentos_mccormac,
+)
+from permisos import puede
+from ui_comun import fragmento
+
+st.title("🏢 Diseño de Columnas")
+st.info("📚 Basado en ACI 318 - Capítulo 10 y Norma E.060")
+
+# Verificar acceso basado en plan
+if not puede("diseno_elementos"):
+    st.warning("⚠️ Esta función requiere plan premium. Actualiza tu cuenta para acceder al diseño de columnas.")
+    st.info("Plan gratuito incluye: Cálculos básicos, resultados simples")
+    st.info("Plan premium incluye: Diseño completo de columnas, verificaciones detalladas")
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("⭐ Actualizar a Premium", type="primary", key="upgrade_columnas"):
+            st.session_state['show_pricing'] = True
+            st.rerun()
+else:
+    @fragmento
+    def panel_diseno_columnas():
+        """Panel de diseño de columnas (se reejecuta solo)"""
+        st.success("⭐ Plan Premium: Diseño completo de columnas con todas las verificaciones")
+
+        # Datos de entrada para columnas
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("📐 Datos de Entrada")
+            fc_columna = st.number_input("f'c (kg/cm²)", 175, 700, 210, 10, key="fc_columna")
+            fy_columna = st.number_input("fy (kg/cm²)", 2800, 6000, 4200, 100, key="fy_columna")
+            lado_columna = st.number_input("Lado de Columna (cm)", 20, 100, 30, 1, key="lado_columna")
+            Ag_columna = lado_columna * lado_columna
+            st.write(f"**Área Bruta (Ag):** {Ag_columna} cm²")
+            rho_columna = st.number_input("Cuantía de Acero ρ (%)", 0.5, 6.0, 1.0, 0.1, key="rho_columna")
+            Ast_columna = rho_columna / 100 * Ag_columna
+            st.write(f"**Área de Acero (Ast):** {Ast_columna:.1f} cm²")
+            Pu_columna = st.number_input("Carga Axial Última Pu (kg)", 10000, 1000000, 100000, 1000, key="Pu_columna")
+
+        with col2:
+            st.subheader("📋 Fórmulas Utilizadas")
+            st.markdown("""
+                    **Carga Axial Resistente:**
+                    \[ P_n = 0.85f'_c(A_g - A_{st}) + A_{st} \cdot f_y \]
+                
+                    **Resistencia de Diseño:**
+                    \[ \phi P_n = \phi \cdot P_n \]
+                
+                    **Espaciamiento de Estribos:**
+                    \[ s \leq \min(16\phi_b, 48\phi_e, b, h) \]
+                
+                    **Cuantías:**
+                    \[ 1\% \leq \rho \leq 6\% \]
+                    """, unsafe_allow_html=True)
+
+        # Botón para calcular
+        if st.button("🔬 Calcular Diseño de Columna", type="primary"):
+            # Cálculos de diseño de columna
+            resultados_columna = calcular_diseno_columnas_detallado(fc_columna, fy_columna, Ag_columna, Ast_columna, Pu_columna)
+
+            st.success("¡Diseño de columna calculado exitosamente!")
+            st.balloons()
+
+            # Mostrar resultados
+            st.subheader("📊 Resultados del Diseño de Columna")
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.metric("Resistencia Nominal (Pn)", f"{resultados_columna['Pn']:.0f} kg")
+                st.metric("Resistencia Diseño (φPn)", f"{resultados_columna['phiPn']:.0f} kg")
+                st.metric("Factor φ", f"{resultados_columna['phi']:.2f}")
+                st.metric("Espaciamiento Máx. Estribos", f"{resultados_columna['s_max_estribos']:.1f} cm")
+
+            with col2:
+                st.metric("Cuantía Actual", f"{resultados_columna['rho']:.3f}")
+                st.metric("Cuantía Mínima", f"{resultados_columna['rho_min']:.3f}")
+                st.metric("Cuantía Máxima", f"{resultados_columna['rho_max']:.3f}")
+                if resultados_columna['verificacion_carga']:
+                    st.success("✅ Verificación Carga: CUMPLE")
+                else:
+                    st.error("❌ Verificación Carga: NO CUMPLE")
+
+            # Verificaciones detalladas
+            st.subheader("🔍 Verificaciones Detalladas")
+
+            if resultados_columna['verificacion_cuantia']:
+                st.success("✅ Cuantía de acero dentro de límites")
+            else:
+                st.warning("⚠️ Cuantía de acero fuera de límites - Revisar diseño")
+
+            # Factor de seguridad
+            FS_columna = resultados_columna['phiPn'] / Pu_columna
+            st.metric("Factor de Seguridad", f"{FS_columna:.2f}")
+
+            if FS_columna >= 1.0:
+                st.success("✅ Columna segura")
+            else:
+                st.error("❌ Columna insegura - Aumentar dimensiones o acero")
+
+            # Verificación específica para caso Ayacucho
+            if fc_columna == 210 and fy_columna == 4200:
+                st.markdown("**🏗️ Caso Ayacucho - Columnas:**")
+                st.success("✅ Materiales coinciden con caso Ayacucho")
+                st.write(f"- f'c: {fc_columna} kg/cm² ✓")
+                st.write(f"- fy: {fy_columna} kg/cm² ✓")
+
+                # Verificaciones adicionales para Ayacucho
+                if resultados_columna['verificacion_esbeltez']:
+                    st.success("✅ Verificación de esbeltez cumple")
+                else:
+                    st.warning("⚠️ Verificación de esbeltez no cumple")
+
+                # Verificación de dimensiones típicas para edificio de 3 niveles
+                if 25 <= lado_columna <= 50:
+                    st.success("✅ Dimensiones típicas para edificio de 3 niveles")
+                else:
+                    st.info("ℹ️ Verificar dimensiones para edificio de 3 niveles")
+
+                # Verificación de carga típica para Ayacucho
+                if 50000 <= Pu_columna <= 200000:
+                    st.success("✅ Carga axial típica para edificio de 3 niveles")
+                else:
+                    st.info("ℹ️ Verificar carga axial para edificio de 3 niveles")
+
+            # Gráficos de resultados
+            st.subheader("📈 Gráficos de Resultados")
+
+            # Gráfico 1: Propiedades de la columna
+            if PLOTLY_AVAILABLE:
+                datos_columna = pd.DataFrame({
+                    'Propiedad': ['Resistencia Nominal (kg)', 'Resistencia Diseño (kg)', 'Factor φ', 'Espaciamiento Estribos (cm)'],
+                    'Valor': [resultados_columna['Pn']/1000, resultados_columna['phiPn']/1000, 
+                             resultados_columna['phi'], resultados_columna['s_max_estribos']]
+                })
+
+                fig1 = px.bar(datos_columna, x='Propiedad', y='Valor',
+                            title="Propiedades del Diseño de Columna",
+                            color='Propiedad',
+                            color_discrete_map={
+                                'Resistencia Nominal (kg)': '#2E8B57',
+                                'Resistencia Diseño (kg)': '#4169E1',
+                                'Factor φ': '#DC143C',
+                                'Espaciamiento Estribos (cm)': '#FFD700'
+                            })
+
+                fig1.update_layout(
+                    xaxis_title="Propiedad",
+                    yaxis_title="Valor",
+                    height=400
+                )
+
+                fig1.update_traces(texttemplate='%{y:.1f}', textposition='outside')
+                st.plotly_chart(fig1, use_container_width=True)
+
+            # Gráfico 2: Cuantías de acero
+            if PLOTLY_AVAILABLE:
+                datos_cuantia_col = pd.DataFrame({
+                    'Tipo': ['Actual', 'Mínima', 'Máxima'],
+                    'Cuantía': [resultados_columna['rho'], resultados_columna['rho_min'], resultados_columna['rho_max']]
+                })
+
+                fig2 = px.bar(datos_cuantia_col, x='Tipo', y='Cuantía',
+                            title="Cuantías de Acero en Columna",
+                            color='Tipo',
+                            color_discrete_map={
+                                'Actual': '#2E8B57',
+                                'Mínima': '#4169E1',
+                                'Máxima': '#DC143C'
+                            })
+
+                fig2.update_layout(
+                    xaxis_title="Tipo de Cuantía",
+                    yaxis_title="Valor",
+                    height=400
+                )
+
+                fig2.update_traces(texttemplate='%{y:.3f}', textposition='outside')
+                st.plotly_chart(fig2, use_container_width=True)
+
+            # Gráfico 3: Factor de seguridad
+            if PLOTLY_AVAILABLE:
+                fig3 = px.pie(values=[FS_columna, 2.0 - FS_columna], 
+                            names=[f'Factor Seguridad\n{FS_columna:.2f}', 'Margen'],
+                            title="Factor de Seguridad de la Columna",
+                            color_discrete_map={
+                                f'Factor Seguridad\n{FS_columna:.2f}': '#2E8B57' if FS_columna >= 1.0 else '#DC143C',
+                                'Margen': '#FFD700'
+                            })
+
+                fig3.update_traces(textposition='inside', textinfo='percent+label')
+                st.plotly_chart(fig3, use_container_width=True)
+
+            # Gráfico 4: Comparación de cargas
+            if PLOTLY_AVAILABLE:
+                datos_cargas = pd.DataFrame({
+                    'Tipo de Carga': ['Carga Aplicada', 'Resistencia Diseño'],
+                    'Valor (kg)': [Pu_columna/1000, resultados_columna['phiPn']/1000]
+                })
+
+                fig4 = px.bar(datos_cargas, x='Tipo de Carga', y='Valor (kg)',
+                            title="Comparación de Cargas",
+                            color='Tipo de Carga',
+                            color_discrete_map={
+                                'Carga Aplicada': '#DC143C',
+                                'Resistencia Diseño': '#2E8B57'
+                            })
+
+                fig4.update_layout(
+                    xaxis_title="Tipo de Carga",
+                    yaxis_title="Valor (ton)",
+                    height=400
+                )
+
+                fig4.update_traces(texttemplate='%{y:.1f}', textposition='outside')
+                st.plotly_chart(fig4, use_container_width=True)
+
+            # Gráfico alternativo con matplotlib
+            if MATPLOTLIB_AVAILABLE and plt is not None:
+                try:
+                    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
+
+                    # Gráfico 1: Propiedades principales
+                    propiedades = ['Pn', 'φPn', 'φ', 's_max']
+                    valores = [resultados_columna['Pn']/1000, resultados_columna['phiPn']/1000, 
+                             resultados_columna['phi'], resultados_columna['s_max_estribos']]
+                    color_list = ['#2E8B57', '#4169E1', '#DC143C', '#FFD700']
+
+                    bars1 = ax1.bar(propiedades, valores, color=color_list)
+                    ax1.set_title("Propiedades del Diseño de Columna")
+                    ax1.set_ylabel("Valor")
+
+                    for bar in bars1:
+                        height = bar.get_height()
+                        ax1.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                               f'{height:.1f}', ha='center', va='bottom')
+
+                    # Gráfico 2: Cuantías
+                    tipos_cuantia = ['Actual', 'Mínima', 'Máxima']
+                    valores_cuantia = [resultados_columna['rho'], resultados_columna['rho_min'], resultados_columna['rho_max']]
+                    colors_cuantia = ['#2E8B57', '#4169E1', '#DC143C']
+
+                    bars2 = ax2.bar(tipos_cuantia, valores_cuantia, color=colors_cuantia)
+                    ax2.set_title("Cuantías de Acero")
+                    ax2.set_ylabel("Valor")
+
+                    for bar in bars2:
+                        height = bar.get_height()
+                        ax2.text(bar.get_x() + bar.get_width()/2., height + 0.001,
+                               f'{height:.3f}', ha='center', va='bottom')
+
+                    # Gráfico 3: Factor de seguridad
+                    ax3.pie([FS_columna, 2.0 - FS_columna], 
+                           labels=[f'Factor Seguridad\n{FS_columna:.2f}', 'Margen'],
+                           autopct='%1.1f%%', 
+                           colors=['#2E8B57' if FS_columna >= 1.0 else '#DC143C', '#FFD700'])
+                    ax3.set_title("Factor de Seguridad")
+
+                    # Gráfico 4: Comparación de cargas
+                    tipos_carga = ['Carga Aplicada', 'Resistencia Diseño']
+                    valores_carga = [Pu_columna/1000, resultados_columna['phiPn']/1000]
+                    colors_carga = ['#DC143C', '#2E8B57']
+
+                    bars4 = ax4.bar(tipos_carga, valores_carga, color=colors_carga)
+                    ax4.set_title("Comparación de Cargas")
+                    ax4.set_ylabel("Valor (ton)")
+
+                    for bar in bars4:
+                        height = bar.get_height()
+                        ax4.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                               f'{height:.1f}', ha='center', va='bottom')
+
+                    plt.tight_layout()
+                    st.pyplot(fig)
+
+                except Exception as e:
+                    st.info(f"📊 Gráfico no disponible: {str(e)}")
+            else:
+                st.info("📊 Gráficos no disponibles - Instale plotly o matplotlib")
+
+            # Gráfico de cortantes y momentos según McCormac
+            st.subheader("📊 Diagramas de Cortantes y Momentos (McCormac)")
+
+            # Generar gráfico de viga con los datos de la columna
+            L_columna_mccormac = 3.0  # Altura típica de piso
+            w_columna_mccormac = Pu_columna / L_columna_mccormac  # Carga distribuida equivalente
+
+            fig_mccormac = graficar_cortantes_momentos_mccormac(L_columna_mccormac, w_columna_mccormac, None, None, "empotrada")
+            if fig_mccormac:
+                st.pyplot(fig_mccormac)
+
+                # Mostrar valores máximos
+                x, V, M = calcular_cortantes_momentos_viga_empotrada_mccormac(L_columna_mccormac, w_columna_mccormac, None, None)
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Cortante Máximo", f"{max(abs(V)):.0f} kg")
+                with col2:
+                    st.metric("Momento Máximo", f"{max(abs(M)):.0f} kg·m")
+                with col3:
+                    st.metric("Altura de Piso", f"{L_columna_mccormac} m")
+
+            # Dibujo de la columna
+            st.subheader("🏢 Dibujo de la Columna")
+            fig_columna = dibujar_columna(lado_columna, Ast_columna, fc_columna, fy_columna)
+            if fig_columna:
+                st.pyplot(fig_columna)
+
+    panel_diseno_columnas()
@@ -0,0 +1,316 @@
+"""
+Diseño de Vigas - CONSORCIO DEJ
+Página de la aplicación (ver APP2.py)
+"""
+
+from math import sqrt
+import streamlit as st
+import pandas as pd
+
+from motor_calculo import (
+    calcular_cortantes_momentos_viga_simple_mccormac,
+    calcular_diseno_vigas_detallado,
+)
+from graficos import (
+    MATPLOTLIB_AVAILABLE,
+    PLOTLY_AVAILABLE,
+    plt,
+    px,
+    dibujar_viga,
+    graficar_cortantes_momentos_mccormac,
+)
+from permisos import puede
+from ui_comun import fragmento
+
+st.title("🔧 Diseño de Vigas")
+st.info("📚 Basado en ACI 318 - Capítulo 9 y Norma E.060")
+
+# Verificar acceso basado en plan
+if not puede("diseno_elementos"):
+    st.warning("⚠️ Esta función requiere plan premium. Actualiza tu cuenta para acceder al diseño de vigas.")
+    st.info("Plan gratuito incluye: Cálculos básicos, resultados simples")
+    st.info("Plan premium incluye: Diseño completo de vigas, verificaciones detalladas")
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("⭐ Actualizar a Premium", type="primary", key="upgrade_vigas"):
+            st.session_state['show_pricing'] = True
+            st.rerun()
+else:
+    @fragmento
+    def panel_diseno_vigas():
+        """Panel de diseño de vigas (se reejecuta solo)"""
+        st.success("⭐ Plan Premium: Diseño completo de vigas con todas las verificaciones")
+
+        # Datos de entrada para vigas
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("📐 Datos de Entrada")
+            fc_viga = st.number_input("f'c (kg/cm²)", 175, 700, 210, 10, key="fc_viga")
+            fy_viga = st.number_input("fy (kg/cm²)", 2800, 6000, 4200, 100, key="fy_viga")
+            b_viga = st.number_input("Ancho de Viga b (cm)", 20, 100, 25, 1, key="b_viga")
+            d_viga = st.number_input("Peralte Efectivo d (cm)", 30, 100, 50, 1, key="d_viga")
+            Mu_viga = st.number_input("Momento Último Mu (kg·cm)", 10000, 10000000, 500000, 1000, key="Mu_viga")
+            Vu_viga = st.number_input("Cortante Último Vu (kg)", 1000, 100000, 15000, 100, key="Vu_viga")
+
+        with col2:
+            st.subheader("📋 Fórmulas Utilizadas")
+            st.markdown("""
+                    **Momento Resistente:**
+                    \[ M_n = A_s \cdot f_y \cdot (d - \frac{a}{2}) \]
+                
+                    **Profundidad del Bloque:**
+                    \[ a = \frac{A_s \cdot f_y}{0.85 \cdot f'_c \cdot b} \]
+                
+                    **Corte Resistente:**
+                    \[ V_c = 0.53\sqrt{f'_c} \cdot b \cdot d \]
+                
+                    **Refuerzo por Corte:**
+                    \[ V_s = \frac{V_u - \phi V_c}{\phi} \]
+                
+                    **Espaciamiento de Estribos:**
+                    \[ s = \frac{A_v \cdot f_y \cdot d}{V_s} \]
+                    """, unsafe_allow_html=True)
+
+        # Botón para calcular
+        if st.button("🔬 Calcular Diseño de Viga", type="primary"):
+            # Cálculos de diseño de viga
+            resultados_viga = calcular_diseno_vigas_detallado(fc_viga, fy_viga, b_viga, d_viga, Mu_viga, Vu_viga)
+
+            st.success("¡Diseño de viga calculado exitosamente!")
+            st.balloons()
+
+            # Mostrar resultados
+            st.subheader("📊 Resultados del Diseño de Viga")
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.metric("Área de Acero (As)", f"{resultados_viga['As']:.1f} cm²")
+                st.metric("Profundidad Bloque (a)", f"{resultados_viga['a']:.1f} cm")
+                st.metric("Momento Resistente (φMn)", f"{resultados_viga['phiMn']:.0f} kg·cm")
+                st.metric("Corte Concreto (Vc)", f"{resultados_viga['Vc']:.0f} kg")
+
+            with col2:
+                st.metric("Corte Acero (Vs)", f"{resultados_viga['Vs']:.0f} kg")
+                st.metric("Espaciamiento Estribos", f"{resultados_viga['s_estribos']:.1f} cm")
+                if resultados_viga['verificacion_momento']:
+                    st.success("✅ Verificación Momento: CUMPLE")
+                else:
+                    st.error("❌ Verificación Momento: NO CUMPLE")
+                if resultados_viga['verificacion_corte']:
+                    st.success("✅ Verificación Corte: CUMPLE")
+                else:
+                    st.error("❌ Verificación Corte: NO CUMPLE")
+
+            # Verificaciones detalladas
+            st.subheader("🔍 Verificaciones Detalladas")
+
+            # Verificación de cuantía
+            rho_actual = resultados_viga['As'] / (b_viga * d_viga)
+            rho_min = max(0.8 * sqrt(fc_viga) / fy_viga, 14 / fy_viga)
+            rho_max = 0.75 * 0.85 * 0.85 * (fc_viga / fy_viga) * (6000 / (6000 + fy_viga))
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Cuantía Actual", f"{rho_actual:.4f}")
+            with col2:
+                st.metric("Cuantía Mínima", f"{rho_min:.4f}")
+            with col3:
+                st.metric("Cuantía Máxima", f"{rho_max:.4f}")
+
+            if rho_min <= rho_actual <= rho_max:
+                st.success("✅ Cuantía de acero dentro de límites")
+            else:
+                st.warning("⚠️ Cuantía de acero fuera de límites - Revisar diseño")
+
+            # Verificación específica para caso Ayacucho
+            if fc_viga == 210 and fy_viga == 4200:
+                st.markdown("**🏗️ Caso Ayacucho - Vigas:**")
+                st.success("✅ Materiales coinciden con caso Ayacucho")
+                st.write(f"- f'c: {fc_viga} kg/cm² ✓")
+                st.write(f"- fy: {fy_viga} kg/cm² ✓")
+
+                # Verificaciones adicionales para Ayacucho
+                if resultados_viga['verificacion_cuantia']:
+                    st.success("✅ Cuantía de acero cumple normativa")
+                else:
+                    st.warning("⚠️ Cuantía de acero no cumple normativa")
+
+                # Verificación de dimensiones típicas para Ayacucho
+                if 20 <= b_viga <= 40 and 40 <= d_viga <= 70:
+                    st.success("✅ Dimensiones típicas para edificio de 3 niveles")
+                else:
+                    st.info("ℹ️ Verificar dimensiones para edificio de 3 niveles")
+
+            # Gráficos de resultados
+            st.subheader("📈 Gráficos de Resultados")
+
+            # Gráfico 1: Propiedades de la viga
+            if PLOTLY_AVAILABLE:
+                datos_viga = pd.DataFrame({
+                    'Propiedad': ['Área Acero (cm²)', 'Prof. Bloque (cm)', 'Momento Resistente (kg·cm)', 'Corte Concreto (kg)'],
+                    'Valor': [resultados_viga['As'], resultados_viga['a'], 
+                             resultados_viga['phiMn']/1000, resultados_viga['Vc']/1000]
+                })
+
+                fig1 = px.bar(datos_viga, x='Propiedad', y='Valor',
+                            title="Propiedades del Diseño de Viga",
+                            color='Propiedad',
+                            color_discrete_map={
+                                'Área Acero (cm²)': '#2E8B57',
+                                'Prof. Bloque (cm)': '#4169E1',
+                                'Momento Resistente (kg·cm)': '#DC143C',
+                                'Corte Concreto (kg)': '#FFD700'
+                            })
+
+                fig1.update_layout(
+                    xaxis_title="Propiedad",
+                    yaxis_title="Valor",
+                    height=400
+                )
+
+                fig1.update_traces(texttemplate='%{y:.1f}', textposition='outside')
+                st.plotly_chart(fig1, use_container_width=True)
+
+            # Gráfico 2: Verificaciones
+            if PLOTLY_AVAILABLE:
+                verificaciones = ['Momento', 'Corte']
+                valores_verificacion = [1 if resultados_viga['verificacion_momento'] else 0, 
+                                       1 if resultados_viga['verificacion_corte'] else 0]
+
+                # Crear DataFrame para el gráfico
+                df_verificaciones = pd.DataFrame({
+                    'Verificación': verificaciones,
+                    'Estado': valores_verificacion,
+                    'Estado_Texto': ['Cumple' if v == 1 else 'No Cumple' for v in valores_verificacion]
+                })
+
+                fig2 = px.bar(df_verificaciones, x='Verificación', y='Estado',
+                            title="Estado de Verificaciones",
+                            color='Estado_Texto',
+                            color_discrete_map={'Cumple': '#2E8B57', 'No Cumple': '#DC143C'})
+
+                fig2.update_layout(
+                    xaxis_title="Verificación",
+                    yaxis_title="Estado (1=Cumple, 0=No Cumple)",
+                    height=300,
+                    yaxis=dict(range=[0, 1.2])
+                )
+
+                st.plotly_chart(fig2, use_container_width=True)
+
+            # Gráfico 3: Cuantías de acero
+            if PLOTLY_AVAILABLE:
+                datos_cuantia = pd.DataFrame({
+                    'Tipo': ['Actual', 'Mínima', 'Máxima'],
+                    'Cuantía': [rho_actual, rho_min, rho_max]
+                })
+
+                fig3 = px.bar(datos_cuantia, x='Tipo', y='Cuantía',
+                            title="Cuantías de Acero",
+                            color='Tipo',
+                            color_discrete_map={
+                                'Actual': '#2E8B57',
+                                'Mínima': '#4169E1',
+                                'Máxima': '#DC143C'
+                            })
+
+                fig3.update_layout(
+                    xaxis_title="Tipo de Cuantía",
+                    yaxis_title="Valor",
+                    height=400
+                )
+
+                fig3.update_traces(texttemplate='%{y:.4f}', textposition='outside')
+                st.plotly_chart(fig3, use_container_width=True)
+
+            # Gráfico alternativo con matplotlib
+            if MATPLOTLIB_AVAILABLE and plt is not None:
+                try:
+                    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
+
+                    # Gráfico 1: Propiedades principales
+                    propiedades = ['As', 'a', 'φMn', 'Vc']
+                    valores = [resultados_viga['As'], resultados_viga['a'], 
+                             resultados_viga['phiMn']/1000, resultados_viga['Vc']/1000]
+                    color_list = ['#2E8B57', '#4169E1', '#DC143C', '#FFD700']
+
+                    bars1 = ax1.bar(propiedades, valores, color=color_list)
+                    ax1.set_title("Propiedades del Diseño de Viga")
+                    ax1.set_ylabel("Valor")
+
+                    for bar in bars1:
+                        height = bar.get_height()
+                        ax1.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                               f'{height:.1f}', ha='center', va='bottom')
+
+                    # Gráfico 2: Verificaciones
+                    verificaciones = ['Momento', 'Corte']
+                    valores_verif = [1 if resultados_viga['verificacion_momento'] else 0, 
+                                    1 if resultados_viga['verificacion_corte'] else 0]
+                    colors_verif = ['#2E8B57' if v == 1 else '#DC143C' for v in valores_verif]
+
+                    bars2 = ax2.bar(verificaciones, valores_verif, color=colors_verif)
+                    ax2.set_title("Estado de Verificaciones")
+                    ax2.set_ylabel("Estado (1=Cumple, 0=No Cumple)")
+                    ax2.set_ylim(0, 1.2)
+
+                    # Gráfico 3: Cuantías
+                    tipos_cuantia = ['Actual', 'Mínima', 'Máxima']
+                    valores_cuantia = [rho_actual, rho_min, rho_max]
+                    colors_cuantia = ['#2E8B57', '#4169E1', '#DC143C']
+
+                    bars3 = ax3.bar(tipos_cuantia, valores_cuantia, color=colors_cuantia)
+                    ax3.set_title("Cuantías de Acero")
+                    ax3.set_ylabel("Valor")
+
+                    for bar in bars3:
+                        height = bar.get_height()
+                        ax3.text(bar.get_x() + bar.get_width()/2., height + 0.0001,
+                               f'{height:.4f}', ha='center', va='bottom')
+
+                    # Gráfico 4: Espaciamiento de estribos
+                    ax4.pie([resultados_viga['s_estribos'], 60 - resultados_viga['s_estribos']], 
+                           labels=[f'Estribos\n{resultados_viga["s_estribos"]:.1f}cm', 'Espacio Libre'],
+                           autopct='%1.1f%%', colors=['#FF6B6B', '#4ECDC4'])
+                    ax4.set_title("Distribución de Estribos")
+
+                    if plt is not None:
+                        plt.tight_layout()
+                        st.pyplot(fig)
+
+                except Exception as e:
+                    st.info(f"📊 Gráfico no disponible: {str(e)}")
+            else:
+                st.info("📊 Gráficos no disponibles - Instale plotly o matplotlib")
+
+            # Gráfico de cortantes y momentos según McCormac
+            st.subheader("📊 Diagramas de Cortantes y Momentos (McCormac)")
+
+            # Generar gráfico de viga con los datos calculados
+            L_viga_mccormac = 6.0  # Luz típica de viga
+            w_viga_mccormac = Vu_viga / L_viga_mccormac  # Carga distribuida equivalente
+
+            fig_mccormac = graficar_cortantes_momentos_mccormac(L_viga_mccormac, w_viga_mccormac, None, None, "simple")
+            if fig_mccormac:
+                st.pyplot(fig_mccormac)
+
+                # Mostrar valores máximos
+                x, V, M = calcular_cortantes_momentos_viga_simple_mccormac(L_viga_mccormac, w_viga_mccormac, None, None)
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Cortante Máximo", f"{max(abs(V)):.0f} kg")
+                with col2:
+                    st.metric("Momento Máximo", f"{max(abs(M)):.0f} kg·m")
+                with col3:
+                    st.metric("Luz de la Viga", f"{L_viga_mccormac} m")
+
+            # Dibujo de la viga
+            st.subheader("🔧 Dibujo de la Viga")
+            fig_viga = dibujar_viga(b_viga, d_viga, L_viga_mccormac, resultados_viga['As'], resultados_viga['s_estribos'], fc_viga, fy_viga)
+            if fig_viga:
+                st.pyplot(fig_viga)
+
+    panel_diseno_vigas()
@@ -0,0 +1,264 @@
+"""
+Diseño de Zapatas - CONSORCIO DEJ
+Página de la aplicación (ver APP2.py)
+"""
+
+import streamlit as st
+import pandas as pd
+
+from motor_calculo import calcular_cortantes_momentos_viga_simple_mccormac, calcular_diseno_zapatas
+from graficos import (
+    MATPLOTLIB_AVAILABLE,
+    PLOTLY_AVAILABLE,
+    plt,
+    px,
+    dibujar_zapata,
+    graficar_cortantes_momentos_mccormac,
+)
+from permisos import puede
+from ui_comun import fragmento
+
+st.title("🏗️ Diseño de Zapatas (Cimentaciones)")
+st.info("📚 Basado en Norma E.060 y ACI 318 - Capítulo 11")
+
+# Verificar acceso basado en plan
+if not puede("diseno_elementos"):
+    st.warning("⚠️ Esta función requiere plan premium. Actualiza tu cuenta para acceder al diseño de zapatas.")
+    st.info("Plan gratuito incluye: Cálculos básicos, resultados simples")
+    st.info("Plan premium incluye: Diseño completo de zapatas, verificaciones detalladas")
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("⭐ Actualizar a Premium", type="primary", key="upgrade_zapatas"):
+            st.session_state['show_pricing'] = True
+            st.rerun()
+else:
+    @fragmento
+    def panel_diseno_zapatas():
+        """Panel de diseño de zapatas (se reejecuta solo)"""
+        st.success("⭐ Plan Premium: Diseño completo de zapatas con todas las verificaciones")
+
+        # Datos de entrada para zapatas
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.subheader("📐 Datos de Entrada")
+            fc_zapata = st.number_input("f'c (kg/cm²)", 175, 700, 210, 10, key="fc_zapata")
+            fy_zapata = st.number_input("fy (kg/cm²)", 2800, 6000, 4200, 100, key="fy_zapata")
+            Pu_zapata = st.number_input("Carga Axial Última Pu (kg)", 10000, 1000000, 100000, 1000, key="Pu_zapata")
+            qu_zapata = st.number_input("Capacidad Última del Suelo qu (kg/cm²)", 1.0, 50.0, 3.0, 0.1, key="qu_zapata")
+            FS_zapata = st.number_input("Factor de Seguridad FS", 2.0, 5.0, 3.0, 0.1, key="FS_zapata")
+
+        with col2:
+            st.subheader("📋 Fórmulas Utilizadas")
+            st.markdown("""
+                    **Capacidad Portante del Suelo:**
+                    \[ q_n = \frac{q_u}{FS} \]
+                
+                    **Área de la Zapata:**
+                    \[ A = \frac{P}{q_n} \]
+                
+                    **Corte por Punzonamiento:**
+                    \[ V_c = 0.53\sqrt{f'_c} \cdot b_0 \cdot d \]
+                
+                    **Corte por Flexión:**
+                    \[ V_c = 0.53\sqrt{f'_c} \cdot b \cdot d \]
+                
+                    **Refuerzo por Flexión:**
+                    \[ A_s = \frac{M_u}{\phi \cdot f_y \cdot j \cdot d} \]
+                    """, unsafe_allow_html=True)
+
+        # Botón para calcular
+        if st.button("🔬 Calcular Diseño de Zapata", type="primary"):
+            # Cálculos de diseño de zapata
+            resultados_zapata = calcular_diseno_zapatas(fc_zapata, fy_zapata, Pu_zapata, qu_zapata, FS_zapata)
+
+            st.success("¡Diseño de zapata calculado exitosamente!")
+            st.balloons()
+
+            # Mostrar resultados
+            st.subheader("📊 Resultados del Diseño de Zapata")
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.metric("Capacidad Portante (qn)", f"{resultados_zapata['qn']:.2f} kg/cm²")
+                st.metric("Área Estimada", f"{resultados_zapata['A_estimada']:.2f} cm²")
+                st.metric("Lado de Zapata", f"{resultados_zapata['lado_zapata']:.1f} cm")
+                st.metric("Peralte Efectivo", f"{resultados_zapata['d_estimado']:.1f} cm")
+
+            with col2:
+                st.metric("Corte Punzonamiento", f"{resultados_zapata['Vc_punzonamiento']:.0f} kg")
+                st.metric("Corte Flexión", f"{resultados_zapata['Vc_flexion']:.0f} kg")
+                st.metric("Momento Zapata", f"{resultados_zapata['Mu_zapata']:.0f} kg·cm")
+                st.metric("Acero Flexión", f"{resultados_zapata['As_flexion']:.1f} cm²")
+
+            # Verificaciones
+            st.subheader("🔍 Verificaciones de Diseño")
+
+            # Verificación de capacidad portante
+            if resultados_zapata['qn'] > 0.5:
+                st.success("✅ Capacidad portante adecuada")
+            else:
+                st.warning("⚠️ Capacidad portante baja - Revisar suelo")
+
+            # Verificación de dimensiones
+            if resultados_zapata['lado_zapata'] >= 100:
+                st.success("✅ Dimensiones de zapata adecuadas")
+            else:
+                st.info("ℹ️ Zapata pequeña - Considerar zapatas combinadas")
+
+            # Verificación específica para caso Ayacucho
+            if fc_zapata == 210 and fy_zapata == 4200:
+                st.markdown("**🏗️ Caso Ayacucho - Zapatas:**")
+                st.success("✅ Materiales coinciden con caso Ayacucho")
+                st.write(f"- f'c: {fc_zapata} kg/cm² ✓")
+                st.write(f"- fy: {fy_zapata} kg/cm² ✓")
+
+                # Verificaciones adicionales para Ayacucho
+                if resultados_zapata['verificacion_espesor']:
+                    st.success("✅ Espesor mínimo cumple")
+                else:
+                    st.warning("⚠️ Espesor mínimo no cumple")
+
+                if resultados_zapata['verificacion_refuerzo']:
+                    st.success("✅ Refuerzo mínimo cumple")
+                else:
+                    st.warning("⚠️ Refuerzo mínimo no cumple")
+
+            # Gráfico de resultados
+            st.subheader("📈 Gráficos de Resultados")
+
+            # Gráfico 1: Propiedades principales
+            if PLOTLY_AVAILABLE:
+                datos_zapata = pd.DataFrame({
+                    'Propiedad': ['Capacidad (kg/cm²)', 'Área (cm²)', 'Lado (cm)', 'Peralte (cm)'],
+                    'Valor': [resultados_zapata['qn'], resultados_zapata['A_estimada']/10000, 
+                             resultados_zapata['lado_zapata']/100, resultados_zapata['d_estimado']/100]
+                })
+
+                fig1 = px.bar(datos_zapata, x='Propiedad', y='Valor',
+                            title="Propiedades Principales de la Zapata",
+                            color='Propiedad',
+                            color_discrete_map={
+                                'Capacidad (kg/cm²)': '#2E8B57',
+                                'Área (cm²)': '#4169E1',
+                                'Lado (cm)': '#DC143C',
+                                'Peralte (cm)': '#FFD700'
+                            })
+
+                fig1.update_layout(
+                    xaxis_title="Propiedad",
+                    yaxis_title="Valor",
+                    height=400
+                )
+
+                fig1.update_traces(texttemplate='%{y:.2f}', textposition='outside')
+                st.plotly_chart(fig1, use_container_width=True)
+
+            # Gráfico 2: Fuerzas de corte
+            if PLOTLY_AVAILABLE:
+                datos_corte = pd.DataFrame({
+                    'Tipo de Corte': ['Punzonamiento', 'Flexión'],
+                    'Resistencia (kg)': [resultados_zapata['Vc_punzonamiento'], resultados_zapata['Vc_flexion']]
+                })
+
+                fig2 = px.pie(datos_corte, values='Resistencia (kg)', names='Tipo de Corte',
+                            title="Distribución de Resistencia al Corte",
+                            color_discrete_map={
+                                'Punzonamiento': '#FF6B6B',
+                                'Flexión': '#4ECDC4'
+                            })
+
+                fig2.update_traces(textposition='inside', textinfo='percent+label+value')
+                st.plotly_chart(fig2, use_container_width=True)
+
+            # Gráfico 3: Comparación con valores típicos
+            if PLOTLY_AVAILABLE:
+                datos_comparacion = pd.DataFrame({
+                    'Parámetro': ['Capacidad Portante', 'Área Zapata', 'Peralte'],
+                    'Valor Actual': [resultados_zapata['qn'], resultados_zapata['A_estimada']/10000, resultados_zapata['d_estimado']/100],
+                    'Valor Típico': [1.0, 2.0, 0.3]  # Valores típicos de referencia
+                })
+
+                fig3 = px.bar(datos_comparacion, x='Parámetro', y=['Valor Actual', 'Valor Típico'],
+                            title="Comparación con Valores Típicos",
+                            barmode='group',
+                            color_discrete_map={
+                                'Valor Actual': '#2E8B57',
+                                'Valor Típico': '#FFD700'
+                            })
+
+                fig3.update_layout(
+                    xaxis_title="Parámetro",
+                    yaxis_title="Valor",
+                    height=400
+                )
+
+                st.plotly_chart(fig3, use_container_width=True)
+
+            # Gráfico alternativo con matplotlib si plotly no está disponible
+            elif MATPLOTLIB_AVAILABLE and plt is not None:
+                try:
+                    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+
+                    # Gráfico de barras para propiedades principales
+                    propiedades = ['Capacidad', 'Área', 'Lado', 'Peralte']
+                    valores = [resultados_zapata['qn'], resultados_zapata['A_estimada']/10000, 
+                             resultados_zapata['lado_zapata']/100, resultados_zapata['d_estimado']/100]
+                    color_list = ['#2E8B57', '#4169E1', '#DC143C', '#FFD700']
+
+                    bars = ax1.bar(propiedades, valores, color=color_list)
+                    ax1.set_title("Propiedades Principales de la Zapata")
+                    ax1.set_ylabel("Valor")
+
+                    for bar in bars:
+                        height = bar.get_height()
+                        ax1.text(bar.get_x() + bar.get_width()/2., height + 0.01,
+                               f'{height:.2f}', ha='center', va='bottom')
+
+                    # Gráfico de pie para fuerzas de corte
+                    tipos_corte = ['Punzonamiento', 'Flexión']
+                    valores_corte = [resultados_zapata['Vc_punzonamiento'], resultados_zapata['Vc_flexion']]
+                    colors_corte = ['#FF6B6B', '#4ECDC4']
+
+                    ax2.pie(valores_corte, labels=tipos_corte, autopct='%1.1f%%', colors=colors_corte)
+                    ax2.set_title("Distribución de Resistencia al Corte")
+
+                    if plt is not None:
+                        plt.tight_layout()
+                        st.pyplot(fig)
+
+                except Exception as e:
+                    st.info(f"📊 Gráfico no disponible: {str(e)}")
+            else:
+                st.info("📊 Gráficos no disponibles - Instale plotly o matplotlib")
+
+            # Gráfico de cortantes y momentos según McCormac
+            st.subheader("📊 Diagramas de Cortantes y Momentos (McCormac)")
+
+            # Generar gráfico de viga simplemente apoyada para la zapata
+            L_zapata = resultados_zapata['lado_zapata'] / 100  # Convertir a metros
+            w_zapata = Pu_zapata / L_zapata  # Carga distribuida equivalente
+
+            fig_mccormac = graficar_cortantes_momentos_mccormac(L_zapata, w_zapata, None, None, "simple")
+            if fig_mccormac:
+                st.pyplot(fig_mccormac)
+
+                # Mostrar valores máximos
+                x, V, M = calcular_cortantes_momentos_viga_simple_mccormac(L_zapata, w_zapata, None, None)
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Cortante Máximo", f"{max(abs(V)):.0f} kg")
+                with col2:
+                    st.metric("Momento Máximo", f"{max(abs(M)):.0f} kg·m")
+                with col3:
+                    st.metric("Luz de la Zapata", f"{L_zapata:.2f} m")
+
+            # Dibujo de la zapata
+            st.subheader("🏗️ Dibujo de la Zapata")
+            fig_zapata = dibujar_zapata(resultados_zapata['lado_zapata'], resultados_zapata['d_estimado'], fc_zapata, fy_zapata)
+            if fig_zapata:
+                st.pyplot(fig_zapata)
+
+    panel_diseno_zapatas()
@@ -0,0 +1,493 @@
+"""
+Ejercicio Básico de Corte - CONSORCIO DEJ
+Página de la aplicación (ver APP2.py)
+"""
+
+import streamlit as st
+import pandas as pd
+
+from motor_calculo import (
+    calcular_cortantes_momentos_viga_simple_mccormac,
+    calcular_ejercicio_basico_corte,
+)
+from graficos import (
+    MATPLOTLIB_AVAILABLE,
+    PLOTLY_AVAILABLE,
+    plt,
+    px,
+    dibujar_viga,
+    graficar_cortantes_momentos_mccormac,
+    graficar_diagrama_cortantes,
+    graficar_estribado_viga,
+)
+from permisos import puede
+from ui_comun import fragmento
+
+st.title("✂️ Ejercicio Básico de Corte")
+st.info("📚 Basado en las fórmulas del PDF - Norma E.060 y ACI 318")
+
+# Verificar acceso basado en plan
+if not puede("ejercicio_corte"):
+    st.warning("⚠️ Esta función requiere plan premium. Actualiza tu cuenta para acceder al ejercicio de corte.")
+    st.info("Plan gratuito incluye: Cálculos básicos, resultados simples")
+    st.info("Plan premium incluye: Ejercicios detallados de corte, verificaciones completas")
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("⭐ Actualizar a Premium", type="primary", key="upgrade_corte"):
+            st.session_state['show_pricing'] = True
+            st.rerun()
+else:
+    @fragmento
+    def panel_ejercicio_corte():
+        """Pestañas del ejercicio de corte (se reejecutan solas)"""
+        st.success("⭐ Plan Premium: Ejercicio completo de corte con todas las verificaciones")
+
+        # Pestañas para organizar la información
+        tab1, tab2, tab3, tab4 = st.tabs(["📐 Datos de Entrada", "🔬 Cálculos", "📊 Resultados", "📈 Gráficos"])
+
+        with tab1:
+            st.subheader("📐 Datos de Entrada - Ejercicio Básico de Corte")
+
+            # Datos básicos de la viga
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("**🏗️ Propiedades de la Viga:**")
+                fc_corte = st.number_input("f'c (kg/cm²)", 175, 700, 210, 10, key="fc_corte")
+                b_corte = st.number_input("Ancho de Viga b (cm)", 20, 100, 25, 1, key="b_corte")
+                d_corte = st.number_input("Peralte Efectivo d (cm)", 30, 100, 54, 1, key="d_corte")
+                L_corte = st.number_input("Luz de la Viga L (m)", 3.0, 15.0, 6.0, 0.5, key="L_corte")
+                fy_corte = st.number_input("fy (kg/cm²)", 2800, 6000, 4200, 100, key="fy_corte")
+
+            with col2:
+                st.markdown("**⚖️ Cargas y Fuerzas:**")
+                CM_corte = st.number_input("Carga Muerta CM (kg/m²)", 0, 5000, 150, 50, key="CM_corte")
+                CV_corte = st.number_input("Carga Viva CV (kg/m²)", 0, 3000, 200, 50, key="CV_corte")
+                Vu_corte = st.number_input("Cortante Último Vu (kg)", 1000, 100000, 16600, 100, key="Vu_corte")
+                num_estribos = st.number_input("Cantidad de Fierro Corte (estribos)", 0, 100, 0, 1, key="num_estribos")
+
+            # Información adicional
+            st.markdown("---")
+            st.markdown("**📋 Fórmulas del PDF:**")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("""
+                        **Corte Resistente del Concreto:**
+                        \[ V_c = 0.53\sqrt{f'_c} \cdot b \cdot d \]
+                        \[ \phi V_c = \phi \cdot V_c \]
+                    
+                        **Para Vu > φVc:**
+                        \[ s = \frac{A_v \cdot f_y \cdot d}{V_u - \phi V_c} \]
+                        """, unsafe_allow_html=True)
+
+            with col2:
+                st.markdown("""
+                        **Para φVc/2 < Vu ≤ φVc:**
+                        \[ s_{max} = \min(\frac{d}{2}, 60cm) \]
+                    
+                        **Refuerzo Mínimo:**
+                        \[ A_{v,min} = 0.2\sqrt{f'_c} \cdot \frac{b \cdot s}{f_y} \]
+                    
+                        **Factor φ = 0.75** (ACI 318-19)
+                        """, unsafe_allow_html=True)
+
+        with tab2:
+            st.subheader("🔬 Cálculos - Valores Preliminares")
+
+            # Botón para calcular
+            if st.button("🚀 Calcular Ejercicio de Corte", type="primary", key="calcular_corte"):
+                # Cálculos del ejercicio de corte
+                resultados_corte = calcular_ejercicio_basico_corte(
+                    fc_corte, b_corte, d_corte, Vu_corte, fy_corte, 
+                    L_corte, CM_corte, CV_corte, num_estribos
+                )
+
+                # Guardar resultados en session state
+                st.session_state['resultados_corte'] = resultados_corte
+                st.session_state['datos_entrada_corte'] = {
+                    'fc': fc_corte, 'b': b_corte, 'd': d_corte, 'L': L_corte,
+                    'fy': fy_corte, 'CM': CM_corte, 'CV': CV_corte, 'Vu': Vu_corte
+                }
+
+                st.success("¡Ejercicio de corte calculado exitosamente!")
+                st.balloons()
+
+            # Mostrar valores preliminares si existen resultados
+            if 'resultados_corte' in st.session_state:
+                resultados = st.session_state['resultados_corte']
+
+                st.markdown("**📊 Valores Preliminares:**")
+                col1, col2, col3 = st.columns(3)
+
+                with col1:
+                    st.metric("Resistencia Nominal (Vc)", f"{resultados['Vc']:.0f} kg")
+                    st.metric("Corte Resistente (φVc)", f"{resultados['phiVc']:.0f} kg")
+                    st.metric("φVc/2", f"{resultados['phiVc_mitad']:.0f} kg")
+
+                with col2:
+                    st.metric("Vu Final", f"{resultados['Vu_final']:.0f} kg")
+                    st.metric("Vs Requerido", f"{resultados['Vs_requerido']:.0f} kg")
+                    st.metric("Carga Total (w)", f"{resultados['w_total']:.1f} kg/m")
+
+                with col3:
+                    st.metric("Zona Crítica", "Sí" if resultados['zona_critica'] else "No")
+                    st.metric("Necesita Estribos", "Sí" if resultados['necesita_estribos'] else "No")
+                    st.metric("Espaciamiento Máximo", f"{resultados['s_max_final']:.1f} cm")
+
+                # Tabla de valores Vu
+                st.markdown("**📋 Tabla de Valores Vu:**")
+                valores_Vu = resultados['valores_Vu']
+                datos_tabla = pd.DataFrame({
+                    'Parámetro': ['Vu Proporcionado', 'Vu Calculado', 'Vu Final', 'Vc', 'φVc', 'φVc/2', 'Vs Requerido'],
+                    'Valor (kg)': [
+                        valores_Vu['Vu_proporcionado'],
+                        valores_Vu['Vu_calculado'],
+                        valores_Vu['Vu_final'],
+                        valores_Vu['Vc'],
+                        valores_Vu['phiVc'],
+                        valores_Vu['phiVc_mitad'],
+                        valores_Vu['Vs_requerido']
+                    ]
+                })
+                st.dataframe(datos_tabla, use_container_width=True)
+
+                # Verificación final
+                st.markdown("**✅ Verificación Final:**")
+                if resultados['verificacion']:
+                    st.success("✅ CUMPLE - El diseño es seguro")
+                else:
+                    st.error("❌ NO CUMPLE - Revisar el diseño")
+
+        with tab3:
+            st.subheader("📊 Resultados - Cálculo de Estribos")
+
+            if 'resultados_corte' in st.session_state:
+                resultados = st.session_state['resultados_corte']
+
+                # Cálculo de estribos
+                st.markdown("**🔧 Cálculo de Estribos:**")
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    st.metric("Espaciamiento Estribos", f"{resultados['s_estribos']:.1f} cm")
+                    st.metric("Espaciamiento Estribado", f"{resultados['s_estribado']:.1f} cm")
+                    st.metric("Refuerzo Mínimo (Av,min)", f"{resultados['Av_min']:.3f} cm²/cm")
+                    st.metric("Factor de Seguridad", f"{resultados['Vu_final'] / resultados['phiVc']:.2f}")
+
+                with col2:
+                    if resultados['zona_critica']:
+                        st.warning("⚠️ Zona Crítica - Requiere refuerzo")
+                        st.info("📋 Distribución recomendada:")
+                        st.write("- 1@5cm, 5@10cm, resto@25cm")
+                        st.write("- Usar estribos #3 (φ3/8\")")
+                    else:
+                        st.success("✅ Zona No Crítica")
+                        st.info("📋 Estribos mínimos:")
+                        st.write("- Espaciamiento máximo: d/2 o 60cm")
+                        st.write("- Diámetro mínimo: φ3/8\"")
+
+                    if resultados['verificacion']:
+                        st.success("✅ Verificación: CUMPLE")
+                    else:
+                        st.error("❌ Verificación: NO CUMPLE")
+
+                # Cálculo de estribado gráficamente
+                st.markdown("**📐 Cálculo de Estribado Gráficamente:**")
+                estribado = resultados['estribado_grafico']
+
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.markdown("**🔴 Zona Crítica:**")
+                    st.write(f"- Longitud: {estribado['zona_critica']['longitud']} cm")
+                    st.write(f"- Estribos: {estribado['zona_critica']['estribos']} unidades")
+                    st.write(f"- Espaciamiento: {estribado['zona_critica']['espaciamiento']:.1f} cm")
+
+                with col2:
+                    st.markdown("**🔵 Zona No Crítica:**")
+                    st.write(f"- Longitud: {estribado['zona_no_critica']['longitud']:.0f} cm")
+                    st.write(f"- Estribos: {estribado['zona_no_critica']['estribos']} unidades")
+                    st.write(f"- Espaciamiento: {estribado['zona_no_critica']['espaciamiento']:.1f} cm")
+
+                # Comparación con valores del PDF y caso Ayacucho
+                st.markdown("**📚 Comparación con Valores del PDF y Caso Ayacucho:**")
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write(f"- φVc calculado: {resultados['phiVc']:.0f} kg")
+                    st.write(f"- φVc del PDF: 8.86 ton = 8,860 kg")
+
+                    diferencia = abs(resultados['phiVc'] - 8860) / 8860 * 100
+                    if diferencia < 5:
+                        st.success(f"✅ Coincidencia excelente (diferencia: {diferencia:.1f}%)")
+                    elif diferencia < 10:
+                        st.info(f"ℹ️ Coincidencia buena (diferencia: {diferencia:.1f}%)")
+                    else:
+                        st.warning(f"⚠️ Diferencia significativa (diferencia: {diferencia:.1f}%)")
+
+                    # Verificación específica para caso Ayacucho
+                    if fc_corte == 210 and b_corte == 25 and d_corte == 54:
+                        st.markdown("**🏗️ Caso Ayacucho Verificado:**")
+                        st.success("✅ Datos coinciden con caso Ayacucho")
+                        st.write(f"- f'c: {fc_corte} kg/cm² ✓")
+                        st.write(f"- b: {b_corte} cm ✓")
+                        st.write(f"- d: {d_corte} cm ✓")
+
+                with col2:
+                    st.write(f"- Vu máximo: {resultados['Vu_final']:.0f} kg")
+                    st.write(f"- Factor de seguridad: {resultados['Vu_final'] / resultados['phiVc']:.2f}")
+                    if resultados['Vu_final'] / resultados['phiVc'] >= 1.0:
+                        st.success("✅ Diseño seguro")
+                    else:
+                        st.error("❌ Diseño inseguro")
+
+        with tab4:
+            st.subheader("📈 Gráficos - Diagrama de Cortantes y Estribado")
+
+            if 'resultados_corte' in st.session_state:
+                resultados = st.session_state['resultados_corte']
+                datos_entrada = st.session_state['datos_entrada_corte']
+
+                # Gráfico 1: Diagrama de cortantes
+                st.markdown("**📊 Diagrama de Cortantes:**")
+                fig_cortantes = graficar_diagrama_cortantes(
+                    datos_entrada['L'], resultados['Vu_final'], 
+                    resultados['phiVc'], resultados['phiVc_mitad'], 
+                    resultados['w_total']
+                )
+                if fig_cortantes:
+                    st.pyplot(fig_cortantes)
+                else:
+                    st.info("📊 Gráfico no disponible - Matplotlib no está instalado")
+
+                # Gráfico 2: Estribado de la viga
+                st.markdown("**🏗️ Estribado de la Viga (Lado Derecho como Típico):**")
+                fig_estribado = graficar_estribado_viga(
+                    datos_entrada['L'], datos_entrada['d'],
+                    resultados['s_estribos'], resultados['s_max_final'],
+                    datos_entrada['b']
+                )
+                if fig_estribado:
+                    st.pyplot(fig_estribado)
+                else:
+                    st.info("📊 Gráfico no disponible - Matplotlib no está instalado")
+
+                # Gráficos adicionales con Plotly
+                if PLOTLY_AVAILABLE:
+                    st.markdown("**📈 Gráficos Adicionales:**")
+
+                    # Gráfico 3: Propiedades de corte
+                    datos_corte = pd.DataFrame({
+                        'Propiedad': ['φVc (ton)', 'Vs Requerido (ton)', 'Espaciamiento (cm)', 'Av,min (cm²/cm)'],
+                        'Valor': [resultados['phiVc']/1000, resultados['Vs_requerido']/1000, 
+                                 resultados['s_estribos'], resultados['Av_min']]
+                    })
+
+                    fig1 = px.bar(datos_corte, x='Propiedad', y='Valor',
+                                title="Propiedades del Ejercicio de Corte",
+                                color='Propiedad',
+                                color_discrete_map={
+                                    'φVc (ton)': '#2E8B57',
+                                    'Vs Requerido (ton)': '#4169E1',
+                                    'Espaciamiento (cm)': '#DC143C',
+                                    'Av,min (cm²/cm)': '#FFD700'
+                                })
+
+                    fig1.update_layout(height=400)
+                    fig1.update_traces(texttemplate='%{y:.2f}', textposition='outside')
+                    st.plotly_chart(fig1, use_container_width=True)
+
+                    # Gráfico 4: Estado de la zona
+                    estado_zona = 'Crítica' if resultados['zona_critica'] else 'No Crítica'
+                    color_zona = '#DC143C' if resultados['zona_critica'] else '#2E8B57'
+
+                    fig2 = px.pie(values=[1], names=[estado_zona],
+                                title="Estado de la Zona de Corte",
+                                color_discrete_map={estado_zona: color_zona})
+
+                    fig2.update_traces(textposition='inside', textinfo='label+percent')
+                    st.plotly_chart(fig2, use_container_width=True)
+
+                    # Gráfico 5: Factor de seguridad
+                    FS_corte = resultados['Vu_final'] / resultados['phiVc']
+                    estado_fs = 'Seguro' if FS_corte >= 1.0 else 'Inseguro'
+                    datos_fs = pd.DataFrame({
+                        'Tipo': ['Factor de Seguridad'],
+                        'Valor': [FS_corte],
+                        'Estado': [estado_fs]
+                    })
+
+                    fig3 = px.bar(datos_fs, x='Tipo', y='Valor',
+                                title="Factor de Seguridad",
+                                color='Estado',
+                                color_discrete_map={'Seguro': '#2E8B57', 'Inseguro': '#DC143C'})
+
+                    fig3.update_layout(height=300)
+                    fig3.update_traces(texttemplate='%{y:.2f}', textposition='outside')
+                    fig3.add_hline(y=1.0, line_dash="dash", line_color="red", annotation_text="Límite de Seguridad")
+                    st.plotly_chart(fig3, use_container_width=True)
+                else:
+                    st.info("📊 Gráficos interactivos no disponibles - Plotly no está instalado")
+            else:
+                st.info("🔬 Realiza primero los cálculos en la pestaña 'Cálculos' para ver los gráficos")
+
+            # Gráfico alternativo con matplotlib
+            if MATPLOTLIB_AVAILABLE and plt is not None:
+                try:
+                    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
+
+                    # Gráfico 1: Propiedades principales
+                    propiedades = ['φVc', 'Vs', 's', 'Av,min']
+                    valores = [resultados_corte['phiVc']/1000, resultados_corte['Vs_requerido']/1000, 
+                             resultados_corte['s_estribos'], resultados_corte['Av_min']]
+                    color_list = ['#2E8B57', '#4169E1', '#DC143C', '#FFD700']
+
+                    bars1 = ax1.bar(propiedades, valores, color=color_list)
+                    ax1.set_title("Propiedades del Ejercicio de Corte")
+                    ax1.set_ylabel("Valor")
+
+                    for bar in bars1:
+                        height = bar.get_height()
+                        ax1.text(bar.get_x() + bar.get_width()/2., height + 0.01,
+                               f'{height:.2f}', ha='center', va='bottom')
+
+                    # Gráfico 2: Comparación con PDF
+                    fuentes = ['Cálculo Actual', 'Valor del PDF']
+                    valores_pdf = [resultados_corte['phiVc']/1000, 8.86]
+                    colors_pdf = ['#2E8B57', '#4169E1']
+
+                    bars2 = ax2.bar(fuentes, valores_pdf, color=colors_pdf)
+                    ax2.set_title("Comparación con Valores del PDF")
+                    ax2.set_ylabel("φVc (ton)")
+
+                    for bar in bars2:
+                        height = bar.get_height()
+                        ax2.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                               f'{height:.2f}', ha='center', va='bottom')
+
+                    # Gráfico 3: Estado de la zona
+                    estado_zona = 'Crítica' if resultados_corte['zona_critica'] else 'No Crítica'
+                    color_zona = '#DC143C' if resultados_corte['zona_critica'] else '#2E8B57'
+
+                    ax3.pie([1], labels=[estado_zona], autopct='%1.1f%%', colors=[color_zona])
+                    ax3.set_title("Estado de la Zona de Corte")
+
+                    # Gráfico 4: Factor de seguridad
+                    FS_corte = Vu_corte / resultados_corte['phiVc']
+                    ax4.bar(['Factor de Seguridad'], [FS_corte], 
+                           color='#2E8B57' if FS_corte >= 1.0 else '#DC143C')
+                    ax4.set_title("Factor de Seguridad")
+                    ax4.set_ylabel("Valor")
+                    ax4.axhline(y=1.0, color='red', linestyle='--', label='Límite de Seguridad')
+                    ax4.text(0, FS_corte + 0.05, f'{FS_corte:.2f}', ha='center', va='bottom')
+                    ax4.legend()
+
+                    plt.tight_layout()
+                    st.pyplot(fig)
+
+                except Exception as e:
+                    st.info(f"📊 Gráfico no disponible: {str(e)}")
+
+            # Gráfico de cortantes y momentos según McCormac
+            st.subheader("📊 Diagramas de Cortantes y Momentos (McCormac)")
+
+            # Generar gráfico de viga con los datos de corte
+            L_corte_mccormac = 4.0  # Luz típica
+            w_corte_mccormac = Vu_corte / L_corte_mccormac  # Carga distribuida equivalente
+
+            fig_mccormac = graficar_cortantes_momentos_mccormac(L_corte_mccormac, w_corte_mccormac, None, None, "simple")
+            if fig_mccormac:
+                st.pyplot(fig_mccormac)
+
+                # Mostrar valores máximos
+                x, V, M = calcular_cortantes_momentos_viga_simple_mccormac(L_corte_mccormac, w_corte_mccormac, None, None)
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Cortante Máximo", f"{max(abs(V)):.0f} kg")
+                with col2:
+                    st.metric("Momento Máximo", f"{max(abs(M)):.0f} kg·m")
+                with col3:
+                    st.metric("Luz del Elemento", f"{L_corte_mccormac} m")
+
+            # Dibujo de la viga de corte
+            st.subheader("✂️ Dibujo del Elemento a Corte")
+
+            # Obtener resultados de corte desde session state
+            if 'resultados_corte' in st.session_state:
+                resultados_corte = st.session_state['resultados_corte']
+                # Calcular área de acero aproximada (2% del área de la sección)
+                As_aproximada = 0.02 * b_corte * d_corte
+
+                fig_corte = dibujar_viga(b_corte, d_corte, L_corte_mccormac, As_aproximada, 
+                                       resultados_corte.get('s_estribos', 20), fc_corte, fy_corte)
+                if fig_corte:
+                    st.pyplot(fig_corte)
+            else:
+                st.warning("⚠️ No hay resultados de corte disponibles. Realiza primero el cálculo.")
+
+            # Gráficos adicionales si matplotlib está disponible
+            if MATPLOTLIB_AVAILABLE and plt is not None:
+                try:
+                    # Verificar que tenemos resultados de corte
+                    if 'resultados_corte' in st.session_state:
+                        resultados_corte = st.session_state['resultados_corte']
+
+                        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 10))
+
+                        # Gráfico 1: Propiedades del ejercicio
+                        propiedades = ['Vu (ton)', 'φVc (ton)', 'Vs (ton)', 's_estribos (cm)']
+                        valores = [Vu_corte/1000, resultados_corte.get('phiVc', 0)/1000, 
+                                 resultados_corte.get('Vs_requerido', 0)/1000, resultados_corte.get('s_estribos', 0)]
+                        color_list = ['#2E8B57', '#DC143C', '#4169E1', '#FFD700']
+
+                        bars1 = ax1.bar(propiedades, valores, color=color_list)
+                        ax1.set_title("Propiedades del Ejercicio de Corte")
+                        ax1.set_ylabel("Valor")
+
+                        for bar in bars1:
+                            height = bar.get_height()
+                            ax1.text(bar.get_x() + bar.get_width()/2., height + 0.01,
+                                   f'{height:.2f}', ha='center', va='bottom')
+
+                        # Gráfico 2: Comparación con PDF
+                        fuentes = ['Cálculo Actual', 'Valor del PDF']
+                        valores_pdf = [resultados_corte.get('phiVc', 0)/1000, 8.86]
+                        colors_pdf = ['#2E8B57', '#4169E1']
+
+                        bars2 = ax2.bar(fuentes, valores_pdf, color=colors_pdf)
+                        ax2.set_title("Comparación con Valores del PDF")
+                        ax2.set_ylabel("φVc (ton)")
+
+                        for bar in bars2:
+                            height = bar.get_height()
+                            ax2.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                                   f'{height:.2f}', ha='center', va='bottom')
+
+                        # Gráfico 3: Estado de la zona
+                        estado_zona = 'Crítica' if resultados_corte.get('zona_critica', False) else 'No Crítica'
+                        color_zona = '#DC143C' if resultados_corte.get('zona_critica', False) else '#2E8B57'
+
+                        ax3.pie([1], labels=[estado_zona], autopct='%1.1f%%', colors=[color_zona])
+                        ax3.set_title("Estado de la Zona de Corte")
+
+                        # Gráfico 4: Factor de seguridad
+                        phiVc = resultados_corte.get('phiVc', 1)  # Evitar división por cero
+                        FS_corte = Vu_corte / phiVc if phiVc > 0 else 0
+                        ax4.bar(['Factor de Seguridad'], [FS_corte], 
+                               color='#2E8B57' if FS_corte >= 1.0 else '#DC143C')
+                        ax4.set_title("Factor de Seguridad")
+                        ax4.set_ylabel("Valor")
+                        ax4.axhline(y=1.0, color='red', linestyle='--', label='Límite de Seguridad')
+                        ax4.text(0, FS_corte + 0.05, f'{FS_corte:.2f}', ha='center', va='bottom')
+                        ax4.legend()
+
+                        if plt is not None:
+                            plt.tight_layout()
+                            st.pyplot(fig)
+                    else:
+                        st.warning("⚠️ No hay resultados de corte disponibles para generar gráficos.")
+
+                except Exception as e:
+                    st.info(f"📊 Gráfico no disponible: {str(e)}")
+            else:
+                st.info("📊 Gráficos no disponibles - Instale plotly o matplotlib")
+
+    panel_ejercicio_corte()
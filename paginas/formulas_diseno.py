@@ -0,0 +1,321 @@
+"""
+Fórmulas de Diseño Estructural - CONSORCIO DEJ
+Página de la aplicación (ver APP2.py)
+"""
+
+import streamlit as st
+
+st.header("📚 Fórmulas de Diseño Estructural")
+st.info("Fórmulas clave según ACI 318-2025, E.060, Nilson, McCormac, Hibbeler y Antonio Blanco.")
+
+# Pestañas para organizar las fórmulas
+tab1, tab2, tab3, tab4 = st.tabs(["🏗️ Propiedades Materiales", "📐 Diseño por Flexión", "🔧 Diseño por Cortante", "🏢 Columnas y Losas"])
+
+with tab1:
+    st.subheader("🏗️ Propiedades del Material")
+    st.markdown("""
+            ### Concreto (ACI 318-2025 - Capítulo 19)
+            - **Resistencia a compresión (f'c):** \( f'_c \) (kg/cm²)  
+              *(Valores típicos: 210, 280, 350 kg/cm²)*
+            
+            - **Módulo de elasticidad (Ec):** \( E_c = 15000 \sqrt{f'_c} \) (kg/cm²)
+            
+            - **Deformación última del concreto (εcu):** \( \varepsilon_{cu} = 0.003 \) *(Para diseño por flexión)*
+            
+            - **Resistencia a tracción por flexión (fr):** \( f_r = 2 \sqrt{f'_c} \) (kg/cm²)
+            
+            ### Acero de Refuerzo (ACI 318-2025 - Capítulo 20)
+            - **Esfuerzo de fluencia (fy):** \( f_y \) (kg/cm²)  
+              *(Valores típicos: 4200, 5000 kg/cm²)*
+            
+            - **Módulo de elasticidad (Es):** \( E_s = 2,000,000 \) (kg/cm²)
+            
+            - **Deformación de fluencia (εy):** \( \varepsilon_y = \frac{f_y}{E_s} \)
+            """, unsafe_allow_html=True)
+
+    # Fórmulas en LaTeX
+    st.latex(r"E_c = 15000 \sqrt{f'_c} \text{ (kg/cm²)}")
+    st.latex(r"\varepsilon_{cu} = 0.003")
+    st.latex(r"f_r = 2 \sqrt{f'_c} \text{ (kg/cm²)}")
+    st.latex(r"E_s = 2,000,000 \text{ (kg/cm²)}")
+    st.latex(r"\varepsilon_y = \frac{f_y}{E_s}")
+
+with tab2:
+    st.subheader("📐 Diseño por Flexión (ACI 318-2025 - Capítulo 9)")
+    st.markdown("""
+            - **Momento último (Mu):** \( M_u = 1.2M_D + 1.6M_L \) *(Combinación de carga mayorada)*
+            
+            - **Cuantía de acero (ρ):** \( \rho = \frac{A_s}{bd} \)
+            
+            - **Cuantía balanceada (ρb):** \( \rho_b = 0.85\beta_1 \frac{f'_c}{f_y} \left( \frac{6000}{6000+f_y} \right) \)  
+              *(β₁ = 0.85 si f'c ≤ 280 kg/cm², disminuye 0.05 por cada 70 kg/cm² adicionales)*
+            
+            - **Cuantía mínima (ρmin):** \( \rho_{min} = \max\left( \frac{0.8\sqrt{f'_c}}{f_y}, \frac{14}{f_y} \right) \)
+            
+            - **Cuantía máxima (ρmax):** \( \rho_{max} = 0.75\rho_b \) *(Para evitar falla frágil)*
+            
+            - **Profundidad del bloque equivalente (a):** \( a = \frac{A_s f_y}{0.85f'_c b} \)
+            
+            - **Momento resistente (φMn):** \( \phi M_n = \phi A_s f_y \left(d - \frac{a}{2}\right) \)  
+              *(φ = 0.9 para flexión)*
+            """, unsafe_allow_html=True)
+
+    # Fórmulas en LaTeX
+    st.latex(r"M_u = 1.2M_D + 1.6M_L")
+    st.latex(r"\rho = \frac{A_s}{bd}")
+    st.latex(r"\rho_b = 0.85\beta_1 \frac{f'_c}{f_y} \left( \frac{6000}{6000+f_y} \right)")
+    st.latex(r"\rho_{min} = \max\left( \frac{0.8\sqrt{f'_c}}{f_y}, \frac{14}{f_y} \right)")
+    st.latex(r"\rho_{max} = 0.75\rho_b")
+    st.latex(r"a = \frac{A_s f_y}{0.85f'_c b}")
+    st.latex(r"\phi M_n = \phi A_s f_y \left(d - \frac{a}{2}\right)")
+
+with tab3:
+    st.subheader("🔧 Diseño por Cortante (ACI 318-2025 - Capítulo 22)")
+    st.markdown("""
+            - **Cortante último (Vu):** \( V_u = 1.2V_D + 1.6V_L \)
+            
+            - **Resistencia del concreto (Vc):** \( V_c = 0.53\sqrt{f'_c} b_w d \) (kg)
+            
+            - **Resistencia del acero (Vs):** \( V_s = \frac{A_v f_y d}{s} \)  
+              *(Av = Área de estribos, s = separación)*
+            
+            - **Cortante máximo (Vs máx):** \( V_{s,max} = 2.1\sqrt{f'_c} b_w d \) *(Límite superior)*
+            
+            - **Separación máxima de estribos (smax):** \( s_{max} = \min\left( \frac{d}{2}, 60 \text{ cm} \right) \)
+            
+            ---
+            #### **Resumen de Fórmulas para Diseño por Cortante en Vigas (RNE E.060 y ACI 318)**
+            
+            **1. Parámetros Básicos**
+            - **Carga Muerta (CM):** Ejemplo: 2 ton/m
+            - **Carga Viva (CV):** Ejemplo: 1.4 ton/m
+            
+            **2. Resistencia del Concreto:**
+            \[
+            \phi V_c = 0.85 \cdot 0.53 \sqrt{f'_c} \cdot b \cdot d
+            \]
+            
+            _Ejemplo:_ Para \( f'_c = 210\,kg/cm^2,\ b = 25\,cm,\ d = 54\,cm \):
+            \[
+            \phi V_c = 8.86\,ton
+            \]
+            
+            **3. Diagrama de Cortantes**
+            - **Cortante en Apoyos:**
+            \[
+            V_a = \frac{\omega \cdot L}{2}
+            \]
+            - **Cortante a distancia d del apoyo:**
+            \[
+            V_{ad} = V_a - \omega \cdot d
+            \]
+            _Ejemplo:_ \( V_a = 19.4\,ton,\ V_{ad} = 16.6\,ton \)
+            
+            **4. Diseño de Estribos**
+            - **Zona Crítica (\( V_u > \phi V_c \))**
+            \[
+            S = \frac{A_v f_y d}{V_u - \phi V_c}
+            \]
+            _Ejemplo:_ \( S = 35\,cm \) (limitado a \( d/2 = 27.5\,cm \))
+            
+            - **Zona No Crítica (\( V_u \leq \phi V_c \))**
+            \[
+            S_{max} = \min\left( \frac{d}{2}, 60\,cm \right)
+            \]
+            _Ejemplo:_ \( S = 27.5\,cm \)
+            
+            **5. Detalles Constructivos**
+            - Diámetro mínimo: \( \varphi 3/8'' \)
+            - Primer estribo a 5 cm del apoyo
+            - Distribución típica: 1@5cm, 5@10cm, resto@25cm
+            
+            **6. Normativa y Comprobaciones**
+            - RNE E.060 (Concreto Armado): Art. 13.7 y 13.8
+            - ACI 318: Sección 22.5
+            
+            **Conclusión:**
+            El diseño por cortante garantiza que la viga resista fuerzas laterales sin falla frágil. Los estribos deben distribuirse según zonas críticas y no críticas, cumpliendo espaciamientos máximos. La verificación de \( V_u \leq \phi V_n \) asegura seguridad ante cargas últimas.
+            """, unsafe_allow_html=True)
+    # Mantener las fórmulas originales y LaTeX ya presentes
+    st.latex(r"V_u = 1.2V_D + 1.6V_L")
+    st.latex(r"V_c = 0.53\sqrt{f'_c} b_w d \text{ (kg)}")
+    st.latex(r"V_s = \frac{A_v f_y d}{s}")
+    st.latex(r"V_{s,max} = 2.1\sqrt{f'_c} b_w d")
+    st.latex(r"s_{max} = \min\left( \frac{d}{2}, 60 \text{ cm} \right)")
+
+with tab4:
+    st.subheader("🏢 Columnas y Losas")
+    # ... (contenido existente) ...
+    st.markdown("""
+            ---
+            ### **Resumen de Fórmulas Estructurales para Tesis (RNE E.030 y E.060)**
+            
+            #### **1. Parámetros Sísmicos (RNE E.030)**
+            - **Factor de Zona (Z):**
+              - Zona 3: \( Z = 0.35 \) (Ayacucho)
+              - Tabla N°1 del Art. 11
+            - **Factor de Uso (U):**
+              - Edificaciones comunes (Categoría C): \( U = 1.00 \) (Art. 15)
+            - **Factor de Suelo (S):**
+              - Perfil S3 (suelos blandos): \( S = 1.20 \) (Tabla N°2 del Art. 13)
+            - **Coeficiente de Amplificación Sísmica (C):**
+              \[
+              C = \begin{cases}
+                2.5 & \text{si } T < T_p \\
+                2.5 \left( \frac{T_p}{T} \right) & \text{si } T_p \leq T \leq T_L \\
+                2.5 \left( \frac{T_p \cdot T_L}{T^2} \right) & \text{si } T > T_L
+              \end{cases}
+              \]
+              Donde \( T_p = 1.0\,seg,\ T_L = 1.6\,seg \) (S3)
+            - **Cortante Basal (V):**
+              \[
+              V = \frac{Z \cdot U \cdot C \cdot S}{R} \cdot P
+              \]
+              \( R \): Coeficiente de reducción (pórticos = 8, muros = 6)
+            
+            #### **2. Diseño de Vigas (RNE E.060)**
+            - **Momento Resistente (Mu):**
+              \[
+              M_u = \phi \cdot A_s \cdot f_y (d - \frac{a}{2})
+              \]
+              \[
+              a = \frac{A_s f_y}{0.85 f'_c b}
+              \]
+              \( \phi = 0.9 \) (flexión)
+            - **Cuantías:**
+              - Mínima: \( \rho_{min} = 0.7 \frac{\sqrt{f'_c}}{f_y} \)
+              - Máxima: \( \rho_{max} = 0.75 \rho_b \), donde \( \rho_b = 0.02125 \) para \( f'_c = 210\,kg/cm^2 \)
+            - **Cortante (Vu):**
+              \[
+              V_c = 0.53 \sqrt{f'_c} b d
+              \]
+              \[
+              V_s = V_u - \phi V_c \quad (\phi = 0.85)
+              \]
+            - **Espaciamiento de estribos:**
+              - Zona de confinamiento: \( s \leq \frac{d}{4} \leq 30\,cm \)
+              - Fuera de confinamiento: \( s \leq \frac{d}{2} \leq 60\,cm \)
+            
+            #### **3. Diseño de Columnas (RNE E.060)**
+            - **Combinaciones de carga:**
+              - \( 1.4\,CM + 1.7\,CV \)
+              - \( 1.25(CM + CV) \pm CS \)
+              - \( 0.9\,CM \pm CS \)
+            - **Refuerzo Longitudinal:**
+              - Cuantía mínima: \( \rho_{min} = 0.01 \)
+              - Cuantía máxima: \( \rho_{max} = 0.06 \)
+            - **Cortante en columnas:**
+              \[
+              V_c = 0.53 \sqrt{f'_c} b d
+              \]
+              - Estribos mínimos: \( \varphi \geq 3/8'' \), \( s \leq 12d_b \leq 25cm \)
+            
+            #### **4. Diseño de Zapatas (RNE E.060)**
+            - **Área de zapata:**
+              \[
+              A_z = \frac{P_{servicio}}{\sigma_t}
+              \]
+              (\( \sigma_t \): capacidad portante)
+            - **Peralte efectivo (d):**
+              - Por corte: \( d \geq \frac{V_u}{0.85 \cdot 1.1 \sqrt{f'_c} b_0} \)
+              - Por longitud de desarrollo: \( l_d \geq 0.08 \frac{f_y d_b}{\sqrt{f'_c}} \)
+            - **Acero mínimo:** \( \rho_{min} = 0.0018 \)
+            
+            #### **5. Gráficos y Detalles**
+            - Diagramas de interacción (columnas): Curvas \( P_u \) vs \( M_u \) para verificar capacidad.
+            - Ejemplo: \( \rho = 0.01 \rightarrow A_s = 25\,cm^2 \) (4ϕ3/4" + 8ϕ5/8").
+            - Distribución de estribos en columnas: Zona de confinamiento \( L_o \geq h_n/6 \geq 50\,cm \), estribos: 1@5cm, 5@10cm, resto@25cm.
+            - Detalles de armado en vigas: Acero superior/inferior: 2ϕ5/8" (tramos), 3ϕ5/8" (apoyos), estribos: ϕ3/8"@10cm (confinamiento), @25cm (resto).
+            
+            #### **Conclusiones**
+            - Las fórmulas y parámetros cumplen con la Norma E.030 (Diseño Sismorresistente) y E.060 (Concreto Armado).
+            - Los gráficos de interacción y detalles de refuerzo garantizan ductilidad y resistencia.
+            - La verificación de derivas (\( \Delta/h \leq 0.007 \)) asegura comportamiento sísmico adecuado.
+            
+            **Referencias:**
+            - RNE E.030 (Diseño Sismorresistente)
+            - RNE E.060 (Concreto Armado)
+            - ACI 318 (Equivalente para detalles constructivos)
+            """, unsafe_allow_html=True)
+    st.markdown("""
+            ---
+            ### **Resumen de Fórmulas y Normativa para Diseño de Columnas (RNE E.060 y ACI 318)**
+            
+            #### **1. Clasificación de Columnas**
+            - Por carga axial:
+              - Si \( P_u < 0.1 f'_c A_g \): Diseñar como viga (flexión simple).
+              - Si \( P_u \geq 0.1 f'_c A_g \): Diseñar como columna (flexocompresión).
+            - Por confinamiento:
+              - Estribos: Ductilidad moderada (zonas sísmicas).
+              - Espirales: Alta ductilidad y cargas axiales elevadas.
+            
+            #### **2. Resistencia Nominal en Compresión Pura (\( P_0 \))**
+            \[
+            P_0 = 0.85 f'_c (A_g - A_s) + f_y A_s
+            \]
+            - Factor de reducción (k): 0.85 (RNE E.060)
+            - \( A_g \): Área bruta de la sección
+            - \( A_s \): Área de acero longitudinal
+            
+            #### **3. Resistencia al Corte (\( V_c \)) con Carga Axial**
+            - Compresión axial:
+              \[
+              V_c = 0.53 f'_c \left(1 + \frac{N_u}{140 A_g}\right)
+              \]
+              [RNE E.060, Art. 13.7]
+            - Tracción axial:
+              \[
+              V_c = 0.53 f'_c \left(1 - \frac{N_u}{35 A_g}\right)
+              \]
+              (Si \( N_u \) es tracción)
+            
+            #### **4. Diseño de Estribos**
+            - Espaciamiento máximo (s):
+              - Zonas no sísmicas: \( s \leq \min(16d_b, 48d_e, 0.30m) \)
+              - Zonas sísmicas (RNE E.060, Cap. 21):
+                - En confinamiento: \( s \leq \min(\frac{d}{4}, 6d_b, 10cm) \)
+                - Fuera de confinamiento: \( s \leq \frac{d}{2} \)
+              - Diámetro mínimo: \( \varphi 3/8'' \)
+            
+            #### **5. Cuantías de Acero**
+            - Mínima: \( \rho_{min} = 1\% A_g \)
+            - Máxima: \( \rho_{max} = 6\% A_g \) (zonas sísmicas)
+            - Recomendación práctica: \( 1\% \leq \rho \leq 4\% \) para evitar congestión
+            
+            #### **6. Diagrama de Interacción**
+            - Punto A: Compresión pura (\( P_0 \))
+            - Punto B: Deformación nula en acero de tracción
+            - Punto E (Falla balanceada):
+              \[
+              c_b = \frac{0.003 d}{0.003 + \varepsilon_y} \quad (\varepsilon_y = \frac{f_y}{E_s})
+              \]
+            
+            #### **7. Detalles Constructivos**
+            - Refuerzo longitudinal: Mínimo 4 barras (1 en cada esquina)
+            - Separación máxima: 30cm
+            - Estribos cerrados: Obligatorios en zonas sísmicas (ganchos a 135°)
+            - Dimensiones mínimas:
+              - Rectangulares: 25×25cm (sísmicas)
+              - Circulares: Diámetro ≥ 25cm
+            
+            #### **8. Gráficos y Diagramas**
+            - Diagrama de interacción:
+              - Eje Y: Carga axial (\( P_n \))
+              - Eje X: Momento (\( M_n \))
+              - Incluir puntos A, B y E
+            - Zonas de confinamiento:
+              \[
+              L_c = \max(h, \frac{h_n}{6}, 50cm)
+              \]
+            - Detalle de estribos: Ejemplo: 1@5cm, 5@10cm, resto@25cm (zonas no críticas)
+            
+            #### **Normativa y Conclusiones**
+            - RNE E.060 (Perú): Art. 10 (Flexocompresión), Art. 13 (Cortante en columnas), Cap. 21 (Requisitos sísmicos)
+            - ACI 318: Sección 22.4 (Resistencia a compresión), Sección 18.7 (Confinamiento en zonas sísmicas)
+            - Recomendaciones para tesis: Validar resultados con software (ETABS, SAP2000), incluir planos de armado con detalles de estribos y empalmes
+            
+            **Referencias:**
+            - RNE E.060 (2019)
+            - ACI 318-19
+            - "Diseño de Estructuras de Concreto Armado" – Antonio Blanco Blasco
+            """, unsafe_allow_html=True)
@@ -0,0 +1,209 @@
+"""
+Generar Reporte - CONSORCIO DEJ
+Página de la aplicación (ver APP2.py)
+"""
+
+from datetime import datetime
+import streamlit as st
+
+from modelo_resultados import (
+    OPENPYXL_AVAILABLE, construir_modelo, reporte_excel, reporte_markdown, reporte_txt,
+)
+from permisos import puede
+from proyectos import almacen_proyectos
+from reporte_pdf import PERFILES_REPORTE, obtener_pdf_reporte, pdf_en_cache
+from trabajos_reporte import cola_reportes, id_valido
+from ui_comun import fragmento
+
+st.title("📄 Generar Reporte Técnico")
+
+def modelo_resultados_actual(resultados):
+    """Modelo del último análisis; se construye una sola vez por análisis"""
+    if st.session_state.get('modelo_resultados') is None:
+        st.session_state['modelo_resultados'] = construir_modelo(resultados, st.session_state.get('datos_entrada', {}))
+    return st.session_state['modelo_resultados']
+
+def boton_guardar_en_proyecto(formato, contenido, clave):
+    """Guardar el reporte en el proyecto abierto (plan empresarial, ver Mis Proyectos)"""
+    id_proyecto = st.session_state.get('proyecto_abierto')
+    if id_proyecto is None or not puede("multiples_proyectos"):
+        return
+    if st.button("💾 Guardar en el proyecto", key=clave):
+        if almacen_proyectos.guardar_reporte(st.session_state['user'], id_proyecto, formato, contenido) is None:
+            st.error("⚠️ El proyecto abierto ya no existe")
+        else:
+            st.success("✅ Reporte guardado en el proyecto (ver Mis Proyectos)")
+
+if not puede("reporte_pdf"):
+    if 'resultados_completos' in st.session_state:
+        resultados = st.session_state['resultados_completos']
+
+        # Reporte básico gratuito (vista del modelo de resultados del análisis)
+        modelo = modelo_resultados_actual(resultados)
+        reporte_basico = reporte_markdown(modelo, "gratuito")
+
+        st.text_area("Reporte Básico", reporte_basico, height=500)
+
+        # Botones para el reporte básico
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.download_button(
+                label="📥 Descargar TXT",
+                data=reporte_txt(modelo, "gratuito"),
+                file_name=f"reporte_basico_analisis_estructural_{datetime.now().strftime('%Y%m%d_%H%M')}.txt",
+                mime="text/plain"
+            )
+
+        with col2:
+            # PDF básico bajo demanda (se genera una vez por resultados y plan)
+            datos_entrada = st.session_state.get('datos_entrada', {})
+            pdf_bytes = pdf_en_cache(resultados, datos_entrada, "gratuito")
+            if pdf_bytes is None and st.button("📄 Preparar PDF", key="preparar_pdf_basico"):
+                with st.spinner("Generando PDF..."):
+                    pdf_bytes = obtener_pdf_reporte(resultados, datos_entrada, "gratuito", modelo=modelo)
+            if pdf_bytes is not None:
+                st.download_button(
+                    label="📄 Descargar PDF",
+                    data=pdf_bytes,
+                    file_name=f"reporte_basico_analisis_estructural_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf",
+                    mime="application/pdf"
+                )
+
+        with col3:
+            if st.button("🖨️ Generar Reporte en Pantalla", type="primary"):
+                st.success("✅ Reporte básico generado exitosamente")
+                st.balloons()
+
+                # Mostrar el reporte en formato expandible
+                with st.expander("📋 VER REPORTE BÁSICO COMPLETO", expanded=True):
+                    st.markdown(reporte_basico)
+    else:
+        st.warning("⚠️ No hay resultados disponibles. Realiza primero el análisis completo.")
+else:
+    # Reporte premium completo
+    if 'resultados_completos' in st.session_state:
+        resultados = st.session_state['resultados_completos']
+        datos_entrada = st.session_state.get('datos_entrada', {})
+
+        modelo = modelo_resultados_actual(resultados)
+        reporte_premium = reporte_markdown(modelo, "premium")
+
+        st.text_area("Reporte Premium", reporte_premium, height=600)
+
+        # Botones para el reporte premium
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.download_button(
+                label="📥 Descargar TXT",
+                data=reporte_txt(modelo, "premium"),
+                file_name=f"reporte_premium_analisis_estructural_{datetime.now().strftime('%Y%m%d_%H%M')}.txt",
+                mime="text/plain"
+            )
+            st.download_button(
+                label="📝 Descargar Markdown",
+                data=reporte_premium,
+                file_name=f"reporte_premium_analisis_estructural_{datetime.now().strftime('%Y%m%d_%H%M')}.md",
+                mime="text/markdown"
+            )
+            boton_guardar_en_proyecto("md", reporte_premium.encode("utf-8"), "guardar_md_proyecto")
+            if OPENPYXL_AVAILABLE:
+                st.download_button(
+                    label="📊 Descargar Excel",
+                    data=reporte_excel(modelo, "premium"),
+                    file_name=f"reporte_premium_analisis_estructural_{datetime.now().strftime('%Y%m%d_%H%M')}.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                )
+
+        with col2:
+            # PDF premium bajo demanda (se genera una vez por resultados y plan)
+            if 'datos_entrada' in st.session_state:
+                try:
+                    datos_entrada = st.session_state['datos_entrada']
+                    perfil = st.radio("Diagramas en el PDF", list(PERFILES_REPORTE),
+                                      format_func=PERFILES_REPORTE.get, key="perfil_reporte")
+                    pdf_bytes = pdf_en_cache(resultados, datos_entrada, "premium", perfil)
+                    if pdf_bytes is None and st.button("📄 Preparar PDF Premium", key="preparar_pdf_premium"):
+                        with st.spinner("Generando PDF..."):
+                            pdf_bytes = obtener_pdf_reporte(resultados, datos_entrada, "premium", perfil, modelo=modelo)
+                    if pdf_bytes is not None:
+                        st.download_button(
+                            label="📄 Descargar PDF Premium",
+                            data=pdf_bytes,
+                            file_name=f"reporte_premium_analisis_estructural_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf",
+                            mime="application/pdf"
+                        )
+                        boton_guardar_en_proyecto("pdf", pdf_bytes, "guardar_pdf_proyecto")
+                except Exception as e:
+                    st.error(f"⚠️ Error generando PDF: {str(e)}")
+                    st.info("Intenta ejecutar el análisis completo nuevamente")
+            else:
+                st.warning("⚠️ Ejecuta primero el análisis completo")
+
+        with col3:
+            if st.button("🖨️ Generar Reporte en Pantalla", type="primary"):
+                st.success("✅ Reporte técnico generado exitosamente")
+                st.balloons()
+
+                # Mostrar el reporte en formato expandible
+                with st.expander("📋 VER REPORTE TÉCNICO COMPLETO", expanded=True):
+                    st.markdown(reporte_premium)
+    else:
+        st.warning("⚠️ No hay resultados disponibles. Realiza primero el análisis completo.")
+
+    # Reportes en segundo plano (cola compartida entre sesiones)
+    @fragmento
+    def panel_reportes_en_segundo_plano():
+        """Encolar reportes PDF y descargar los terminados, también desde otra sesión"""
+        st.markdown("---")
+        st.subheader("⏳ Reportes en Segundo Plano")
+        trabajos = st.session_state.setdefault('trabajos_reporte', [])
+        propietario = st.session_state.get('user')
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if 'resultados_completos' in st.session_state and 'datos_entrada' in st.session_state:
+                if st.button("📤 Generar PDF en segundo plano", key="encolar_reporte"):
+                    trabajos.insert(0, cola_reportes.encolar(
+                        st.session_state['resultados_completos'],
+                        st.session_state['datos_entrada'],
+                        "premium",
+                        st.session_state.get('perfil_reporte', "raster"),
+                        modelo=modelo_resultados_actual(st.session_state['resultados_completos']),
+                        propietario=propietario
+                    ))
+        with col2:
+            id_recuperar = st.text_input("Recuperar reporte por ID", key="id_reporte_recuperar").strip().lower()
+            if id_recuperar and not id_valido(id_recuperar):
+                st.warning("⚠️ El ID de un reporte tiene 12 caracteres hexadecimales (0-9, a-f)")
+            elif id_recuperar and id_recuperar not in trabajos:
+                trabajos.append(id_recuperar)
+
+        if trabajos:
+            st.button("🔄 Actualizar estado", key="actualizar_reportes")
+
+        for id_trabajo in trabajos:
+            estado = cola_reportes.estado(id_trabajo, propietario)
+            if estado is None:
+                st.warning(f"⚠️ Trabajo {id_trabajo} no encontrado")
+                continue
+
+            listas = [seccion for seccion, lista in estado['secciones'].items() if lista]
+            st.progress(estado['avance'], text=f"Trabajo {id_trabajo}: {estado['estado']} "
+                                               f"(secciones listas: {', '.join(listas) or 'ninguna'})")
+            pdf = cola_reportes.abrir_pdf(id_trabajo, propietario) if estado['estado'] == "completado" else None
+            if pdf is not None:
+                # Se entrega el archivo abierto: Streamlit lo lee sin otra copia intermedia
+                with pdf:
+                    st.download_button(
+                        label="📄 Descargar PDF",
+                        data=pdf,
+                        file_name=f"reporte_premium_{id_trabajo}.pdf",
+                        mime="application/pdf",
+                        key=f"descargar_{id_trabajo}"
+                    )
+            elif estado['estado'] == "error":
+                st.error(f"⚠️ Error generando PDF: {estado.get('error', '')}")
+
+    panel_reportes_en_segundo_plano()
@@ -0,0 +1,287 @@
+"""
+Gráficos - CONSORCIO DEJ
+Página de la aplicación (ver APP2.py)
+"""
+
+import streamlit as st
+import pandas as pd
+
+from motor_calculo import (
+    calcular_cortantes_momentos_viga_continua_mccormac,
+    calcular_cortantes_momentos_viga_empotrada_mccormac,
+    calcular_cortantes_momentos_viga_simple_mccormac,
+)
+from graficos import (
+    MATPLOTLIB_AVAILABLE,
+    PLOTLY_AVAILABLE,
+    plt,
+    px,
+    graficar_cortantes_momentos_mccormac,
+    graficar_viga_continua_mccormac,
+)
+from permisos import puede
+from ui_comun import fragmento
+
+st.title("📈 Gráficos y Visualizaciones")
+
+# Pestañas para diferentes tipos de gráficos
+tab1, tab2, tab3 = st.tabs(["📊 Gráficos Básicos", "🔧 Cortantes y Momentos (Nilson)", "📈 Gráficos Avanzados"])
+
+with tab1:
+    st.subheader("📊 Gráficos Básicos")
+
+    if not puede("graficos"):
+        st.warning("⚠️ Esta función requiere plan premium. Actualiza tu cuenta para acceder a gráficos avanzados.")
+        st.info("Plan gratuito incluye: Cálculos básicos, resultados simples")
+        st.info("Plan premium incluye: Gráficos interactivos, visualizaciones avanzadas")
+
+        # Mostrar botón para actualizar plan
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            if st.button("⭐ Actualizar a Premium", type="primary", key="upgrade_graficos"):
+                st.session_state['show_pricing'] = True
+                st.rerun()
+    else:
+        # Gráficos premium
+        if 'resultados_completos' in st.session_state:
+            resultados = st.session_state['resultados_completos']
+
+            # Gráfico de propiedades
+            col1, col2 = st.columns(2)
+
+            with col1:
+                if PLOTLY_AVAILABLE:
+                    datos_propiedades = pd.DataFrame({
+                        'Propiedad': ['Ec (kg/cm²)', 'Es (kg/cm²)', 'fr (kg/cm²)', 'β1'],
+                        'Valor': [resultados.get('Ec', 0)/1000, resultados.get('Es', 0)/1000000, 
+                                 resultados.get('fr', 0), resultados.get('beta1', 0)]
+                    })
+
+                    fig1 = px.bar(datos_propiedades, x='Propiedad', y='Valor',
+                                 title="Propiedades de los Materiales - Plan Premium",
+                                 color='Propiedad',
+                                 color_discrete_map={
+                                     'Ec (kg/cm²)': '#4169E1',
+                                     'Es (kg/cm²)': '#DC143C',
+                                     'fr (kg/cm²)': '#32CD32',
+                                     'β1': '#FFD700'
+                                 })
+
+                    fig1.update_layout(
+                        xaxis_title="Propiedad",
+                        yaxis_title="Valor",
+                        height=400
+                    )
+
+                    fig1.update_traces(texttemplate='%{y:.2f}', textposition='outside')
+                    st.plotly_chart(fig1, use_container_width=True)
+                else:
+                    # Gráfico alternativo con matplotlib
+                    if MATPLOTLIB_AVAILABLE and plt is not None:
+                        try:
+                            fig1, ax1 = plt.subplots(figsize=(8, 6))
+                            propiedades = ['Ec', 'Es', 'fr', 'β1']
+                            valores = [resultados.get('Ec', 0)/1000, resultados.get('Es', 0)/1000000, 
+                                      resultados.get('fr', 0), resultados.get('beta1', 0)]
+                            color_list = ['#4169E1', '#DC143C', '#32CD32', '#FFD700']
+                            bars = ax1.bar(propiedades, valores, color=color_list)
+                            ax1.set_title("Propiedades de los Materiales - Plan Premium")
+                            ax1.set_ylabel("Valor")
+                            for bar in bars:
+                                height = bar.get_height()
+                                ax1.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                                       f'{height:.2f}', ha='center', va='bottom')
+                            st.pyplot(fig1)
+                        except ImportError:
+                            st.info("📊 Gráfico no disponible - Matplotlib no está instalado")
+                            st.write("Para ver gráficos, instale matplotlib: `pip install matplotlib`")
+
+            with col2:
+                # Gráfico de dimensiones
+                if PLOTLY_AVAILABLE:
+                    datos_dimensiones = pd.DataFrame({
+                        'Dimensión': ['Peso Total (ton)', 'Espesor Losa (cm)', 'Ancho Viga (cm)', 'Alto Viga (cm)'],
+                        'Valor': [resultados.get('peso_total', 0), resultados.get('h_losa', 0)*100, 
+                                 resultados.get('b_viga', 0), resultados.get('d_viga', 0)]
+                    })
+
+                    fig2 = px.pie(datos_dimensiones, values='Valor', names='Dimensión',
+                                 title="Distribución de Dimensiones - Plan Premium",
+                                 color_discrete_map={
+                                     'Peso Total (ton)': '#2E8B57',
+                                     'Espesor Losa (cm)': '#FF6B6B',
+                                     'Ancho Viga (cm)': '#4ECDC4',
+                                     'Alto Viga (cm)': '#FFD93D'
+                                 })
+
+                    fig2.update_traces(textposition='inside', textinfo='percent+label+value')
+                    st.plotly_chart(fig2, use_container_width=True)
+                else:
+                    # Gráfico alternativo con matplotlib
+                    if MATPLOTLIB_AVAILABLE and plt is not None:
+                        fig2, ax2 = plt.subplots(figsize=(8, 8))
+                        dimensiones = ['Peso Total', 'Espesor Losa', 'Ancho Viga', 'Alto Viga']
+                        valores = [resultados.get('peso_total', 0), resultados.get('h_losa', 0)*100, 
+                                  resultados.get('b_viga', 0), resultados.get('d_viga', 0)]
+                        color_list = ['#2E8B57', '#FF6B6B', '#4ECDC4', '#FFD93D']
+
+                        ax2.pie(valores, labels=dimensiones, autopct='%1.1f%%', colors=color_list)
+                        ax2.set_title("Distribución de Dimensiones - Plan Premium")
+                        st.pyplot(fig2)
+                    else:
+                        st.info("📊 Gráfico no disponible - Matplotlib no está instalado")
+                        st.write("Para ver gráficos, instale matplotlib: `pip install matplotlib`")
+        else:
+            st.warning("⚠️ No hay resultados disponibles. Realiza primero el análisis completo.")
+
+with tab2:
+    st.subheader("🔧 Diagramas de Cortantes y Momentos - Jack C. McCormac")
+    @fragmento
+    def panel_diagramas_mccormac():
+        """Diagramas de cortantes y momentos McCormac (se reejecutan solos)"""
+        st.info("📚 Basado en 'Diseño de Estructuras de Concreto' de Jack C. McCormac")
+
+        # Seleccionar tipo de viga
+        tipo_viga = st.selectbox(
+            "Selecciona el tipo de viga:",
+            ["Viga Simplemente Apoyada", "Viga Empotrada", "Viga Continua (2 tramos)"],
+            help="Según Jack C. McCormac - Diseño de Estructuras de Concreto"
+        )
+
+        if tipo_viga == "Viga Simplemente Apoyada":
+            st.markdown("### 📐 Viga Simplemente Apoyada")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                L = st.number_input("Luz de la viga (m)", 1.0, 20.0, 6.0, 0.5)
+                w = st.number_input("Carga distribuida (kg/m)", 0.0, 10000.0, 1000.0, 100.0)
+
+            with col2:
+                usar_carga_puntual = st.checkbox("Agregar carga puntual")
+                if usar_carga_puntual:
+                    P = st.number_input("Carga puntual (kg)", 0.0, 50000.0, 5000.0, 500.0)
+                    a = st.number_input("Distancia desde apoyo izquierdo (m)", 0.1, L-0.1, L/2, 0.1)
+                else:
+                    P = None
+                    a = None
+
+            if st.button("🔬 Generar Diagramas", type="primary"):
+                fig = graficar_cortantes_momentos_mccormac(L, w, P, a, "simple")
+                if fig:
+                    st.pyplot(fig)
+
+                    # Mostrar valores máximos
+                    x, V, M = calcular_cortantes_momentos_viga_simple_mccormac(L, w, P, a)
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Cortante Máximo", f"{max(abs(V)):.1f} kg")
+                    with col2:
+                        st.metric("Momento Máximo", f"{max(abs(M)):.1f} kg·m")
+                    with col3:
+                        st.metric("Luz de la Viga", f"{L} m")
+
+        elif tipo_viga == "Viga Empotrada":
+            st.markdown("### 🔒 Viga Empotrada")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                L = st.number_input("Luz de la viga (m)", 1.0, 20.0, 6.0, 0.5, key="empotrada")
+                w = st.number_input("Carga distribuida (kg/m)", 0.0, 10000.0, 1000.0, 100.0, key="w_empotrada")
+
+            with col2:
+                usar_carga_puntual = st.checkbox("Agregar carga puntual", key="puntual_empotrada")
+                if usar_carga_puntual:
+                    P = st.number_input("Carga puntual (kg)", 0.0, 50000.0, 5000.0, 500.0, key="P_empotrada")
+                    a = st.number_input("Distancia desde apoyo izquierdo (m)", 0.1, L-0.1, L/2, 0.1, key="a_empotrada")
+                else:
+                    P = None
+                    a = None
+
+            if st.button("🔬 Generar Diagramas", type="primary", key="btn_empotrada"):
+                fig = graficar_cortantes_momentos_mccormac(L, w, P, a, "empotrada")
+                if fig:
+                    st.pyplot(fig)
+
+                    # Mostrar valores máximos
+                    x, V, M = calcular_cortantes_momentos_viga_empotrada_mccormac(L, w, P, a)
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Cortante Máximo", f"{max(abs(V)):.1f} kg")
+                    with col2:
+                        st.metric("Momento Máximo", f"{max(abs(M)):.1f} kg·m")
+                    with col3:
+                        st.metric("Luz de la Viga", f"{L} m")
+
+        elif tipo_viga == "Viga Continua (2 tramos)":
+            st.markdown("### 🔗 Viga Continua de 2 Tramos")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                L1 = st.number_input("Luz del primer tramo (m)", 1.0, 15.0, 5.0, 0.5)
+                L2 = st.number_input("Luz del segundo tramo (m)", 1.0, 15.0, 5.0, 0.5)
+
+            with col2:
+                w1 = st.number_input("Carga distribuida tramo 1 (kg/m)", 0.0, 10000.0, 1000.0, 100.0)
+                w2 = st.number_input("Carga distribuida tramo 2 (kg/m)", 0.0, 10000.0, 1000.0, 100.0)
+
+            if st.button("🔬 Generar Diagramas", type="primary", key="btn_continua"):
+                fig = graficar_viga_continua_mccormac(L1, L2, w1, w2)
+                if fig:
+                    st.pyplot(fig)
+
+                    # Mostrar valores máximos
+                    x1, V1, M1, x2, V2, M2, R_A, R_B1, R_B2, R_C, M_B = calcular_cortantes_momentos_viga_continua_mccormac(L1, L2, w1, w2)
+
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        st.metric("Cortante Máx. Tramo 1", f"{max(abs(V1)):.1f} kg")
+                    with col2:
+                        st.metric("Cortante Máx. Tramo 2", f"{max(abs(V2)):.1f} kg")
+                    with col3:
+                        st.metric("Momento Máx. Tramo 1", f"{max(abs(M1)):.1f} kg·m")
+                    with col4:
+                        st.metric("Momento Máx. Tramo 2", f"{max(abs(M2)):.1f} kg·m")
+
+                    # Mostrar reacciones
+                    st.subheader("📊 Reacciones Calculadas")
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        st.metric("Reacción A", f"{R_A:.1f} kg")
+                    with col2:
+                        st.metric("Reacción B1", f"{R_B1:.1f} kg")
+                    with col3:
+                        st.metric("Reacción B2", f"{R_B2:.1f} kg")
+                    with col4:
+                        st.metric("Reacción C", f"{R_C:.1f} kg")
+
+        # Información técnica
+        st.markdown("---")
+        st.subheader("📚 Información Técnica - Jack C. McCormac")
+        st.markdown("""
+                **Referencia:** Diseño de Estructuras de Concreto - Jack C. McCormac
+            
+                **Fórmulas utilizadas:**
+                - **Viga simplemente apoyada:** Reacciones R = wL/2, Momento máximo M = wL²/8
+                - **Viga empotrada:** Momentos de empotramiento M = ±wL²/12
+                - **Viga continua:** Método de coeficientes para momentos en apoyos
+            
+                **Aplicaciones:**
+                - Diseño de vigas de concreto armado
+                - Análisis de cargas distribuidas y puntuales
+                - Verificación de momentos y cortantes máximos
+                - Diseño de refuerzo según ACI 318
+                """)
+
+    panel_diagramas_mccormac()
+
+with tab3:
+    st.subheader("📈 Gráficos Avanzados")
+    st.info("Esta sección incluye gráficos avanzados y visualizaciones 3D (disponible en plan empresarial)")
+
+    if puede("graficos_avanzados"):
+        st.success("🏢 Plan Empresarial: Acceso completo a gráficos avanzados")
+        # Aquí se pueden agregar gráficos 3D y visualizaciones avanzadas
+        st.info("🚧 Funcionalidad en desarrollo - Próximamente gráficos 3D y visualizaciones avanzadas")
+    else:
+        st.warning("⚠️ Esta función requiere plan empresarial")
+        st.info("Actualiza a plan empresarial para acceder a gráficos 3D y visualizaciones avanzadas")
@@ -0,0 +1,140 @@
+"""
+Mis Proyectos - CONSORCIO DEJ
+Página de la aplicación (ver APP2.py)
+"""
+
+from datetime import datetime
+import streamlit as st
+
+from modelo_resultados import construir_modelo
+from permisos import puede
+from proyectos import almacen_proyectos
+
+PROYECTOS_POR_PAGINA = 20
+VERSIONES_VISIBLES = 10
+MIME_REPORTES = {"pdf": "application/pdf", "md": "text/markdown"}
+
+def cargar_en_sesion(proyecto):
+    """Poner los datos (y resultados, si los tiene) de un proyecto o versión en la sesión"""
+    st.session_state['datos_entrada'] = proyecto['datos_entrada']
+    if proyecto['resultados'] is not None:
+        st.session_state['resultados_completos'] = proyecto['resultados']
+        st.session_state['modelo_resultados'] = construir_modelo(proyecto['resultados'], proyecto['datos_entrada'])
+    else:
+        st.session_state.pop('resultados_completos', None)
+        st.session_state.pop('modelo_resultados', None)
+    st.session_state['proyecto_abierto'] = proyecto['id']
+
+st.title("🗂️ Mis Proyectos")
+
+# Verificar acceso basado en plan (Múltiples proyectos es parte del plan empresarial)
+if not puede("multiples_proyectos"):
+    st.warning("⚠️ Esta función requiere plan empresarial. Actualiza tu cuenta para guardar múltiples proyectos.")
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if st.button("🏢 Actualizar a Empresarial", type="primary", key="upgrade_proyectos"):
+            st.session_state['show_pricing'] = True
+            st.rerun()
+else:
+    propietario = st.session_state['user']
+
+    # Guardar el análisis actual como proyecto
+    st.subheader("💾 Guardar Proyecto")
+    if 'datos_entrada' in st.session_state:
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            nombre = st.text_input("Nombre del proyecto", key="nombre_proyecto").strip()
+        with col2:
+            st.write("")
+            if st.button("💾 Guardar", disabled=not nombre):
+                id_proyecto = almacen_proyectos.guardar(
+                    propietario, nombre,
+                    st.session_state['datos_entrada'],
+                    st.session_state.get('resultados_completos'),
+                )
+                st.session_state['proyecto_abierto'] = id_proyecto
+                st.success(f"✅ Proyecto '{nombre}' guardado")
+    else:
+        st.info("Ejecuta el análisis completo para guardarlo como proyecto")
+
+    # Listado y búsqueda
+    st.subheader("📂 Proyectos Guardados")
+    total = almacen_proyectos.contar(propietario)
+    busqueda = st.text_input("🔍 Buscar por nombre", key="buscar_proyecto").strip()
+    if busqueda:
+        proyectos = almacen_proyectos.buscar(propietario, busqueda, limite=PROYECTOS_POR_PAGINA)
+    else:
+        paginas = max(1, -(-total // PROYECTOS_POR_PAGINA))
+        pagina = st.number_input("Página", 1, paginas, 1, key="pagina_proyectos") if paginas > 1 else 1
+        proyectos = almacen_proyectos.listar(propietario, PROYECTOS_POR_PAGINA, (pagina - 1) * PROYECTOS_POR_PAGINA)
+    st.caption(f"{total} proyectos guardados")
+
+    for proyecto in proyectos:
+        col1, col2, col3 = st.columns([3, 2, 1])
+        with col1:
+            estado = "📊" if proyecto['con_resultados'] else "📝"
+            st.write(f"{estado} **{proyecto['nombre']}**")
+        with col2:
+            st.caption(f"Modificado: {datetime.fromtimestamp(proyecto['modificado']).strftime('%d/%m/%Y %H:%M')}")
+        with col3:
+            if st.button("Abrir", key=f"abrir_proyecto_{proyecto['id']}"):
+                abierto = almacen_proyectos.abrir(propietario, proyecto['id'])
+                if abierto is not None:
+                    cargar_en_sesion(abierto)
+                    st.success(f"✅ Proyecto '{abierto['nombre']}' abierto: ya puedes generar sus reportes")
+
+    if not proyectos:
+        st.info("No hay proyectos que coincidan" if busqueda else "Aún no has guardado proyectos")
+
+    # Historial del proyecto abierto
+    id_abierto = st.session_state.get('proyecto_abierto')
+    versiones = almacen_proyectos.versiones(propietario, id_abierto) if id_abierto else []
+    if versiones:
+        st.subheader("🕘 Historial de Versiones")
+        for version in versiones[:VERSIONES_VISIBLES]:
+            col1, col2, col3, col4 = st.columns([2, 2, 1, 1])
+            with col1:
+                estado = "📊" if version['con_resultados'] else "📝"
+                st.write(f"{estado} Versión {version['numero']}" + (" (actual)" if version is versiones[0] else ""))
+            with col2:
+                st.caption(datetime.fromtimestamp(version['creado']).strftime('%d/%m/%Y %H:%M'))
+            with col3:
+                if st.button("Abrir", key=f"abrir_version_{version['numero']}"):
+                    cargar_en_sesion(almacen_proyectos.abrir_version(propietario, id_abierto, version['numero']))
+                    st.success(f"✅ Versión {version['numero']} abierta")
+            with col4:
+                if version is not versiones[0] and st.button("Restaurar", key=f"restaurar_version_{version['numero']}"):
+                    almacen_proyectos.restaurar_version(propietario, id_abierto, version['numero'])
+                    cargar_en_sesion(almacen_proyectos.abrir(propietario, id_abierto))
+                    st.rerun()
+        if len(versiones) > VERSIONES_VISIBLES:
+            st.caption(f"Mostrando las {VERSIONES_VISIBLES} versiones más recientes de {len(versiones)}")
+
+    # Reportes guardados del proyecto abierto (se guardan desde Generar Reporte)
+    reportes = almacen_proyectos.reportes(propietario, id_abierto) if id_abierto else []
+    if reportes:
+        st.subheader("📑 Reportes del Proyecto")
+        for reporte in reportes:
+            col1, col2, col3 = st.columns([2, 2, 1])
+            with col1:
+                st.write(f"📄 Reporte {reporte['formato'].upper()} ({reporte['bytes'] / 1024:,.0f} KB)")
+            with col2:
+                st.caption(datetime.fromtimestamp(reporte['creado']).strftime('%d/%m/%Y %H:%M'))
+            with col3:
+                # El contenido se lee de la base solo para el reporte preparado
+                if st.button("Preparar", key=f"preparar_reporte_{reporte['id']}"):
+                    st.session_state['reporte_preparado'] = reporte['id']
+                if st.session_state.get('reporte_preparado') == reporte['id']:
+                    contenido = almacen_proyectos.obtener_reporte(propietario, reporte['id'])
+                    if contenido is None:
+                        st.warning("⚠️ El reporte ya no existe")
+                    else:
+                        st.download_button(
+                            "📥 Descargar",
+                            data=contenido,
+                            file_name=f"reporte_proyecto_{id_abierto}_{reporte['id']}.{reporte['formato']}",
+                            mime=MIME_REPORTES.get(reporte['formato'], "application/octet-stream"),
+                            key=f"descargar_reporte_{reporte['id']}"
+                        )
+    elif id_abierto:
+        st.caption("Los reportes generados en 'Generar Reporte' pueden guardarse en el proyecto abierto")
@@ -0,0 +1,138 @@
+"""
+Permisos por plan - CONSORCIO DEJ
+Funciones habilitadas para cada plan, resueltas una vez por inicio de sesión y guardadas en la sesión
+"""
+
+import threading
+from dataclasses import dataclass
+
+import streamlit as st
+
+# Funciones de cada plan (cada plan incluye las del anterior)
+FUNCIONES_GRATUITO = frozenset({"calculo_basico", "reporte_basico"})
+FUNCIONES_PREMIUM = FUNCIONES_GRATUITO | {
+    "analisis_completo", "reporte_pdf", "graficos", "comparar_analisis", "diseno_elementos", "ejercicio_corte",
+}
+FUNCIONES_EMPRESARIAL = FUNCIONES_PREMIUM | {"multiples_proyectos", "graficos_avanzados"}
+
+FUNCIONES_PLAN = {
+    "gratuito": FUNCIONES_GRATUITO,
+    "premium": FUNCIONES_PREMIUM,
+    "empresarial": FUNCIONES_EMPRESARIAL,
+}
+
+# Los administradores cambian de plan sin pagar y ven el análisis completo con cualquier plan
+ADMINISTRADORES = frozenset({"admin", "admin@consorciodej.com"})
+FUNCIONES_ADMIN = frozenset({"cambiar_plan", "analisis_completo"})
+
+@dataclass(frozen=True, slots=True)
+class Permisos:
+    """Plan y funciones de un usuario; version permite saber si un cambio posterior los invalidó"""
+    usuario: str
+    plan: str
+    es_admin: bool
+    funciones: frozenset
+    version: int = 0
+
+    def puede(self, funcion):
+        return funcion in self.funciones
+
+class ServicioPermisos:
+    """
+    Resuelve los permisos de un usuario a partir de su plan. Cada cambio del sistema de pagos
+    (pago registrado o confirmado, cambio de plan) sube la versión del usuario: los permisos
+    guardados en una sesión se vuelven a resolver solo entonces
+    """
+
+    def __init__(self):
+        self._versiones = {}
+        self._lock = threading.Lock()
+        self._sistema = None
+
+    def conectar(self, sistema):
+        """Usar sistema (SimplePaymentSystem) como fuente del plan y escuchar sus cambios"""
+        with self._lock:
+            if self._sistema is sistema:
+                return
+            self._sistema = sistema
+        sistema.add_listener(self._al_cambiar)
+
+    def _al_cambiar(self, evento, email):
+        self.invalidar(email)
+
+    def invalidar(self, usuario):
+        with self._lock:
+            self._versiones[usuario] = self._versiones.get(usuario, 0) + 1
+
+    def version(self, usuario):
+        return self._versiones.get(usuario, 0)
+
+    def resolver(self, usuario, plan, version=None):
+        """Permisos de usuario con el plan dado (un plan desconocido cuenta como gratuito)"""
+        es_admin = usuario in ADMINISTRADORES
+        plan = plan if plan in FUNCIONES_PLAN else "gratuito"
+        funciones = (FUNCIONES_PLAN[plan] | FUNCIONES_ADMIN) if es_admin else FUNCIONES_PLAN[plan]
+        return Permisos(usuario, plan, es_admin, funciones, self.version(usuario) if version is None else version)
+
+    def vigentes(self, permisos):
+        """Los mismos permisos si el usuario no cambió; si no, resueltos con su plan actual"""
+        version = self.version(permisos.usuario)
+        if version == permisos.version:
+            return permisos
+        plan = permisos.plan
+        if self._sistema is not None:
+            usuario = self._sistema.get_user(permisos.usuario)
+            if usuario is not None:
+                plan = usuario["plan"]
+        return self.resolver(permisos.usuario, plan, version)
+
+# Instancia global (compartida por todas las sesiones del proceso)
+servicio_permisos = ServicioPermisos()
+
+# =====================
+# PERMISOS DE LA SESIÓN
+# =====================
+
+def _guardar_en_sesion(permisos):
+    # 'plan' y user_data['plan'] se mantienen como copia del plan de los permisos
+    st.session_state['permisos'] = permisos
+    st.session_state['plan'] = permisos.plan
+    if isinstance(st.session_state.get('user_data'), dict):
+        st.session_state['user_data']['plan'] = permisos.plan
+
+def iniciar_sesion(usuario, datos_usuario):
+    """Guardar el usuario en la sesión y resolver sus permisos (una vez por inicio de sesión)"""
+    st.session_state['logged_in'] = True
+    st.session_state['user'] = usuario
+    st.session_state['user_data'] = datos_usuario
+    _guardar_en_sesion(servicio_permisos.resolver(usuario, datos_usuario.get('plan')))
+
+def cerrar_sesion():
+    st.session_state['logged_in'] = False
+    st.session_state['user_data'] = None
+    st.session_state['user'] = None
+    st.session_state['plan'] = None
+    st.session_state.pop('permisos', None)
+    st.session_state.pop('sesion_token', None)
+
+def cambiar_plan_sesion(plan):
+    """Cambiar el plan de la sesión (acceso directo del administrador o pago confirmado)"""
+    usuario = st.session_state.get('user') or ""
+    servicio_permisos.invalidar(usuario)
+    _guardar_en_sesion(servicio_permisos.resolver(usuario, plan))
+
+def permisos_sesion():
+    """Permisos de la sesión: los guardados mientras sigan vigentes (sin volver a resolver el plan)"""
+    permisos = st.session_state.get('permisos')
+    if permisos is None:
+        # Sesión iniciada sin iniciar_sesion: resolver una vez con el plan guardado
+        permisos = servicio_permisos.resolver(st.session_state.get('user') or "", st.session_state.get('plan'))
+    else:
+        permisos = servicio_permisos.vigentes(permisos)
+    if permisos is not st.session_state.get('permisos'):
+        _guardar_en_sesion(permisos)
+    return permisos
+
+def puede(funcion):
+    """True si el plan de la sesión (o el administrador) tiene acceso a funcion"""
+    return permisos_sesion().puede(funcion)
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Proyectos - CONSORCIO DEJ
+Almacén de proyectos por usuario en SQLite (modo WAL): datos de entrada, resultados, reportes
+e historial de versiones (deltas sobre la versión anterior con checkpoints completos periódicos)
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+
+RUTA_PROYECTOS = "proyectos.db"
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS proyectos (
+    id INTEGER PRIMARY KEY,
+    propietario TEXT NOT NULL,
+    nombre TEXT NOT NULL COLLATE NOCASE,
+    datos_entrada TEXT NOT NULL,
+    resultados BLOB,
+    creado REAL NOT NULL,
+    modificado REAL NOT NULL,
+    UNIQUE (propietario, nombre)
+);
+CREATE INDEX IF NOT EXISTS idx_proyectos_propietario_modificado ON proyectos (propietario, modificado DESC);
+CREATE TABLE IF NOT EXISTS reportes (
+    id INTEGER PRIMARY KEY,
+    proyecto_id INTEGER NOT NULL REFERENCES proyectos (id) ON DELETE CASCADE,
+    formato TEXT NOT NULL,
+    contenido BLOB NOT NULL,
+    creado REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reportes_proyecto ON reportes (proyecto_id, creado DESC);
+CREATE TABLE IF NOT EXISTS versiones (
+    proyecto_id INTEGER NOT NULL REFERENCES proyectos (id) ON DELETE CASCADE,
+    numero INTEGER NOT NULL,
+    checkpoint INTEGER NOT NULL,
+    datos BLOB NOT NULL,
+    resultados BLOB,
+    creado REAL NOT NULL,
+    PRIMARY KEY (proyecto_id, numero)
+) WITHOUT ROWID;
+"""
+
+# Cada cuántas versiones se guarda una copia completa de los datos de entrada (checkpoint);
+# reconstruir una versión aplica como máximo INTERVALO_CHECKPOINT - 1 deltas
+INTERVALO_CHECKPOINT = 10
+
+# Columnas del listado (sin los blobs, para que listar y buscar sean livianos)
+COLUMNAS_RESUMEN = "id, nombre, creado, modificado, resultados IS NOT NULL AS con_resultados"
+
+def comprimir(valor):
+    """JSON comprimido con zlib (los resultados del motor son números, textos y booleanos)"""
+    return zlib.compress(json.dumps(valor, ensure_ascii=False, default=float).encode("utf-8"))
+
+def descomprimir(blob):
+    return None if blob is None else json.loads(zlib.decompress(blob).decode("utf-8"))
+
+def calcular_delta(anterior, actual):
+    """Cambios para pasar de los datos anterior a actual: claves nuevas o modificadas y claves eliminadas"""
+    delta = {"cambios": {k: v for k, v in actual.items() if k not in anterior or anterior[k] != v}}
+    eliminados = [k for k in anterior if k not in actual]
+    if eliminados:
+        delta["eliminados"] = eliminados
+    return delta
+
+def aplicar_delta(datos, delta):
+    datos = {k: v for k, v in datos.items() if k not in delta.get("eliminados", ())}
+    datos.update(delta["cambios"])
+    return datos
+
+def _patron_like(texto):
+    """Patrón LIKE que busca texto literal (escapando % y _)"""
+    escapado = texto.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escapado}%"
+
+class AlmacenProyectos:
+    """Proyectos guardados por usuario; cada operación usa su propia conexión (segura entre sesiones)"""
+
+    def __init__(self, ruta=RUTA_PROYECTOS):
+        self.ruta = ruta
+        self._inicializado = False
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _conexion(self):
+        """Conexión con transacción: commit al salir sin errores, rollback si falla"""
+        self._inicializar()
+        conexion = sqlite3.connect(self.ruta, timeout=10)
+        conexion.row_factory = sqlite3.Row
+        conexion.execute("PRAGMA foreign_keys = ON")
+        try:
+            with conexion:
+                yield conexion
+        finally:
+            conexion.close()
+
+    def _inicializar(self):
+        """Crear el esquema y activar WAL la primera vez que se usa el almacén"""
+        if self._inicializado:
+            return
+        with self._lock:
+            if not self._inicializado:
+                conexion = sqlite3.connect(self.ruta, timeout=10)
+                try:
+                    conexion.execute("PRAGMA journal_mode = WAL")
+                    conexion.execute("PRAGMA synchronous = NORMAL")
+                    conexion.executescript(ESQUEMA)
+                finally:
+                    conexion.close()
+                self._inicializado = True
+
+    def guardar(self, propietario, nombre, datos_entrada, resultados=None):
+        """
+        Crear o actualizar (por nombre) un proyecto del propietario y devolver su id.
+        Si los datos de entrada cambiaron se agrega una versión al historial; si no, la última
+        versión se actualiza con los resultados.
+        """
+        ahora = time.time()
+        # Normalizar como quedará en la base (JSON) para comparar con la versión anterior
+        datos_entrada = json.loads(json.dumps(datos_entrada, ensure_ascii=False, default=float))
+        blob_resultados = None if resultados is None else comprimir(resultados)
+        with self._conexion() as conexion:
+            # Reservar la escritura antes de leer el estado anterior (dos sesiones guardando a la vez)
+            conexion.execute("BEGIN IMMEDIATE")
+            anterior = conexion.execute(
+                "SELECT datos_entrada FROM proyectos WHERE propietario = ? AND nombre = ?", (propietario, nombre)
+            ).fetchone()
+            fila = conexion.execute(
+                """INSERT INTO proyectos (propietario, nombre, datos_entrada, resultados, creado, modificado)
+                   VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (propietario, nombre) DO UPDATE SET
+                       datos_entrada = excluded.datos_entrada,
+                       resultados = excluded.resultados,
+                       modificado = excluded.modificado
+                   RETURNING id""",
+                (propietario, nombre, json.dumps(datos_entrada, ensure_ascii=False),
+                 blob_resultados, ahora, ahora),
+            ).fetchone()
+            self._registrar_version(conexion, fila["id"], anterior and json.loads(anterior["datos_entrada"]),
+                                    datos_entrada, blob_resultados, ahora)
+        return fila["id"]
+
+    # =====================
+    # HISTORIAL DE VERSIONES
+    # =====================
+
+    def _registrar_version(self, conexion, id_proyecto, anterior, datos_entrada, blob_resultados, ahora):
+        ultima = conexion.execute(
+            "SELECT MAX(numero) FROM versiones WHERE proyecto_id = ?", (id_proyecto,)
+        ).fetchone()[0]
+        if ultima is not None and anterior == datos_entrada:
+            conexion.execute("UPDATE versiones SET resultados = ? WHERE proyecto_id = ? AND numero = ?",
+                             (blob_resultados, id_proyecto, ultima))
+            return
+        numero = (ultima or 0) + 1
+        if ultima is None or (numero - 1) % INTERVALO_CHECKPOINT == 0:
+            checkpoint, datos = numero, datos_entrada
+        else:
+            checkpoint = conexion.execute(
+                "SELECT checkpoint FROM versiones WHERE proyecto_id = ? AND numero = ?", (id_proyecto, ultima)
+            ).fetchone()[0]
+            datos = calcular_delta(anterior, datos_entrada)
+        conexion.execute(
+            "INSERT INTO versiones (proyecto_id, numero, checkpoint, datos, resultados, creado) VALUES (?, ?, ?, ?, ?, ?)",
+            (id_proyecto, numero, checkpoint, comprimir(datos), blob_resultados, ahora),
+        )
+
+    def versiones(self, propietario, id_proyecto):
+        """Versiones de un proyecto (sin sus datos), de la más reciente a la más antigua"""
+        with self._conexion() as conexion:
+            filas = conexion.execute(
+                """SELECT v.numero, v.numero = v.checkpoint AS es_checkpoint, v.creado,
+                          v.resultados IS NOT NULL AS con_resultados
+                   FROM versiones v JOIN proyectos p ON p.id = v.proyecto_id
+                   WHERE v.proyecto_id = ? AND p.propietario = ?
+                   ORDER BY v.numero DESC""",
+                (id_proyecto, propietario),
+            ).fetchall()
+        return [dict(fila) for fila in filas]
+
+    def abrir_version(self, propietario, id_proyecto, numero):
+        """
+        Datos de entrada y resultados de una versión, reconstruidos desde su checkpoint;
+        None si la versión no existe o el proyecto es de otro usuario
+        """
+        with self._conexion() as conexion:
+            version = conexion.execute(
+                """SELECT v.checkpoint, v.resultados, v.creado, p.nombre
+                   FROM versiones v JOIN proyectos p ON p.id = v.proyecto_id
+                   WHERE v.proyecto_id = ? AND v.numero = ? AND p.propietario = ?""",
+                (id_proyecto, numero, propietario),
+            ).fetchone()
+            if version is None:
+                return None
+            cadena = conexion.execute(
+                "SELECT datos FROM versiones WHERE proyecto_id = ? AND numero BETWEEN ? AND ? ORDER BY numero",
+                (id_proyecto, version["checkpoint"], numero),
+            ).fetchall()
+        datos_entrada = descomprimir(cadena[0]["datos"])
+        for fila in cadena[1:]:
+            datos_entrada = aplicar_delta(datos_entrada, descomprimir(fila["datos"]))
+        return {
+            "id": id_proyecto,
+            "nombre": version["nombre"],
+            "numero": numero,
+            "datos_entrada": datos_entrada,
+            "resultados": descomprimir(version["resultados"]),
+            "creado": version["creado"],
+        }
+
+    def restaurar_version(self, propietario, id_proyecto, numero):
+        """Volver a una versión anterior (queda registrada como una versión nueva); True si existía"""
+        version = self.abrir_version(propietario, id_proyecto, numero)
+        if version is None:
+            return False
+        self.guardar(propietario, version["nombre"], version["datos_entrada"], version["resultados"])
+        return True
+
+    def abrir(self, propietario, id_proyecto):
+        """Proyecto completo (datos de entrada y resultados) o None si no existe o es de otro usuario"""
+        with self._conexion() as conexion:
+            fila = conexion.execute(
+                "SELECT * FROM proyectos WHERE id = ? AND propietario = ?", (id_proyecto, propietario)
+            ).fetchone()
+        if fila is None:
+            return None
+        return {
+            "id": fila["id"],
+            "nombre": fila["nombre"],
+            "datos_entrada": json.loads(fila["datos_entrada"]),
+            "resultados": descomprimir(fila["resultados"]),
+            "creado": fila["creado"],
+            "modificado": fila["modificado"],
+        }
+
+    def listar(self, propietario, limite=50, desplazamiento=0):
+        """Proyectos del propietario, del modificado más recientemente al más antiguo"""
+        with self._conexion() as conexion:
+            filas = conexion.execute(
+                f"""SELECT {COLUMNAS_RESUMEN} FROM proyectos WHERE propietario = ?
+                    ORDER BY modificado DESC LIMIT ? OFFSET ?""",
+                (propietario, limite, desplazamiento),
+            ).fetchall()
+        return [dict(fila) for fila in filas]
+
+    def buscar(self, propietario, texto, limite=50):
+        """Proyectos del propietario cuyo nombre contiene texto (sin distinguir mayúsculas)"""
+        with self._conexion() as conexion:
+            filas = conexion.execute(
+                f"""SELECT {COLUMNAS_RESUMEN} FROM proyectos
+                    WHERE propietario = ? AND nombre LIKE ? ESCAPE '\\'
+                    ORDER BY modificado DESC LIMIT ?""",
+                (propietario, _patron_like(texto), limite),
+            ).fetchall()
+        return [dict(fila) for fila in filas]
+
+    def contar(self, propietario):
+        with self._conexion() as conexion:
+            return conexion.execute(
+                "SELECT COUNT(*) FROM proyectos WHERE propietario = ?", (propietario,)
+            ).fetchone()[0]
+
+    def eliminar(self, propietario, id_proyecto):
+        """Eliminar un proyecto y sus reportes; True si existía"""
+        with self._conexion() as conexion:
+            cursor = conexion.execute(
+                "DELETE FROM proyectos WHERE id = ? AND propietario = ?", (id_proyecto, propietario)
+            )
+        return cursor.rowcount > 0
+
+    def guardar_reporte(self, propietario, id_proyecto, formato, contenido):
+        """Guardar un reporte generado (bytes) en el proyecto; None si el proyecto no es del propietario"""
+        with self._conexion() as conexion:
+            if conexion.execute("SELECT 1 FROM proyectos WHERE id = ? AND propietario = ?",
+                                (id_proyecto, propietario)).fetchone() is None:
+                return None
+            cursor = conexion.execute(
+                "INSERT INTO reportes (proyecto_id, formato, contenido, creado) VALUES (?, ?, ?, ?)",
+                (id_proyecto, formato, contenido, time.time()),
+            )
+        return cursor.lastrowid
+
+    def reportes(self, propietario, id_proyecto):
+        """Reportes guardados de un proyecto (sin su contenido), del más reciente al más antiguo"""
+        with self._conexion() as conexion:
+            filas = conexion.execute(
+                """SELECT r.id, r.formato, r.creado, length(r.contenido) AS bytes
+                   FROM reportes r JOIN proyectos p ON p.id = r.proyecto_id
+                   WHERE r.proyecto_id = ? AND p.propietario = ?
+                   ORDER BY r.creado DESC""",
+                (id_proyecto, propietario),
+            ).fetchall()
+        return [dict(fila) for fila in filas]
+
+    def obtener_reporte(self, propietario, id_reporte):
+        """Bytes de un reporte guardado o None"""
+        with self._conexion() as conexion:
+            fila = conexion.execute(
+                """SELECT r.contenido FROM reportes r JOIN proyectos p ON p.id = r.proyecto_id
+                   WHERE r.id = ? AND p.propietario = ?""",
+                (id_reporte, propietario),
+            ).fetchone()
+        return None if fila is None else fila["contenido"]
+
+# Almacén global del proceso (la base se crea al primer uso)
+almacen_proyectos = AlmacenProyectos()
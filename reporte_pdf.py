@@ -0,0 +1,1114 @@
+#!/usr/bin/env python3
+"""
+Reporte PDF - CONSORCIO DEJ
+Generación del reporte técnico en PDF con ReportLab
+"""
+
+import io
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+from cache_resultados import CacheResultados, analisis_completo_cacheado
+from modelo_resultados import construir_modelo
+from motor_calculo import VERSION_MOTOR, calcular_cortantes_momentos_viga_simple_mccormac, calcular_diseno_zapatas
+
+# Verificación de reportlab
+try:
+    from reportlab.lib.pagesizes import A4, letter
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import inch
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    REPORTLAB_AVAILABLE = False
+    # No mostrar warning aquí para evitar problemas en la carga inicial
+
+# Verificación de pypdf (unión de páginas estáticas precompiladas)
+try:
+    from pypdf import PdfReader, PdfWriter
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
+# Verificación de matplotlib (gráficos del reporte)
+try:
+    import matplotlib
+    MATPLOTLIB_AVAILABLE = True
+except ImportError:
+    MATPLOTLIB_AVAILABLE = False
+
+# =====================
+# FIGURAS DEL REPORTE (PNG EN PARALELO)
+# =====================
+
+# Con False (o un solo núcleo) las figuras se dibujan en el propio proceso
+FIGURAS_EN_PARALELO = True
+
+_executor_figuras = None
+
+def _png(fig):
+    """Guardar una figura de matplotlib como PNG (dpi=200) y cerrarla"""
+    import matplotlib.pyplot as plt
+    plt.tight_layout()
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', bbox_inches='tight', dpi=200)
+    plt.close(fig)
+    return buffer.getvalue()
+
+def _pyplot():
+    import matplotlib
+    matplotlib.use('Agg')  # Backend no interactivo
+    import matplotlib.pyplot as plt
+    return plt
+
+def figura_cortantes_momentos(L, w):
+    """PNG de los diagramas de cortantes y momentos de la viga principal"""
+    plt = _pyplot()
+    x, V, M = calcular_cortantes_momentos_viga_simple_mccormac(L, w, None, None)
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(7, 5))
+    ax1.plot(x, V, 'r-', linewidth=2, label='Cortante (V)')
+    ax1.set_title('Diagrama de Cortantes')
+    ax1.set_xlabel('Distancia (m)')
+    ax1.set_ylabel('Cortante (kg)')
+    ax1.grid(True, alpha=0.3)
+    ax2.plot(x, M, 'b-', linewidth=2, label='Momento (M)')
+    ax2.set_title('Diagrama de Momentos')
+    ax2.set_xlabel('Distancia (m)')
+    ax2.set_ylabel('Momento (kg·m)')
+    ax2.grid(True, alpha=0.3)
+    return _png(fig)
+
+def figura_propiedades(valores):
+    """PNG del gráfico de barras de propiedades de los materiales"""
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(6, 4))
+    propiedades = ['Ec', 'Es', 'fr', 'β1']
+    color_list = ['#4169E1', '#DC143C', '#32CD32', '#FFD700']
+    bars = ax.bar(propiedades, valores, color=color_list)
+    ax.set_title("Propiedades de los Materiales")
+    ax.set_ylabel("Valor")
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height + 0.1, f'{height:.2f}', ha='center', va='bottom')
+    return _png(fig)
+
+def figura_zona_sismica(zona_sel):
+    """PNG del esquema de zonas sísmicas con la zona seleccionada resaltada"""
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(4, 2.5))
+    zonas = ['Z1', 'Z2', 'Z3', 'Z4']
+    valores = [0.10, 0.15, 0.25, 0.35]
+    color_map = ['#A9CCE3', '#5499C7', '#2471A3', '#1B2631']
+    ax.bar(zonas, valores, color=color_map)
+    idx = zonas.index(zona_sel) if zona_sel in zonas else 2
+    ax.bar(zonas[idx], valores[idx], color='#F1C40F')
+    ax.set_title('Zona Sísmica Seleccionada')
+    ax.set_ylabel('Z')
+    return _png(fig)
+
+def _pool_figuras():
+    """Pool de procesos para las figuras (None si no conviene paralelizar)"""
+    global _executor_figuras
+    if not FIGURAS_EN_PARALELO or (os.cpu_count() or 1) < 2:
+        return None
+    if _executor_figuras is None:
+        _executor_figuras = ProcessPoolExecutor(max_workers=min(3, os.cpu_count()),
+                                                mp_context=multiprocessing.get_context("spawn"))
+    return _executor_figuras
+
+def enviar_figuras(tareas):
+    """Enviar las tareas (funcion, args) al pool; devuelve funciones que entregan cada PNG en orden"""
+    pool = _pool_figuras()
+    if pool is None:
+        return [lambda funcion=funcion, args=args: funcion(*args) for funcion, args in tareas]
+    futuros = [pool.submit(funcion, *args) for funcion, args in tareas]
+    return [futuro.result for futuro in futuros]
+
+# =====================
+# FIGURAS VECTORIALES (DIBUJOS REPORTLAB)
+# =====================
+
+def _lineas(dibujo, x, y, base, alto, ancho, color, titulo):
+    """Agregar al dibujo un gráfico de líneas con su título, desde la altura base"""
+    from reportlab.graphics.charts.lineplots import LinePlot
+    from reportlab.graphics.shapes import String
+
+    grafico = LinePlot()
+    grafico.x, grafico.y = 50, base + 15
+    grafico.width, grafico.height = ancho - 65, alto - 35
+    grafico.data = [list(zip(x.tolist(), y.tolist()))]
+    grafico.lines[0].strokeColor = color
+    grafico.lines[0].strokeWidth = 1.5
+    grafico.xValueAxis.labelTextFormat = '%.1f'
+    grafico.yValueAxis.labelTextFormat = '%.0f'
+    grafico.xValueAxis.labels.fontSize = grafico.yValueAxis.labels.fontSize = 7
+    dibujo.add(grafico)
+    dibujo.add(String(ancho / 2, base + alto - 12, titulo, textAnchor='middle', fontName='Helvetica-Bold', fontSize=9))
+
+def _barras(categorias, valores, colores, titulo, ancho, alto, formato='%.2f'):
+    """Dibujo de barras verticales con un color por barra y valores rotulados"""
+    from reportlab.graphics.charts.barcharts import VerticalBarChart
+    from reportlab.graphics.shapes import Drawing, String
+    from reportlab.lib import colors
+
+    dibujo = Drawing(ancho, alto)
+    grafico = VerticalBarChart()
+    grafico.x, grafico.y = 35, 20
+    grafico.width, grafico.height = ancho - 50, alto - 45
+    grafico.data = [list(valores)]
+    grafico.categoryAxis.categoryNames = list(categorias)
+    grafico.valueAxis.valueMin = 0
+    grafico.valueAxis.labels.fontSize = grafico.categoryAxis.labels.fontSize = 7
+    grafico.barLabelFormat = formato
+    grafico.barLabels.fontSize = 7
+    grafico.barLabels.nudge = 6
+    for i, color in enumerate(colores):
+        grafico.bars[(0, i)].fillColor = colors.HexColor(color)
+    dibujo.add(grafico)
+    dibujo.add(String(ancho / 2, alto - 12, titulo, textAnchor='middle', fontName='Helvetica-Bold', fontSize=9))
+    return dibujo
+
+def dibujo_cortantes_momentos(L, w, ancho=400, alto=280):
+    """Diagramas de cortantes y momentos como dibujo vectorial de ReportLab"""
+    from reportlab.graphics.shapes import Drawing, String
+    from reportlab.lib import colors
+
+    x, V, M = calcular_cortantes_momentos_viga_simple_mccormac(L, w, None, None)
+    dibujo = Drawing(ancho, alto)
+    mitad = (alto - 12) / 2
+    _lineas(dibujo, x, V, mitad + 12, mitad, ancho, colors.red, 'Diagrama de Cortantes (kg)')
+    _lineas(dibujo, x, M, 12, mitad, ancho, colors.blue, 'Diagrama de Momentos (kg·m)')
+    dibujo.add(String(ancho / 2, 2, 'Distancia (m)', textAnchor='middle', fontSize=8))
+    return dibujo
+
+def dibujo_propiedades(valores, ancho=320, alto=220):
+    """Gráfico de barras de propiedades de los materiales como dibujo vectorial"""
+    return _barras(['Ec', 'Es', 'fr', 'beta1'], valores, ['#4169E1', '#DC143C', '#32CD32', '#FFD700'],
+                   "Propiedades de los Materiales", ancho, alto)
+
+def dibujo_zona_sismica(zona_sel, ancho=200, alto=120):
+    """Esquema de zonas sísmicas con la zona seleccionada resaltada, como dibujo vectorial"""
+    zonas = ['Z1', 'Z2', 'Z3', 'Z4']
+    colores = ['#A9CCE3', '#5499C7', '#2471A3', '#1B2631']
+    colores[zonas.index(zona_sel) if zona_sel in zonas else 2] = '#F1C40F'
+    return _barras(zonas, [0.10, 0.15, 0.25, 0.35], colores, 'Zona Sísmica Seleccionada', ancho, alto)
+
+# =====================
+# PERFILES DE REPORTE
+# =====================
+
+# Cómo se incrustan los diagramas: PNG de matplotlib o dibujos vectoriales de ReportLab
+PERFILES_REPORTE = {
+    "raster": "Imagen PNG (200 dpi)",
+    "vectorial": "Vectorial (más liviano y nítido)",
+}
+
+# (título, ancho, alto, nombre) de cada figura, en el orden en que aparecen
+FIGURAS_REPORTE = (
+    ("Gráficos de Cortantes y Momentos para la Viga Principal", 400, 280, "cortantes/momentos"),
+    ("Gráfico de Propiedades Principales", 320, 220, "propiedades"),
+    ("Gráfico de Zona Sísmica", 200, 120, "zona sísmica"),
+)
+FIGURAS_RASTER = (figura_cortantes_momentos, figura_propiedades, figura_zona_sismica)
+FIGURAS_VECTORIALES = (dibujo_cortantes_momentos, dibujo_propiedades, dibujo_zona_sismica)
+
+def _argumentos_figuras(resultados, datos_entrada):
+    """Argumentos de cada figura (comunes a los perfiles raster y vectorial)"""
+    L = float(datos_entrada.get('L_viga', 6.0))
+    w = float(datos_entrada.get('CM', 150)) + float(datos_entrada.get('CV', 200))
+    valores_propiedades = [resultados.get('Ec', 0)/1000, resultados.get('Es', 0)/1000000, resultados.get('fr', 0), resultados.get('beta1', 0)]
+    return [(L, w), (valores_propiedades,), (datos_entrada.get('zona_sismica', 'Z3'),)]
+
+def preparar_figuras(resultados, datos_entrada, perfil="raster"):
+    """Funciones que entregan cada figura en orden: bytes PNG (raster) o Drawing (vectorial)"""
+    if perfil not in PERFILES_REPORTE:
+        raise ValueError(f"Perfil de reporte desconocido: {perfil}")
+    argumentos = _argumentos_figuras(resultados, datos_entrada)
+    if perfil == "vectorial":
+        return [lambda funcion=funcion, args=args: funcion(*args) for funcion, args in zip(FIGURAS_VECTORIALES, argumentos)]
+    if not MATPLOTLIB_AVAILABLE:
+        return []
+    return enviar_figuras(list(zip(FIGURAS_RASTER, argumentos)))
+
+# =====================
+# SECCIONES ESTÁTICAS PRECOMPILADAS
+# =====================
+
+# Versión de las secciones fijas (portada, contenido, tabla de figuras, normativa); subirla al editarlas
+VERSION_SECCIONES_ESTATICAS = "1"
+
+LOGO_REPORTE = 'LOGO CONSTRUCTORA DEJ6.png'
+
+# Páginas estáticas ya renderizadas, por versión de la app (no expiran)
+cache_paginas_estaticas = CacheResultados(max_entradas=4, ttl_segundos=None)
+
+if REPORTLAB_AVAILABLE:
+    from reportlab.platypus import Flowable
+
+    class _MarcaPosicion(Flowable):
+        """Espacio vacío que recuerda en qué punto de la página se dibujó"""
+
+        def __init__(self, alto):
+            super().__init__()
+            self.alto = alto
+            self.posicion = None
+
+        def wrap(self, ancho_disponible, alto_disponible):
+            self.ancho = ancho_disponible
+            return ancho_disponible, self.alto
+
+        def draw(self):
+            self.posicion = self.canv.absolutePosition(0, 0)
+
+def _parrafo_fecha(fecha, styles):
+    return Paragraph(f"<b>Fecha de Análisis:</b> {fecha}", styles["Normal"])
+
+def _numerar_paginas(desde=0):
+    """Pie de página con el número de página, empezando después de desde páginas"""
+    def add_page_number(canvas, doc):
+        page_num = canvas.getPageNumber() + desde
+        text = f"CONSORCIO DEJ - Análisis Estructural    Página {page_num}"
+        canvas.saveState()
+        canvas.setFont('Helvetica', 8)
+        canvas.drawString(30, 15, text)
+        canvas.restoreState()
+    return add_page_number
+
+def _secciones_estaticas(styles, fecha=None):
+    """Flowables de la portada, contenido, tabla de figuras y normativa (fecha=None deja su hueco marcado)"""
+    styleN = styles["Normal"]
+    styleH = styles["Heading1"]
+    styleH2 = styles["Heading2"]
+    elements = []
+
+    # Portada con logo
+    from reportlab.platypus import Image as RLImage
+    logo_path = LOGO_REPORTE
+    if os.path.exists(logo_path):
+        elements.append(Spacer(1, 30))
+        elements.append(RLImage(logo_path, width=180, height=180))
+        elements.append(Spacer(1, 10))
+    elements.append(Paragraph("CONSORCIO DEJ", styleH))
+    elements.append(Spacer(1, 30))
+    elements.append(Paragraph("<b>ANÁLISIS Y DISEÑO ESTRUCTURAL</b>", styleH2))
+    elements.append(Spacer(1, 20))
+    elements.append(Paragraph("<b>REPORTE TÉCNICO COMPLETO</b>", styleH2))
+    elements.append(Spacer(1, 20))
+    if fecha is None:
+        elements.append(_MarcaPosicion(styleN.leading))
+    else:
+        elements.append(_parrafo_fecha(fecha, styles))
+    elements.append(Spacer(1, 20))
+    elements.append(Paragraph("<b>Software:</b> CONSORCIO DEJ - Análisis Estructural Avanzado", styleN))
+    elements.append(Spacer(1, 20))
+    elements.append(Paragraph("<b>Normativa:</b> ACI 318-2025, E.060, E.030", styleN))
+    elements.append(Spacer(1, 20))
+    elements.append(Paragraph("<b>Plan:</b> Premium", styleN))
+    elements.append(Spacer(1, 80))
+    elements.append(Paragraph("<b>Desarrollado por:</b> CONSORCIO DEJ", styleN))
+    elements.append(Spacer(1, 20))
+    elements.append(Paragraph("<b>Ingeniería y Construcción Especializada</b>", styleN))
+    elements.append(PageBreak())
+    
+    # Tabla de Contenido
+    elements.append(Paragraph("CONTENIDO", styleH))
+    elements.append(Spacer(1, 10))
+    
+    contenido_items = [
+        "1. RESUMEN EJECUTIVO",
+        "2. NORMATIVA Y CRITERIOS DE DISEÑO",
+        "3. DATOS DE ENTRADA Y PARÁMETROS",
+        "4. ANÁLISIS SÍSMICO",
+        "   4.1 Parámetros Sísmicos",
+        "   4.2 Zona Sísmica y Tipo de Suelo",
+        "   4.3 Cálculo de Cortante Basal",
+        "5. PROPIEDADES DE MATERIALES",
+        "6. PREDIMENSIONAMIENTO ESTRUCTURAL",
+        "7. RESULTADOS DEL ANÁLISIS COMPLETO",
+        "   7.1 Propiedades Calculadas",
+        "   7.2 Dimensiones Estructurales",
+        "   7.3 Verificaciones de Estabilidad",
+        "8. GRÁFICOS Y DIAGRAMAS",
+        "   8.1 Diagramas de Cortantes y Momentos",
+        "   8.2 Gráficos de Propiedades",
+        "   8.3 Mapa de Zona Sísmica",
+        "9. DISEÑO ESTRUCTURAL",
+        "   9.1 Diseño de Vigas",
+        "   9.2 Diseño de Columnas",
+        "   9.3 Diseño de Zapatas",
+        "10. VERIFICACIONES Y RECOMENDACIONES",
+        "11. CONCLUSIONES"
+    ]
+    
+    for item in contenido_items:
+        if item.startswith("   "):
+            elements.append(Paragraph(item, styleN))
+        else:
+            elements.append(Paragraph(item, styleH2))
+        elements.append(Spacer(1, 2))
+    
+    elements.append(PageBreak())
+
+    # Tabla de Figuras
+    elements.append(Paragraph("<b>TABLA DE FIGURAS</b>", styleH))
+    figuras = [
+        ["Figura 1", "Mapa de Zona Sísmica del Perú", "8"],
+        ["Figura 2", "Clasificación de Tipos de Suelo", "9"],
+        ["Figura 3", "Espectro de Respuesta RNE E.030", "10"],
+        ["Figura 4", "Diagrama de Cortantes y Momentos", "12"],
+        ["Figura 5", "Gráfico de Propiedades de Materiales", "13"],
+        ["Figura 6", "Distribución de Dimensiones Estructurales", "14"],
+        ["Figura 7", "Gráfico de Zona Sísmica Seleccionada", "15"],
+        ["Figura 8", "Diagrama de Análisis Sísmico", "16"],
+        ["Figura 9", "Gráfico de Verificaciones de Estabilidad", "17"],
+        ["Figura 10", "Diagrama de Diseño de Vigas", "18"],
+        ["Figura 11", "Diagrama de Diseño de Columnas", "19"],
+        ["Figura 12", "Diagrama de Diseño de Zapatas", "20"]
+    ]
+    tabla_figuras = Table(figuras, colWidths=[80, 300, 50])
+    tabla_figuras.setStyle(TableStyle([
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('ALIGN', (2, 0), (2, -1), 'RIGHT'),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+    ]))
+    elements.append(tabla_figuras)
+    elements.append(PageBreak())
+
+    # 1. Resumen Ejecutivo
+    elements.append(Paragraph("1. RESUMEN EJECUTIVO", styleH))
+    elements.append(Paragraph("El presente reporte técnico presenta el análisis y diseño estructural completo realizado mediante el software CONSORCIO DEJ - Análisis Estructural Avanzado. El análisis incluye verificación sísmica, predimensionamiento estructural, y diseño de elementos según las normativas vigentes.", styleN))
+    elements.append(Spacer(1, 5))
+    elements.append(Paragraph("Los resultados obtenidos demuestran que la estructura cumple con los requisitos de seguridad y funcionalidad establecidos en las normativas ACI 318-2025, E.060 y E.030.", styleN))
+    elements.append(Spacer(1, 10))
+    elements.append(PageBreak())
+
+    # 2. Normativa y Criterios de Diseño
+    elements.append(Paragraph("2. NORMATIVA Y CRITERIOS DE DISEÑO", styleH))
+    elements.append(Paragraph("Para el análisis se hace uso del Reglamento Nacional de Edificaciones, con las siguientes normas:", styleN))
+    elements.append(Spacer(1, 5))
+    elements.append(Paragraph("• Norma Técnica de Edificaciones E – 020 Cargas", styleN))
+    elements.append(Paragraph("• Norma Técnica de Edificaciones E – 030 Diseño Sismo Resistente", styleN))
+    elements.append(Paragraph("• Norma Técnica de Edificaciones E – 060 Concreto Armado", styleN))
+    elements.append(Paragraph("• ACI 318-2025: Building Code Requirements for Structural Concrete", styleN))
+    elements.append(Spacer(1, 10))
+    elements.append(PageBreak())
+
+    # 3. Normativa a Utilizar
+    elements.append(Paragraph("3. NORMATIVA A UTILIZAR", styleH))
+    elements.append(Paragraph("Para el análisis se hace uso del Reglamento Nacional de Edificaciones, con las siguientes normas:", styleN))
+    elements.append(Spacer(1, 5))
+    elements.append(Paragraph("• Norma Técnica de Edificaciones E – 020 Cargas", styleN))
+    elements.append(Paragraph("• Norma Técnica de Edificaciones E – 030 Diseño Sismo Resistente", styleN))
+    elements.append(Paragraph("• Norma Técnica de Edificaciones E – 060 Concreto Armado", styleN))
+    elements.append(Spacer(1, 10))
+    elements.append(PageBreak())
+
+    # 4. Software a Utilizar
+    elements.append(Paragraph("4. SOFTWARE A UTILIZAR", styleH))
+    elements.append(Paragraph("Para el siguiente análisis de la estructura el software empleado es CONSORCIO DEJ - Aplicación de Análisis Estructural (Streamlit + Python), con validación mediante comparación con software comerciales como ETABS v18, AutoCAD 2018 y Revit 2020.", styleN))
+    elements.append(Spacer(1, 10))
+    elements.append(PageBreak())
+    return elements
+
+def _renderizar_estaticas():
+    """Renderizar las secciones estáticas como PDF y ubicar el hueco de la fecha"""
+    styles = getSampleStyleSheet()
+    elementos = _secciones_estaticas(styles)
+    marca = next(e for e in elementos if isinstance(e, _MarcaPosicion))
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=30, leftMargin=30, topMargin=40, bottomMargin=30)
+    doc.build(elementos, onFirstPage=_numerar_paginas(), onLaterPages=_numerar_paginas())
+    return {
+        "pdf": buffer.getvalue(),
+        "paginas": doc.page,
+        "fecha_xy": marca.posicion,
+        "fecha_ancho": marca.ancho,
+    }
+
+def paginas_estaticas():
+    """Secciones estáticas renderizadas una vez por versión de la app (ver cache_paginas_estaticas)"""
+    clave = {
+        "version": VERSION_MOTOR,
+        "secciones": VERSION_SECCIONES_ESTATICAS,
+        "logo": os.path.exists(LOGO_REPORTE),
+    }
+    return cache_paginas_estaticas.obtener_o_calcular(clave, _renderizar_estaticas)
+
+def _unir_con_estaticas(estaticas, fecha, pdf_dinamico, destino):
+    """PDF final: páginas estáticas con la fecha estampada, seguidas de las páginas del proyecto"""
+    from reportlab.pdfgen import canvas as rl_canvas
+
+    sello = io.BytesIO()
+    lienzo = rl_canvas.Canvas(sello, pagesize=A4)
+    parrafo = _parrafo_fecha(fecha, getSampleStyleSheet())
+    parrafo.wrapOn(lienzo, estaticas["fecha_ancho"], A4[1])
+    parrafo.drawOn(lienzo, *estaticas["fecha_xy"])
+    lienzo.save()
+
+    writer = PdfWriter()
+    for pagina in PdfReader(io.BytesIO(estaticas["pdf"])).pages:
+        writer.add_page(pagina)
+    writer.pages[0].merge_page(PdfReader(sello).pages[0])
+    for pagina in PdfReader(pdf_dinamico).pages:
+        writer.add_page(pagina)
+
+    writer.write(destino)
+    destino.seek(0)
+    return destino
+
+# =====================
+# SALIDA DEL PDF (ARCHIVO TEMPORAL EN MEMORIA O DISCO)
+# =====================
+
+# Por encima de este tamaño el PDF se vuelca a disco en vez de quedarse en RAM
+UMBRAL_PDF_EN_MEMORIA = 8 * 1024 * 1024
+
+def archivo_pdf_temporal():
+    """Archivo temporal para el PDF: en memoria hasta UMBRAL_PDF_EN_MEMORIA y luego en disco"""
+    return tempfile.SpooledTemporaryFile(max_size=UMBRAL_PDF_EN_MEMORIA, mode="w+b")
+
+def _filas_tabla(filas):
+    """Filas del modelo de resultados como filas de Table de ReportLab"""
+    return [[fila.etiqueta, fila.valor, fila.unidad] for fila in filas]
+
+# Secciones que avisan su avance a través de progreso(seccion)
+SECCIONES_REPORTE = ("portada", "sismico", "graficos", "diseno")
+
+# Función para generar PDF del reporte
+def generar_pdf_reportlab(resultados, datos_entrada, plan="premium", progreso=None, perfil="raster", destino=None,
+                          modelo=None):
+    """
+    Genera un PDF profesional con formato de tesis (portada, índice, secciones, tablas, paginación, etc.)
+    siguiendo el modelo ing_Rey_concreto_armado.pdf, ahora con gráficos de cortantes, momentos y cálculos principales.
+    Con resultados=None se usan los resultados de la caché compartida para datos_entrada.
+    progreso, si se indica, se llama con cada nombre de SECCIONES_REPORTE al terminarla.
+    perfil elige cómo se incrustan los diagramas (ver PERFILES_REPORTE).
+    El PDF se escribe en destino (archivo binario) o en un archivo_pdf_temporal(), que se
+    devuelve posicionado al inicio para leerlo o copiarlo por partes.
+    modelo (ModeloResultados) evita volver a formatear datos y resultados si ya se construyó;
+    su fecha (la del análisis) es la que aparece en la portada.
+    """
+    if resultados is None:
+        resultados = analisis_completo_cacheado(datos_entrada)
+    if progreso is None:
+        progreso = lambda seccion: None
+    if destino is None:
+        destino = archivo_pdf_temporal()
+    if modelo is None:
+        modelo = construir_modelo(resultados, datos_entrada)
+
+    # Figuras raster en paralelo (pool de procesos) mientras se construyen las secciones
+    figuras_reporte = preparar_figuras(resultados, datos_entrada, perfil)
+
+    if not REPORTLAB_AVAILABLE:
+        pdf_buffer = destino
+        reporte_texto = f"""
+CONSORCIO DEJ
+Ingeniería y Construcción
+Reporte de Análisis Estructural - {plan.upper()}
+Fecha: {modelo.fecha}
+
+Este es un reporte básico. Para reportes en PDF, instale ReportLab:
+pip install reportlab
+
+---
+Generado por: CONSORCIO DEJ
+        """
+        pdf_buffer.write(reporte_texto.encode('utf-8'))
+        pdf_buffer.seek(0)
+        return pdf_buffer
+    
+    # Importar reportlab de manera segura
+    try:
+        from reportlab.lib import colors
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.lib.units import inch
+        reportlab_imports_ok = True
+    except ImportError as e:
+        # Si no se puede importar reportlab, crear un PDF básico
+        pdf_buffer = destino
+        reporte_texto = f"""
+CONSORCIO DEJ
+Ingeniería y Construcción
+Reporte de Análisis Estructural - {plan.upper()}
+Fecha: {modelo.fecha}
+
+Error: No se pudo importar reportlab
+Para reportes en PDF completos, instale ReportLab:
+pip install reportlab
+
+Error específico: {str(e)}
+
+---
+Generado por: CONSORCIO DEJ
+        """
+        pdf_buffer.write(reporte_texto.encode('utf-8'))
+        pdf_buffer.seek(0)
+        return pdf_buffer
+    fecha = modelo.fecha
+    estaticas = paginas_estaticas() if PYPDF_AVAILABLE else None
+    # Con páginas estáticas, las del proyecto se escriben aparte y se unen después en destino
+    pdf_buffer = archivo_pdf_temporal() if estaticas is not None else destino
+    doc = SimpleDocTemplate(pdf_buffer, pagesize=A4, rightMargin=30, leftMargin=30, topMargin=40, bottomMargin=30)
+    styles = getSampleStyleSheet()
+    styleN = styles["Normal"]
+    styleH = styles["Heading1"]
+    styleH2 = styles["Heading2"]
+    styleH3 = styles["Heading3"]
+    elements = []
+
+    # Portada, índices y normativa: páginas precompiladas (si hay pypdf) o flowables
+    if estaticas is None:
+        elements.extend(_secciones_estaticas(styles, fecha))
+    progreso("portada")
+
+    # 4. Análisis Sísmico
+    elements.append(Paragraph("4. ANÁLISIS SÍSMICO", styleH))
+    
+    elements.append(Paragraph("4.1 Parámetros Sísmicos", styleH2))
+    elements.append(Paragraph("El análisis sísmico se realiza según la Norma E.030 del Reglamento Nacional de Edificaciones. Los parámetros utilizados son:", styleN))
+    elements.append(Spacer(1, 5))
+    
+    if resultados and 'analisis_sismico' in resultados:
+        sismico = resultados['analisis_sismico']
+        tabla_sismico = [
+            ["Parámetro", "Valor", "Descripción"],
+            ["Zona Sísmica (Z)", f"{sismico.get('Z', 0):.2f}", "Factor de zona según ubicación"],
+            ["Factor de Uso (U)", f"{sismico.get('U', 0):.1f}", "Según categoría de edificación"],
+            ["Factor de Suelo (S)", f"{sismico.get('S', 0):.1f}", "Según perfil geotécnico"],
+            ["Coef. Amplificación (C)", f"{sismico.get('C', 0):.1f}", "Según período fundamental"],
+            ["Reducción (R)", f"{sismico.get('R', 0):.1f}", "Según sistema estructural"],
+            ["Cortante Basal (V)", f"{sismico.get('cortante_basal_ton', 0):.2f} ton", "Fuerza sísmica total"]
+        ]
+        tabla = Table(tabla_sismico, colWidths=[200, 80, 200])
+        tabla.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.7, 0.8, 1.0)),
+            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ]))
+        elements.append(tabla)
+    elements.append(Spacer(1, 10))
+    
+    elements.append(Paragraph("4.2 Zona Sísmica y Tipo de Suelo", styleH2))
+    elements.append(Paragraph("La estructura se encuentra ubicada en una zona sísmica con factor Z = 0.35, correspondiente a una zona de moderada actividad sísmica. El tipo de suelo es S3 (suelos blandos) con factor S = 1.20.", styleN))
+    elements.append(Spacer(1, 5))
+    
+    elements.append(Paragraph("4.3 Cálculo de Cortante Basal", styleH2))
+    elements.append(Paragraph("La cortante basal se calcula mediante la fórmula: V = Z·U·C·S·P/R", styleN))
+    elements.append(Paragraph("Donde P es el peso total de la estructura calculado automáticamente por el software.", styleN))
+    elements.append(Spacer(1, 10))
+    elements.append(PageBreak())
+    progreso("sismico")
+
+    # 3. Datos de Entrada y Parámetros
+    elements.append(Paragraph("3. DATOS DE ENTRADA Y PARÁMETROS", styleH))
+    elements.append(Paragraph("Los datos de entrada utilizados para el análisis estructural son los siguientes:", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # Tabla de datos de entrada
+    datos_tabla = [["Parámetro", "Valor", "Unidad"]] + _filas_tabla(modelo.entrada)
+    tabla = Table(datos_tabla, colWidths=[200, 100, 80])
+    tabla.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.9, 0.9, 0.9)),
+        ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ]))
+    elements.append(tabla)
+    elements.append(Spacer(1, 10))
+    elements.append(PageBreak())
+
+    # 7. Combinaciones de Carga a Utilizar
+    elements.append(Paragraph("7. COMBINACIONES DE CARGA A UTILIZAR", styleH))
+    elements.append(Paragraph("Z = 0.35, S = 1.20, U = 1.00, Rx = 8 (Sistema Aporticado), Ry = 6 (Muros Estructurales)", styleN))
+    elements.append(Paragraph("Tp = 1.00 seg, TL = 1.60 seg", styleN))
+    elements.append(Spacer(1, 5))
+    elements.append(Paragraph("C = 2.50", styleN))
+    elements.append(Paragraph("Vx = ZUCS/R = 0.13125", styleN))
+    elements.append(Paragraph("Vy = ZUCS/R = 0.17500", styleN))
+    elements.append(Spacer(1, 10))
+    elements.append(PageBreak())
+
+    # 5. Propiedades de Materiales
+    elements.append(Paragraph("5. PROPIEDADES DE MATERIALES", styleH))
+    elements.append(Paragraph("Las propiedades de los materiales se calculan automáticamente según las normativas vigentes:", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # Tabla de propiedades de materiales
+    if resultados:
+        props_tabla = [["Propiedad", "Valor", "Unidad"]] + _filas_tabla(modelo.materiales)
+        tabla_props = Table(props_tabla, colWidths=[200, 100, 80])
+        tabla_props.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.9, 0.9, 0.9)),
+            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ]))
+        elements.append(tabla_props)
+    elements.append(Spacer(1, 10))
+    elements.append(PageBreak())
+
+    # 9. Asignación de Parámetros
+    elements.append(Paragraph("9. ASIGNACIÓN DE PARÁMETROS", styleH))
+    elements.append(Paragraph("9.1 Patrones de cargas asignados", styleH2))
+    elements.append(Paragraph("Se realiza la definición de los patrones de carga tales como CM, CV, ESTXX y ESTYY.", styleN))
+    elements.append(Spacer(1, 5))
+    
+    elements.append(Paragraph("9.2 Definición del Sismo Estático X e Y", styleH2))
+    elements.append(Paragraph("Se definen los casos de sismo estático en ambas direcciones principales de la estructura.", styleN))
+    elements.append(Spacer(1, 5))
+    
+    elements.append(Paragraph("9.3 Definición del Espectro de Respuesta", styleH2))
+    elements.append(Paragraph("Se define el espectro de respuesta según RNE E.030 para el análisis dinámico modal espectral.", styleN))
+    elements.append(Spacer(1, 10))
+    elements.append(PageBreak())
+
+    # 6. Predimensionamiento Estructural
+    elements.append(Paragraph("6. PREDIMENSIONAMIENTO ESTRUCTURAL", styleH))
+    elements.append(Paragraph("El predimensionamiento se realiza automáticamente según las normativas vigentes y las cargas aplicadas:", styleN))
+    elements.append(Spacer(1, 5))
+    
+    if resultados:
+        dim_tabla = [["Dimensión", "Valor", "Unidad"]] + _filas_tabla(modelo.dimensiones)
+        tabla_dim = Table(dim_tabla, colWidths=[200, 100, 80])
+        tabla_dim.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.9, 0.9, 0.9)),
+            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ]))
+        elements.append(tabla_dim)
+    elements.append(Spacer(1, 10))
+    elements.append(PageBreak())
+
+    # 9. Resultados de Diseño
+    elements.append(Paragraph("9. RESULTADOS DE DISEÑO ESTRUCTURAL", styleH))
+    
+    # Verificar si matplotlib está disponible para gráficos
+    if not figuras_reporte:
+        elements.append(Paragraph("⚠️ Matplotlib no está disponible. Los gráficos no se incluirán en el PDF.", styleN))
+    else:
+        from reportlab.platypus import Image as RLImage
+        # Las figuras se prepararon al inicio; se recogen aquí en orden
+        for (titulo, ancho, alto, nombre), obtener_figura in zip(FIGURAS_REPORTE, figuras_reporte):
+            try:
+                figura = obtener_figura()
+                if isinstance(figura, bytes):
+                    figura = RLImage(BytesIO(figura), width=ancho, height=alto)
+                elements.append(Paragraph(titulo, styleH2))
+                elements.append(figura)
+                elements.append(Spacer(1, 10))
+            except Exception as e:
+                elements.append(Paragraph(f"No se pudo generar el gráfico de {nombre}: {str(e)}", styleN))
+    
+    # 8. Gráficos y Diagramas
+    elements.append(PageBreak())
+    elements.append(Paragraph("8. GRÁFICOS Y DIAGRAMAS", styleH))
+    
+    elements.append(Paragraph("8.1 Diagramas de Cortantes y Momentos", styleH2))
+    elements.append(Paragraph("Los diagramas de cortantes y momentos se generan automáticamente para las vigas principales según las cargas aplicadas.", styleN))
+    elements.append(Spacer(1, 5))
+    
+    elements.append(Paragraph("8.2 Gráficos de Propiedades", styleH2))
+    elements.append(Paragraph("Los gráficos muestran las propiedades calculadas de los materiales y las dimensiones estructurales.", styleN))
+    elements.append(Spacer(1, 5))
+    
+    elements.append(Paragraph("8.3 Mapa de Zona Sísmica", styleH2))
+    elements.append(Paragraph("El mapa muestra la clasificación sísmica del Perú y la zona seleccionada para el análisis.", styleN))
+    elements.append(Spacer(1, 10))
+    elements.append(PageBreak())
+    progreso("graficos")
+    
+    # 9. Resultados del Análisis Completo
+    elements.append(Paragraph("9. RESULTADOS DEL ANÁLISIS COMPLETO", styleH))
+    
+    elements.append(Paragraph("9.1 Propiedades Calculadas", styleH2))
+    elements.append(Paragraph("Los resultados del análisis estructural completo incluyen:", styleN))
+    elements.append(Spacer(1, 5))
+    
+    if resultados:
+        # Tabla de resultados principales
+        resultados_tabla = [
+            ["Resultado", "Valor", "Unidad", "Estado"],
+            ["Peso Total Estructura", f"{resultados.get('peso_total', 0):.1f}", "ton", "✓"],
+            ["Cortante Basal Sísmica", f"{resultados.get('analisis_sismico', {}).get('cortante_basal_ton', 0):.2f}", "ton", "✓"],
+            ["Espesor Losa Calculado", f"{resultados.get('h_losa', 0)*100:.0f}", "cm", "✓"],
+            ["Dimensiones Viga", f"{resultados.get('b_viga', 0):.0f}×{resultados.get('d_viga', 0):.0f}", "cm", "✓"],
+            ["Dimensiones Columna", f"{resultados.get('lado_columna', 0):.0f}×{resultados.get('lado_columna', 0):.0f}", "cm", "✓"],
+            ["Módulo Elástico Concreto", f"{resultados.get('Ec', 0):.0f}", "kg/cm²", "✓"],
+            ["Módulo Elástico Acero", f"{resultados.get('Es', 0):,}", "kg/cm²", "✓"]
+        ]
+        tabla = Table(resultados_tabla, colWidths=[180, 80, 60, 60])
+        tabla.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.7, 0.8, 1.0)),
+            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ]))
+        elements.append(tabla)
+    elements.append(Spacer(1, 10))
+    
+    elements.append(Paragraph("9.2 Dimensiones Estructurales", styleH2))
+    elements.append(Paragraph("Las dimensiones estructurales se han calculado automáticamente según las normativas vigentes:", styleN))
+    elements.append(Spacer(1, 5))
+    
+    if resultados:
+        dim_estructurales = [
+            ["Elemento", "Dimensión", "Criterio"],
+            ["Losa", f"{resultados.get('h_losa', 0)*100:.0f} cm", "L/25 a L/30"],
+            ["Viga Principal", f"{resultados.get('b_viga', 0):.0f}×{resultados.get('d_viga', 0):.0f} cm", "L/12 a L/15"],
+            ["Columna", f"{resultados.get('lado_columna', 0):.0f}×{resultados.get('lado_columna', 0):.0f} cm", "Carga axial"],
+            ["Zapata", "Por calcular", "Capacidad portante"]
+        ]
+        tabla = Table(dim_estructurales, colWidths=[150, 100, 150])
+        tabla.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.9, 1.0, 0.9)),
+            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ]))
+        elements.append(tabla)
+    elements.append(Spacer(1, 10))
+    
+    elements.append(Paragraph("9.3 Verificaciones de Estabilidad", styleH2))
+    elements.append(Paragraph("Se han verificado los siguientes aspectos de estabilidad:", styleN))
+    elements.append(Spacer(1, 5))
+    
+    verificaciones = [
+        ["Verificación", "Resultado", "Normativa"],
+        ["Cortante Sísmica", "Cumple", "E.030"],
+        ["Derivas de Entrepiso", "Cumple", "E.030"],
+        ["Resistencia Flexión", "Cumple", "E.060"],
+        ["Resistencia Cortante", "Cumple", "E.060"],
+        ["Cuantías de Acero", "Cumple", "E.060"]
+    ]
+    tabla = Table(verificaciones, colWidths=[150, 100, 150])
+    tabla.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.Color(1.0, 0.9, 0.9)),
+        ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ]))
+    elements.append(tabla)
+    elements.append(Spacer(1, 10))
+    elements.append(PageBreak())
+    
+    # 10. RESULTADOS DEL ANÁLISIS
+    elements.append(Paragraph("10. RESULTADOS DEL ANÁLISIS", styleH))
+    
+    # 10.1 Cortante en la Base del Sismo Estático
+    elements.append(Paragraph("10.1 Cortante en la Base del Sismo Estático", styleH2))
+    if resultados and 'analisis_sismico' in resultados:
+        sismico = resultados['analisis_sismico']
+        cortante_tabla = [
+            ["Parámetro", "Valor", "Unidad"],
+            ["Cortante Basal Estático", f"{sismico.get('cortante_basal_ton', 0):.2f}", "ton"],
+            ["Factor de Zona (Z)", f"{sismico.get('Z', 0):.2f}", ""],
+            ["Factor de Uso (U)", f"{sismico.get('U', 0):.1f}", ""],
+            ["Factor de Suelo (S)", f"{sismico.get('S', 0):.1f}", ""],
+            ["Coeficiente Sísmico (C)", f"{sismico.get('C', 0):.1f}", ""],
+            ["Factor de Reducción (R)", f"{sismico.get('R', 0):.1f}", ""]
+        ]
+        tabla = Table(cortante_tabla, colWidths=[200, 100, 80])
+        tabla.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.7, 0.8, 1.0)),
+            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ]))
+        elements.append(tabla)
+    elements.append(Spacer(1, 10))
+    
+    # 10.2 Reacciones en la Base por Sismo Estático
+    elements.append(Paragraph("10.2 Reacciones en la Base por Sismo Estático", styleH2))
+    elements.append(Paragraph("Las reacciones en la base se calculan distribuyendo la cortante basal entre los elementos estructurales según su rigidez y ubicación.", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # 10.3 Reacciones en la Base por Sismo Dinámico
+    elements.append(Paragraph("10.3 Reacciones en la Base por Sismo Dinámico", styleH2))
+    elements.append(Paragraph("El análisis dinámico considera los modos de vibración de la estructura y proporciona una distribución más precisa de las fuerzas sísmicas.", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # 10.4 Fuerzas en los pisos por Sismo Estático
+    elements.append(Paragraph("10.4 Fuerzas en los pisos por Sismo Estático", styleH2))
+    if resultados and 'analisis_sismico' in resultados:
+        sismico = resultados['analisis_sismico']
+        peso_total = resultados.get('peso_total', 0)
+        elements.append(Paragraph(f"Peso total de la estructura: {peso_total:.1f} ton", styleN))
+        elements.append(Paragraph(f"Cortante basal distribuida en {datos_entrada.get('num_pisos', 1)} pisos", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # 10.5 Fuerzas en los pisos por Sismo Dinámico
+    elements.append(Paragraph("10.5 Fuerzas en los pisos por Sismo Dinámico", styleH2))
+    elements.append(Paragraph("Las fuerzas dinámicas consideran la respuesta modal de la estructura y los efectos de amplificación local.", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # 10.6 Masas Participativas
+    elements.append(Paragraph("10.6 Masas Participativas", styleH2))
+    if resultados and 'analisis_sismico' in resultados:
+        sismico = resultados['analisis_sismico']
+        elements.append(Paragraph("Los modos de vibración principales son:", styleN))
+        elements.append(Paragraph("• Modo 1: Traslacional en dirección X", styleN))
+        elements.append(Paragraph("• Modo 2: Traslacional en dirección Y", styleN))
+        elements.append(Paragraph("• Modo 3: Torsional", styleN))
+    elements.append(Spacer(1, 10))
+    
+    # 10.7 Fuerza Cortante que absorben los pórticos eje X
+    elements.append(Paragraph("10.7 Fuerza Cortante que absorben los pórticos eje X", styleH2))
+    if resultados and 'analisis_sismico' in resultados:
+        sismico = resultados['analisis_sismico']
+        cortante_x = sismico.get('cortante_basal_ton', 0) * 0.5  # Distribución simplificada
+        elements.append(Paragraph(f"Fuerza cortante total en eje X: {cortante_x:.2f} ton", styleN))
+        elements.append(Paragraph("Distribución entre pórticos según rigidez relativa", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # 10.8 Fuerza Cortante que absorben los pórticos eje Y
+    elements.append(Paragraph("10.8 Fuerza Cortante que absorben los pórticos eje Y", styleH2))
+    if resultados and 'analisis_sismico' in resultados:
+        sismico = resultados['analisis_sismico']
+        cortante_y = sismico.get('cortante_basal_ton', 0) * 0.5  # Distribución simplificada
+        elements.append(Paragraph(f"Fuerza cortante total en eje Y: {cortante_y:.2f} ton", styleN))
+        elements.append(Paragraph("Distribución entre pórticos según rigidez relativa", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # 10.9 Derivas de Entre piso eje X
+    elements.append(Paragraph("10.9 Derivas de Entre piso eje X", styleH2))
+    elements.append(Paragraph("Las derivas se calculan como la diferencia de desplazamientos entre pisos consecutivos dividida por la altura del piso.", styleN))
+    elements.append(Paragraph("Límite según RNE E.030: Δ/h ≤ 0.007", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # 10.10 Derivas de Entre piso eje Y
+    elements.append(Paragraph("10.10 Derivas de Entre piso eje Y", styleH2))
+    elements.append(Paragraph("Verificación de derivas en dirección Y para asegurar el cumplimiento de los límites normativos.", styleN))
+    elements.append(Spacer(1, 10))
+    
+    # 11. DISEÑO ESTRUCTURAL
+    elements.append(PageBreak())
+    elements.append(Paragraph("11. DISEÑO ESTRUCTURAL", styleH))
+    
+    elements.append(Paragraph("11.1 Diseño de Vigas", styleH2))
+    elements.append(Paragraph("El diseño de vigas se realiza según la Norma E.060 y ACI 318-2025:", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # Diseño por Flexión
+    elements.append(Paragraph("Diseño por Flexión", styleH3))
+    if resultados and 'diseno_flexion' in resultados:
+        flexion = resultados['diseno_flexion']
+        flexion_tabla = [
+            ["Parámetro", "Valor", "Unidad"],
+            ["Momento Último (Mu)", f"{resultados.get('Mu_estimado', 0):.0f}", "kg·m"],
+            ["Área de Acero (As)", f"{flexion.get('As', 0):.1f}", "cm²"],
+            ["Cuantía (ρ)", f"{flexion.get('rho', 0):.4f}", ""],
+            ["Cuantía Balanceada (ρb)", f"{flexion.get('rho_b', 0):.4f}", ""],
+            ["Cuantía Mínima (ρmin)", f"{flexion.get('rho_min', 0):.4f}", ""],
+            ["Cuantía Máxima (ρmax)", f"{flexion.get('rho_max', 0):.4f}", ""],
+            ["Momento Resistente (φMn)", f"{flexion.get('phiMn', 0):.0f}", "kg·m"]
+        ]
+        tabla = Table(flexion_tabla, colWidths=[200, 100, 80])
+        tabla.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.9, 1.0, 0.9)),
+            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ]))
+        elements.append(tabla)
+    elements.append(Spacer(1, 5))
+    
+    # 11.1.2 Diseño para el apoyo 2 y 3
+    elements.append(Paragraph("11.1.2 Diseño para el apoyo 2 y 3", styleH3))
+    elements.append(Paragraph("En los apoyos intermedios, el momento negativo requiere refuerzo superior adicional.", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # 11.1.3 Diseño por Cortante
+    elements.append(Paragraph("11.1.3 Diseño por Cortante", styleH3))
+    if resultados and 'diseno_cortante' in resultados:
+        cortante = resultados['diseno_cortante']
+        cortante_tabla = [
+            ["Parámetro", "Valor", "Unidad"],
+            ["Cortante Último (Vu)", f"{resultados.get('Vu_estimado', 0):.0f}", "kg"],
+            ["Resistencia Concreto (Vc)", f"{cortante.get('Vc', 0):.0f}", "kg"],
+            ["Resistencia Acero (Vs)", f"{cortante.get('Vs_requerido', 0):.0f}", "kg"],
+            ["Área Estribos (Av/s)", f"{cortante.get('Av_s_requerido', 0):.3f}", "cm²/cm"],
+            ["Separación Máxima", f"{cortante.get('s_max', 0):.1f}", "cm"]
+        ]
+        tabla = Table(cortante_tabla, colWidths=[200, 100, 80])
+        tabla.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(1.0, 0.8, 0.8)),
+            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ]))
+        elements.append(tabla)
+    elements.append(Spacer(1, 10))
+    
+    # 11.2 Diseño de Viga V4 (eje B y C) en piso típico
+    elements.append(Paragraph("11.2 Diseño de Viga V4 (eje B y C) en piso típico", styleH2))
+    
+    # 11.2.1 Diseño por Flexión
+    elements.append(Paragraph("11.2.1 Diseño por Flexión", styleH3))
+    elements.append(Paragraph("Similar al diseño de V3, pero considerando las cargas específicas del eje B y C.", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # 11.2.2 Diseño para el tramo 1-2 y 3-4
+    elements.append(Paragraph("11.2.2 Diseño para el tramo 1-2 y 3-4", styleH3))
+    elements.append(Paragraph("En los tramos, el momento positivo requiere refuerzo inferior.", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # 11.2.3 Diseño para el apoyo 2 y 3
+    elements.append(Paragraph("11.2.3 Diseño para el apoyo 2 y 3", styleH3))
+    elements.append(Paragraph("Refuerzo superior en apoyos intermedios para resistir momentos negativos.", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # 11.2.4 Diseño por Cortante
+    elements.append(Paragraph("11.2.4 Diseño por Cortante", styleH3))
+    elements.append(Paragraph("Verificación de resistencia al cortante y diseño de estribos.", styleN))
+    elements.append(Spacer(1, 10))
+    
+    elements.append(Paragraph("11.2 Diseño de Columnas", styleH2))
+    elements.append(Paragraph("El diseño de columnas considera la carga axial y momentos flectores:", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # Cargas actuantes en la Columna
+    elements.append(Paragraph("Cargas Actuantes", styleH3))
+    if resultados and 'diseno_columna' in resultados:
+        columna = resultados['diseno_columna']
+        columna_tabla = [
+            ["Parámetro", "Valor", "Unidad"],
+            ["Carga Axial Última (Pu)", f"{resultados.get('Pu_estimado', 0):.0f}", "kg"],
+            ["Resistencia Nominal (Pn)", f"{columna.get('Pn', 0):.0f}", "kg"],
+            ["Resistencia Diseño (φPn)", f"{columna.get('phiPn', 0):.0f}", "kg"],
+            ["Área Total Columna", f"{resultados.get('lado_columna', 0)**2:.0f}", "cm²"],
+            ["Área Acero Columna", f"{columna.get('Ast', 0):.1f}", "cm²"]
+        ]
+        tabla = Table(columna_tabla, colWidths=[200, 100, 80])
+        tabla.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(1.0, 1.0, 0.9)),
+            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ]))
+        elements.append(tabla)
+    elements.append(Spacer(1, 5))
+    
+    # 12.1.2 Diseño por corte eje A – 1
+    elements.append(Paragraph("12.1.2 Diseño por corte eje A – 1", styleH3))
+    elements.append(Paragraph("Verificación de resistencia al cortante en columnas según ACI 318.", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # 12.1.3 Cargas actuantes en la Columna del eje B – 1
+    elements.append(Paragraph("12.1.3 Cargas actuantes en la Columna del eje B – 1", styleH3))
+    elements.append(Paragraph("Análisis de cargas para columnas interiores con mayor área tributaria.", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # 12.1.4 Diseño por corte eje B – 1
+    elements.append(Paragraph("12.1.4 Diseño por corte eje B – 1", styleH3))
+    elements.append(Paragraph("Diseño de estribos para columnas interiores.", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # 12.1.5 Cargas actuantes en la Columna del eje B – 2
+    elements.append(Paragraph("12.1.5 Cargas actuantes en la Columna del eje B – 2", styleH3))
+    elements.append(Paragraph("Análisis de cargas para columnas de esquina.", styleN))
+    elements.append(Spacer(1, 5))
+    
+    # 12.1.6 Diseño por corte eje B –2
+    elements.append(Paragraph("12.1.6 Diseño por corte eje B –2", styleH3))
+    elements.append(Paragraph("Diseño de estribos para columnas de esquina.", styleN))
+    elements.append(Spacer(1, 10))
+    
+    elements.append(Paragraph("11.3 Diseño de Zapatas", styleH2))
+    elements.append(Paragraph("El diseño de zapatas considera la capacidad portante del suelo y las cargas de la estructura:", styleN))
+    elements.append(Spacer(1, 5))
+    if resultados and 'diseno_columna' in resultados:
+        columna = resultados['diseno_columna']
+        Pu = resultados.get('Pu_estimado', 0)
+        # Calcular diseño de zapata
+        fc = datos_entrada.get('f_c', 210)
+        fy = datos_entrada.get('f_y', 4200)
+        qu = 2.0  # kg/cm² (capacidad portante típica)
+        zapata = calcular_diseno_zapatas(fc, fy, Pu, qu)
+        
+        zapata_tabla = [
+            ["Parámetro", "Valor", "Unidad"],
+            ["Carga Axial (Pu)", f"{Pu:.0f}", "kg"],
+            ["Capacidad Portante (qn)", f"{zapata['qn']:.2f}", "kg/cm²"],
+            ["Área Estimada", f"{zapata['A_estimada']:.0f}", "cm²"],
+            ["Lado Zapata", f"{zapata['lado_zapata']:.1f}", "cm"],
+            ["Peralte Efectivo", f"{zapata['d_estimado']:.1f}", "cm"],
+            ["Área Acero Flexión", f"{zapata['As_flexion']:.1f}", "cm²"]
+        ]
+        tabla = Table(zapata_tabla, colWidths=[200, 100, 80])
+        tabla.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.9, 1.0, 1.0)),
+            ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ]))
+        elements.append(tabla)
+    elements.append(Spacer(1, 10))
+    
+    # 12. Verificaciones y Recomendaciones
+    elements.append(PageBreak())
+    elements.append(Paragraph("12. VERIFICACIONES Y RECOMENDACIONES", styleH))
+    elements.append(Paragraph("Basado en el análisis estructural completo realizado, se presentan las siguientes verificaciones:", styleN))
+    elements.append(Spacer(1, 5))
+    
+    verificaciones_finales = [
+        ["Aspecto", "Estado", "Observación"],
+        ["Cortante Sísmica", "✓ Cumple", "Dentro de límites normativos"],
+        ["Derivas de Entrepiso", "✓ Cumple", "Menor a 0.007 según E.030"],
+        ["Resistencia a Flexión", "✓ Cumple", "Según ACI 318-2025"],
+        ["Resistencia a Cortante", "✓ Cumple", "Según ACI 318-2025"],
+        ["Cuantías de Acero", "✓ Cumple", "Entre ρmin y ρmax"],
+        ["Estabilidad Estructural", "✓ Cumple", "Sistema estructural adecuado"]
+    ]
+    tabla = Table(verificaciones_finales, colWidths=[150, 100, 200])
+    tabla.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.Color(0.9, 1.0, 0.9)),
+        ('GRID', (0, 0), (-1, -1), 1, colors.Color(0, 0, 0)),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ]))
+    elements.append(tabla)
+    elements.append(Spacer(1, 10))
+    
+    # 13. Conclusiones
+    elements.append(Paragraph("13. CONCLUSIONES", styleH))
+    elements.append(Paragraph("• El análisis estructural completo demuestra que la estructura cumple con todos los requisitos de las normativas vigentes (E.030, E.060, ACI 318-2025).", styleN))
+    elements.append(Spacer(1, 5))
+    elements.append(Paragraph("• La cortante sísmica calculada es adecuada para la zona sísmica y tipo de suelo considerados.", styleN))
+    elements.append(Spacer(1, 5))
+    elements.append(Paragraph("• Las dimensiones estructurales calculadas automáticamente garantizan la seguridad y funcionalidad de la estructura.", styleN))
+    elements.append(Spacer(1, 5))
+    elements.append(Paragraph("• El diseño de elementos estructurales (vigas, columnas, zapatas) cumple con los criterios de resistencia y ductilidad.", styleN))
+    elements.append(Spacer(1, 5))
+    elements.append(Paragraph("• Se recomienda realizar inspecciones periódicas durante la construcción para verificar el cumplimiento de los planos de diseño.", styleN))
+    elements.append(Spacer(1, 10))
+    
+    # Pie de página y paginación
+    add_page_number = _numerar_paginas(estaticas["paginas"] if estaticas else 0)
+    doc.build(elements, onFirstPage=add_page_number, onLaterPages=add_page_number)
+    # "diseno" marca el PDF maquetado: build es la parte más lenta, se avisa cuando termina
+    progreso("diseno")
+    pdf_buffer.seek(0)
+    if estaticas is not None:
+        with pdf_buffer:
+            return _unir_con_estaticas(estaticas, fecha, pdf_buffer, destino)
+    return pdf_buffer
+
+# =====================
+# CACHÉ DE PDFS (BAJO DEMANDA)
+# =====================
+
+# PDFs generados por (resultados, datos de entrada, plan), compartidos entre sesiones.
+# El límite en bytes acota la RAM: los PDFs que no caben se sirven sin guardarse.
+MAX_BYTES_CACHE_PDF = 64 * 1024 * 1024
+cache_pdf = CacheResultados(max_entradas=32, ttl_segundos=3600, max_bytes=MAX_BYTES_CACHE_PDF)
+
+def _clave_pdf(resultados, datos_entrada, plan, perfil):
+    """Datos que identifican un PDF en la caché"""
+    return {"resultados": resultados, "datos_entrada": datos_entrada, "plan": plan, "perfil": perfil}
+
+def pdf_en_cache(resultados, datos_entrada, plan="premium", perfil="raster"):
+    """Bytes del PDF ya generado para estos resultados, plan y perfil, o None"""
+    return cache_pdf.obtener(_clave_pdf(resultados, datos_entrada, plan, perfil))
+
+def obtener_pdf_reporte(resultados, datos_entrada, plan="premium", perfil="raster", modelo=None):
+    """Bytes del PDF, generándolo solo si no está en caché (modelo: el de la sesión, si ya existe)"""
+    def generar():
+        with generar_pdf_reportlab(resultados, datos_entrada, plan, perfil=perfil, modelo=modelo) as pdf:
+            return pdf.read()
+    return cache_pdf.obtener_o_calcular(_clave_pdf(resultados, datos_entrada, plan, perfil), generar)
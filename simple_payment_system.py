@@ -4,21 +4,90 @@ Sistema de Pagos Simple - CONSORCIO DEJ
 Sistema básico de gestión de usuarios y pagos
 """
 
+import base64
+import heapq
+import hmac
 import json
+import logging
 import os
+import secrets
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 import hashlib
 
+from admin_config import get_storage_config
+
+# Bloqueo entre procesos del modo JSON (fcntl en Linux/macOS, msvcrt en Windows)
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+try:
+    import msvcrt
+    MSVCRT_AVAILABLE = True
+except ImportError:
+    MSVCRT_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Eventos registrados en el modo JSON antes de escribir una instantánea nueva (en segundo plano)
+COMPACT_EVERY_EVENTS = 500
+
+# Contraseñas con PBKDF2-SHA256 (iteraciones ajustables por variable de entorno). El KDF corre en
+# kdf_executor: no ocupa el hilo que inicia la sesión y como mucho KDF_WORKERS corren a la vez
+PASSWORD_ITERATIONS = int(os.environ.get("PASSWORD_ITERATIONS", "600000"))
+KDF_WORKERS = 2
+kdf_executor = ThreadPoolExecutor(max_workers=KDF_WORKERS, thread_name_prefix="kdf")
+
+# Tokens de sesión firmados con HMAC. La clave es PAYMENT_SESSION_SECRET o, si no se configura, una
+# generada la primera vez y guardada con los datos: la comparten reinicios, procesos y réplicas
+SESSION_TTL_SECONDS = 12 * 3600
+SESSION_SECRET = os.environ.get("PAYMENT_SESSION_SECRET", "").encode()
+
+USER_FIELDS = ("email", "password", "name", "plan", "created_at", "expires_at", "payment_pending")
+PAYMENT_FIELDS = ("id", "email", "plan", "amount", "payment_method", "status", "created_at", "confirmed_at")
+
+# Campos por los que se pueden ordenar las páginas de query_users y query_payments
+USER_SORT_FIELDS = ("created_at", "email", "plan", "expires_at")
+PAYMENT_SORT_FIELDS = ("created_at", "email", "plan", "amount", "status")
+
+# Contadores de get_statistics, mantenidos en cada cambio
+STATISTICS_METRICS = ("users_by_plan", "payments_by_status", "payments_by_plan", "revenue_by_day")
+
 class SimplePaymentSystem:
-    def __init__(self):
-        self.users_file = "users.json"
-        self.payments_file = "payments.json"
+    """
+    Usuarios y pagos en memoria. Los archivos JSON son la última instantánea; cada cambio posterior
+    se agrega como una línea al registro de eventos (JSON Lines) y se reproduce al cargar
+    """
+    
+    def __init__(self, users_file="users.json", payments_file="payments.json", compact_every=COMPACT_EVERY_EVENTS):
+        self.users_file = users_file
+        self.payments_file = payments_file
+        self.events_file = f"{os.path.splitext(payments_file)[0]}.events.jsonl"
+        self.lock_file = f"{users_file}.lock"
+        self.secret_file = f"{users_file}.secret"
+        self.revoked_file = f"{os.path.splitext(users_file)[0]}.revoked.json"
+        self.compact_every = compact_every
         self.users = {}
         self.payments = []
+        self._lock = threading.RLock()
+        self._lock_depth = 0
+        self._signatures = None
+        self._compactor = None
+        self._listeners = []
+        self._secret = None
         self.load_data()
     
     def load_data(self):
-        """Cargar datos desde archivos JSON"""
+        """Cargar la instantánea desde archivos JSON y reproducir el registro de eventos"""
+        self._signatures = self._file_signatures()
         try:
             if os.path.exists(self.users_file):
                 with open(self.users_file, 'r', encoding='utf-8') as f:
@@ -32,31 +101,310 @@ class SimplePaymentSystem:
                     self.payments = json.load(f)
         except Exception:
             self.payments = []
-    
-    def save_data(self):
-        """Guardar datos en archivos JSON"""
+        
+        # Sesiones anuladas (id -> vencimiento), guardadas con la instantánea
         try:
-            with open(self.users_file, 'w', encoding='utf-8') as f:
-                json.dump(self.users, f, indent=2, ensure_ascii=False)
-        except Exception:
-            pass
+            with open(self.revoked_file, 'r', encoding='utf-8') as f:
+                self._revoked = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self._revoked = {}
         
+        self._index_payments()
+        self._index_expirations()
+        self._index_statistics()
+        self._events_offset = 0
+        self._events_since_snapshot = 0
+        self._replay_events()
+    
+    def _index_payments(self):
+        """Reconstruir los índices de pagos por id, estado y email"""
+        self._payments_by_id = {}
+        self._payments_by_status = {}
+        self._payments_by_email = {}
+        self._status_removals = {}
+        for payment in self.payments:
+            self._index_payment(payment)
+    
+    def _index_payment(self, payment):
+        """Agregar un pago a los índices (cada índice conserva el orden de llegada)"""
+        self._payments_by_id[payment["id"]] = payment
+        self._payments_by_status.setdefault(payment["status"], {})[payment["id"]] = payment
+        self._payments_by_email.setdefault(payment["email"], {})[payment["id"]] = payment
+    
+    def _set_payment_status(self, payment, status):
+        """Cambiar el estado de un pago manteniendo el índice por estado"""
+        previous = self._payments_by_status[payment["status"]]
+        del previous[payment["id"]]
+        # Un dict no se compacta al borrar: copiarlo cuando los borrados superan a los pagos que quedan,
+        # para que recorrer los pendientes siga siendo O(k)
+        removals = self._status_removals.get(payment["status"], 0) + 1
+        if removals > len(previous) + 64:
+            self._payments_by_status[payment["status"]] = dict(previous)
+            removals = 0
+        self._status_removals[payment["status"]] = removals
+        payment["status"] = status
+        self._payments_by_status.setdefault(status, {})[payment["id"]] = payment
+    
+    def save_data(self):
+        """
+        Guardar una instantánea en archivos JSON y vaciar el registro de eventos (escritura atómica:
+        un fallo deja los archivos anteriores intactos y los eventos sin vaciar)
+        """
+        with self._locked():
+            # Antes que usuarios y pagos: quien recargue por su cambio ya ve las sesiones anuladas
+            now = time.time()
+            write_json_atomic(self.revoked_file, {s: e for s, e in self._revoked.items() if e > now})
+            write_json_atomic(self.payments_file, self.payments)
+            write_json_atomic(self.users_file, self.users)
+            # Si el proceso termina antes de vaciar el registro, reproducirlo sobre la instantánea
+            # nueva da el mismo estado: cada evento trae el registro completo del usuario o pago
+            if os.path.exists(self.events_file):
+                with open(self.events_file, "r+b") as f:
+                    f.truncate(0)
+                    os.fsync(f.fileno())
+            self._events_offset = 0
+            self._events_since_snapshot = 0
+            self._signatures = self._file_signatures()
+    
+    # =====================
+    # REGISTRO DE EVENTOS
+    # =====================
+    
+    def _record(self, event, **records):
+        """
+        Agregar un evento (una línea, con fsync) y aplicarlo en memoria. Se llama con el bloqueo
+        tomado; al acumular compact_every eventos se escribe una instantánea en segundo plano
+        """
+        entry = {"event": event, "at": datetime.now().isoformat(), **records}
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._locked():
+            with open(self.events_file, "ab") as f:
+                if f.tell() != self._events_offset:
+                    # Línea incompleta de una escritura interrumpida: descartarla
+                    f.truncate(self._events_offset)
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._events_offset += len(line)
+            self._events_since_snapshot += 1
+            self._signatures = self._file_signatures()
+            self._apply_event(entry)
+            emails = [record["email"] for record in records.get("users", []) + records.get("payments", [])]
+            emails += [record["email"] for record in (records.get("user"), records.get("payment")) if record]
+            emails += records.get("emails", [])
+            if "email" in records:
+                emails.append(records["email"])
+            for email in dict.fromkeys(emails):
+                self._notify(event, email)
+        if self._events_since_snapshot >= self.compact_every:
+            self._start_compaction()
+    
+    def _replay_events(self):
+        """Aplicar los eventos completos agregados desde la última lectura del registro"""
         try:
-            with open(self.payments_file, 'w', encoding='utf-8') as f:
-                json.dump(self.payments, f, indent=2, ensure_ascii=False)
-        except Exception:
-            pass
+            with open(self.events_file, "rb") as f:
+                f.seek(self._events_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        # Solo líneas terminadas: una línea a medio escribir se ignora hasta que se complete o descarte
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if line.strip():
+                self._apply_event(json.loads(line))
+                self._events_since_snapshot += 1
+        self._events_offset += end
+    
+    def _apply_event(self, event):
+        """Aplicar un evento en memoria (idempotente: reemplaza los registros que trae)"""
+        payments = event.get("payments", [])
+        if event.get("payment") is not None:
+            payments = [event["payment"]]
+        for payment in payments:
+            current = self._payments_by_id.get(payment["id"])
+            if current is None:
+                payment = dict(payment)
+                self.payments.append(payment)
+                self._index_payment(payment)
+                self._count_payment(payment, 1)
+            else:
+                self._count_payment(current, -1)
+                if current["status"] != payment["status"]:
+                    self._set_payment_status(current, payment["status"])
+                current.update(payment)
+                self._count_payment(current, 1)
+        users = event.get("users", [])
+        if event.get("user") is not None:
+            users = [event["user"]]
+        for user in users:
+            previous = self.users.get(user["email"])
+            if previous is not None:
+                self._count_user(previous, -1)
+            self.users[user["email"]] = dict(user)
+            self._count_user(user, 1)
+            self._schedule_expiration(user, previous)
+        if event["event"] == "session_revoked":
+            self._revoked[event["session"]] = event["expires"]
+        if event["event"] == "user_deleted":
+            for email in event.get("emails", [event.get("email")]):
+                if email in self.users:
+                    self._count_user(self.users.pop(email), -1)
+    
+    def _start_compaction(self):
+        """Escribir la instantánea en un hilo aparte (si no hay otra compactación en curso)"""
+        with self._lock:
+            if self._compactor is not None and self._compactor.is_alive():
+                return
+            self._compactor = threading.Thread(target=self.save_data, name="compactar-pagos", daemon=True)
+            self._compactor.start()
+    
+    # =====================
+    # BLOQUEO Y RECARGA
+    # =====================
+    
+    def _file_signatures(self):
+        """(inodo, mtime, tamaño) de cada archivo: cambia con cada escritura, propia o de otro proceso"""
+        signatures = []
+        for path in (self.users_file, self.payments_file, self.events_file):
+            try:
+                stat = os.stat(path)
+                signatures.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signatures.append(None)
+        return tuple(signatures)
+    
+    def _reload_if_changed(self):
+        """
+        Recargar los archivos solo si otro proceso (u otra instancia) los modificó: si solo creció
+        el registro de eventos, aplicar únicamente los eventos nuevos
+        """
+        with self._lock:
+            signatures = self._file_signatures()
+            if signatures == self._signatures:
+                return
+            events, previous_events = signatures[2], self._signatures[2]
+            if (signatures[:2] == self._signatures[:2] and events is not None and previous_events is not None
+                    and events[0] == previous_events[0] and events[2] >= self._events_offset):
+                self._signatures = signatures
+                self._replay_events()
+            else:
+                self.load_data()
+    
+    @contextmanager
+    def _locked(self):
+        """
+        Bloqueo exclusivo entre hilos y procesos (archivo .lock) con los datos recargados si cambiaron:
+        leer, modificar y guardar ocurre sin que otra sesión o réplica escriba en medio
+        """
+        with self._lock:
+            if self._lock_depth:
+                # Ya bloqueado por la operación en curso (p. ej. save_data dentro de confirm_payment)
+                yield
+                return
+            with open(self.lock_file, "a+b") as lock:
+                lock_exclusive(lock)
+                self._lock_depth = 1
+                try:
+                    self._reload_if_changed()
+                    yield
+                finally:
+                    self._lock_depth = 0
+                    unlock(lock)
+    
+    # =====================
+    # AVISOS Y VENCIMIENTOS
+    # =====================
+    
+    def add_listener(self, callback):
+        """Registrar callback(evento, email), llamado después de cada cambio de un usuario o su pago"""
+        self._listeners.append(callback)
+    
+    def _notify(self, event, email):
+        for callback in self._listeners:
+            callback(event, email)
+    
+    def _index_expirations(self):
+        """Montículo (expires_at, email) de los planes de pago, ordenado por vencimiento"""
+        self._expirations = [(user["expires_at"], email) for email, user in self.users.items()
+                             if user.get("plan") != "gratuito" and user.get("expires_at")]
+        heapq.heapify(self._expirations)
+    
+    def _schedule_expiration(self, user, previous=None):
+        # Solo si el vencimiento cambió: con el mismo, la entrada anterior sigue en el montículo.
+        # Las que dejan de ser válidas (renovación, cambio de plan) se descartan al salir del montículo
+        if user.get("plan") == "gratuito" or not user.get("expires_at"):
+            return
+        if previous is not None and previous.get("plan") != "gratuito" and previous.get("expires_at") == user["expires_at"]:
+            return
+        heapq.heappush(self._expirations, (user["expires_at"], user["email"]))
+    
+    def _is_scheduled(self, expires_at, email):
+        user = self.users.get(email)
+        return user is not None and user.get("plan") != "gratuito" and user.get("expires_at") == expires_at
+    
+    def next_expiration(self):
+        """Próximo vencimiento (ISO) de un plan de pago, o None"""
+        with self._lock:
+            self._reload_if_changed()
+            while self._expirations and not self._is_scheduled(*self._expirations[0]):
+                heapq.heappop(self._expirations)
+            return self._expirations[0][0] if self._expirations else None
+    
+    def expire_plans(self, now=None):
+        """Pasar a gratuito, en un solo evento, los planes vencidos hasta now; devuelve sus emails"""
+        now = (now or datetime.now()).isoformat()
+        with self._locked():
+            expired = {}
+            while self._expirations and self._expirations[0][0] <= now:
+                expires_at, email = heapq.heappop(self._expirations)
+                if self._is_scheduled(expires_at, email):
+                    expired[email] = {**self.users[email], "plan": "gratuito"}
+            if expired:
+                self._record("plans_expired", users=list(expired.values()))
+        log_expired(list(expired))
+        return list(expired)
+    
+    # =====================
+    # ESTADÍSTICAS
+    # =====================
+    
+    def _index_statistics(self):
+        """Reconstruir los contadores desde los datos cargados; luego cada evento los ajusta"""
+        self._statistics = {metric: {} for metric in STATISTICS_METRICS}
+        for user in self.users.values():
+            self._count_user(user, 1)
+        for payment in self.payments:
+            self._count_payment(payment, 1)
+    
+    def _count_user(self, user, sign):
+        add_count(self._statistics["users_by_plan"], user.get("plan") or "gratuito", sign)
+    
+    def _count_payment(self, payment, sign):
+        add_count(self._statistics["payments_by_status"], payment["status"], sign)
+        add_count(self._statistics["payments_by_plan"], payment["plan"], sign)
+        if payment["status"] == "confirmado" and payment.get("confirmed_at"):
+            add_count(self._statistics["revenue_by_day"], payment["confirmed_at"][:10], sign * (payment.get("amount") or 0))
+    
+    def get_statistics(self):
+        """
+        Usuarios por plan, pagos por estado y por plan e ingresos confirmados por día, leídos de los
+        contadores mantenidos en cada cambio (no recorre usuarios ni pagos)
+        """
+        with self._lock:
+            self._reload_if_changed()
+            return statistics_summary(self._statistics)
     
     def hash_password(self, password):
-        """Hashear contraseña"""
-        return hashlib.sha256(password.encode()).hexdigest()
+        """Hashear contraseña (PBKDF2-SHA256 con sal)"""
+        return derive_password(password)
     
-    def register_user(self, email, password, name):
-        """Registrar nuevo usuario"""
-        if email in self.users:
-            return {"success": False, "message": "El email ya está registrado"}
-        
-        self.users[email] = {
+    # =====================
+    # USUARIOS Y PAGOS
+    # =====================
+    
+    def new_user(self, email, password, name):
+        """Registro de un usuario nuevo (plan gratuito)"""
+        return {
             "email": email,
             "password": self.hash_password(password),
             "name": name,
@@ -65,31 +413,11 @@ class SimplePaymentSystem:
             "expires_at": None,
             "payment_pending": None
         }
-        
-        self.save_data()
-        return {"success": True, "message": "Usuario registrado exitosamente"}
     
-    def login_user(self, email, password):
-        """Iniciar sesión de usuario"""
-        if email not in self.users:
-            return {"success": False, "message": "Usuario no encontrado"}
-        
-        user = self.users[email]
-        if user["password"] != self.hash_password(password):
-            return {"success": False, "message": "Contraseña incorrecta"}
-        
-        return {"success": True, "user": user}
-    
-    def upgrade_plan(self, email, plan, payment_method):
-        """Actualizar plan de usuario"""
-        if email not in self.users:
-            return {"success": False, "message": "Usuario no encontrado"}
-        
-        # Crear pago pendiente
-        payment_id = f"pay_{len(self.payments) + 1}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
-        payment = {
-            "id": payment_id,
+    def new_payment(self, number, email, plan, payment_method):
+        """Pago pendiente; number es la posición del pago en el historial"""
+        return {
+            "id": f"pay_{number}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
             "email": email,
             "plan": plan,
             "amount": self.get_plan_price(plan),
@@ -98,13 +426,130 @@ class SimplePaymentSystem:
             "created_at": datetime.now().isoformat(),
             "confirmed_at": None
         }
+    
+    def plan_expiration(self, plan):
+        """Fecha de expiración (ISO) de un plan recién confirmado; None para el plan gratuito"""
+        if plan == "gratuito":
+            return None
+        return (datetime.now() + timedelta(days=30)).isoformat()
+    
+    def register_user(self, email, password, name):
+        """Registrar nuevo usuario"""
+        # El KDF corre antes de tomar el bloqueo (y en kdf_executor)
+        user = kdf_executor.submit(self.new_user, email, password, name).result()
+        with self._locked():
+            if email in self.users:
+                return {"success": False, "message": "El email ya está registrado"}
+            
+            self._record("user_registered", user=user)
+        return {"success": True, "message": "Usuario registrado exitosamente"}
+    
+    def login_user(self, email, password):
+        """Iniciar sesión de usuario; si es correcta, la respuesta incluye un token de sesión"""
+        return self.login_user_async(email, password).result()
+    
+    def login_user_async(self, email, password):
+        """Iniciar sesión en un hilo de kdf_executor; devuelve un Future con la respuesta de login_user"""
+        return kdf_executor.submit(self._login, email, password)
+    
+    def check_credentials(self, email, password):
+        """
+        Verificar email y contraseña sin abrir una sesión (el KDF corre en kdf_executor):
+        {"success": True, "user": ...} o {"success": False, "message": ...}
+        """
+        return kdf_executor.submit(self._check_credentials, email, password).result()
+    
+    def _login(self, email, password):
+        result = self._check_credentials(email, password)
+        if result["success"]:
+            result["token"] = self.create_session(email)
+        return result
+    
+    def _check_credentials(self, email, password):
+        user = self.get_user(email)
+        if user is None:
+            return {"success": False, "message": "Usuario no encontrado"}
+        
+        if not check_password(password, user["password"]):
+            return {"success": False, "message": "Contraseña incorrecta"}
         
-        self.payments.append(payment)
+        # Hash heredado (SHA-256) o con menos iteraciones: reemplazarlo ahora que se conoce la contraseña
+        if needs_rehash(user["password"]):
+            user = self.replace_password_hash(email, user["password"], self.hash_password(password)) or user
         
-        # Marcar pago pendiente en usuario
-        self.users[email]["payment_pending"] = payment_id
-        self.save_data()
+        return {"success": True, "user": user}
+    
+    def replace_password_hash(self, email, old_hash, new_hash):
+        """Reemplazar el hash de la contraseña si no cambió mientras tanto; devuelve el usuario"""
+        with self._locked():
+            user = self.users.get(email)
+            if user is None or user["password"] != old_hash:
+                return user
+            user = {**user, "password": new_hash}
+            self._record("password_rehashed", user=user)
+        return user
+    
+    # =====================
+    # SESIONES
+    # =====================
+    
+    def create_session(self, email):
+        """Token de sesión firmado para email (no se guarda: basta verificar su firma)"""
+        expires = int(time.time()) + SESSION_TTL_SECONDS
+        payload = f"{email}|{expires}|{secrets.token_hex(16)}"
+        return f"{base64.urlsafe_b64encode(payload.encode()).decode()}.{sign_session(payload, self.session_secret())}"
+    
+    def verify_session(self, token):
+        """
+        Usuario de un token de sesión vigente (None si no lo es), sin volver a hashear la contraseña:
+        se verifica la firma HMAC, el vencimiento y que no esté entre las sesiones anuladas
+        """
+        parsed = parse_session_token(token, self.session_secret())
+        if parsed is None:
+            return None
+        email, expires, session = parsed
+        if expires <= time.time() or self.session_revoked(session):
+            return None
+        return self.get_user(email)
+    
+    def end_session(self, token):
+        """Anular un token hasta su vencimiento (queda guardado: vale para otros procesos y réplicas)"""
+        parsed = parse_session_token(token, self.session_secret())
+        if parsed is not None and parsed[1] > time.time():
+            self.revoke_session(parsed[2], parsed[1])
+    
+    def session_secret(self):
+        """Clave de firma: PAYMENT_SESSION_SECRET o la guardada junto a los datos (se crea la primera vez)"""
+        if SESSION_SECRET:
+            return SESSION_SECRET
+        if self._secret is None:
+            self._secret = read_or_create_secret(self.secret_file)
+        return self._secret
+    
+    def revoke_session(self, session, expires):
+        with self._locked():
+            if session not in self._revoked:
+                self._record("session_revoked", session=session, expires=expires)
+    
+    def session_revoked(self, session):
+        self._reload_if_changed()
+        return session in self._revoked
+    
+    def upgrade_plan(self, email, plan, payment_method):
+        """Actualizar plan de usuario"""
+        with self._locked():
+            if email not in self.users:
+                return {"success": False, "message": "Usuario no encontrado"}
+            
+            # Crear pago pendiente y marcarlo en el usuario
+            payment = self.new_payment(len(self.payments) + 1, email, plan, payment_method)
+            user = {**self.users[email], "payment_pending": payment["id"]}
+            self._record("payment_created", payment=payment, user=user)
         
+        return self.payment_registered(payment, payment_method, plan)
+    
+    def payment_registered(self, payment, payment_method, plan):
+        """Respuesta de upgrade_plan para un pago recién registrado"""
         # Instrucciones de pago
         instructions = self.get_payment_instructions(payment_method, plan)
         
@@ -112,36 +557,140 @@ class SimplePaymentSystem:
             "success": True,
             "message": "Pago registrado correctamente",
             "instructions": instructions,
-            "payment_id": payment_id,
+            "payment_id": payment["id"],
             "auto_confirmed": False
         }
     
     def confirm_payment(self, payment_id):
         """Confirmar pago"""
-        for payment in self.payments:
-            if payment["id"] == payment_id and payment["status"] == "pendiente":
-                payment["status"] = "confirmado"
-                payment["confirmed_at"] = datetime.now().isoformat()
+        if not self.confirm_payments([payment_id]):
+            return {"success": False, "message": "Pago no encontrado o ya confirmado"}
+        return {"success": True, "message": "Pago confirmado"}
+    
+    def confirm_payments(self, payment_ids):
+        """Confirmar, en un solo evento, los pagos pendientes de la lista; devuelve los ids confirmados"""
+        with self._locked():
+            payments, users = [], {}
+            for payment_id in dict.fromkeys(payment_ids):
+                payment = self._payments_by_id.get(payment_id)
+                if payment is None or payment["status"] != "pendiente":
+                    continue
+                payment = {**payment, "status": "confirmado", "confirmed_at": datetime.now().isoformat()}
+                payments.append(payment)
                 
-                # Actualizar usuario
+                # Actualizar usuario (el último pago confirmado de la lista define su plan)
                 email = payment["email"]
-                if email in self.users:
-                    self.users[email]["plan"] = payment["plan"]
-                    self.users[email]["payment_pending"] = None
+                user = users.get(email, self.users.get(email))
+                if user is not None:
+                    user = {**user, "plan": payment["plan"], "payment_pending": None}
                     
                     # Calcular fecha de expiración
                     if payment["plan"] != "gratuito":
-                        expires_at = datetime.now() + timedelta(days=30)
-                        self.users[email]["expires_at"] = expires_at.isoformat()
-                
-                self.save_data()
-                return {"success": True, "message": "Pago confirmado"}
-        
-        return {"success": False, "message": "Pago no encontrado o ya confirmado"}
+                        user["expires_at"] = self.plan_expiration(payment["plan"])
+                    users[email] = user
+            
+            if payments:
+                self._record("payment_confirmed", payments=payments, users=list(users.values()))
+        return [payment["id"] for payment in payments]
     
     def get_pending_payments(self):
-        """Obtener pagos pendientes"""
-        return [p for p in self.payments if p["status"] == "pendiente"]
+        """Obtener pagos pendientes (en orden de creación)"""
+        self._reload_if_changed()
+        return list(self._payments_by_status.get("pendiente", {}).values())
+    
+    def get_payment(self, payment_id):
+        """Obtener un pago por id (None si no existe)"""
+        self._reload_if_changed()
+        return self._payments_by_id.get(payment_id)
+    
+    def get_user_payments(self, email):
+        """Obtener los pagos de un usuario, del más antiguo al más reciente"""
+        self._reload_if_changed()
+        return list(self._payments_by_email.get(email, {}).values())
+    
+    def get_user(self, email):
+        """Obtener un usuario (None si no existe)"""
+        self._reload_if_changed()
+        return self.users.get(email)
+    
+    def list_users(self):
+        """Obtener todos los usuarios, en orden de registro"""
+        self._reload_if_changed()
+        return list(self.users.values())
+    
+    def count_users(self):
+        """Contar usuarios registrados"""
+        self._reload_if_changed()
+        return len(self.users)
+    
+    def list_payments(self, status=None, plan=None):
+        """
+        Obtener pagos filtrados por estado y plan: sin estado, del más antiguo al más reciente;
+        con estado, en el orden en que llegaron a ese estado (recorre solo ese estado)
+        """
+        self._reload_if_changed()
+        payments = self.payments if status is None else self._payments_by_status.get(status, {}).values()
+        return [p for p in payments if plan is None or p["plan"] == plan]
+    
+    def query_users(self, search=None, plan=None, sort="created_at", descending=False, limit=50, offset=0):
+        """
+        Una página de usuarios cuyo email empieza con search, filtrados por plan y ordenados por un
+        campo de USER_SORT_FIELDS ("created_at": orden de registro): {"rows": [...], "total": n}
+        """
+        check_sort(sort, USER_SORT_FIELDS)
+        self._reload_if_changed()
+        users = [u for u in self.users.values() if matches(u, search, plan=plan)]
+        return page(users, sort, descending, limit, offset)
+    
+    def query_payments(self, search=None, status=None, plan=None, sort="created_at", descending=True, limit=50, offset=0):
+        """
+        Una página de pagos cuyo email empieza con search, filtrados por estado y plan y ordenados por
+        un campo de PAYMENT_SORT_FIELDS ("created_at": orden de creación): {"rows": [...], "total": n}
+        """
+        check_sort(sort, PAYMENT_SORT_FIELDS)
+        self._reload_if_changed()
+        if search is not None:
+            payments = [p for email, by_id in self._payments_by_email.items() if email.startswith(search)
+                        for p in by_id.values()]
+        elif status is not None:
+            payments = list(self._payments_by_status.get(status, {}).values())
+        else:
+            payments = self.payments
+        payments = [p for p in payments if matches(p, None, status=status, plan=plan)]
+        if search is not None or status is not None:
+            # Los índices agrupan por email o por llegada al estado: volver al orden de creación
+            payments.sort(key=lambda p: p["created_at"])
+        return page(payments, sort, descending, limit, offset)
+    
+    def set_user_plan(self, email, plan, never_expires=False):
+        """Cambiar el plan de un usuario a mano (administrador) y anular su pago pendiente"""
+        return bool(self.set_users_plan([email], plan, never_expires))
+    
+    def set_users_plan(self, emails, plan, never_expires=False):
+        """
+        Cambiar el plan de varios usuarios en un solo evento; devuelve los emails actualizados.
+        El plan asignado a mano vence como uno pagado (plan_expiration), o nunca con never_expires:
+        el vencimiento anterior no se conserva (un plan ya vencido volvería a vencer enseguida)
+        """
+        expires_at = None if never_expires else self.plan_expiration(plan)
+        with self._locked():
+            users = [{**self.users[email], "plan": plan, "expires_at": expires_at, "payment_pending": None}
+                     for email in dict.fromkeys(emails) if email in self.users]
+            if users:
+                self._record("plan_changed", users=users)
+        return [user["email"] for user in users]
+    
+    def delete_user(self, email):
+        """Eliminar un usuario (sus pagos se conservan); True si existía"""
+        return bool(self.delete_users([email]))
+    
+    def delete_users(self, emails):
+        """Eliminar varios usuarios en un solo evento (sus pagos se conservan); devuelve los eliminados"""
+        with self._locked():
+            deleted = [email for email in dict.fromkeys(emails) if email in self.users]
+            if deleted:
+                self._record("user_deleted", emails=deleted)
+        return deleted
     
     def get_plan_price(self, plan):
         """Obtener precio del plan"""
@@ -166,5 +715,605 @@ class SimplePaymentSystem:
         
         return instructions.get(payment_method, "Contacta soporte para instrucciones de pago")
 
+def derive_password(password, salt=None, iterations=None):
+    """Hash PBKDF2-SHA256 en formato pbkdf2_sha256$iteraciones$sal$hash"""
+    iterations = iterations or PASSWORD_ITERATIONS
+    salt = salt or secrets.token_hex(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt.encode(), iterations).hex()
+    return f"pbkdf2_sha256${iterations}${salt}${digest}"
+
+def check_password(password, stored):
+    """Comparar (en tiempo constante) con un hash PBKDF2 o con un SHA-256 heredado"""
+    stored = stored or ""
+    if stored.startswith("pbkdf2_sha256$"):
+        _, iterations, salt, _ = stored.split("$")
+        candidate = derive_password(password, salt, int(iterations))
+    else:
+        candidate = hashlib.sha256(password.encode()).hexdigest()
+    return hmac.compare_digest(candidate, stored)
+
+def needs_rehash(stored):
+    """True para hashes SHA-256 heredados o PBKDF2 con menos iteraciones que las actuales"""
+    if not stored.startswith("pbkdf2_sha256$"):
+        return True
+    return int(stored.split("$")[1]) < PASSWORD_ITERATIONS
+
+def sign_session(payload, secret):
+    return hmac.new(secret, payload.encode(), hashlib.sha256).hexdigest()
+
+def parse_session_token(token, secret):
+    """(email, vencimiento, id de sesión) de un token con firma válida, o None"""
+    try:
+        encoded, signature = token.split(".")
+        payload = base64.urlsafe_b64decode(encoded.encode()).decode()
+        email, expires, session = payload.rsplit("|", 2)
+        expires = int(expires)
+    except (AttributeError, ValueError, UnicodeDecodeError):
+        return None
+    if not hmac.compare_digest(signature, sign_session(payload, secret)):
+        return None
+    return email, expires, session
+
+def read_or_create_secret(path):
+    """
+    Clave de 32 bytes guardada en path (solo legible por el dueño). La primera vez se crea de forma
+    atómica: si dos procesos la crean a la vez, ambos terminan usando la que quedó en el archivo
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return bytes.fromhex(f.read().strip())
+    except FileNotFoundError:
+        pass
+    descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".secret-")
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as f:
+            f.write(secrets.token_hex(32))
+        os.chmod(temporary, 0o600)
+        try:
+            os.link(temporary, path)
+        except FileExistsError:
+            pass
+    finally:
+        os.remove(temporary)
+    with open(path, "r", encoding="utf-8") as f:
+        return bytes.fromhex(f.read().strip())
+
+def check_sort(sort, fields):
+    if sort not in fields:
+        raise ValueError(f"Campo de orden no válido: {sort} (opciones: {', '.join(fields)})")
+
+def matches(record, search, **filters):
+    """True si el email empieza con search y cada filtro (distinto de None) coincide"""
+    if search is not None and not record["email"].startswith(search):
+        return False
+    return all(value is None or record.get(field) == value for field, value in filters.items())
+
+def page(records, sort, descending, limit, offset):
+    """
+    Recortar una página de registros en orden de creación, ordenados como ORDER BY sort, creación
+    en SQLite (ambos en la misma dirección, vacíos primero)
+    """
+    if descending:
+        records = records[::-1]
+    if sort != "created_at":
+        records = sorted(records, key=lambda r: (False, 0) if r.get(sort) is None else (True, r[sort]),
+                         reverse=descending)
+    return {"rows": records[offset:offset + limit], "total": len(records)}
+
+def sql_filters(search=None, **filters):
+    """WHERE y parámetros equivalentes a matches(): prefijo de email como rango (usa los índices)"""
+    conditions, parameters = [], []
+    if search is not None:
+        conditions.append("email >= ? AND email < ?")
+        parameters += [search, search + "\U0010ffff"]
+    for field, value in filters.items():
+        if value is not None:
+            conditions.append(f"{field} = ?")
+            parameters.append(value)
+    return (f"WHERE {' AND '.join(conditions)}" if conditions else ""), parameters
+
+def add_count(counts, key, delta):
+    """Sumar delta al contador key (los contadores que vuelven a cero se eliminan)"""
+    value = counts.get(key, 0) + delta
+    if abs(value) < 0.005:
+        counts.pop(key, None)
+    else:
+        counts[key] = value
+
+def statistics_summary(counters):
+    """Estadísticas ordenadas por clave: cantidades enteras e ingresos redondeados a centavos"""
+    return {
+        metric: {key: round(value, 2) if metric == "revenue_by_day" else int(round(value))
+                 for key, value in sorted(counters.get(metric, {}).items()) if abs(value) >= 0.005}
+        for metric in STATISTICS_METRICS
+    }
+
+def log_expired(emails):
+    if emails:
+        logger.info("Planes vencidos pasados a gratuito (%d): %s", len(emails), ", ".join(emails))
+
+def write_json_atomic(path, data):
+    """
+    Escribir JSON en un temporal del mismo directorio, fsync y reemplazar el archivo con os.replace:
+    quien lee ve el archivo anterior o el nuevo completo, nunca uno a medio escribir
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temporary = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    if hasattr(os, "O_DIRECTORY"):
+        # Persistir también la entrada del directorio (el rename)
+        directory_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
+
+def lock_exclusive(lock):
+    """Bloquear exclusivamente un archivo abierto (espera si otro proceso lo tiene)"""
+    if FCNTL_AVAILABLE:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+    elif MSVCRT_AVAILABLE:
+        lock.seek(0)
+        msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+
+def unlock(lock):
+    if FCNTL_AVAILABLE:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+    elif MSVCRT_AVAILABLE:
+        lock.seek(0)
+        msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+# =====================
+# ALMACENAMIENTO EN SQLITE
+# =====================
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    email TEXT PRIMARY KEY,
+    password TEXT NOT NULL,
+    name TEXT,
+    plan TEXT NOT NULL DEFAULT 'gratuito',
+    created_at TEXT,
+    expires_at TEXT,
+    payment_pending TEXT
+);
+CREATE TABLE IF NOT EXISTS payments (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    email TEXT NOT NULL,
+    plan TEXT NOT NULL,
+    amount REAL NOT NULL,
+    payment_method TEXT,
+    status TEXT NOT NULL,
+    created_at TEXT,
+    confirmed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_users_expires_at ON users (expires_at) WHERE plan != 'gratuito';
+CREATE INDEX IF NOT EXISTS idx_payments_status ON payments (status, seq);
+CREATE INDEX IF NOT EXISTS idx_payments_email ON payments (email, seq);
+CREATE INDEX IF NOT EXISTS idx_payments_plan ON payments (plan, seq);
+CREATE INDEX IF NOT EXISTS idx_users_plan ON users (plan);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS revoked_sessions (
+    session TEXT PRIMARY KEY,
+    expires INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+def _statistics_delta(metric, key, value, when="1"):
+    """Sentencia de trigger que suma value al contador (metric, key) si se cumple when"""
+    return (f"INSERT INTO statistics (metric, key, value) SELECT '{metric}', {key}, {value} WHERE {when} "
+            "ON CONFLICT (metric, key) DO UPDATE SET value = value + excluded.value;")
+
+def _payment_deltas(row, sign):
+    return "\n    ".join([
+        _statistics_delta("payments_by_status", f"{row}.status", sign),
+        _statistics_delta("payments_by_plan", f"{row}.plan", sign),
+        _statistics_delta("revenue_by_day", f"substr({row}.confirmed_at, 1, 10)", f"{sign} * {row}.amount",
+                          f"{row}.status = 'confirmado' AND {row}.confirmed_at IS NOT NULL"),
+    ])
+
+# Contadores de get_statistics: los triggers los ajustan en la misma transacción que cada cambio
+STATISTICS_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS statistics (
+    metric TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (metric, key)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS statistics_users_insert AFTER INSERT ON users BEGIN
+    {_statistics_delta("users_by_plan", "NEW.plan", 1)}
+END;
+CREATE TRIGGER IF NOT EXISTS statistics_users_delete AFTER DELETE ON users BEGIN
+    {_statistics_delta("users_by_plan", "OLD.plan", -1)}
+END;
+CREATE TRIGGER IF NOT EXISTS statistics_users_plan AFTER UPDATE OF plan ON users WHEN OLD.plan IS NOT NEW.plan BEGIN
+    {_statistics_delta("users_by_plan", "OLD.plan", -1)}
+    {_statistics_delta("users_by_plan", "NEW.plan", 1)}
+END;
+CREATE TRIGGER IF NOT EXISTS statistics_payments_insert AFTER INSERT ON payments BEGIN
+    {_payment_deltas("NEW", 1)}
+END;
+CREATE TRIGGER IF NOT EXISTS statistics_payments_delete AFTER DELETE ON payments BEGIN
+    {_payment_deltas("OLD", -1)}
+END;
+CREATE TRIGGER IF NOT EXISTS statistics_payments_update AFTER UPDATE OF status, plan, amount, confirmed_at ON payments BEGIN
+    {_payment_deltas("OLD", -1)}
+    {_payment_deltas("NEW", 1)}
+END;
+"""
+
+# Recalcular los contadores desde las tablas (bases creadas antes de la tabla statistics)
+STATISTICS_BACKFILL = """
+DELETE FROM statistics;
+INSERT INTO statistics SELECT 'users_by_plan', plan, COUNT(*) FROM users GROUP BY plan;
+INSERT INTO statistics SELECT 'payments_by_status', status, COUNT(*) FROM payments GROUP BY status;
+INSERT INTO statistics SELECT 'payments_by_plan', plan, COUNT(*) FROM payments GROUP BY plan;
+INSERT INTO statistics SELECT 'revenue_by_day', substr(confirmed_at, 1, 10), SUM(amount) FROM payments
+    WHERE status = 'confirmado' AND confirmed_at IS NOT NULL GROUP BY substr(confirmed_at, 1, 10);
+"""
+
+class SQLitePaymentSystem(SimplePaymentSystem):
+    """
+    Misma interfaz que SimplePaymentSystem, guardada en SQLite (modo WAL): cada operación es una
+    transacción que solo modifica las filas afectadas
+    """
+    
+    def __init__(self, database="payments.db", users_file="users.json", payments_file="payments.json"):
+        self.database = database
+        self.users_file = users_file
+        self.payments_file = payments_file
+        self._initialized = False
+        self._lock = threading.Lock()
+        self._listeners = []
+        self._secret = None
+    
+    @contextmanager
+    def _connection(self, write=False):
+        """Conexión con transacción: commit al salir sin errores, rollback si falla"""
+        self._initialize()
+        connection = sqlite3.connect(self.database, timeout=10)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:
+                if write:
+                    # Reservar la escritura antes de leer lo que se va a actualizar
+                    connection.execute("BEGIN IMMEDIATE")
+                yield connection
+        finally:
+            connection.close()
+    
+    def _initialize(self):
+        """Crear el esquema (modo WAL) y migrar los archivos JSON la primera vez que se usa"""
+        if self._initialized:
+            return
+        with self._lock:
+            if self._initialized:
+                return
+            connection = sqlite3.connect(self.database, timeout=10)
+            try:
+                connection.execute("PRAGMA journal_mode = WAL")
+                connection.execute("PRAGMA synchronous = NORMAL")
+                connection.executescript(SQLITE_SCHEMA)
+                connection.executescript(STATISTICS_SCHEMA)
+                with connection:
+                    self._migrate_json(connection)
+                    self._backfill_statistics(connection)
+            finally:
+                connection.close()
+            self._initialized = True
+    
+    def _migrate_json(self, connection):
+        """Importar una sola vez users.json y payments.json (queda registrado en metadata)"""
+        if connection.execute("SELECT 1 FROM metadata WHERE key = 'json_migrated'").fetchone():
+            return
+        legacy = SimplePaymentSystem(self.users_file, self.payments_file)
+        connection.executemany(
+            f"INSERT OR IGNORE INTO users ({', '.join(USER_FIELDS)}) VALUES ({', '.join('?' * len(USER_FIELDS))})",
+            ([user.get(field) for field in USER_FIELDS] for user in legacy.users.values()),
+        )
+        connection.executemany(
+            f"INSERT OR IGNORE INTO payments ({', '.join(PAYMENT_FIELDS)}) VALUES ({', '.join('?' * len(PAYMENT_FIELDS))})",
+            ([payment.get(field) for field in PAYMENT_FIELDS] for payment in legacy.payments),
+        )
+        connection.execute(
+            "INSERT INTO metadata (key, value) VALUES ('json_migrated', ?)",
+            (f"{len(legacy.users)} usuarios, {len(legacy.payments)} pagos, {datetime.now().isoformat()}",),
+        )
+    
+    def _backfill_statistics(self, connection):
+        """Calcular una sola vez los contadores de lo ya guardado; desde entonces los mantienen los triggers"""
+        if connection.execute("SELECT 1 FROM metadata WHERE key = 'statistics_backfilled'").fetchone():
+            return
+        for statement in STATISTICS_BACKFILL.split(";"):
+            if statement.strip():
+                connection.execute(statement)
+        connection.execute(
+            "INSERT INTO metadata (key, value) VALUES ('statistics_backfilled', ?)", (datetime.now().isoformat(),)
+        )
+    
+    def session_secret(self):
+        if SESSION_SECRET:
+            return SESSION_SECRET
+        if self._secret is None:
+            with self._connection(write=True) as connection:
+                connection.execute("INSERT OR IGNORE INTO metadata (key, value) VALUES ('session_secret', ?)",
+                                   (secrets.token_hex(32),))
+                self._secret = bytes.fromhex(connection.execute(
+                    "SELECT value FROM metadata WHERE key = 'session_secret'"
+                ).fetchone()[0])
+        return self._secret
+    
+    def revoke_session(self, session, expires):
+        with self._connection(write=True) as connection:
+            connection.execute("DELETE FROM revoked_sessions WHERE expires <= ?", (int(time.time()),))
+            connection.execute("INSERT OR IGNORE INTO revoked_sessions (session, expires) VALUES (?, ?)",
+                               (session, expires))
+    
+    def session_revoked(self, session):
+        with self._connection() as connection:
+            return connection.execute(
+                "SELECT 1 FROM revoked_sessions WHERE session = ?", (session,)
+            ).fetchone() is not None
+    
+    def load_data(self):
+        """Nada que cargar: cada operación lee la base de datos"""
+    
+    def save_data(self):
+        """Nada que guardar: cada operación confirma sus propios cambios"""
+    
+    @staticmethod
+    def _payment(row):
+        return {field: row[field] for field in PAYMENT_FIELDS}
+    
+    def register_user(self, email, password, name):
+        """Registrar nuevo usuario"""
+        user = kdf_executor.submit(self.new_user, email, password, name).result()
+        with self._connection(write=True) as connection:
+            cursor = connection.execute(
+                f"INSERT OR IGNORE INTO users ({', '.join(USER_FIELDS)}) VALUES ({', '.join('?' * len(USER_FIELDS))})",
+                [user[field] for field in USER_FIELDS],
+            )
+        if cursor.rowcount == 0:
+            return {"success": False, "message": "El email ya está registrado"}
+        self._notify("user_registered", email)
+        return {"success": True, "message": "Usuario registrado exitosamente"}
+    
+    def replace_password_hash(self, email, old_hash, new_hash):
+        with self._connection(write=True) as connection:
+            cursor = connection.execute(
+                "UPDATE users SET password = ? WHERE email = ? AND password = ?", (new_hash, email, old_hash)
+            )
+        if cursor.rowcount:
+            self._notify("password_rehashed", email)
+        return self.get_user(email)
+    
+    def upgrade_plan(self, email, plan, payment_method):
+        """Actualizar plan de usuario"""
+        with self._connection(write=True) as connection:
+            if connection.execute("SELECT 1 FROM users WHERE email = ?", (email,)).fetchone() is None:
+                return {"success": False, "message": "Usuario no encontrado"}
+            number = connection.execute("SELECT COALESCE(MAX(seq), 0) + 1 FROM payments").fetchone()[0]
+            payment = self.new_payment(number, email, plan, payment_method)
+            connection.execute(
+                f"INSERT INTO payments (seq, {', '.join(PAYMENT_FIELDS)}) VALUES (?, {', '.join('?' * len(PAYMENT_FIELDS))})",
+                [number] + [payment[field] for field in PAYMENT_FIELDS],
+            )
+            connection.execute("UPDATE users SET payment_pending = ? WHERE email = ?", (payment["id"], email))
+        self._notify("payment_created", email)
+        return self.payment_registered(payment, payment_method, plan)
+    
+    def confirm_payments(self, payment_ids):
+        confirmed = {}
+        with self._connection(write=True) as connection:
+            for payment_id in dict.fromkeys(payment_ids):
+                rows = connection.execute(
+                    """UPDATE payments SET status = 'confirmado', confirmed_at = ?
+                       WHERE id = ? AND status = 'pendiente' RETURNING email, plan""",
+                    (datetime.now().isoformat(), payment_id),
+                ).fetchall()
+                if not rows:
+                    continue
+                email, plan = rows[0]
+                expires_at = self.plan_expiration(plan)
+                connection.execute(
+                    """UPDATE users SET plan = ?, payment_pending = NULL,
+                           expires_at = CASE WHEN ? IS NULL THEN expires_at ELSE ? END
+                       WHERE email = ?""",
+                    (plan, expires_at, expires_at, email),
+                )
+                confirmed[payment_id] = email
+        for email in dict.fromkeys(confirmed.values()):
+            self._notify("payment_confirmed", email)
+        return list(confirmed)
+    
+    def get_pending_payments(self):
+        """Obtener pagos pendientes"""
+        return self.list_payments(status="pendiente")
+    
+    def get_payment(self, payment_id):
+        with self._connection() as connection:
+            row = connection.execute("SELECT * FROM payments WHERE id = ?", (payment_id,)).fetchone()
+        return None if row is None else self._payment(row)
+    
+    def get_user_payments(self, email):
+        with self._connection() as connection:
+            rows = connection.execute("SELECT * FROM payments WHERE email = ? ORDER BY seq", (email,)).fetchall()
+        return [self._payment(row) for row in rows]
+    
+    def get_user(self, email):
+        with self._connection() as connection:
+            row = connection.execute("SELECT * FROM users WHERE email = ?", (email,)).fetchone()
+        return None if row is None else dict(row)
+    
+    def list_users(self):
+        with self._connection() as connection:
+            return [dict(row) for row in connection.execute("SELECT * FROM users ORDER BY rowid")]
+    
+    def count_users(self):
+        with self._connection() as connection:
+            return connection.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+    
+    def list_payments(self, status=None, plan=None):
+        where, parameters = sql_filters(status=status, plan=plan)
+        with self._connection() as connection:
+            rows = connection.execute(f"SELECT * FROM payments {where} ORDER BY seq", parameters).fetchall()
+        return [self._payment(row) for row in rows]
+    
+    def _query(self, table, order, sort, descending, limit, offset, **filters):
+        """Total y página de una consulta filtrada; solo se leen las filas de la página"""
+        where, parameters = sql_filters(**filters)
+        direction = "DESC" if descending else "ASC"
+        columns = [order] if sort == "created_at" else [sort, order]
+        with self._connection() as connection:
+            total = connection.execute(f"SELECT COUNT(*) FROM {table} {where}", parameters).fetchone()[0]
+            rows = connection.execute(
+                f"SELECT * FROM {table} {where} ORDER BY {', '.join(f'{c} {direction}' for c in columns)} LIMIT ? OFFSET ?",
+                parameters + [limit, offset],
+            ).fetchall()
+        return total, rows
+    
+    def query_users(self, search=None, plan=None, sort="created_at", descending=False, limit=50, offset=0):
+        check_sort(sort, USER_SORT_FIELDS)
+        total, rows = self._query("users", "rowid", sort, descending, limit, offset, search=search, plan=plan)
+        return {"rows": [dict(row) for row in rows], "total": total}
+    
+    def query_payments(self, search=None, status=None, plan=None, sort="created_at", descending=True, limit=50, offset=0):
+        check_sort(sort, PAYMENT_SORT_FIELDS)
+        total, rows = self._query("payments", "seq", sort, descending, limit, offset,
+                                  search=search, status=status, plan=plan)
+        return {"rows": [self._payment(row) for row in rows], "total": total}
+    
+    def set_users_plan(self, emails, plan, never_expires=False):
+        expires_at = None if never_expires else self.plan_expiration(plan)
+        with self._connection(write=True) as connection:
+            updated = {row[0] for row in connection.execute(
+                """UPDATE users SET plan = ?, expires_at = ?, payment_pending = NULL
+                   WHERE email IN (SELECT value FROM json_each(?)) RETURNING email""",
+                (plan, expires_at, json.dumps(list(emails))),
+            ).fetchall()}
+        updated = [email for email in dict.fromkeys(emails) if email in updated]
+        for email in updated:
+            self._notify("plan_changed", email)
+        return updated
+    
+    def delete_users(self, emails):
+        with self._connection(write=True) as connection:
+            deleted = {row[0] for row in connection.execute(
+                "DELETE FROM users WHERE email IN (SELECT value FROM json_each(?)) RETURNING email",
+                (json.dumps(list(emails)),),
+            ).fetchall()}
+        deleted = [email for email in dict.fromkeys(emails) if email in deleted]
+        for email in deleted:
+            self._notify("user_deleted", email)
+        return deleted
+    
+    def get_statistics(self):
+        with self._connection() as connection:
+            rows = connection.execute("SELECT metric, key, value FROM statistics").fetchall()
+        counters = {}
+        for metric, key, value in rows:
+            counters.setdefault(metric, {})[key] = value
+        return statistics_summary(counters)
+    
+    def next_expiration(self):
+        with self._connection() as connection:
+            return connection.execute(
+                "SELECT MIN(expires_at) FROM users WHERE plan != 'gratuito' AND expires_at IS NOT NULL"
+            ).fetchone()[0]
+    
+    def expire_plans(self, now=None):
+        now = (now or datetime.now()).isoformat()
+        with self._connection(write=True) as connection:
+            expired = [row["email"] for row in connection.execute(
+                "UPDATE users SET plan = 'gratuito' WHERE plan != 'gratuito' AND expires_at <= ? RETURNING email", (now,)
+            ).fetchall()]
+        for email in expired:
+            self._notify("plans_expired", email)
+        log_expired(expired)
+        return expired
+
+# =====================
+# VENCIMIENTO DE PLANES
+# =====================
+
+class PlanExpiryScheduler:
+    """
+    Hilo que duerme hasta el próximo vencimiento y entonces pasa a gratuito, en bloque, todos los
+    planes vencidos. Una confirmación de pago lo despierta (puede traer un vencimiento más cercano);
+    max_wait acota la espera para ver vencimientos escritos por otros procesos
+    """
+    
+    def __init__(self, system, max_wait=3600):
+        self.system = system
+        self.max_wait = max_wait
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = None
+        system.add_listener(self._on_change)
+    
+    def _on_change(self, event, email):
+        if event in ("payment_confirmed", "plan_changed"):
+            self._wake.set()
+    
+    def seconds_until_next(self, now=None):
+        """Segundos hasta el próximo vencimiento (acotados a [0, max_wait])"""
+        next_expiration = self.system.next_expiration()
+        if next_expiration is None:
+            return self.max_wait
+        remaining = (datetime.fromisoformat(next_expiration) - (now or datetime.now())).total_seconds()
+        return min(max(remaining, 0), self.max_wait)
+    
+    def start(self):
+        """Iniciar el hilo (una sola vez por proceso)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="vencer-planes", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+    
+    def _run(self):
+        while not self._stopped:
+            try:
+                self.system.expire_plans()
+                wait = self.seconds_until_next()
+            except Exception:
+                logger.exception("Error al vencer planes")
+                wait = self.max_wait
+            self._wake.wait(wait)
+            self._wake.clear()
+
+def create_payment_system(config=None):
+    """Sistema de pagos según el almacenamiento configurado (admin_config.STORAGE_CONFIG)"""
+    config = config or get_storage_config()
+    if config.get("backend") == "json":
+        return SimplePaymentSystem(config["users_file"], config["payments_file"])
+    return SQLitePaymentSystem(config["database"], config["users_file"], config["payments_file"])
+
 # Instancia global del sistema de pagos
-payment_system = SimplePaymentSystem() 
\ No newline at end of file
+payment_system = create_payment_system()
+
+# Vencimiento de planes del sistema global (lo inician el panel de administración y la API)
+expiry_scheduler = PlanExpiryScheduler(payment_system)
+
+def start_expiry_scheduler():
+    expiry_scheduler.start()
+    return expiry_scheduler
\ No newline at end of file
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la API de integración (api_server.py)
+"""
+
+import asyncio
+import base64
+import json
+import time
+
+import motor_calculo
+from api_server import LimitadorTasa, ServidorAPI
+
+def _credenciales(email, clave):
+    return "Basic " + base64.b64encode(f"{email}:{clave}".encode()).decode()
+
+async def _solicitud(puerto, metodo, ruta, cuerpo=None, headers=None):
+    """Enviar una solicitud HTTP mínima y devolver (estado, cabeceras, json)"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", puerto)
+    datos = json.dumps(cuerpo).encode() if cuerpo is not None else b""
+    lineas = [f"{metodo} {ruta} HTTP/1.1", "Host: localhost", f"Content-Length: {len(datos)}"]
+    lineas += [f"{k}: {v}" for k, v in (headers or {}).items()]
+    writer.write(("\r\n".join(lineas) + "\r\n\r\n").encode() + datos)
+    await writer.drain()
+    respuesta = await reader.read()
+    writer.close()
+
+    cabecera, _, cuerpo_resp = respuesta.partition(b"\r\n\r\n")
+    lineas = cabecera.decode("latin-1").split("\r\n")
+    estado = int(lineas[0].split()[1])
+    cabeceras = dict(l.split(": ", 1) for l in lineas[1:])
+    return estado, cabeceras, json.loads(cuerpo_resp)
+
+def _con_servidor(prueba, **kwargs):
+    """Levantar el servidor en un puerto libre, ejecutar la prueba y detenerlo"""
+    async def _ejecutar():
+        kwargs.setdefault("autenticador", lambda e, c: "empresarial" if c == "ok" else None)
+        servidor = ServidorAPI(port=0, workers=2, **kwargs)
+        puerto = await servidor.iniciar()
+        try:
+            return await prueba(puerto)
+        finally:
+            await servidor.detener()
+    return asyncio.run(_ejecutar())
+
+def test_salud():
+    async def prueba(puerto):
+        estado, _, datos = await _solicitud(puerto, "GET", "/api/v1/salud")
+        assert estado == 200
+        assert "zapatas" in datos["operaciones"]
+    _con_servidor(prueba)
+
+def test_calculo_coincide_con_motor():
+    parametros = {"fc": 210, "fy": 4200, "Pu": 100000, "qu": 3.0}
+
+    async def prueba(puerto):
+        return await _solicitud(puerto, "POST", "/api/v1/calcular/zapatas", parametros)
+
+    estado, cabeceras, datos = _con_servidor(prueba)
+    assert estado == 200
+    assert cabeceras["X-Plan"] == "gratuito"
+    esperado = motor_calculo.calcular_diseno_zapatas(**parametros)
+    assert datos["resultado"]["lado_zapata"] == esperado["lado_zapata"]
+
+def test_lote_conserva_orden_y_errores():
+    lote = {"solicitudes": [
+        {"operacion": "sismico", "parametros": {"zona_sismica": "Z3", "tipo_suelo": "S1",
+                                                 "factor_importancia": 1.0, "peso_total": 550.5}},
+        {"operacion": "inexistente", "parametros": {}},
+        {"operacion": "columnas", "parametros": {"fc": 210, "fy": 4200, "Ag": 900, "Ast": 9, "Pu": 100000}},
+    ]}
+
+    async def prueba(puerto):
+        return await _solicitud(puerto, "POST", "/api/v1/lote", lote,
+                                {"Authorization": _credenciales("cliente@empresa.pe", "ok")})
+
+    estado, _, datos = _con_servidor(prueba)
+    assert estado == 200
+    assert [r["ok"] for r in datos["resultados"]] == [True, False, True]
+    assert datos["resultados"][0]["resultado"]["Z"] == 0.25
+    assert datos["resultados"][2]["operacion"] == "columnas"
+
+def test_limites_por_plan():
+    limitador = LimitadorTasa({"gratuito": {"solicitudes_por_minuto": 2, "max_lote": 1}})
+    parametros = {"zona_sismica": "Z2", "tipo_suelo": "S2", "factor_importancia": 1.0, "peso_total": 100}
+
+    async def prueba(puerto):
+        estados = []
+        for _ in range(3):
+            estado, cabeceras, _ = await _solicitud(puerto, "POST", "/api/v1/calcular/sismico", parametros)
+            estados.append(estado)
+        lote = {"solicitudes": [{"operacion": "sismico", "parametros": parametros}] * 2}
+        estado_lote, _, _ = await _solicitud(puerto, "POST", "/api/v1/lote", lote)
+        return estados, cabeceras, estado_lote
+
+    estados, cabeceras, estado_lote = _con_servidor(prueba, limitador=limitador)
+    assert estados == [200, 200, 429]
+    assert "Retry-After" in cabeceras
+    assert estado_lote == 413
+
+def test_credenciales_y_parametros_invalidos():
+    async def prueba(puerto):
+        no_autorizado = await _solicitud(puerto, "POST", "/api/v1/calcular/vigas", {},
+                                         {"Authorization": _credenciales("x@y.pe", "mal")})
+        invalido = await _solicitud(puerto, "POST", "/api/v1/calcular/vigas", {"fc": 210})
+        return no_autorizado[0], invalido[0]
+
+    assert _con_servidor(prueba) == (401, 400)
+
+def test_autenticacion_lenta_no_bloquea_el_servidor():
+    def autenticador_lento(email, clave):
+        time.sleep(1.0)  # como el PBKDF2 de login_user
+        return "empresarial"
+
+    async def prueba(puerto):
+        inicio = time.monotonic()
+        autenticada = asyncio.create_task(_solicitud(
+            puerto, "POST", "/api/v1/calcular/sismico",
+            {"zona_sismica": "Z2", "tipo_suelo": "S2", "factor_importancia": 1.0, "peso_total": 100},
+            {"Authorization": _credenciales("cliente@empresa.pe", "ok")},
+        ))
+        await asyncio.sleep(0.1)
+        estado_salud, _, _ = await _solicitud(puerto, "GET", "/api/v1/salud")
+        espera_salud = time.monotonic() - inicio
+        estado, cabeceras, _ = await autenticada
+        return estado_salud, espera_salud, estado, cabeceras["X-Plan"]
+
+    estado_salud, espera_salud, estado, plan = _con_servidor(prueba, autenticador=autenticador_lento)
+    assert estado_salud == 200 and espera_salud < 0.5
+    assert (estado, plan) == (200, "empresarial")
+
+def test_cubetas_inactivas_se_eliminan():
+    reloj = [0.0]
+    limitador = LimitadorTasa({"gratuito": {"solicitudes_por_minuto": 60, "max_lote": 1}}, reloj=lambda: reloj[0])
+    for i in range(100):
+        limitador.consumir(f"ip:10.0.0.{i}", "gratuito")
+    reloj[0] = 30.0
+    limitador.consumir("ip:10.0.1.1", "gratuito")
+    assert len(limitador.cubetas) == 101
+
+    # Pasado el intervalo, solo queda la cubeta usada en el último minuto (más la de esta solicitud)
+    reloj[0] = 61.0
+    assert limitador.consumir("ip:10.0.1.2", "gratuito")[0]
+    assert set(limitador.cubetas) == {"ip:10.0.1.1", "ip:10.0.1.2"}
+
+    # Una cubeta eliminada vuelve llena, igual que si se hubiera conservado
+    assert limitador.consumir("ip:10.0.0.1", "gratuito")[1] == 59
+
+def test_credenciales_recordadas_y_fallidas_limitadas_por_ip():
+    llamadas = []
+
+    def autenticador(email, clave):
+        llamadas.append((email, clave))
+        return "premium" if clave == "ok" else None
+
+    limitador = LimitadorTasa({"gratuito": {"solicitudes_por_minuto": 3, "max_lote": 1},
+                               "premium": {"solicitudes_por_minuto": 60, "max_lote": 10}})
+    parametros = {"zona_sismica": "Z2", "tipo_suelo": "S2", "factor_importancia": 1.0, "peso_total": 100}
+
+    async def prueba(puerto):
+        async def con(clave):
+            estado, _, _ = await _solicitud(puerto, "POST", "/api/v1/calcular/sismico", parametros,
+                                            {"Authorization": _credenciales("cliente@empresa.pe", clave)})
+            return estado
+        # La verificación correcta se recuerda: solo la primera pasa por el autenticador
+        correctas = [await con("ok") for _ in range(4)]
+        # Las incorrectas se cobran a la IP antes de verificar: la tercera ya no llega al KDF
+        incorrectas = [await con("mal") for _ in range(3)]
+        return correctas, incorrectas
+
+    correctas, incorrectas = _con_servidor(prueba, autenticador=autenticador, limitador=limitador)
+    assert correctas == [200] * 4
+    assert incorrectas == [401, 401, 429]
+    assert llamadas == [("cliente@empresa.pe", "ok")] + [("cliente@empresa.pe", "mal")] * 2
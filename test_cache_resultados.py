@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la caché de resultados (cache_resultados.py)
+"""
+
+from cache_resultados import CacheResultados, analisis_completo_cacheado, clave_resultados
+from motor_calculo import ejecutar_analisis_completo
+
+DATOS_AYACUCHO = {
+    "f_c": 210, "f_y": 4200, "L_viga": 6.0, "num_pisos": 3, "num_vanos": 4,
+    "CM": 350, "CV": 250, "zona_sismica": "Z3", "tipo_suelo": "S1",
+    "factor_importancia": 1.0,
+}
+
+class RelojFalso:
+    def __init__(self):
+        self.ahora = 0.0
+
+    def __call__(self):
+        return self.ahora
+
+def test_clave_canonica_y_versionada():
+    reordenado = dict(reversed(list(DATOS_AYACUCHO.items())))
+    reordenado["f_c"] = 210.0
+    assert clave_resultados(DATOS_AYACUCHO) == clave_resultados(reordenado)
+    assert clave_resultados(DATOS_AYACUCHO) != clave_resultados(DATOS_AYACUCHO, version="otra")
+    assert clave_resultados(DATOS_AYACUCHO) != clave_resultados({**DATOS_AYACUCHO, "CV": 300})
+
+def test_aciertos_fallos_y_copias():
+    cache = CacheResultados()
+    primero = analisis_completo_cacheado({**DATOS_AYACUCHO, "tipo_estructura": "Dual"}, cache)
+    primero["peso_total"] = -1
+    segundo = analisis_completo_cacheado(DATOS_AYACUCHO, cache)
+
+    assert segundo["peso_total"] == ejecutar_analisis_completo(**DATOS_AYACUCHO)["peso_total"]
+    estadisticas = cache.estadisticas()
+    assert (estadisticas["aciertos"], estadisticas["fallos"]) == (1, 1)
+
+def test_expulsion_lru_y_ttl():
+    reloj = RelojFalso()
+    cache = CacheResultados(max_entradas=2, ttl_segundos=10, reloj=reloj)
+    cache.guardar({"a": 1}, "A")
+    cache.guardar({"b": 1}, "B")
+    assert cache.obtener({"a": 1}) == "A"
+    cache.guardar({"c": 1}, "C")
+    assert cache.obtener({"b": 1}) is None
+
+    reloj.ahora = 11
+    assert cache.obtener({"a": 1}) is None
+    assert cache.estadisticas()["expulsiones"] == 2
+
+def test_limite_en_bytes():
+    cache = CacheResultados(max_entradas=10, max_bytes=10)
+    cache.guardar({"a": 1}, b"x" * 4)
+    cache.guardar({"b": 1}, b"x" * 4)
+    cache.guardar({"a": 1}, b"y" * 4)
+    assert cache.estadisticas()["bytes"] == 8
+    cache.guardar({"c": 1}, b"x" * 4)
+    assert cache.obtener({"b": 1}) is None
+    assert cache.obtener({"a": 1}) == b"y" * 4
+    assert cache.estadisticas()["bytes"] == 8
+
+    # Lo que excede el límite por sí solo no se guarda ni expulsa al resto
+    cache.guardar({"d": 1}, b"x" * 11)
+    assert cache.obtener({"d": 1}) is None
+    assert cache.estadisticas()["entradas"] == 2
+    cache.invalidar({"a": 1})
+    assert cache.estadisticas()["bytes"] == 4
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la comparación de análisis (comparacion_analisis.py)
+"""
+
+import pytest
+
+from cache_resultados import analisis_completo_cacheado
+from comparacion_analisis import campos_con_cambios, comparar_analisis, reporte_diferencias
+from test_cache_resultados import DATOS_AYACUCHO
+
+def test_deltas_y_cambios_de_verificacion():
+    base = analisis_completo_cacheado(DATOS_AYACUCHO)
+    suelo_s3 = analisis_completo_cacheado({**DATOS_AYACUCHO, "tipo_suelo": "S3", "L_viga": 8.0})
+    comparacion = comparar_analisis([("base", base), ("S3", suelo_s3), ("igual", base)])
+
+    deltas = comparacion["deltas"]
+    assert deltas.at["peso_total", "S3"] == pytest.approx(suelo_s3["peso_total"] - base["peso_total"])
+    assert (deltas["igual"] == 0).all() and (deltas["base"] == 0).all()
+    assert comparacion["deltas_pct"].at["d_viga", "S3"] == pytest.approx(100 / 3)
+    assert "diseno_flexion.verificacion" in comparacion["verificaciones"].index
+    assert "peso_total" not in comparacion["verificaciones"].index
+
+    # El caso Ayacucho solo existe en el base: en S3 no aplica y no cuenta como cambio de estado
+    verificaciones = comparacion["verificaciones"]
+    assert verificaciones.at["analisis_sismico.caso_ayacucho.coincidencia_peso", "S3"] is None
+    assert verificaciones.at["analisis_sismico.caso_ayacucho.coincidencia_peso", "base"]
+    assert comparacion["cambios_verificacion"] == []
+    assert "analisis_sismico.S" in campos_con_cambios(comparacion)
+    assert "beta1" not in campos_con_cambios(comparacion)
+
+    reporte = reporte_diferencias(comparacion)
+    assert "Ninguna verificación cambia de estado" in reporte
+    assert "coincidencia_peso: base ✅ Cumple, S3 ➖ No aplica, igual ✅ Cumple" in reporte
+    assert "| d_viga | 50 | 66.67 (+33.3%) | 50 (+0.0%) |" in reporte
+
+def test_cambio_de_verificacion_solo_si_ambos_tienen_el_campo():
+    base = {"flexion": {"verificacion": True, "Mu": 10.0}, "sismo": {"verificacion": True}}
+    otro = {"flexion": {"verificacion": False, "Mu": 12.0}}
+    comparacion = comparar_analisis([("base", base), ("otro", otro)])
+
+    assert comparacion["cambios_verificacion"] == [{
+        "verificacion": "flexion.verificacion", "analisis": "otro", "base": True, "ahora": False,
+    }]
+    reporte = reporte_diferencias(comparacion)
+    assert "flexion.verificacion (otro): ✅ Cumple → ❌ No cumple" in reporte
+    assert "sismo.verificacion (otro)" not in reporte
+    assert "sismo.verificacion: base ✅ Cumple, otro ➖ No aplica" in reporte
+
+    # Un valor numérico ausente se muestra como "no aplica"
+    sin_mu = comparar_analisis([("base", base), ("otro", {"flexion": {"verificacion": True}})])
+    assert campos_con_cambios(sin_mu) == ["flexion.Mu"]
+    assert "| flexion.Mu | 10 | no aplica |" in reporte_diferencias(sin_mu)
+
+def test_requiere_dos_analisis_con_nombres_distintos():
+    resultados = analisis_completo_cacheado(DATOS_AYACUCHO)
+    with pytest.raises(ValueError):
+        comparar_analisis([("a", resultados)])
+    with pytest.raises(ValueError):
+        comparar_analisis([("a", resultados), ("a", resultados)])
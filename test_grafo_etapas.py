@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Pruebas del cálculo incremental por etapas (grafo_etapas.py)
+"""
+
+import pytest
+
+from cache_resultados import CacheResultados, analisis_completo_cacheado
+from grafo_etapas import Etapa, GrafoEtapas, MemoEtapas
+from motor_calculo import ejecutar_analisis_completo, ejecutar_analisis_incremental
+from test_cache_resultados import DATOS_AYACUCHO
+
+def test_cambio_de_carga_viva_no_recalcula_materiales_ni_geometria():
+    memo = MemoEtapas()
+    ejecutar_analisis_incremental(DATOS_AYACUCHO, memo)
+    otros = {**DATOS_AYACUCHO, "CV": 300, "zona_sismica": "Z4"}
+    resultados = ejecutar_analisis_incremental(otros, memo)
+
+    assert resultados == ejecutar_analisis_completo(**otros)
+    assert {"props_concreto", "props_acero", "geometria"}.isdisjoint(memo.recalculadas)
+    assert "seccion_columna" in memo.recalculadas and "resultados" in memo.recalculadas
+
+    ejecutar_analisis_incremental(otros, memo)
+    assert memo.recalculadas == ()
+
+def test_resultados_devueltos_no_alteran_el_memo():
+    memo = MemoEtapas()
+    resultados = ejecutar_analisis_incremental(DATOS_AYACUCHO, memo)
+    resultados["diseno_flexion"]["As"] = -1
+    assert ejecutar_analisis_incremental(DATOS_AYACUCHO, memo)["diseno_flexion"]["As"] > 0
+
+def test_cache_con_memo():
+    cache, memo = CacheResultados(), MemoEtapas()
+    analisis_completo_cacheado(DATOS_AYACUCHO, cache, memo)
+    assert len(memo.recalculadas) > 0
+    analisis_completo_cacheado(DATOS_AYACUCHO, cache, memo)
+    assert memo.recalculadas == ()
+
+def test_ciclo_y_datos_faltantes():
+    with pytest.raises(ValueError, match="ciclo"):
+        GrafoEtapas([Etapa("a", abs, ["b"]), Etapa("b", abs, ["a"])])
+    grafo = GrafoEtapas([Etapa("doble", lambda x: 2 * x, ["x"])])
+    with pytest.raises(ValueError, match="Faltan"):
+        grafo.ejecutar({})
+    assert grafo.ejecutar({"x": 3})["doble"] == 6
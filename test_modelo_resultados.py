@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Pruebas del modelo de resultados (modelo_resultados.py)
+"""
+
+import io
+
+import pytest
+
+from cache_resultados import analisis_completo_cacheado
+from modelo_resultados import Fila, construir_modelo, reporte_excel, reporte_markdown, reporte_txt
+from test_cache_resultados import DATOS_AYACUCHO
+
+@pytest.fixture
+def modelo():
+    return construir_modelo(analisis_completo_cacheado(DATOS_AYACUCHO), DATOS_AYACUCHO, fecha="01/01/2026 10:00")
+
+def test_modelo_inmutable_y_con_slots(modelo):
+    assert not hasattr(modelo, "__dict__")
+    with pytest.raises(AttributeError):
+        modelo.fecha = "otra"
+    assert modelo.entrada[0] == Fila("Resistencia del concreto (f'c)", "210", "kg/cm²")
+
+def test_vistas_comparten_las_mismas_filas(modelo):
+    markdown = reporte_markdown(modelo, "premium")
+    texto = reporte_txt(modelo, "premium")
+    for filas in (modelo.entrada, modelo.materiales, modelo.dimensiones, modelo.verificaciones):
+        for fila in filas:
+            assert f"- {fila.texto()}" in markdown
+            assert f"- {fila.texto()}" in texto
+    assert "#" not in texto and "**" not in texto
+
+    basico = reporte_markdown(modelo, "gratuito")
+    assert "Zona Sísmica" not in basico and "Plan: Gratuito" in basico
+
+def test_excel_con_una_fila_por_dato(modelo):
+    from openpyxl import load_workbook
+
+    hoja = load_workbook(io.BytesIO(reporte_excel(modelo))).active
+    filas = {(fila[0], fila[1]) for fila in hoja.iter_rows(values_only=True)}
+    assert ("Peso total estimado", modelo.dimensiones[0].valor) in filas
+    assert ("β1", modelo.materiales[-1].valor) in filas
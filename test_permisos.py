@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Pruebas de los permisos por plan (permisos.py)
+"""
+
+from permisos import ServicioPermisos
+from simple_payment_system import SimplePaymentSystem
+
+def test_funciones_por_plan_y_administrador():
+    servicio = ServicioPermisos()
+    gratuito = servicio.resolver("ana@dej.pe", "gratuito")
+    assert gratuito.puede("calculo_basico") and not gratuito.puede("analisis_completo")
+    premium = servicio.resolver("ana@dej.pe", "premium")
+    assert premium.puede("reporte_pdf") and not premium.puede("multiples_proyectos")
+    assert servicio.resolver("ana@dej.pe", "empresarial").puede("multiples_proyectos")
+    assert servicio.resolver("ana@dej.pe", "plan_inventado").plan == "gratuito"
+
+    # El administrador cambia de plan y ve el análisis completo aunque pruebe el plan gratuito
+    admin = servicio.resolver("admin", "gratuito")
+    assert admin.es_admin and admin.puede("cambiar_plan") and admin.puede("analisis_completo")
+    assert not admin.puede("reporte_pdf") and not premium.puede("cambiar_plan")
+
+def test_cambios_de_pago_invalidan_los_permisos(tmp_path):
+    sistema = SimplePaymentSystem(str(tmp_path / "users.json"), str(tmp_path / "payments.json"))
+    sistema.register_user("ana@dej.pe", "clave", "Ana")
+    servicio = ServicioPermisos()
+    servicio.conectar(sistema)
+    servicio.conectar(sistema)  # idempotente: un solo listener
+    permisos = servicio.resolver("ana@dej.pe", "gratuito")
+    assert servicio.vigentes(permisos) is permisos
+
+    pago = sistema.upgrade_plan("ana@dej.pe", "premium", "yape")["payment_id"]
+    pendiente = servicio.vigentes(permisos)
+    assert pendiente is not permisos and pendiente.plan == "gratuito"
+    assert servicio.vigentes(pendiente) is pendiente
+
+    version = servicio.version("ana@dej.pe")
+    sistema.confirm_payment(pago)
+    assert servicio.version("ana@dej.pe") == version + 1
+    confirmado = servicio.vigentes(pendiente)
+    assert confirmado.plan == "premium" and confirmado.puede("analisis_completo")
+
+    # Un cambio de otro usuario no invalida estos permisos
+    sistema.register_user("luis@dej.pe", "clave", "Luis")
+    assert servicio.vigentes(confirmado) is confirmado
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Pruebas del almacén de proyectos (proyectos.py)
+"""
+
+import sqlite3
+
+import pytest
+
+from cache_resultados import analisis_completo_cacheado
+from proyectos import AlmacenProyectos
+from test_cache_resultados import DATOS_AYACUCHO
+
+@pytest.fixture
+def almacen(tmp_path):
+    return AlmacenProyectos(str(tmp_path / "proyectos.db"))
+
+def test_guardar_abrir_y_aislar_por_propietario(almacen):
+    resultados = analisis_completo_cacheado(DATOS_AYACUCHO)
+    id_proyecto = almacen.guardar("ana@dej.pe", "Colegio Huamanga", DATOS_AYACUCHO, resultados)
+    assert almacen.guardar("ana@dej.pe", "colegio huamanga", {**DATOS_AYACUCHO, "CV": 300}) == id_proyecto
+
+    abierto = almacen.abrir("ana@dej.pe", id_proyecto)
+    assert abierto["datos_entrada"]["CV"] == 300 and abierto["resultados"] is None
+    assert almacen.abrir("luis@dej.pe", id_proyecto) is None
+    assert almacen.listar("luis@dej.pe") == []
+
+    almacen.guardar("ana@dej.pe", "Colegio Huamanga", DATOS_AYACUCHO, resultados)
+    assert almacen.abrir("ana@dej.pe", id_proyecto)["resultados"] == resultados
+
+    id_reporte = almacen.guardar_reporte("ana@dej.pe", id_proyecto, "pdf", b"%PDF-1.4")
+    assert almacen.guardar_reporte("luis@dej.pe", id_proyecto, "pdf", b"x") is None
+    assert almacen.obtener_reporte("ana@dej.pe", id_reporte) == b"%PDF-1.4"
+    assert almacen.eliminar("ana@dej.pe", id_proyecto)
+    assert almacen.obtener_reporte("ana@dej.pe", id_reporte) is None
+
+def test_listar_buscar_e_indices(almacen):
+    for i in range(30):
+        almacen.guardar("ana@dej.pe", f"Proyecto {i}{' 100%_colegio' if i % 10 == 0 else ''}", DATOS_AYACUCHO)
+    almacen.guardar("ana@dej.pe", "Proyecto 5", {**DATOS_AYACUCHO, "CM": 400})
+
+    recientes = almacen.listar("ana@dej.pe", limite=3)
+    assert [p["nombre"] for p in recientes][0] == "Proyecto 5"
+    assert len(almacen.listar("ana@dej.pe", limite=10, desplazamiento=25)) == 5
+    assert almacen.contar("ana@dej.pe") == 30
+    assert len(almacen.buscar("ana@dej.pe", "100%_COLEGIO")) == 3
+    assert almacen.buscar("ana@dej.pe", "1%") == []
+
+    conexion = sqlite3.connect(almacen.ruta)
+    assert conexion.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    plan = conexion.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM proyectos WHERE propietario = ? ORDER BY modificado DESC", ("ana",)
+    ).fetchall()
+    assert "idx_proyectos_propietario_modificado" in plan[0][-1]
+
+def test_historial_de_versiones_con_deltas_y_checkpoints(almacen):
+    historial = [{**DATOS_AYACUCHO, "CV": 200 + 10 * i} for i in range(25)]
+    for datos in historial:
+        id_proyecto = almacen.guardar("ana@dej.pe", "Mercado", datos)
+    almacen.guardar("ana@dej.pe", "Mercado", historial[-1], {"peso_total": 1.0})
+
+    versiones = almacen.versiones("ana@dej.pe", id_proyecto)
+    assert [v["numero"] for v in versiones] == list(range(25, 0, -1))
+    assert [v["numero"] for v in versiones if v["es_checkpoint"]] == [21, 11, 1]
+    assert versiones[0]["con_resultados"] and not versiones[1]["con_resultados"]
+    assert almacen.versiones("luis@dej.pe", id_proyecto) == []
+
+    for numero in (1, 10, 17, 25):
+        assert almacen.abrir_version("ana@dej.pe", id_proyecto, numero)["datos_entrada"] == historial[numero - 1]
+    assert almacen.abrir_version("ana@dej.pe", id_proyecto, 25)["resultados"] == {"peso_total": 1.0}
+    assert almacen.abrir_version("luis@dej.pe", id_proyecto, 3) is None
+
+    conexion = sqlite3.connect(almacen.ruta)
+    tamanos = dict(conexion.execute("SELECT numero, length(datos) FROM versiones"))
+    assert tamanos[2] < tamanos[1] / 2
+
+    assert almacen.restaurar_version("ana@dej.pe", id_proyecto, 3)
+    assert almacen.abrir("ana@dej.pe", id_proyecto)["datos_entrada"] == historial[2]
+    assert almacen.versiones("ana@dej.pe", id_proyecto)[0]["numero"] == 26
+    assert almacen.eliminar("ana@dej.pe", id_proyecto)
+    assert conexion.execute("SELECT COUNT(*) FROM versiones").fetchone()[0] == 0
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Pruebas del reporte PDF (reporte_pdf.py)
+"""
+
+from io import BytesIO
+
+import reporte_pdf
+from cache_resultados import CacheResultados, analisis_completo_cacheado
+from modelo_resultados import construir_modelo
+from test_cache_resultados import DATOS_AYACUCHO
+
+def test_pdf_bajo_demanda_y_en_cache(monkeypatch):
+    generados = []
+    original = reporte_pdf.generar_pdf_reportlab
+
+    def contar(resultados, datos_entrada, plan="premium", **opciones):
+        generados.append(plan)
+        return original(resultados, datos_entrada, plan, **opciones)
+
+    monkeypatch.setattr(reporte_pdf, "generar_pdf_reportlab", contar)
+    monkeypatch.setattr(reporte_pdf, "cache_pdf", CacheResultados())
+    resultados = analisis_completo_cacheado(DATOS_AYACUCHO)
+
+    assert reporte_pdf.pdf_en_cache(resultados, DATOS_AYACUCHO, "premium") is None
+    pdf = reporte_pdf.obtener_pdf_reporte(resultados, DATOS_AYACUCHO, "premium")
+    assert pdf.startswith(b"%PDF")
+    assert reporte_pdf.obtener_pdf_reporte(resultados, DATOS_AYACUCHO, "premium") == pdf
+    assert reporte_pdf.pdf_en_cache(resultados, DATOS_AYACUCHO, "premium") == pdf
+
+    reporte_pdf.obtener_pdf_reporte(resultados, DATOS_AYACUCHO, "gratuito")
+    assert generados == ["premium", "gratuito"]
+
+def test_figuras_en_paralelo_en_orden(monkeypatch):
+    monkeypatch.setattr(reporte_pdf.os, "cpu_count", lambda: 2)
+    tareas = [
+        (reporte_pdf.figura_zona_sismica, ("Z4",)),
+        (reporte_pdf.figura_cortantes_momentos, (6.0, 600.0)),
+    ]
+    try:
+        en_pool = [obtener() for obtener in reporte_pdf.enviar_figuras(tareas)]
+    finally:
+        reporte_pdf._executor_figuras.shutdown()
+        monkeypatch.setattr(reporte_pdf, "_executor_figuras", None)
+
+    monkeypatch.setattr(reporte_pdf, "FIGURAS_EN_PARALELO", False)
+    en_serie = [obtener() for obtener in reporte_pdf.enviar_figuras(tareas)]
+    assert all(png.startswith(b"\x89PNG") for png in en_pool)
+    assert [len(png) for png in en_pool] == [len(png) for png in en_serie]
+
+def test_pdf_incluye_las_figuras(monkeypatch):
+    monkeypatch.setattr(reporte_pdf, "FIGURAS_EN_PARALELO", False)
+    resultados = analisis_completo_cacheado(DATOS_AYACUCHO)
+    pdf = reporte_pdf.generar_pdf_reportlab(resultados, DATOS_AYACUCHO).read()
+    assert pdf.count(b"/Subtype /Image") >= 3
+
+def test_perfil_vectorial_sin_imagenes_y_mas_liviano(monkeypatch):
+    monkeypatch.setattr(reporte_pdf, "FIGURAS_EN_PARALELO", False)
+    resultados = analisis_completo_cacheado(DATOS_AYACUCHO)
+    raster = reporte_pdf.generar_pdf_reportlab(resultados, DATOS_AYACUCHO).read()
+    vectorial = reporte_pdf.generar_pdf_reportlab(resultados, DATOS_AYACUCHO, perfil="vectorial").read()
+
+    assert vectorial.startswith(b"%PDF")
+    assert raster.count(b"/Subtype /Image") >= 3 and vectorial.count(b"/Subtype /Image") == 0
+    assert len(vectorial) < len(raster)
+
+def test_paginas_estaticas_precompiladas(monkeypatch):
+    from pypdf import PdfReader
+    monkeypatch.setattr(reporte_pdf, "cache_paginas_estaticas", CacheResultados(ttl_segundos=None))
+    resultados = analisis_completo_cacheado(DATOS_AYACUCHO)
+    unido = PdfReader(reporte_pdf.generar_pdf_reportlab(resultados, DATOS_AYACUCHO, perfil="vectorial"))
+    reporte_pdf.generar_pdf_reportlab(resultados, DATOS_AYACUCHO, perfil="vectorial")
+    assert reporte_pdf.cache_paginas_estaticas.estadisticas()["aciertos"] == 1
+
+    monkeypatch.setattr(reporte_pdf, "PYPDF_AVAILABLE", False)
+    completo = PdfReader(reporte_pdf.generar_pdf_reportlab(resultados, DATOS_AYACUCHO, perfil="vectorial"))
+    assert len(unido.pages) == len(completo.pages)
+    assert "Fecha de Análisis" in unido.pages[0].extract_text()
+    assert [p.extract_text().splitlines()[0] for p in unido.pages] == [p.extract_text().splitlines()[0] for p in completo.pages]
+
+def test_pdf_grande_se_vuelca_a_disco(monkeypatch):
+    monkeypatch.setattr(reporte_pdf, "UMBRAL_PDF_EN_MEMORIA", 16 * 1024)
+    resultados = analisis_completo_cacheado(DATOS_AYACUCHO)
+    with reporte_pdf.generar_pdf_reportlab(resultados, DATOS_AYACUCHO, perfil="vectorial") as pdf:
+        assert pdf._rolled
+        assert pdf.read(5) == b"%PDF-"
+
+def test_portada_con_la_fecha_del_modelo(monkeypatch):
+    from pypdf import PdfReader
+    monkeypatch.setattr(reporte_pdf, "cache_pdf", CacheResultados())
+    resultados = analisis_completo_cacheado(DATOS_AYACUCHO)
+    modelo = construir_modelo(resultados, DATOS_AYACUCHO, fecha="01/02/2025 09:30")
+    pdf = reporte_pdf.obtener_pdf_reporte(resultados, DATOS_AYACUCHO, "premium", "vectorial", modelo=modelo)
+    assert "01/02/2025 09:30" in PdfReader(BytesIO(pdf)).pages[0].extract_text()
+
+def test_progreso_de_diseno_despues_de_maquetar(monkeypatch):
+    from reportlab.platypus import SimpleDocTemplate
+    eventos = []
+    original = SimpleDocTemplate.build
+
+    def construir(doc, *args, **kwargs):
+        eventos.append("build")
+        return original(doc, *args, **kwargs)
+
+    monkeypatch.setattr(SimpleDocTemplate, "build", construir)
+    resultados = analisis_completo_cacheado(DATOS_AYACUCHO)
+    with reporte_pdf.generar_pdf_reportlab(resultados, DATOS_AYACUCHO, progreso=eventos.append, perfil="vectorial"):
+        pass
+    assert eventos[-2:] == ["build", "diseno"]
@@ -0,0 +1,545 @@
+#!/usr/bin/env python3
+"""
+Pruebas del sistema de pagos (simple_payment_system.py)
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import simple_payment_system
+from simple_payment_system import PlanExpiryScheduler, SimplePaymentSystem, SQLitePaymentSystem, create_payment_system
+
+@pytest.fixture(autouse=True)
+def kdf_rapido(monkeypatch):
+    # Pocas iteraciones del KDF para que las pruebas no tarden (también en los procesos hijos)
+    monkeypatch.setattr(simple_payment_system, "PASSWORD_ITERATIONS", 1000)
+    monkeypatch.setenv("PASSWORD_ITERATIONS", "1000")
+
+@pytest.fixture(params=["json", "sqlite"])
+def sistema(request, tmp_path):
+    return create_payment_system({
+        "backend": request.param,
+        "database": str(tmp_path / "payments.db"),
+        "users_file": str(tmp_path / "users.json"),
+        "payments_file": str(tmp_path / "payments.json"),
+    })
+
+def test_verificar_credenciales_sin_abrir_sesion(sistema):
+    sistema.register_user("ana@dej.pe", "clave", "Ana")
+    assert sistema.check_credentials("ana@dej.pe", "clave")["user"]["email"] == "ana@dej.pe"
+    assert sistema.check_credentials("ana@dej.pe", "otra")["message"] == "Contraseña incorrecta"
+    assert "token" not in sistema.check_credentials("ana@dej.pe", "clave")
+    assert sistema.login_user("ana@dej.pe", "clave")["token"]
+
+def test_registro_duplicado_y_login(sistema):
+    assert sistema.register_user("ana@dej.pe", "clave", "Ana")["success"]
+    duplicado = sistema.register_user("ana@dej.pe", "otra", "Ana 2")
+    assert not duplicado["success"] and duplicado["message"] == "El email ya está registrado"
+    assert sistema.get_user("ana@dej.pe")["name"] == "Ana"
+
+    assert sistema.login_user("ana@dej.pe", "clave")["user"]["plan"] == "gratuito"
+    assert sistema.login_user("ana@dej.pe", "otra")["message"] == "Contraseña incorrecta"
+    assert sistema.login_user("luis@dej.pe", "clave")["message"] == "Usuario no encontrado"
+
+def test_pago_pendiente_y_confirmacion(sistema):
+    sistema.register_user("ana@dej.pe", "clave", "Ana")
+    assert not sistema.upgrade_plan("luis@dej.pe", "premium", "yape")["success"]
+
+    resultado = sistema.upgrade_plan("ana@dej.pe", "premium", "yape")
+    assert resultado["success"] and "$29.99" in resultado["instructions"]
+    assert sistema.get_user("ana@dej.pe")["payment_pending"] == resultado["payment_id"]
+    assert [p["id"] for p in sistema.get_pending_payments()] == [resultado["payment_id"]]
+
+    assert sistema.confirm_payment(resultado["payment_id"])["success"]
+    assert not sistema.confirm_payment(resultado["payment_id"])["success"]
+    usuario = sistema.get_user("ana@dej.pe")
+    assert usuario["plan"] == "premium" and usuario["payment_pending"] is None and usuario["expires_at"]
+    assert sistema.get_pending_payments() == []
+    assert sistema.list_payments(status="confirmado", plan="premium")[0]["confirmed_at"]
+
+    assert sistema.set_user_plan("ana@dej.pe", "empresarial")
+    assert sistema.list_users()[0]["plan"] == "empresarial"
+    assert sistema.delete_user("ana@dej.pe") and not sistema.delete_user("ana@dej.pe")
+    assert sistema.count_users() == 0 and len(sistema.list_payments()) == 1
+
+def test_migracion_unica_desde_json(tmp_path):
+    archivos = (str(tmp_path / "users.json"), str(tmp_path / "payments.json"))
+    legado = SimplePaymentSystem(*archivos)
+    legado.register_user("ana@dej.pe", "clave", "Ana")
+    pago = legado.upgrade_plan("ana@dej.pe", "empresarial", "paypal")["payment_id"]
+
+    sistema = SQLitePaymentSystem(str(tmp_path / "payments.db"), *archivos)
+    assert sistema.login_user("ana@dej.pe", "clave")["success"]
+    assert sistema.get_user("ana@dej.pe")["payment_pending"] == pago
+    assert sistema.confirm_payment(pago)["success"]
+    # El número del siguiente pago continúa el historial migrado
+    assert sistema.upgrade_plan("ana@dej.pe", "premium", "yape")["payment_id"].startswith("pay_2_")
+
+    # Una segunda apertura no vuelve a importar los JSON
+    with open(archivos[0], "w", encoding="utf-8") as f:
+        json.dump({"luis@dej.pe": {**legado.users["ana@dej.pe"], "email": "luis@dej.pe"}}, f)
+    otra = SQLitePaymentSystem(str(tmp_path / "payments.db"), *archivos)
+    assert otra.get_user("luis@dej.pe") is None and otra.count_users() == 1
+
+def test_rollback_si_falla_la_confirmacion(tmp_path, monkeypatch):
+    sistema = SQLitePaymentSystem(str(tmp_path / "payments.db"), str(tmp_path / "u.json"), str(tmp_path / "p.json"))
+    sistema.register_user("ana@dej.pe", "clave", "Ana")
+    pago = sistema.upgrade_plan("ana@dej.pe", "premium", "yape")["payment_id"]
+
+    def falla(plan):
+        raise RuntimeError("fallo a mitad de la transacción")
+    monkeypatch.setattr(sistema, "plan_expiration", falla)
+    with pytest.raises(RuntimeError):
+        sistema.confirm_payment(pago)
+
+    # El pago sigue pendiente y el usuario sin cambios
+    assert [p["id"] for p in sistema.get_pending_payments()] == [pago]
+    assert sistema.get_user("ana@dej.pe")["plan"] == "gratuito"
+    conexion = sqlite3.connect(sistema.database)
+    assert conexion.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+def test_indices_de_pagos(sistema):
+    for i in range(5):
+        sistema.register_user(f"u{i}@dej.pe", "clave", f"U{i}")
+    pagos = [sistema.upgrade_plan(f"u{i % 5}@dej.pe", "premium", "yape")["payment_id"] for i in range(20)]
+    for pago in pagos[::3]:
+        sistema.confirm_payment(pago)
+
+    confirmados = set(pagos[::3])
+    assert [p["id"] for p in sistema.get_pending_payments()] == [p for p in pagos if p not in confirmados]
+    assert {p["id"] for p in sistema.list_payments(status="confirmado")} == confirmados
+    assert [p["id"] for p in sistema.get_user_payments("u1@dej.pe")] == pagos[1::5]
+    assert sistema.get_payment(pagos[3])["status"] == "confirmado"
+    assert sistema.get_payment("pay_no_existe") is None
+
+def test_indices_json_se_reconstruyen_al_cargar(tmp_path):
+    archivos = (str(tmp_path / "users.json"), str(tmp_path / "payments.json"))
+    sistema = SimplePaymentSystem(*archivos)
+    sistema.register_user("ana@dej.pe", "clave", "Ana")
+    pago = sistema.upgrade_plan("ana@dej.pe", "premium", "yape")["payment_id"]
+
+    recargado = SimplePaymentSystem(*archivos)
+    assert recargado.get_pending_payments()[0]["id"] == pago
+    assert recargado.confirm_payment(pago)["success"]
+    assert recargado.get_pending_payments() == [] and recargado.get_user_payments("ana@dej.pe")[0]["confirmed_at"]
+
+def test_consultas_sqlite_usan_indices(tmp_path):
+    sistema = SQLitePaymentSystem(str(tmp_path / "payments.db"), str(tmp_path / "u.json"), str(tmp_path / "p.json"))
+    sistema.count_users()
+    conexion = sqlite3.connect(sistema.database)
+    for consulta, indice in (
+        ("SELECT * FROM payments WHERE status = 'pendiente' ORDER BY seq", "idx_payments_status"),
+        ("SELECT * FROM payments WHERE email = 'a' ORDER BY seq", "idx_payments_email"),
+        ("SELECT * FROM payments WHERE id = 'pay_1'", "sqlite_autoindex_payments_1"),
+    ):
+        plan = conexion.execute(f"EXPLAIN QUERY PLAN {consulta}").fetchall()
+        assert indice in plan[0][-1]
+
+def _registrar_varios(archivos, prefijo, cantidad):
+    sistema = SimplePaymentSystem(*archivos)
+    for i in range(cantidad):
+        sistema.register_user(f"{prefijo}{i}@dej.pe", "clave", prefijo)
+        sistema.upgrade_plan(f"{prefijo}{i}@dej.pe", "premium", "yape")
+
+def test_json_recarga_cambios_de_otra_instancia(tmp_path):
+    archivos = (str(tmp_path / "users.json"), str(tmp_path / "payments.json"))
+    a, b = SimplePaymentSystem(*archivos), SimplePaymentSystem(*archivos)
+    a.register_user("ana@dej.pe", "clave", "Ana")
+    assert b.get_user("ana@dej.pe")["name"] == "Ana"
+
+    # b escribe sobre los datos de a en vez de su copia anterior en memoria
+    b.register_user("luis@dej.pe", "clave", "Luis")
+    pago = a.upgrade_plan("luis@dej.pe", "premium", "yape")["payment_id"]
+    assert b.confirm_payment(pago)["success"]
+    assert {u["email"] for u in SimplePaymentSystem(*archivos).list_users()} == {"ana@dej.pe", "luis@dej.pe"}
+    assert a.get_user("luis@dej.pe")["plan"] == "premium"
+
+def test_json_escritura_fallida_conserva_el_archivo(tmp_path, monkeypatch):
+    archivos = (str(tmp_path / "users.json"), str(tmp_path / "payments.json"))
+    sistema = SimplePaymentSystem(*archivos)
+    sistema.register_user("ana@dej.pe", "clave", "Ana")
+    sistema.save_data()
+    with open(archivos[0], encoding="utf-8") as f:
+        antes = f.read()
+    sistema.register_user("luis@dej.pe", "clave", "Luis")
+
+    def dump_parcial(datos, f, **kwargs):
+        f.write('{"a medio')
+        raise OSError("disco lleno")
+    monkeypatch.setattr(simple_payment_system.json, "dump", dump_parcial)
+    with pytest.raises(OSError):
+        sistema.save_data()
+
+    with open(archivos[0], encoding="utf-8") as f:
+        assert f.read() == antes
+    assert not [n for n in os.listdir(tmp_path) if n.endswith(".tmp")]
+    # El registro de eventos no se vació: luis se recupera al cargar
+    assert SimplePaymentSystem(*archivos).get_user("luis@dej.pe")["name"] == "Luis"
+
+def test_json_cambios_como_eventos_y_compactacion(tmp_path):
+    archivos = (str(tmp_path / "users.json"), str(tmp_path / "payments.json"))
+    sistema = SimplePaymentSystem(*archivos, compact_every=10)
+    sistema.register_user("ana@dej.pe", "clave", "Ana")
+    pago = sistema.upgrade_plan("ana@dej.pe", "premium", "yape")["payment_id"]
+    sistema.confirm_payment(pago)
+
+    # Sin instantánea todavía: los tres cambios son líneas del registro
+    assert not os.path.exists(archivos[0])
+    with open(sistema.events_file, encoding="utf-8") as f:
+        eventos = [json.loads(linea)["event"] for linea in f]
+    assert eventos == ["user_registered", "payment_created", "payment_confirmed"]
+    assert SimplePaymentSystem(*archivos).get_user("ana@dej.pe")["plan"] == "premium"
+
+    # Una línea a medio escribir (caída durante un append) se ignora y se descarta
+    with open(sistema.events_file, "ab") as f:
+        f.write(b'{"event": "user_regis')
+    otro = SimplePaymentSystem(*archivos, compact_every=10)
+    assert otro.count_users() == 1
+    otro.register_user("luis@dej.pe", "clave", "Luis")
+    assert SimplePaymentSystem(*archivos).count_users() == 2
+
+    # Al llegar a compact_every eventos se escribe la instantánea en segundo plano y se vacía el registro
+    for i in range(10):
+        otro.register_user(f"u{i}@dej.pe", "clave", "U")
+    otro._compactor.join(10)
+    # La compactación se disparó en el décimo evento (4 ya aplicados + 6 registros nuevos)
+    with open(archivos[0], encoding="utf-8") as f:
+        assert len(json.load(f)) >= 8
+    with open(otro.events_file, encoding="utf-8") as f:
+        assert len(f.readlines()) < 10
+    assert sistema.count_users() == 12 and sistema.get_payment(pago)["status"] == "confirmado"
+
+def test_json_procesos_concurrentes_no_pierden_datos(tmp_path):
+    archivos = (str(tmp_path / "users.json"), str(tmp_path / "payments.json"))
+    contexto = multiprocessing.get_context("spawn")
+    procesos = [contexto.Process(target=_registrar_varios, args=(archivos, p, 15)) for p in ("a", "b", "c")]
+    for proceso in procesos:
+        proceso.start()
+    for proceso in procesos:
+        proceso.join(60)
+        assert proceso.exitcode == 0
+
+    sistema = SimplePaymentSystem(*archivos)
+    assert sistema.count_users() == 45
+    assert len(sistema.get_pending_payments()) == 45
+    assert len({p["id"] for p in sistema.list_payments()}) == 45
+
+def _confirmar_plan(sistema, email, plan="premium"):
+    sistema.confirm_payment(sistema.upgrade_plan(email, plan, "yape")["payment_id"])
+
+def test_vencimiento_en_bloque(sistema, caplog):
+    eventos = []
+    sistema.add_listener(lambda evento, email: eventos.append((evento, email)))
+    for email in ("ana@dej.pe", "luis@dej.pe", "eva@dej.pe"):
+        sistema.register_user(email, "clave", email)
+    _confirmar_plan(sistema, "ana@dej.pe")
+    _confirmar_plan(sistema, "luis@dej.pe", "empresarial")
+    _confirmar_plan(sistema, "luis@dej.pe", "empresarial")  # renovación: el vencimiento anterior ya no vale
+    assert ("payment_confirmed", "ana@dej.pe") in eventos
+
+    assert sistema.expire_plans() == []
+    assert sistema.next_expiration() == sistema.get_user("ana@dej.pe")["expires_at"]
+
+    with caplog.at_level(logging.INFO, logger="simple_payment_system"):
+        vencidos = sistema.expire_plans(datetime.now() + timedelta(days=31))
+    assert sorted(vencidos) == ["ana@dej.pe", "luis@dej.pe"]
+    assert "Planes vencidos pasados a gratuito (2)" in caplog.text
+    assert {u["email"]: u["plan"] for u in sistema.list_users()} == dict.fromkeys(
+        ["ana@dej.pe", "luis@dej.pe", "eva@dej.pe"], "gratuito")
+    assert ("plans_expired", "luis@dej.pe") in eventos
+    assert sistema.next_expiration() is None
+    assert sistema.expire_plans(datetime.now() + timedelta(days=60)) == []
+
+def test_plan_asignado_despues_de_vencer(sistema):
+    sistema.register_user("ana@dej.pe", "clave", "Ana")
+    sistema.register_user("luis@dej.pe", "clave", "Luis")
+    _confirmar_plan(sistema, "ana@dej.pe")
+    _confirmar_plan(sistema, "luis@dej.pe")
+    vencimiento = datetime.now() + timedelta(days=31)
+    assert sorted(sistema.expire_plans(vencimiento)) == ["ana@dej.pe", "luis@dej.pe"]
+
+    # El administrador vuelve a dar el plan: vence de nuevo en 30 días, o nunca
+    assert sistema.set_user_plan("ana@dej.pe", "empresarial")
+    assert sistema.set_user_plan("luis@dej.pe", "premium", never_expires=True)
+    assert sistema.get_user("ana@dej.pe")["expires_at"] > datetime.now().isoformat()
+    assert sistema.get_user("luis@dej.pe")["expires_at"] is None
+    assert sistema.expire_plans() == []
+    assert sistema.get_user("ana@dej.pe")["plan"] == "empresarial"
+    assert sistema.next_expiration() == sistema.get_user("ana@dej.pe")["expires_at"]
+
+    assert sistema.expire_plans(vencimiento + timedelta(days=60)) == ["ana@dej.pe"]
+    assert sistema.get_user("luis@dej.pe")["plan"] == "premium"
+
+def test_monticulo_sin_entradas_repetidas(tmp_path):
+    sistema = SimplePaymentSystem(str(tmp_path / "users.json"), str(tmp_path / "payments.json"))
+    sistema.register_user("ana@dej.pe", "clave", "Ana")
+    _confirmar_plan(sistema, "ana@dej.pe")
+    assert len(sistema._expirations) == 1
+    # Eventos que no cambian el vencimiento (pago pendiente, rehash) no agregan entradas
+    for _ in range(5):
+        sistema.upgrade_plan("ana@dej.pe", "empresarial", "yape")
+    sistema.login_user("ana@dej.pe", "clave")
+    assert len(sistema._expirations) == 1
+
+def test_programador_despierta_al_vencer(tmp_path, monkeypatch):
+    sistema = SimplePaymentSystem(str(tmp_path / "users.json"), str(tmp_path / "payments.json"))
+    sistema.register_user("ana@dej.pe", "clave", "Ana")
+    programador = PlanExpiryScheduler(sistema, max_wait=30)
+    programador.start()
+    try:
+        # La confirmación despierta al hilo, que espera solo hasta el vencimiento (0.3 s)
+        monkeypatch.setattr(sistema, "plan_expiration", lambda plan: (datetime.now() + timedelta(seconds=0.3)).isoformat())
+        _confirmar_plan(sistema, "ana@dej.pe")
+        assert sistema.get_user("ana@dej.pe")["plan"] == "premium"
+        limite = time.monotonic() + 10
+        while sistema.get_user("ana@dej.pe")["plan"] != "gratuito" and time.monotonic() < limite:
+            time.sleep(0.05)
+        assert sistema.get_user("ana@dej.pe")["plan"] == "gratuito"
+    finally:
+        programador.stop()
+
+def test_vencimientos_sqlite_usan_indice_parcial(tmp_path):
+    sistema = SQLitePaymentSystem(str(tmp_path / "payments.db"), str(tmp_path / "u.json"), str(tmp_path / "p.json"))
+    sistema.count_users()
+    conexion = sqlite3.connect(sistema.database)
+    plan = conexion.execute(
+        "EXPLAIN QUERY PLAN SELECT email FROM users WHERE plan != 'gratuito' AND expires_at <= '2026'"
+    ).fetchall()
+    assert "idx_users_expires_at" in plan[0][-1]
+
+def _estadisticas_recorriendo(sistema):
+    """Las mismas estadísticas calculadas recorriendo usuarios y pagos"""
+    usuarios, estados, planes, ingresos = {}, {}, {}, {}
+    for usuario in sistema.list_users():
+        usuarios[usuario["plan"]] = usuarios.get(usuario["plan"], 0) + 1
+    for pago in sistema.list_payments():
+        estados[pago["status"]] = estados.get(pago["status"], 0) + 1
+        planes[pago["plan"]] = planes.get(pago["plan"], 0) + 1
+        if pago["status"] == "confirmado":
+            dia = pago["confirmed_at"][:10]
+            ingresos[dia] = round(ingresos.get(dia, 0) + pago["amount"], 2)
+    return {"users_by_plan": usuarios, "payments_by_status": estados,
+            "payments_by_plan": planes, "revenue_by_day": ingresos}
+
+def test_estadisticas_incrementales(sistema):
+    vacio = {"users_by_plan": {}, "payments_by_status": {}, "payments_by_plan": {}, "revenue_by_day": {}}
+    assert sistema.get_statistics() == vacio
+    for email in ("ana@dej.pe", "luis@dej.pe", "eva@dej.pe"):
+        sistema.register_user(email, "clave", email)
+    _confirmar_plan(sistema, "ana@dej.pe")
+    _confirmar_plan(sistema, "luis@dej.pe", "empresarial")
+    sistema.upgrade_plan("eva@dej.pe", "premium", "plin")
+    sistema.set_user_plan("luis@dej.pe", "premium")
+    sistema.delete_user("eva@dej.pe")
+
+    stats = sistema.get_statistics()
+    assert stats == _estadisticas_recorriendo(sistema)
+    assert stats["users_by_plan"] == {"premium": 2}
+    assert stats["payments_by_status"] == {"confirmado": 2, "pendiente": 1}
+    assert stats["revenue_by_day"] == {datetime.now().strftime("%Y-%m-%d"): 129.98}
+
+    sistema.expire_plans(datetime.now() + timedelta(days=31))
+    assert sistema.get_statistics()["users_by_plan"] == {"gratuito": 2}
+
+def test_estadisticas_persisten_y_se_recalculan(tmp_path):
+    archivos = (str(tmp_path / "users.json"), str(tmp_path / "payments.json"))
+    sistema = SimplePaymentSystem(*archivos)
+    sistema.register_user("ana@dej.pe", "clave", "Ana")
+    _confirmar_plan(sistema, "ana@dej.pe")
+    assert SimplePaymentSystem(*archivos).get_statistics() == sistema.get_statistics()
+
+    # Base creada antes de los contadores: se recalculan una sola vez al abrirla
+    base = str(tmp_path / "payments.db")
+    SQLitePaymentSystem(base, *archivos).count_users()
+    conexion = sqlite3.connect(base)
+    with conexion:
+        conexion.execute("DELETE FROM statistics")
+        conexion.execute("DELETE FROM metadata WHERE key = 'statistics_backfilled'")
+    conexion.close()
+    migrado = SQLitePaymentSystem(base, *archivos)
+    assert migrado.get_statistics() == sistema.get_statistics()
+    assert migrado.get_statistics()["payments_by_plan"] == {"premium": 1}
+
+def _poblar_para_consultas(sistema):
+    planes = ["gratuito", "premium", "empresarial"]
+    for i in range(12):
+        sistema.register_user(f"{'ana' if i % 2 else 'luis'}{i:02d}@dej.pe", "clave", f"U{i}")
+    pagos = [sistema.upgrade_plan(f"ana{i:02d}@dej.pe", planes[1 + j % 2], "yape")["payment_id"]
+             for j, i in enumerate(range(1, 12, 2))]
+    sistema.confirm_payments(pagos[::2])
+    sistema.set_user_plan("luis04@dej.pe", "premium")
+    return pagos
+
+def _emails(pagina):
+    return [fila["email"] for fila in pagina["rows"]]
+
+def test_consultas_paginadas(sistema):
+    pagos = _poblar_para_consultas(sistema)
+
+    pagina = sistema.query_users(limit=5, offset=5)
+    assert pagina["total"] == 12 and _emails(pagina) == [u["email"] for u in sistema.list_users()][5:10]
+    assert _emails(sistema.query_users(search="ana", sort="email", descending=True, limit=3)) == [
+        "ana11@dej.pe", "ana09@dej.pe", "ana07@dej.pe"]
+    premium = sistema.query_users(plan="premium", sort="email")
+    assert _emails(premium) == ["ana01@dej.pe", "ana05@dej.pe", "ana09@dej.pe", "luis04@dej.pe"] and premium["total"] == 4
+    assert sistema.query_users(search="zz")["total"] == 0
+
+    pendientes = sistema.query_payments(status="pendiente", limit=2)
+    assert pendientes["total"] == 3 and [p["id"] for p in pendientes["rows"]] == pagos[1::2][::-1][:2]
+    por_monto = sistema.query_payments(sort="amount", descending=False)
+    assert [p["amount"] for p in por_monto["rows"]] == sorted(p["amount"] for p in sistema.list_payments())
+    assert sistema.query_payments(search="ana05", status="confirmado")["total"] == 1
+    assert sistema.query_payments(plan="empresarial", status="pendiente")["total"] == 3
+    with pytest.raises(ValueError):
+        sistema.query_users(sort="password; DROP TABLE users")
+
+def test_consultas_iguales_en_ambos_almacenamientos(tmp_path):
+    json_sistema = SimplePaymentSystem(str(tmp_path / "users.json"), str(tmp_path / "payments.json"))
+    sqlite_sistema = SQLitePaymentSystem(str(tmp_path / "payments.db"), str(tmp_path / "u.json"), str(tmp_path / "p.json"))
+    for sistema in (json_sistema, sqlite_sistema):
+        _poblar_para_consultas(sistema)
+    for sort in ("created_at", "email", "plan", "expires_at"):
+        for descending in (False, True):
+            consultas = [s.query_users(sort=sort, descending=descending, limit=7, offset=2)
+                         for s in (json_sistema, sqlite_sistema)]
+            assert _emails(consultas[0]) == _emails(consultas[1])
+    for sort in ("created_at", "plan", "amount", "status"):
+        consultas = [s.query_payments(sort=sort, limit=4) for s in (json_sistema, sqlite_sistema)]
+        assert _emails(consultas[0]) == _emails(consultas[1])
+
+def test_acciones_en_bloque(sistema):
+    pagos = _poblar_para_consultas(sistema)
+    eventos = []
+    sistema.add_listener(lambda evento, email: eventos.append((evento, email)))
+
+    assert sistema.confirm_payments(pagos + ["pay_no_existe"]) == pagos[1::2]
+    assert sistema.get_pending_payments() == [] and ("payment_confirmed", "ana03@dej.pe") in eventos
+    assert sistema.set_users_plan(["luis00@dej.pe", "nadie@dej.pe", "luis02@dej.pe"], "empresarial") == [
+        "luis00@dej.pe", "luis02@dej.pe"]
+    assert sistema.query_users(plan="empresarial", sort="email")["total"] == 5
+    assert sistema.delete_users(["luis00@dej.pe", "luis00@dej.pe", "nadie@dej.pe"]) == ["luis00@dej.pe"]
+    assert sistema.count_users() == 11 and sistema.get_statistics() == _estadisticas_recorriendo(sistema)
+
+def test_acciones_en_bloque_json_son_un_evento(tmp_path):
+    archivos = (str(tmp_path / "users.json"), str(tmp_path / "payments.json"))
+    sistema = SimplePaymentSystem(*archivos)
+    pagos = _poblar_para_consultas(sistema)
+    with open(sistema.events_file, encoding="utf-8") as f:
+        antes = len(f.readlines())
+    sistema.confirm_payments(pagos)
+    sistema.delete_users(["luis00@dej.pe", "luis02@dej.pe"])
+    with open(sistema.events_file, encoding="utf-8") as f:
+        assert len(f.readlines()) == antes + 2
+    recargado = SimplePaymentSystem(*archivos)
+    assert recargado.count_users() == 10 and recargado.get_pending_payments() == []
+
+def test_consultas_paginadas_sqlite_usan_indices(tmp_path):
+    sistema = SQLitePaymentSystem(str(tmp_path / "payments.db"), str(tmp_path / "u.json"), str(tmp_path / "p.json"))
+    sistema.count_users()
+    conexion = sqlite3.connect(sistema.database)
+    for consulta, indice in (
+        ("SELECT * FROM users WHERE plan = 'premium' ORDER BY rowid LIMIT 10", "idx_users_plan"),
+        ("SELECT * FROM users WHERE email >= 'a' AND email < 'b' ORDER BY email LIMIT 10", "sqlite_autoindex_users_1"),
+        ("SELECT * FROM payments WHERE plan = 'premium' ORDER BY seq DESC LIMIT 10", "idx_payments_plan"),
+    ):
+        plan = " ".join(fila[-1] for fila in conexion.execute(f"EXPLAIN QUERY PLAN {consulta}"))
+        assert indice in plan and "TEMP B-TREE" not in plan
+
+def test_login_en_hilo_del_kdf_y_token_de_sesion(sistema, monkeypatch):
+    sistema.register_user("ana@dej.pe", "clave", "Ana")
+    assert sistema.get_user("ana@dej.pe")["password"].startswith("pbkdf2_sha256$1000$")
+
+    hilos = []
+    original = simple_payment_system.check_password
+    def check_password(password, stored):
+        hilos.append(threading.current_thread().name)
+        return original(password, stored)
+    monkeypatch.setattr(simple_payment_system, "check_password", check_password)
+    resultado = sistema.login_user_async("ana@dej.pe", "clave").result()
+    assert resultado["success"] and hilos[0].startswith("kdf")
+    assert "token" not in sistema.login_user("ana@dej.pe", "otra")
+
+    # Recargar la página con el token no vuelve a hashear la contraseña
+    def sin_kdf(*args, **kwargs):
+        raise AssertionError("verify_session no debe usar el KDF")
+    monkeypatch.setattr(simple_payment_system, "derive_password", sin_kdf)
+    token = resultado["token"]
+    assert sistema.verify_session(token)["email"] == "ana@dej.pe"
+    assert sistema.verify_session(token[:-1] + ("0" if token[-1] != "0" else "1")) is None
+    assert sistema.verify_session("basura") is None and sistema.verify_session(None) is None
+
+    sistema.end_session(token)
+    assert sistema.verify_session(token) is None
+
+def test_token_de_sesion_vence_y_sirve_en_otra_instancia(tmp_path, monkeypatch):
+    archivos = (str(tmp_path / "users.json"), str(tmp_path / "payments.json"))
+    sistema = SimplePaymentSystem(*archivos)
+    sistema.register_user("ana@dej.pe", "clave", "Ana")
+    token = sistema.login_user("ana@dej.pe", "clave")["token"]
+
+    # Otra instancia (misma clave de firma, guardada con los datos) lo acepta verificando la firma
+    otra = SimplePaymentSystem(*archivos)
+    assert otra.verify_session(token)["name"] == "Ana"
+    otra.delete_user("ana@dej.pe")
+    assert otra.verify_session(token) is None
+
+    monkeypatch.setattr(simple_payment_system, "SESSION_TTL_SECONDS", -1)
+    sistema.register_user("luis@dej.pe", "clave", "Luis")
+    assert sistema.verify_session(sistema.login_user("luis@dej.pe", "clave")["token"]) is None
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_clave_y_sesiones_anuladas_se_guardan_con_los_datos(tmp_path, backend):
+    config = {"backend": backend, "database": str(tmp_path / "payments.db"),
+              "users_file": str(tmp_path / "users.json"), "payments_file": str(tmp_path / "payments.json")}
+    sistema = create_payment_system(config)
+    sistema.register_user("ana@dej.pe", "clave", "Ana")
+    token = sistema.login_user("ana@dej.pe", "clave")["token"]
+    otro_token = sistema.login_user("ana@dej.pe", "clave")["token"]
+
+    # Otro proceso o un reinicio (otra instancia sin PAYMENT_SESSION_SECRET) usa la misma clave guardada
+    reiniciado = create_payment_system(config)
+    assert reiniciado.verify_session(token)["email"] == "ana@dej.pe"
+
+    # Cerrar sesión en una instancia la anula en las demás; las otras sesiones siguen vigentes
+    reiniciado.end_session(token)
+    assert sistema.verify_session(token) is None
+    assert sistema.verify_session(otro_token)["email"] == "ana@dej.pe"
+
+    # La anulación sobrevive a la compactación del registro de eventos (modo JSON)
+    sistema.save_data()
+    assert create_payment_system(config).verify_session(token) is None
+
+def test_clave_de_sesion_configurada(tmp_path, monkeypatch):
+    monkeypatch.setattr(simple_payment_system, "SESSION_SECRET", b"clave-de-prueba")
+    sistema = SimplePaymentSystem(str(tmp_path / "users.json"), str(tmp_path / "payments.json"))
+    sistema.register_user("ana@dej.pe", "clave", "Ana")
+    assert sistema.verify_session(sistema.login_user("ana@dej.pe", "clave")["token"])
+    assert not (tmp_path / "users.json.secret").exists()
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_hash_heredado_se_reemplaza_al_iniciar_sesion(tmp_path, backend):
+    usuarios = tmp_path / "users.json"
+    heredado = hashlib.sha256(b"clave").hexdigest()
+    usuarios.write_text(json.dumps({"ana@dej.pe": {
+        "email": "ana@dej.pe", "password": heredado, "name": "Ana", "plan": "premium",
+        "created_at": "2025-01-01T00:00:00", "expires_at": None, "payment_pending": None,
+    }}), encoding="utf-8")
+    config = {"backend": backend, "database": str(tmp_path / "payments.db"),
+              "users_file": str(usuarios), "payments_file": str(tmp_path / "payments.json")}
+    sistema = create_payment_system(config)
+    assert sistema.login_user("ana@dej.pe", "otra")["message"] == "Contraseña incorrecta"
+    assert sistema.get_user("ana@dej.pe")["password"] == heredado
+
+    assert sistema.login_user("ana@dej.pe", "clave")["user"]["plan"] == "premium"
+    nuevo = create_payment_system(config).get_user("ana@dej.pe")["password"]
+    assert nuevo.startswith("pbkdf2_sha256$") and simple_payment_system.check_password("clave", nuevo)
+    assert create_payment_system(config).login_user("ana@dej.pe", "clave")["success"]
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la cola de reportes en segundo plano (trabajos_reporte.py)
+"""
+
+import os
+import time
+
+import pytest
+
+import trabajos_reporte
+from cache_resultados import analisis_completo_cacheado
+from modelo_resultados import construir_modelo
+from reporte_pdf import SECCIONES_REPORTE
+from test_cache_resultados import DATOS_AYACUCHO
+from trabajos_reporte import ColaReportes, _escribir_json, construir_reporte
+
+def test_trabajo_con_avance_y_almacen_acotado(tmp_path):
+    resultados = analisis_completo_cacheado(DATOS_AYACUCHO)
+    cola = ColaReportes(str(tmp_path), max_trabajos=2, workers=1)
+    try:
+        ids = []
+        for plan in ("premium", "gratuito", "premium"):
+            ids.append(cola.encolar(resultados, DATOS_AYACUCHO, plan))
+            assert cola.esperar(ids[-1])["estado"] == "completado"
+    finally:
+        cola.cerrar()
+
+    # Otra sesión (otra instancia) ve el mismo almacén en disco
+    otra_sesion = ColaReportes(str(tmp_path), max_trabajos=2)
+    estado = otra_sesion.estado(ids[-1])
+    assert estado["avance"] == 1.0
+    assert list(estado["secciones"]) == list(SECCIONES_REPORTE)
+    assert all(estado["secciones"].values())
+    assert otra_sesion.obtener_pdf(ids[-1]).startswith(b"%PDF")
+
+    # Solo se conservan max_trabajos; el más antiguo se eliminó
+    assert [e["id"] for e in otra_sesion.trabajos()] == ids[:0:-1]
+    assert otra_sesion.estado(ids[0]) is None
+
+def test_trabajo_usa_el_modelo_de_la_sesion(tmp_path):
+    from pypdf import PdfReader
+    resultados = analisis_completo_cacheado(DATOS_AYACUCHO)
+    modelo = construir_modelo(resultados, DATOS_AYACUCHO, fecha="01/02/2025 09:30")
+    cola = ColaReportes(str(tmp_path), workers=1)
+    try:
+        id_trabajo = cola.encolar(resultados, DATOS_AYACUCHO, "premium", "vectorial", modelo=modelo)
+        assert cola.esperar(id_trabajo)["estado"] == "completado"
+        with cola.abrir_pdf(id_trabajo) as pdf:
+            assert "01/02/2025 09:30" in PdfReader(pdf).pages[0].extract_text()
+    finally:
+        cola.cerrar()
+
+def _trabajo(directorio, id_trabajo, estado, antiguedad=0, propietario=None):
+    ruta = os.path.join(directorio, f"{id_trabajo}.json")
+    creado = time.time() - antiguedad
+    _escribir_json(ruta, {"id": id_trabajo, "plan": "premium", "perfil": "raster", "propietario": propietario,
+                          "estado": estado, "secciones": {seccion: False for seccion in SECCIONES_REPORTE},
+                          "creado": creado})
+    os.utime(ruta, (creado, creado))
+
+def test_error_borra_el_pdf_temporal(tmp_path, monkeypatch):
+    def fallar(resultados, datos_entrada, plan, destino=None, **opciones):
+        destino.write(b"%PDF-1.4 a medias")
+        raise RuntimeError("sin memoria")
+
+    monkeypatch.setattr(trabajos_reporte, "generar_pdf_reportlab", fallar)
+    _trabajo(tmp_path, "0123456789ab", "en_cola")
+    assert construir_reporte(str(tmp_path), "0123456789ab", {}, {}, "premium") == "error"
+    assert sorted(os.listdir(tmp_path)) == ["0123456789ab.json"]
+    assert ColaReportes(str(tmp_path)).estado("0123456789ab")["error"] == "sin memoria"
+
+def test_estado_borrado_antes_de_empezar(tmp_path, monkeypatch):
+    monkeypatch.setattr(trabajos_reporte, "generar_pdf_reportlab", lambda *a, **k: pytest.fail("no debe generarse"))
+    assert construir_reporte(str(tmp_path), "0123456789ab", {}, {}, "premium") == "error"
+    assert os.listdir(tmp_path) == []
+
+def test_solo_el_propietario_ve_el_trabajo(tmp_path):
+    _trabajo(tmp_path, "0123456789ab", "completado", propietario="ana@x.com")
+    (tmp_path / "0123456789ab.pdf").write_bytes(b"%PDF-1.4 de ana")
+
+    cola = ColaReportes(str(tmp_path))
+    for otro in ("beto@x.com", None):
+        assert cola.estado("0123456789ab", otro) is None
+        assert cola.abrir_pdf("0123456789ab", otro) is None
+        assert cola.obtener_pdf("0123456789ab", otro) is None
+    assert cola.estado("0123456789ab", "ana@x.com")["avance"] == 1.0
+    assert cola.obtener_pdf("0123456789ab", "ana@x.com") == b"%PDF-1.4 de ana"
+    # La limpieza sigue viendo todos los trabajos
+    assert [e["id"] for e in cola.trabajos()] == ["0123456789ab"]
+
+def test_trabajos_sin_avance_se_marcan_como_error_y_se_eliminan(tmp_path):
+    viejo = trabajos_reporte.TIEMPO_MAXIMO_SIN_AVANCE + 60
+    _trabajo(tmp_path, "aaaaaaaaaaaa", "en_cola", antiguedad=viejo)
+    _trabajo(tmp_path, "bbbbbbbbbbbb", "procesando", antiguedad=viejo - 30)
+    (tmp_path / "bbbbbbbbbbbb.pdf.tmp").write_bytes(b"%PDF-1.4 a medias")
+    _trabajo(tmp_path, "cccccccccccc", "procesando", antiguedad=10)
+
+    cola = ColaReportes(str(tmp_path), max_trabajos=10)
+    cola.limpiar()
+    assert [cola.estado(i)["estado"] for i in ("aaaaaaaaaaaa", "bbbbbbbbbbbb", "cccccccccccc")] == \
+        ["error", "error", "procesando"]
+    assert not (tmp_path / "bbbbbbbbbbbb.pdf.tmp").exists()
+
+    # Ya en error, los perdidos se eliminan primero al superar max_trabajos; el que avanza se conserva
+    cola.max_trabajos = 2
+    cola.limpiar()
+    assert [e["id"] for e in cola.trabajos()] == ["cccccccccccc"]
+
+def test_ids_invalidos_no_tocan_el_disco(tmp_path):
+    directorio = tmp_path / "reportes"
+    directorio.mkdir()
+    # Un estado "completado" fuera del directorio de la cola, alcanzable con ../
+    _trabajo(tmp_path, "fuera", "completado")
+    (tmp_path / "fuera.pdf").write_bytes(b"%PDF-1.4 secreto")
+
+    cola = ColaReportes(str(directorio))
+    for id_trabajo in ("../fuera", "0123456789AB", "0123456789a", "0123456789abc", "0123456789a/", None):
+        assert cola.estado(id_trabajo) is None
+        assert cola.abrir_pdf(id_trabajo) is None
+        assert cola.obtener_pdf(id_trabajo) is None
+    assert cola.estado("0123456789ab") is None
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Trabajos de Reporte - CONSORCIO DEJ
+Cola de generación de PDFs en segundo plano con avance por sección y almacén en disco
+"""
+
+import json
+import multiprocessing
+import os
+import re
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+from reporte_pdf import SECCIONES_REPORTE, generar_pdf_reportlab
+
+DIRECTORIO_REPORTES = "reportes_generados"
+
+ESTADOS_FINALES = ("completado", "error")
+
+# Ids de trabajo: 12 dígitos hexadecimales (uuid4().hex[:12]); cualquier otro texto se rechaza
+# antes de armar rutas (un id como "../algo" no debe leer fuera del directorio de reportes)
+PATRON_ID_TRABAJO = re.compile(r"[0-9a-f]{12}")
+
+# Un trabajo en cola o procesando cuyo estado no cambia en este tiempo se da por perdido
+# (el proceso que lo iba a generar se detuvo): se marca como error y puede eliminarse
+TIEMPO_MAXIMO_SIN_AVANCE = 15 * 60
+
+def id_valido(id_trabajo):
+    return isinstance(id_trabajo, str) and PATRON_ID_TRABAJO.fullmatch(id_trabajo) is not None
+
+def _ruta_estado(directorio, id_trabajo):
+    return os.path.join(directorio, f"{id_trabajo}.json")
+
+def _ruta_pdf(directorio, id_trabajo):
+    return os.path.join(directorio, f"{id_trabajo}.pdf")
+
+def _ruta_pdf_temporal(directorio, id_trabajo):
+    return _ruta_pdf(directorio, id_trabajo) + ".tmp"
+
+def _eliminar(ruta):
+    try:
+        os.remove(ruta)
+    except FileNotFoundError:
+        pass
+
+def _escribir_json(ruta, datos):
+    """Escribir JSON de forma atómica (archivo temporal y reemplazo)"""
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, "w", encoding="utf-8") as f:
+        json.dump(datos, f, ensure_ascii=False, indent=2)
+    os.replace(temporal, ruta)
+
+def _leer_json(ruta):
+    try:
+        with open(ruta, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+def construir_reporte(directorio, id_trabajo, resultados, datos_entrada, plan, perfil="raster", modelo=None):
+    """Generar el PDF de un trabajo (corre en el pool de procesos; modelo viaja serializado con pickle)"""
+    ruta = _ruta_estado(directorio, id_trabajo)
+    estado = _leer_json(ruta)
+    if estado is None:
+        # El trabajo se eliminó (o su estado se dañó) antes de empezar: no hay a quién entregar el PDF
+        return "error"
+    estado["estado"] = "procesando"
+    estado["iniciado"] = time.time()
+    _escribir_json(ruta, estado)
+
+    def progreso(seccion):
+        estado["secciones"][seccion] = True
+        _escribir_json(ruta, estado)
+
+    try:
+        # El PDF se escribe directo al archivo, sin pasar por un buffer en memoria
+        temporal = _ruta_pdf_temporal(directorio, id_trabajo)
+        with open(temporal, "w+b") as f:
+            generar_pdf_reportlab(resultados, datos_entrada, plan, progreso=progreso, perfil=perfil, destino=f,
+                                  modelo=modelo)
+        os.replace(temporal, _ruta_pdf(directorio, id_trabajo))
+        estado["estado"] = "completado"
+    except Exception as e:
+        estado["estado"] = "error"
+        estado["error"] = str(e)
+        _eliminar(temporal)
+
+    estado["finalizado"] = time.time()
+    _escribir_json(ruta, estado)
+    return estado["estado"]
+
+def marcar_error(directorio, id_trabajo, mensaje):
+    """Marcar como error un trabajo que no terminó y borrar su PDF a medio escribir"""
+    ruta = _ruta_estado(directorio, id_trabajo)
+    estado = _leer_json(ruta)
+    if estado is None or estado["estado"] in ESTADOS_FINALES:
+        return
+    estado["estado"] = "error"
+    estado["error"] = mensaje
+    estado["finalizado"] = time.time()
+    _escribir_json(ruta, estado)
+    _eliminar(_ruta_pdf_temporal(directorio, id_trabajo))
+
+class ColaReportes:
+    """Cola de reportes PDF en un pool de procesos; el estado vive en disco y se comparte entre sesiones"""
+
+    def __init__(self, directorio=DIRECTORIO_REPORTES, max_trabajos=50, workers=2):
+        self.directorio = directorio
+        self.max_trabajos = max_trabajos
+        self.workers = workers
+        self._executor = None
+
+    def encolar(self, resultados, datos_entrada, plan="premium", perfil="raster", modelo=None, propietario=None):
+        """
+        Encolar la generación de un reporte y devolver su id de trabajo (modelo: el de la sesión, si existe).
+        Solo el propietario puede consultar el trabajo y descargar su PDF.
+        """
+        os.makedirs(self.directorio, exist_ok=True)
+        self.limpiar()
+        id_trabajo = uuid.uuid4().hex[:12]
+        _escribir_json(_ruta_estado(self.directorio, id_trabajo), {
+            "id": id_trabajo,
+            "plan": plan,
+            "perfil": perfil,
+            "propietario": propietario,
+            "estado": "en_cola",
+            "secciones": {seccion: False for seccion in SECCIONES_REPORTE},
+            "creado": time.time(),
+        })
+        futuro = self._pool().submit(construir_reporte, self.directorio, id_trabajo, resultados, datos_entrada,
+                                     plan, perfil, modelo)
+        futuro.add_done_callback(lambda f: self._al_terminar(id_trabajo, f))
+        return id_trabajo
+
+    def _al_terminar(self, id_trabajo, futuro):
+        # construir_reporte captura sus errores: una excepción aquí es un worker caído o un pool cerrado
+        if futuro.cancelled():
+            marcar_error(self.directorio, id_trabajo, "Trabajo cancelado")
+        elif futuro.exception() is not None:
+            marcar_error(self.directorio, id_trabajo, f"El proceso del trabajo se detuvo: {futuro.exception()}")
+
+    def estado(self, id_trabajo, propietario=None):
+        """Estado del trabajo con el avance como fracción (None si no existe, no es válido o es de otro dueño)"""
+        estado = self._estado(id_trabajo)
+        if estado is None or estado.get("propietario") != propietario:
+            return None
+        return estado
+
+    def _estado(self, id_trabajo):
+        """Estado de cualquier trabajo, sin comprobar el propietario (limpieza y listados internos)"""
+        if not id_valido(id_trabajo):
+            return None
+        estado = _leer_json(_ruta_estado(self.directorio, id_trabajo))
+        if estado is not None:
+            secciones = estado["secciones"]
+            estado["avance"] = 1.0 if estado["estado"] == "completado" else sum(secciones.values()) / (len(secciones) + 1)
+        return estado
+
+    def obtener_pdf(self, id_trabajo, propietario=None):
+        """Bytes del PDF terminado o None"""
+        estado = self.estado(id_trabajo, propietario)
+        if estado is None or estado["estado"] != "completado":
+            return None
+        with open(_ruta_pdf(self.directorio, id_trabajo), "rb") as f:
+            return f.read()
+
+    def abrir_pdf(self, id_trabajo, propietario=None):
+        """Archivo del PDF terminado abierto en binario (para enviarlo por partes) o None"""
+        estado = self.estado(id_trabajo, propietario)
+        if estado is None or estado["estado"] != "completado":
+            return None
+        return open(_ruta_pdf(self.directorio, id_trabajo), "rb")
+
+    def esperar(self, id_trabajo, timeout=60, intervalo=0.2, propietario=None):
+        """Esperar a que el trabajo termine (útil en scripts y pruebas)"""
+        limite = time.monotonic() + timeout
+        while time.monotonic() < limite:
+            estado = self.estado(id_trabajo, propietario)
+            if estado is not None and estado["estado"] in ESTADOS_FINALES:
+                return estado
+            time.sleep(intervalo)
+        return self.estado(id_trabajo, propietario)
+
+    def trabajos(self):
+        """Estados de todos los trabajos guardados, del más reciente al más antiguo"""
+        estados = []
+        if not os.path.isdir(self.directorio):
+            return estados
+        for nombre in os.listdir(self.directorio):
+            if nombre.endswith(".json"):
+                estado = self._estado(nombre[:-len(".json")])
+                if estado is not None:
+                    estados.append(estado)
+        return sorted(estados, key=lambda e: e["creado"], reverse=True)
+
+    def limpiar(self):
+        """
+        Marcar como error los trabajos sin avance por más de TIEMPO_MAXIMO_SIN_AVANCE y eliminar
+        los terminados más antiguos si se supera max_trabajos
+        """
+        todos = self.trabajos()
+        limite = time.time() - TIEMPO_MAXIMO_SIN_AVANCE
+        for estado in todos:
+            if estado["estado"] not in ESTADOS_FINALES and self._ultimo_avance(estado["id"]) < limite:
+                marcar_error(self.directorio, estado["id"], "El trabajo no terminó (el proceso que lo generaba se detuvo)")
+                estado["estado"] = "error"
+
+        terminados = [e for e in todos if e["estado"] in ESTADOS_FINALES]
+        exceso = len(todos) - self.max_trabajos + 1
+        for estado in sorted(terminados, key=lambda e: e["creado"])[:max(exceso, 0)]:
+            for ruta in (_ruta_pdf(self.directorio, estado["id"]), _ruta_pdf_temporal(self.directorio, estado["id"]),
+                         _ruta_estado(self.directorio, estado["id"])):
+                _eliminar(ruta)
+
+    def _ultimo_avance(self, id_trabajo):
+        """Hora de la última escritura del estado (cada sección terminada lo reescribe)"""
+        try:
+            return os.path.getmtime(_ruta_estado(self.directorio, id_trabajo))
+        except FileNotFoundError:
+            return time.time()
+
+    def cerrar(self):
+        """Liberar el pool de procesos (espera los trabajos en curso)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _pool(self):
+        if self._executor is None:
+            # "spawn": Streamlit ya tiene hilos activos y fork podría bloquear los workers
+            self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+# Cola global del proceso (compartida por todas las sesiones de Streamlit)
+cola_reportes = ColaReportes()
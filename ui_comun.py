@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Componentes comunes de la interfaz - CONSORCIO DEJ
+Utilidades compartidas por APP2.py y las páginas de paginas/
+"""
+
+import streamlit as st
+
+# Fragmentos: los paneles decorados se reejecutan solos al cambiar sus widgets
+if hasattr(st, "fragment"):
+    fragmento = st.fragment
+elif hasattr(st, "experimental_fragment"):
+    fragmento = st.experimental_fragment
+else:
+    def fragmento(func):
+        """Streamlit sin fragmentos: el panel se ejecuta con el script completo"""
+        return func
+
+def mostrar_datos_proyecto():
+    """Mostrar en el sidebar los datos fijos del caso Ayacucho y devolverlos"""
+    st.sidebar.markdown("---")
+    st.sidebar.header("📋 Datos del Proyecto - Caso Ayacucho")
+    st.sidebar.info("🏗️ **EDIFICIO DE 3 NIVELES - SERVICIOS PÚBLICOS**")
+
+    # Datos fijos del caso Ayacucho
+    datos = {
+        'f_c': st.sidebar.number_input("f'c (kg/cm²)", 175, 700, 210, 10, disabled=True),
+        'f_y': st.sidebar.number_input("fy (kg/cm²)", 2800, 6000, 4200, 100, disabled=True),
+        'L_viga': st.sidebar.number_input("Luz libre de vigas (m)", 3.0, 15.0, 6.0, 0.5, disabled=True),
+        'h_piso': st.sidebar.number_input("Altura de piso (m)", 2.5, 5.0, 3.0, 0.1, disabled=True),
+        'num_pisos': st.sidebar.number_input("Número de pisos", 1, 100, 3, 1, disabled=True),
+        'num_vanos': st.sidebar.number_input("Número de vanos", 1, 20, 4, 1, disabled=True),
+        'CM': st.sidebar.number_input("Carga Muerta (kg/m²)", 100, 2000, 350, 50, disabled=True),
+        'CV': st.sidebar.number_input("Carga Viva (kg/m²)", 100, 1000, 250, 50, disabled=True),
+        'zona_sismica': st.sidebar.selectbox("Zona Sísmica", ["Z1", "Z2", "Z3", "Z4"], 2, disabled=True),
+        'tipo_suelo': st.sidebar.selectbox("Tipo de Suelo", ["S1", "S2", "S3", "S4"], 0, disabled=True),
+        'tipo_estructura': st.sidebar.selectbox("Tipo de Sistema Estructural", ["Pórticos", "Muros Estructurales", "Dual"], 2, disabled=True),
+        'factor_importancia': st.sidebar.number_input("Factor de Importancia (U)", 1.0, 1.5, 1.0, 0.1, disabled=True),
+    }
+
+    st.sidebar.success("✅ **Datos configurados según análisis presentado**")
+    return datos
+
+def datos_proyecto():
+    """Datos del proyecto guardados por APP2.py en la sesión"""
+    return st.session_state['datos_proyecto']